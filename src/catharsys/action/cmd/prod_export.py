@@ -107,6 +107,56 @@ def AddArgParseArguments(_parseArgs):
         help="Specify the maximum number of samples to export. ",
     )
 
+    _parseArgs.add_argument(
+        "-w",
+        "--workers",
+        nargs=1,
+        dest="workers",
+        default=[1],
+        help="Specify the number of threads that read and decode samples ahead of the xtar writer. ",
+    )
+
+    _parseArgs.add_argument(
+        "--prefetch",
+        nargs=1,
+        dest="prefetch",
+        default=[0],
+        help=(
+            "Specify the maximum number of samples that are read ahead of the xtar writer. "
+            "Defaults to twice the number of workers."
+        ),
+    )
+
+    _parseArgs.add_argument(
+        "--shards",
+        nargs=1,
+        dest="shards",
+        default=[1],
+        help=(
+            "Split the export into the given number of shards, which are written to separate xtar datasets. "
+            "Without '--shard-index' all shards are exported in parallel processes and merged."
+        ),
+    )
+
+    _parseArgs.add_argument(
+        "--shard-index",
+        nargs=1,
+        dest="shard_index",
+        default=[-1],
+        help=(
+            "Only export the shard with the given index, e.g. to distribute the shards over several nodes. "
+            "Use the same scan file for all shards."
+        ),
+    )
+
+    _parseArgs.add_argument(
+        "--merge-shards",
+        action="store_true",
+        dest="merge_shards",
+        default=False,
+        help="Only create the index over all shards, after all shards have been exported.",
+    )
+
 # enddef
 
 
@@ -126,6 +176,11 @@ def RunCmd(_argsCmd, _lArgs):
         _iSamplesPerGroup=int(argsSubCmd.samples_per_group[0]),
         _bOverwrite=argsSubCmd.overwrite,
         _iMaxSamples=int(argsSubCmd.max_samples[0]),
+        _iWorkers=int(argsSubCmd.workers[0]),
+        _iPrefetch=int(argsSubCmd.prefetch[0]),
+        _iShardCount=int(argsSubCmd.shards[0]),
+        _iShardIndex=int(argsSubCmd.shard_index[0]),
+        _bMergeShards=argsSubCmd.merge_shards,
     )
 
 
@@ -65,6 +65,11 @@ def RunExport(
     _iSamplesPerGroup: int = 1000,
     _bOverwrite: bool = False,
     _iMaxSamples: int = -1,
+    _iWorkers: int = 1,
+    _iPrefetch: int = 0,
+    _iShardCount: int = 1,
+    _iShardIndex: int = -1,
+    _bMergeShards: bool = False,
 ) -> None:
     """
     Run the export process for the given configuration and product configuration.
@@ -78,6 +83,12 @@ def RunExport(
         _iSamplesPerGroup (int, optional): The number of samples per group. Defaults to 1000.
         _bOverwrite (bool, optional): Whether to overwrite existing files. Defaults to False.
         _iMaxSamples (int, optional): The maximum number of samples. Defaults to -1.
+        _iWorkers (int, optional): The number of threads reading samples ahead of the writer. Defaults to 1.
+        _iPrefetch (int, optional): The maximum number of samples read ahead. Defaults to twice the number of workers.
+        _iShardCount (int, optional): The number of shards. Defaults to 1.
+        _iShardIndex (int, optional): The index of the only shard to export.
+            If negative, all shards are exported in parallel processes and merged. Defaults to -1.
+        _bMergeShards (bool, optional): Only merge the shards of a sharded export. Defaults to False.
 
     Raises:
         RuntimeError: If an error occurs during the export process.
@@ -93,9 +104,17 @@ def RunExport(
             _funcIterUpdate=_IterUpdate,
             )
 
+        if _bMergeShards:
+            xExport.MergeShards(_sOutputPath, _iShardCount)
+            return
+        # endif
+
         xExport.ProvideProductScan(_sScanFile=_sScanFile)
-        xExport.PrepareExport()
-        if xExport.bHasMissingArtefacts:
+        # When exporting a single shard, the list of missing artefacts is only stored once.
+        xExport.PrepareExport(_bStoreMissingArtefacts=(_iShardIndex <= 0))
+        if xExport.bHasMissingArtefacts and _iShardIndex >= 0:
+            print("WARNING: There are missing artefacts.")
+        elif xExport.bHasMissingArtefacts:
             response = input("There are missing artefacts. Do you want to continue the export? (y/N): ").strip().lower()
             if response != "y":
                 print("Export cancelled by user due to missing artefacts.")
@@ -103,7 +122,28 @@ def RunExport(
             # endif
         # endif
 
-        xExport.ExportArtefacts(_sOutputPath=_sOutputPath, _iSamplesPerGroup=_iSamplesPerGroup, _bOverwrite=_bOverwrite, _iMaxSamples=_iMaxSamples)
+        if _iShardCount > 1 and _iShardIndex < 0:
+            xExport.ExportArtefactsSharded(
+                _sOutputPath=_sOutputPath,
+                _iShardCount=_iShardCount,
+                _iSamplesPerGroup=_iSamplesPerGroup,
+                _bOverwrite=_bOverwrite,
+                _iMaxSamples=_iMaxSamples,
+                _iWorkers=_iWorkers,
+                _iPrefetch=_iPrefetch,
+            )
+        else:
+            xExport.ExportArtefacts(
+                _sOutputPath=_sOutputPath,
+                _iSamplesPerGroup=_iSamplesPerGroup,
+                _bOverwrite=_bOverwrite,
+                _iMaxSamples=_iMaxSamples,
+                _iWorkers=_iWorkers,
+                _iPrefetch=_iPrefetch,
+                _iShardCount=_iShardCount,
+                _iShardIndex=max(_iShardIndex, 0),
+            )
+        # endif
 
     except Exception as xEx:
         xFinalEx = CAnyError_Message(sMsg="Error exporting products", xChildEx=xEx)
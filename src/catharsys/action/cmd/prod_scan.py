@@ -71,6 +71,28 @@ def AddArgParseArguments(_parseArgs):
         help="Specify production group from production configuration to scan",
     )
 
+    _parseArgs.add_argument(
+        "-w",
+        "--workers",
+        nargs=1,
+        dest="workers",
+        default=[8],
+        type=int,
+        help="Number of threads that list directories in parallel during the scan (default: 8)",
+    )
+
+    _parseArgs.add_argument(
+        "-i",
+        "--incremental",
+        dest="incremental",
+        action="store_true",
+        default=False,
+        help=(
+            "Only list directories again that changed since the previous scan, "
+            "which is loaded from the output file. Runs a full scan if no previous scan is available."
+        ),
+    )
+
 
 # enddef
 
@@ -87,6 +109,8 @@ def RunCmd(_argsCmd, _lArgs):
         _sProdCfgFile=argsSubCmd.prod_config[0],
         _sOutFile=argsSubCmd.output_file[0],
         _sGroup=argsSubCmd.group[0],
+        _bIncremental=argsSubCmd.incremental,
+        _iWorkers=argsSubCmd.workers[0],
     )
 
 
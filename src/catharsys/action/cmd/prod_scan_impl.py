@@ -83,6 +83,8 @@ def RunScan(
     _sProdCfgFile: str,
     _sOutFile: Optional[str] = None,
     _sGroup: Optional[str] = None,
+    _bIncremental: bool = False,
+    _iWorkers: int = 8,
 ):
     try:
         xWs = CWorkspace()
@@ -101,14 +103,6 @@ def RunScan(
             print(dicEx)
         # endif
 
-        print("Scanning for artefacts...")
-        xProds.ScanArtefacts(
-            _sGroupId=_sGroup,
-            _funcStatus=_ScanStatus,
-            _funcIterInit=_ScanIterInit,
-            _funcIterUpdate=_ScanIterUpdate,
-        )
-
         if _sOutFile is None:
             sFileId: str = xPrj.sId.replace("/", "_")
             if _sGroup is None:
@@ -120,6 +114,16 @@ def RunScan(
             pathScan = anypath.MakeNormPath(_sOutFile).absolute()
         # endif
 
+        print("Scanning for artefacts...")
+        xProds.ScanArtefacts(
+            _sGroupId=_sGroup,
+            _funcStatus=_ScanStatus,
+            _funcIterInit=_ScanIterInit,
+            _funcIterUpdate=_ScanIterUpdate,
+            _xPrevScanFilePath=pathScan if _bIncremental is True else None,
+            _iScanWorkers=_iWorkers,
+        )
+
         print("Storing file scan...")
         xProds.SerializeScan(pathScan)
         print(f"Artefact scan stored in file: {pathScan}")
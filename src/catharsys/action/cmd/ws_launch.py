@@ -156,6 +156,33 @@ def AddArgParseArguments(_parseArgs):
         help="When '--config-only' is selected, adds also the local variables of the job config to the output.",
     )
 
+    _parseArgs.add_argument(
+        "--clear-config-cache",
+        dest="clear_config_cache",
+        action="store_true",
+        default=False,
+        help="Removes all entries from the config disk cache of the workspace before launching the action.",
+    )
+
+    _parseArgs.add_argument(
+        "--resume",
+        dest="resume",
+        action="store_true",
+        default=False,
+        help="Skips all jobs that have been completed in a previous launch of the action with the same configuration.",
+    )
+
+    _parseArgs.add_argument(
+        "--profile",
+        dest="profile",
+        action="store_true",
+        default=False,
+        help=(
+            "Records the timings of the launch phases, like loading the manifest and processing the configs, "
+            "and saves them as JSON and HTML report in the output folder of the workspace."
+        ),
+    )
+
     _parseArgs.add_argument(
         "--debug-port",
         nargs=1,
@@ -218,6 +245,9 @@ def RunCmd(_argsCmd, _lArgs):
         bShowActionGui=argsSubCmd.action_gui,
         bConfigOnly=argsSubCmd.config_only,
         bIncludeConfigVars=argsSubCmd.include_config_vars,
+        bClearConfigCache=argsSubCmd.clear_config_cache,
+        bResume=argsSubCmd.resume,
+        bProfile=argsSubCmd.profile,
     )
 
 
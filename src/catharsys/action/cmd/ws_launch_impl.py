@@ -25,6 +25,7 @@
 ###
 
 import re
+from datetime import datetime
 from pathlib import Path
 
 from typing import Optional
@@ -35,6 +36,9 @@ from anybase import file as anyfile
 from anybase.cls_any_error import CAnyError, CAnyError_Message
 
 from catharsys.config.cls_project import CProjectConfig
+from catharsys.util.cls_disk_cache import CDiskCache, GetConfigCachePath
+from catharsys.util import cls_launch_profile as launchprofile
+from catharsys.util.cls_launch_profile import ProfilePhase
 from catharsys.action.cls_actionfactory import CActionFactory
 from catharsys.action.cls_actionclass_executor import CActionClassExecutor
 from catharsys.config.cls_job import CConfigJob
@@ -59,16 +63,22 @@ def Launch(
     assertion.FuncArgTypes()
 
     # Create action factory for given action
-    xActFac = CActionFactory(xPrjCfg=xPrjCfg, dicLaunchArgs=dicLaunchArgs)
+    with ProfilePhase("action/create"):
+        xActFac = CActionFactory(xPrjCfg=xPrjCfg, dicLaunchArgs=dicLaunchArgs)
 
-    # Create the action
-    xAction = xActFac.CreateAction(sAction=sAction, dicConfigOverride=dicConfigOverride)
+        # Create the action
+        xAction = xActFac.CreateAction(sAction=sAction, dicConfigOverride=dicConfigOverride)
+    # endwith
 
     # Initialize action
-    xAction.Init()
+    with ProfilePhase("action/init"):
+        xAction.Init()
+    # endwith
 
     # Executes the action and returns the configuration dictionaries
-    return xAction.Execute(bDoProcess=bDoProcess, dicDebug=dicDebug)
+    with ProfilePhase("action/execute"):
+        return xAction.Execute(bDoProcess=bDoProcess, dicDebug=dicDebug)
+    # endwith
 
 
 # enddef
@@ -131,6 +141,24 @@ def GetScriptArgDict(_lScriptArgs: list[str]) -> dict:
 # enddef
 
 
+####################################################################
+# Save the report of the launch profile to the output folder of the workspace
+def _SaveLaunchProfile(*, xProfile: launchprofile.CLaunchProfile, xPrjCfg: CProjectConfig, sAction: str):
+    sConfigName = xPrjCfg.sLaunchFolderName.replace("/", "+").replace(" ", "-").replace(".", "_")
+    sActionFilename = sAction.replace("/", "+").replace(" ", "-").replace(".", "_")
+    sDT = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    pathProfile = xPrjCfg.pathOutput / f"launch-profile_[{sConfigName}]_[{sActionFilename}]_{sDT}.json"
+
+    pathProfileHtml = pathProfile.with_suffix(".html")
+
+    xProfile.SaveJson(pathProfile)
+    xProfile.SaveHtml(pathProfileHtml)
+    print("Launch profile saved in files:\n> {}\n> {}\n".format(pathProfile.as_posix(), pathProfileHtml.as_posix()))
+
+
+# enddef
+
+
 ####################################################################
 
 
@@ -152,6 +180,9 @@ def RunLaunch(
     bShowActionGui: bool = False,
     bConfigOnly: bool = False,
     bIncludeConfigVars: bool = False,
+    bClearConfigCache: bool = False,
+    bResume: bool = False,
+    bProfile: bool = False,
 ):
 
     xPrjCfg = None
@@ -159,37 +190,44 @@ def RunLaunch(
         raise RuntimeError("No action specified")
     # endif
 
+    xProfile: Optional[launchprofile.CLaunchProfile] = None
+    if bProfile is True:
+        xProfile = launchprofile.StartLaunchProfile(sAction)
+    # endif
+
     try:
-        xPrjCfg = CProjectConfig(sFileBasenameLaunch=sFileBasenameLaunch)
-        pathMain = None
-
-        if sPathWorkspace is not None:
-            # A project path has been specified
-            pathMain = Path(sPathWorkspace)
-            if not pathMain.exists():
-                raise CAnyError_Message(sMsg="Project path does not exist: {}".format(pathMain.as_posix()))
+        with launchprofile.ProfilePhase("launch/project-config"):
+            xPrjCfg = CProjectConfig(sFileBasenameLaunch=sFileBasenameLaunch)
+            pathMain = None
+
+            if sPathWorkspace is not None:
+                # A project path has been specified
+                pathMain = Path(sPathWorkspace)
+                if not pathMain.exists():
+                    raise CAnyError_Message(sMsg="Project path does not exist: {}".format(pathMain.as_posix()))
+                # endif
             # endif
-        # endif
 
-        if sFolderConfig is not None:
-            # A config folder has been specified.
-            # If the main path has not been specified explicitly,
-            # the project config class assumes that the CWD is the project directory.
-            if sPathLaunch is not None:
-                print("Ignoring given launch path to use workspace path and config folder")
-            # endif
+            if sFolderConfig is not None:
+                # A config folder has been specified.
+                # If the main path has not been specified explicitly,
+                # the project config class assumes that the CWD is the project directory.
+                if sPathLaunch is not None:
+                    print("Ignoring given launch path to use workspace path and config folder")
+                # endif
 
-            xPrjCfg.FromConfigName(xPathMain=pathMain, sConfigName=sFolderConfig)
+                xPrjCfg.FromConfigName(xPathMain=pathMain, sConfigName=sFolderConfig)
 
-        else:
-            # No config folder specified.
-            # Assume that the CWD is the launch path
-            if pathMain is not None:
-                print("Ignoring given workspace path to use launch path")
-            # endif
+            else:
+                # No config folder specified.
+                # Assume that the CWD is the launch path
+                if pathMain is not None:
+                    print("Ignoring given workspace path to use launch path")
+                # endif
 
-            xPrjCfg.FromLaunchPath(sPathLaunch)
-        # endif
+                xPrjCfg.FromLaunchPath(sPathLaunch)
+            # endif
+        # endwith
 
         dicDebug = dict()
 
@@ -218,10 +256,21 @@ def RunLaunch(
         dicDebug[NsKeys.bSkipAction] = bDebugSkipAction
         dicDebug[NsKeys.bShowGui] = bShowActionGui
 
+        if bResume is True:
+            # Jobs completed in previous launches are skipped by the action
+            lActArgs = (lActArgs or []) + ["bResume=true"]
+        # endif
+
         dicConfigOverride = ws_impl.GetConfigOverride(sTrialFile=sTrialFile, sExecFile=sExecFile, lActArgs=lActArgs)
 
         bDoProcess = not bConfigOnly
 
+        if bClearConfigCache is True:
+            xDiskCache = CDiskCache(GetConfigCachePath(xPrjCfg))
+            print(f"Clearing config cache: {xDiskCache.pathCache.as_posix()}")
+            xDiskCache.Clear()
+        # endif
+
         xProcConfig = Launch(
             xPrjCfg=xPrjCfg,
             sAction=sAction,
@@ -256,6 +305,19 @@ def RunLaunch(
             )
         # endif
         raise RuntimeError(xFinalEx.ToString())
+
+    finally:
+        # The profile is also saved for failed launches, to see where the launch stopped
+        if xProfile is not None:
+            launchprofile.StopLaunchProfile()
+            if xPrjCfg is not None:
+                try:
+                    _SaveLaunchProfile(xProfile=xProfile, xPrjCfg=xPrjCfg, sAction=sAction)
+                except Exception as xEx:
+                    print(f"WARNING: Launch profile could not be saved: {xEx}")
+                # endtry
+            # endif
+        # endif
     # endtry
 
 
@@ -42,6 +42,8 @@ import catharsys.gui.web
 from catharsys.api.cls_action import CAction
 from catharsys.config.cls_job import CConfigJob
 from catharsys.config.cls_exec_job import CConfigExecJob
+from catharsys.util.cls_lsf_job_monitor import CLsfJobMonitor, CLsfJobEvent
+from catharsys.util.cls_file_tail import CFileTail
 
 from anybase import shell
 from anybase.cls_process_group_handler import CProcessGroupHandler, EProcessStatus
@@ -70,6 +72,8 @@ class ELsfJobStatus(enum.Enum):
 @dataclass
 class CLsfJobInfo:
     iLsfId: int = None
+    # Index of the job in an LSF job array or zero, if the job is not part of an array
+    iArrayIdx: int = 0
     iJobIdx: int = None
     sUser: str = None
     eStatus: ELsfJobStatus = ELsfJobStatus.NONE
@@ -110,8 +114,9 @@ class CActionExecutorLsf(CActionExecutor):
         self._lJobStatus: list[EJobStatus] = []
         self._setJobStatusChanged: set[int] = set()
 
-        self._dicLsfJobInfo: dict[int, CLsfJobInfo] = dict()
-        self._dicJobIdxToLsfId: dict[int, int] = dict()
+        # LSF job info by (LSF job id, array index)
+        self._dicLsfJobInfo: dict[tuple[int, int], CLsfJobInfo] = dict()
+        self._dicJobIdxToLsfId: dict[int, tuple[int, int]] = dict()
 
         self._dicLsfJobStatusText: dict[ELsfJobStatus, str] = {
             ELsfJobStatus.NONE: "n/a",
@@ -130,6 +135,11 @@ class CActionExecutorLsf(CActionExecutor):
         self._lActJobOutputType: list[EOutputType] = []
         self._setJobOutputChanged: set[int] = set()
 
+        # Readers of the LSF output files of running and ended jobs by job index,
+        # and the output type of the lines last passed to the job process handler.
+        self._dicLsfOutputTails: dict[int, dict[EOutputType, CFileTail]] = dict()
+        self._dicLsfOutputTailType: dict[int, EOutputType] = dict()
+
     # enddef
 
     # ##################################################################################################
@@ -151,7 +161,7 @@ class CActionExecutorLsf(CActionExecutor):
         dicInfo = dict()
 
         with self._lockJobData:
-            iLsfIdx: int = self._dicJobIdxToLsfId.get(iIdx)
+            iLsfIdx: tuple[int, int] = self._dicJobIdxToLsfId.get(iIdx)
 
             if iLsfIdx is None:
                 dicInfo["Status"] = "n/a"
@@ -165,7 +175,7 @@ class CActionExecutorLsf(CActionExecutor):
             # endif
 
             dicInfo["Status"] = self._dicLsfJobStatusText.get(xLsfJobInfo.eStatus, "n/a")
-            dicInfo["Job Id"] = str(xLsfJobInfo.iLsfId)
+            dicInfo["Job Id"] = self._GetLsfJobIdText(xLsfJobInfo.iLsfId, xLsfJobInfo.iArrayIdx)
 
             if isinstance(xLsfJobInfo.sUser, str):
                 dicInfo["User"] = xLsfJobInfo.sUser
@@ -362,21 +372,6 @@ class CActionExecutorLsf(CActionExecutor):
 
     # enddef
 
-    # ##################################################################################################
-    def _DoExecuteSingleBjobs(self) -> list[str]:
-        sSystem: str = platform.system()
-        if sSystem == "Linux":
-            lLines: list[str] = []
-            bOk: bool = False
-            bOK, lLines = shell.ExecBashCmds(lCmds=["bjobs"], bReturnStdOut=True)
-        else:
-            raise RuntimeError(f"Launching LSF jobs not supported on system type '{sSystem}")
-        # endif
-
-        return lLines
-
-    # enddef
-
     def _BpeekStdOut(self, sLine: str):
         if "ls_rstat: File operation failed:" in sLine:
             # print("BPEEK: Terminate")
@@ -479,30 +474,110 @@ class CActionExecutorLsf(CActionExecutor):
     # enddef
 
     # ##################################################################################################
-    def _DoTerminateLsfJob(self, *, _iLsfJobId: int):
+    # Get the LSF job id as text, including the array index for elements of job arrays
+    @staticmethod
+    def _GetLsfJobIdText(_iLsfJobId: int, _iArrayIdx: int) -> str:
+        if _iArrayIdx > 0:
+            return f"{_iLsfJobId}[{_iArrayIdx}]"
+        # endif
+        return str(_iLsfJobId)
+
+    # enddef
+
+    # ##################################################################################################
+    def _DoTerminateLsfJob(self, *, _iLsfJobId: int, _iArrayIdx: int = 0):
         sSystem: str = platform.system()
         if sSystem == "Linux":
-            shell.ExecBashCmds(lCmds=[f"bkill {_iLsfJobId}"])
+            shell.ExecBashCmds(lCmds=[f'bkill "{self._GetLsfJobIdText(_iLsfJobId, _iArrayIdx)}"'])
         else:
             raise RuntimeError(f"Launching LSF jobs not supported on system type '{sSystem}")
         # endif
 
+    # ##################################################################################################
+    # Handle a state transition of an LSF job, reported by the job monitor
+    def _OnLsfJobEvent(
+        self,
+        _xEvent: CLsfJobEvent,
+        *,
+        _setTerminatingLsfJob: set[tuple[int, int]],
+        _setEndedLsfJobs: set[int],
+    ):
+        tLsfId: tuple[int, int] = (_xEvent.iLsfId, _xEvent.iArrayIdx)
+        sState: str = _xEvent.xState.sStat
+        with self._lockJobData:
+            xLsfJobInfo: CLsfJobInfo = self._dicLsfJobInfo.get(tLsfId)
+            if xLsfJobInfo is None:
+                return
+            # endif
+
+            if not isinstance(xLsfJobInfo.sUser, str) and isinstance(_xEvent.xState.sUser, str):
+                xLsfJobInfo.sUser = _xEvent.xState.sUser
+                xLsfJobInfo.sFromHost = _xEvent.xState.sFromHost
+                xLsfJobInfo.sQueue = _xEvent.xState.sQueue
+                xLsfJobInfo.sJobName = _xEvent.xState.sJobName
+                xLsfJobInfo.dtLaunch = self._ParseLsfSubmitTime(_xEvent.xState.sSubmitTime)
+            # endif
+
+            if _xEvent.bFinished is True:
+                # Jobs that never ran or were killed by the user are terminated
+                if tLsfId in _setTerminatingLsfJob or (
+                    xLsfJobInfo.eStatus != ELsfJobStatus.RUNNING and sState != "DONE"
+                ):
+                    xLsfJobInfo.eStatus = ELsfJobStatus.TERMINATED
+                    self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.TERMINATED
+                else:
+                    xLsfJobInfo.eStatus = ELsfJobStatus.ENDED
+                    self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.ENDED
+                # endif
+                self._setJobStatusChanged.add(xLsfJobInfo.iJobIdx)
+
+                self._StartLsfOutputTail(xLsfJobInfo.iJobIdx, _xEvent.iLsfId, _xEvent.iArrayIdx)
+                _setEndedLsfJobs.add(xLsfJobInfo.iJobIdx)
+
+            elif sState in ["PEND", "PSUSP"] and xLsfJobInfo.eStatus != ELsfJobStatus.PENDING:
+                xLsfJobInfo.eStatus = ELsfJobStatus.PENDING
+                self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.STARTING
+                self._setJobStatusChanged.add(xLsfJobInfo.iJobIdx)
+
+            elif sState == "RUN" and xLsfJobInfo.eStatus in [ELsfJobStatus.PENDING, ELsfJobStatus.SUBMITTED]:
+                xLsfJobInfo.eStatus = ELsfJobStatus.RUNNING
+                xLsfJobInfo.sExecHost = _xEvent.xState.sExecHost
+                self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.RUNNING
+                self._setJobStatusChanged.add(xLsfJobInfo.iJobIdx)
+
+                self._StartLsfOutputTail(xLsfJobInfo.iJobIdx, _xEvent.iLsfId, _xEvent.iArrayIdx)
+            # endif
+
+            self._lLsfJobStatus[xLsfJobInfo.iJobIdx] = xLsfJobInfo.eStatus
+        # endwith lock
+
+    # enddef
+
+    # ##################################################################################################
+    @staticmethod
+    def _ParseLsfSubmitTime(_sTime: Optional[str]) -> Optional[datetime]:
+        # bjobs prints the submit time like 'Oct 17 10:22', optionally followed by flags like 'L'
+        if _sTime is None:
+            return None
+        # endif
+        try:
+            return datetime.strptime(" ".join(_sTime.split()[0:3]), "%b %d %H:%M")
+        except ValueError:
+            return None
+        # endtry
+
+    # enddef
+
     # ##################################################################################################
     def _DoExecuteLsfJobs(self):
         # self._xAction.ExecuteJobList(self._lExecJobs, bPrintOutput=True)
 
-        reJobSubmitted: re.Pattern = re.compile(r"Job\s<(?P<id>\d+)> is submitted")
-        reBjobLine: re.Pattern = re.compile(
-            r"^(?P<id>\d+)\s+(?P<user>[^\s]+)\s+(?P<state>[^\s]+)\s+"
-            r"(?P<queue>[^\s]+)\s+(?P<from_host>[^\s]+)\s+"
-            r"((?P<exec_host>[\w\-]+)|(?P<no_exec_host>\s{9}))\s+"
-            r"(?P<job_name>[^\s]+)\s+(?P<month>\w+)\s+"
-            r"(?P<day>\d+)\s+(?P<hour>\d+):(?P<minute>\d+)"
-        )
+        # Jobs submitted as part of a job array are reported as 'Job <id[index]> is submitted'
+        reJobSubmitted: re.Pattern = re.compile(r"Job\s<(?P<id>\d+)(\[(?P<idx>\d+)\])?> is submitted")
 
         with self._lockJobData:
-            self._dicLsfJobInfo: dict[int, CLsfJobInfo] = dict()
-            self._dicJobIdxToLsfId: dict[int, int] = dict()
+            self._dicLsfJobInfo: dict[tuple[int, int], CLsfJobInfo] = dict()
+            self._dicJobIdxToLsfId: dict[int, tuple[int, int]] = dict()
         # endwith
 
         # #######################################################################
@@ -518,19 +593,29 @@ class CActionExecutorLsf(CActionExecutor):
         # In this loop we:
         # - capture the output of the lsf job submission jobs and capture the
         #   LSF job ids to associate them with the job indices.
-        # - capture the output of the bjobs parallel thread
-        # - if a full bjobs output has been received, analyze whether new jobs
-        #   are added, whether they are running or were removed.
-
-        lBjobsText: list[str] = []
-        setBpeekStartLsfJobId: set[int] = set()
-        setBjobsFound: set[int] = set()
-        setTerminatingLsfJob: set[int] = set()
-        dicLoadLsfOutputTexts: dict[int, Path] = dict()
+        # - poll the state of the submitted jobs with the LSF job monitor,
+        #   which only queries bjobs for our jobs and backs off while nothing changes.
+        #   State changes are handled by _OnLsfJobEvent().
+
+        setTerminatingLsfJob: set[tuple[int, int]] = set()
+        # Indices of ended jobs, whose output files have not been read completely
+        setEndedLsfJobs: set[int] = set()
+        self._dicLsfOutputTails.clear()
+        self._dicLsfOutputTailType.clear()
+
+        xMonitor = CLsfJobMonitor()
+        xMonitor.AddHandlerEvent(
+            lambda xEvent: self._OnLsfJobEvent(
+                xEvent, _setTerminatingLsfJob=setTerminatingLsfJob, _setEndedLsfJobs=setEndedLsfJobs
+            )
+        )
 
         bTestJobSubmisson: bool = True
         bTerminating: bool = False
-        iEmptyBjobsOutputCount: int = 0
+        # Maximal time between two iterations of the main loop
+        fLoopInterval_s: float = 0.5
+        # Number of failed bjobs calls in a row, after which the main loop ends
+        iMaxQueryErrorCount: int = 10
 
         while True:
             if self._evTerminateAll.is_set() and bTerminating is False:
@@ -561,15 +646,21 @@ class CActionExecutorLsf(CActionExecutor):
                             if xMatch is not None:
                                 self._lLsfJobStatus[iJobIdx] = ELsfJobStatus.SUBMITTED
                                 iLsfId: int = int(xMatch.group("id"))
-                                self._dicLsfJobInfo[iLsfId] = CLsfJobInfo(
-                                    iLsfId=iLsfId, iJobIdx=iJobIdx, eStatus=ELsfJobStatus.SUBMITTED
+                                iArrayIdx: int = int(xMatch.group("idx") or 0)
+                                self._dicLsfJobInfo[(iLsfId, iArrayIdx)] = CLsfJobInfo(
+                                    iLsfId=iLsfId,
+                                    iArrayIdx=iArrayIdx,
+                                    iJobIdx=iJobIdx,
+                                    eStatus=ELsfJobStatus.SUBMITTED,
                                 )
-                                self._dicJobIdxToLsfId[iJobIdx] = iLsfId
+                                self._dicJobIdxToLsfId[iJobIdx] = (iLsfId, iArrayIdx)
+                                xMonitor.AddJob(iLsfId, iArrayIdx)
                                 # print(f"Submitted job {iJobIdx} with LSF index {iLsfId}")
                                 xProcHandler = self._lJobProcHandler[iJobIdx]
                                 if xProcHandler.bStdOutAvailable:
-                                    xProcHandler.StdOut(f"--- Job {iJobIdx} submitted with id {iLsfId} ---\n")
-                                    xProcHandler.StdOut("--- Full output available when job ended ---\n")
+                                    sLsfId: str = self._GetLsfJobIdText(iLsfId, iArrayIdx)
+                                    xProcHandler.StdOut(f"--- Job {iJobIdx} submitted with id {sLsfId} ---\n")
+                                    xProcHandler.StdOut("--- Output shown as written to the LSF output files ---\n")
                                     xProcHandler.StdOut("------\n")
                                 # endif
                                 break
@@ -583,126 +674,17 @@ class CActionExecutorLsf(CActionExecutor):
                 # endif
             # endif
 
-            lBjobsText = self._DoExecuteSingleBjobs()
-            setBjobsFound.clear()
+            xMonitor.Poll()
 
-            # if bBjobsStartFound is True and bBjobsEndFound is True:
-            for sLine in lBjobsText:
-                # print(f"BJOB: {sLine}")
-                xMatch = reBjobLine.match(sLine)
-                if xMatch is None:
-                    # print("> no job info line")
-                    continue
-                # endif
-                iLsfId = int(xMatch.group("id"))
-                if iLsfId not in self._dicLsfJobInfo:
-                    # print(f"> LSF Job id {iLsfId} not in list of submitted jobs")
-                    continue
-                # endif
-
-                setBjobsFound.add(iLsfId)
-                # print(f"Found bjob {iLsfId}")
-
-                xLsfJobInfo: CLsfJobInfo = self._dicLsfJobInfo[iLsfId]
-                sState = xMatch.group("state")
-                if sState == "PEND" and xLsfJobInfo.eStatus != ELsfJobStatus.PENDING:
-                    # print("State PENDING")
-                    with self._lockJobData:
-                        xLsfJobInfo.eStatus = ELsfJobStatus.PENDING
-                        self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.STARTING
-                        self._setJobStatusChanged.add(xLsfJobInfo.iJobIdx)
-                    # endwith lock
-                elif sState == "RUN" and xLsfJobInfo.eStatus in [
-                    ELsfJobStatus.PENDING,
-                    ELsfJobStatus.SUBMITTED,
-                ]:
-                    # print("State change to RUNNING")
-                    setBpeekStartLsfJobId.add(iLsfId)
-                    with self._lockJobData:
-                        xLsfJobInfo.eStatus = ELsfJobStatus.RUNNING
-                        xLsfJobInfo.sExecHost = xMatch.group("exec_host")
-                        self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.RUNNING
-                        self._setJobStatusChanged.add(xLsfJobInfo.iJobIdx)
-                    # endwith lock
-                # endif
-
-                self._lLsfJobStatus[xLsfJobInfo.iJobIdx] = xLsfJobInfo.eStatus
-
-                if not isinstance(xLsfJobInfo.sUser, str):
-                    with self._lockJobData:
-                        xLsfJobInfo.sUser = xMatch.group("user")
-                        xLsfJobInfo.sFromHost = xMatch.group("from_host")
-                        xLsfJobInfo.sQueue = xMatch.group("queue")
-                        xLsfJobInfo.sJobName = xMatch.group("job_name")
-
-                        sMonth: str = xMatch.group("month")
-                        sDay: str = xMatch.group("day")
-                        sHour: str = xMatch.group("hour")
-                        sMinute: str = xMatch.group("minute")
-
-                        sDate: str = f"{sMonth} {sDay} {sHour}:{sMinute}"
-                        xLsfJobInfo.dtLaunch = datetime.strptime(sDate, "%b %d %H:%M")
-                    # endwith lock
-                # endif
-
-                # print(f"{iLsfId} [{xLsfJobInfo.iJobIdx}]: {xLsfJobInfo.eStatus} ({sState})")
-            # endfor bjob lines
-            # bBjobsStartFound = False
-            # bBjobsEndFound = False
-            lBjobsText.clear()
-
-            # Check whether jobs that were previously started are no longer in bjobs output
-            for iLsfId in self._dicLsfJobInfo:
-                xLsfJobInfo = self._dicLsfJobInfo[iLsfId]
-                if iLsfId not in setBjobsFound and xLsfJobInfo.eStatus in [
-                    ELsfJobStatus.PENDING,
-                    ELsfJobStatus.RUNNING,
-                ]:
-                    if xLsfJobInfo.eStatus == ELsfJobStatus.PENDING or iLsfId in setTerminatingLsfJob:
-                        xLsfJobInfo.eStatus = ELsfJobStatus.TERMINATED
-                    else:
-                        xLsfJobInfo.eStatus = ELsfJobStatus.ENDED
-                    # endif
-
-                    self._lLsfJobStatus[xLsfJobInfo.iJobIdx] = xLsfJobInfo.eStatus
-
-                    with self._lockJobData:
-                        if xLsfJobInfo.eStatus == ELsfJobStatus.TERMINATED:
-                            self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.TERMINATED
-                        else:
-                            self._lJobStatus[xLsfJobInfo.iJobIdx] = EJobStatus.ENDED
-                        # endif
-                        self._setJobStatusChanged.add(xLsfJobInfo.iJobIdx)
+            self.UpdateLsfTextFiles(setEndedLsfJobs)
 
-                        xPrj: CProject = self._xAction.xProject
-                        xWorkspace: CWorkspace = xPrj.xWorkspace
-                        pathLsf: Path = xWorkspace.pathWorkspace / "lsf" / f"{iLsfId}"
-                        dicLoadLsfOutputTexts[xLsfJobInfo.iJobIdx] = pathLsf
-                    # endwith
-
-                    # print(f"Job {xLsfJobInfo.iJobIdx} with LSF id {iLsfId} ENDED with state {xLsfJobInfo.eStatus}")
-                # endif
-            # endfor
-
-            self.UpdateLsfTextFiles(dicLoadLsfOutputTexts)
-
-            # This is a fail-safe, to end this thread, if the bjobs call
-            # does not return output for any jobs that we have submitted
-            # but the jos themselves are not triggered to end- for some
-            # reason. In this case, the main loop ends if this happens
-            # 10 times in a row.
-            if len(setBjobsFound) == 0 and len(self._dicLsfJobInfo) > 0:
-                iEmptyBjobsOutputCount += 1
-            else:
-                iEmptyBjobsOutputCount = 0
+            # Test whether all submitted jobs have ended
+            if bTestJobSubmisson is False and not xMonitor.bHasActiveJobs:
+                break
             # endif
 
-            # Test whether all jobs have ended
-            if (
-                all((x == ELsfJobStatus.ENDED or x == ELsfJobStatus.TERMINATED) for x in self._lLsfJobStatus)
-                or iEmptyBjobsOutputCount >= 10
-            ):
-                # print("All jobs ENDED")
+            # This is a fail-safe, to end this thread, if bjobs cannot be called
+            if xMonitor.iQueryErrorCount >= iMaxQueryErrorCount:
                 break
             # endif
 
@@ -712,82 +694,107 @@ class CActionExecutorLsf(CActionExecutor):
             xProcHandler: CProcessHandler = None
             for iJobIdx, xProcHandler in enumerate(self._lJobProcHandler):
                 if xProcHandler.PollTerminate() is True:
-                    iLsfId = self._dicJobIdxToLsfId.get(iJobIdx)
-                    if iLsfId is not None and iLsfId not in setTerminatingLsfJob:
-                        # print(f"Terminating LSF Job {iLsfId} [{iJobIdx}]")
-                        setTerminatingLsfJob.add(iLsfId)
-                        self._DoTerminateLsfJob(_iLsfJobId=iLsfId)
+                    tLsfId: tuple[int, int] = self._dicJobIdxToLsfId.get(iJobIdx)
+                    if tLsfId is not None and tLsfId not in setTerminatingLsfJob:
+                        # print(f"Terminating LSF Job {tLsfId} [{iJobIdx}]")
+                        setTerminatingLsfJob.add(tLsfId)
+                        self._DoTerminateLsfJob(_iLsfJobId=tLsfId[0], _iArrayIdx=tLsfId[1])
+                        xMonitor.Notify()
                     # endif
                 # endif
             # endfor
 
-            time.sleep(1)
+            time.sleep(min(fLoopInterval_s, max(0.05, xMonitor.fTimeToNextPoll_s)))
 
         # endwhile main loop
 
         time.sleep(1)
-        self.UpdateLsfTextFiles(dicLoadLsfOutputTexts)
+        self.UpdateLsfTextFiles(setEndedLsfJobs)
+
+        if xMonitor.iQueryErrorCount >= iMaxQueryErrorCount:
+            print("ERROR: bjobs failed repeatedly but job management threads still running. Cleaning up...")
+        # endif
 
-        if iEmptyBjobsOutputCount >= 10:
-            print("ERROR: bjobs shows no jobs but job management threads still running. Cleaning up...")
+    # enddef
+
+    # ##################################################################################################
+    # The output of LSF jobs is written to 'lsf/[id]' in the workspace and for elements of
+    # job arrays to 'lsf/[id]/[index]'.
+    def _GetLsfOutputPath(self, _iLsfId: int, _iArrayIdx: int) -> Path:
+        xPrj: CProject = self._xAction.xProject
+        xWorkspace: CWorkspace = xPrj.xWorkspace
+        pathLsf: Path = xWorkspace.pathWorkspace / "lsf" / f"{_iLsfId}"
+        if _iArrayIdx > 0:
+            pathLsf = pathLsf / f"{_iArrayIdx}"
         # endif
+        return pathLsf
 
     # enddef
 
-    def UpdateLsfTextFiles(self, _dicLoadLsfOutputTexts: dict[int, Path]):
+    # ##################################################################################################
+    def _StartLsfOutputTail(self, _iJobIdx: int, _iLsfId: int, _iArrayIdx: int):
+        if _iJobIdx in self._dicLsfOutputTails:
+            return
+        # endif
+        pathLsf: Path = self._GetLsfOutputPath(_iLsfId, _iArrayIdx)
+        self._dicLsfOutputTails[_iJobIdx] = {
+            EOutputType.STD: CFileTail(pathLsf / "stdout.txt"),
+            EOutputType.ERR: CFileTail(pathLsf / "stderr.txt"),
+        }
+
+    # enddef
+
+    # ##################################################################################################
+    # Pass the new lines of the LSF output files of all running and ended jobs to the job process handlers.
+    # Ended jobs are no longer read, when both output files exist and have been read completely.
+    def UpdateLsfTextFiles(self, _setEndedLsfJobs: set[int]):
         lRemove: list[int] = []
-        for iJobIdx, pathLsf in _dicLoadLsfOutputTexts.items():
-            bOk = self.LoadLsfTextFiles(iJobIdx, pathLsf)
-            if bOk is True:
+        for iJobIdx in self._dicLsfOutputTails:
+            bEnded: bool = iJobIdx in _setEndedLsfJobs
+            bComplete = self.LoadLsfTextFiles(iJobIdx, _bFinal=bEnded)
+            if bEnded is True and bComplete is True:
                 lRemove.append(iJobIdx)
             # endif
         # endfor
         for iJobIdx in lRemove:
-            del _dicLoadLsfOutputTexts[iJobIdx]
+            del self._dicLsfOutputTails[iJobIdx]
+            _setEndedLsfJobs.discard(iJobIdx)
         # endfor
 
     # enddef
 
-    def LoadLsfTextFiles(self, _iJobIdx: int, _pathLsf: Path) -> bool:
-        bOk = True
-        if _pathLsf.exists():
-            # print(f"LSF path exists: {pathLsf}")
-            xProcHandler = self._lJobProcHandler[_iJobIdx]
-            if xProcHandler.bStdOutAvailable:
-                pathStdOut = _pathLsf / "stdout.txt"
-                if pathStdOut.exists():
-                    # print(">> stdout.txt exists")
-                    sText = pathStdOut.read_text()
-                    lLines = sText.splitlines(keepends=True)
+    # ##################################################################################################
+    # Read the new lines of the LSF output files of a job. Returns true, if both files exist
+    # and no new lines were read. If '_bFinal' is true, incomplete last lines are also passed on.
+    def LoadLsfTextFiles(self, _iJobIdx: int, *, _bFinal: bool = False) -> bool:
+        dicTails: dict[EOutputType, CFileTail] = self._dicLsfOutputTails[_iJobIdx]
+        xProcHandler = self._lJobProcHandler[_iJobIdx]
+        bComplete: bool = True
+
+        for eOutType, xTail in dicTails.items():
+            lLines: list[str] = xTail.ReadLines(_bFlush=_bFinal)
+            if xTail.bExists is False or len(lLines) > 0:
+                bComplete = False
+            # endif
+            if len(lLines) == 0 or not xProcHandler.bStdOutAvailable:
+                continue
+            # endif
+
+            if self._dicLsfOutputTailType.get(_iJobIdx) != eOutType:
+                if eOutType == EOutputType.STD:
                     xProcHandler.StdOut("<< output from stdout >>")
-                    for sLine in lLines:
-                        xProcHandler.StdOut(sLine)
-                    # endfor
                 else:
-                    bOk = False
-                # endif
-
-                pathStdErr = _pathLsf / "stderr.txt"
-                if pathStdErr.exists():
-                    # print(">> stderr.txt exists")
-                    sText = pathStdErr.read_text()
-                    lLines = sText.splitlines(keepends=True)
                     xProcHandler.StdOut("<< output from stderr >>")
-                    for sLine in lLines:
-                        xProcHandler.StdOut(sLine)
-                    # endfor
-                else:
-                    bOk = False
                 # endif
-
+                self._dicLsfOutputTailType[_iJobIdx] = eOutType
             # endif
-        else:
-            bOk = False
-        # endif
+            for sLine in lLines:
+                xProcHandler.StdOut(sLine)
+            # endfor
+        # endfor
 
-        return bOk
+        return bComplete
 
     # enddef
 
-
 # endclass
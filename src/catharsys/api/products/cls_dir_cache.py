@@ -0,0 +1,229 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import os
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, Future
+
+
+@dataclass
+class CDirListing:
+    # Stat fingerprint of the directory at the time of listing.
+    # None, if the listing must not be reused by a later scan.
+    tKey: Optional[tuple]
+    # Entry names in the order returned by the file system
+    tNames: tuple[str, ...]
+    # Entry types: 'd' directory, 'f' file, 'o' other
+    sTypes: str
+
+
+# endclass
+
+
+# ##########################################################################################################
+# Cache of directory listings used by the file system scans of the products.
+# A directory is only listed again, if its stat fingerprint differs from the listing
+# of a previous scan. As the content of a directory can only change by adding, removing
+# or renaming entries, which changes the directory modification time, a scan with
+# reused listings results in the same tree as a full scan.
+#
+# If more than one worker is given, directories passed to Prefetch() are listed
+# by a thread pool, so that the latency of network file systems is overlapped.
+# The listings are only ever consumed by the scanning thread.
+class CDirCache:
+    # Directories modified less than this time before they were listed, are always
+    # listed again, as further changes may not change the modification time.
+    c_iRacyTimeNs: int = 2 * 10**9
+
+    def __init__(
+        self,
+        *,
+        _dicPrevious: Optional[dict[str, tuple]] = None,
+        _bCompareInode: bool = False,
+        _iWorkers: int = 1,
+    ):
+        self._dicPrevious: dict[str, tuple] = _dicPrevious if _dicPrevious is not None else dict()
+        self._dicListings: dict[str, CDirListing] = dict()
+        self._dicPending: dict[str, Future] = dict()
+        self._bCompareInode: bool = _bCompareInode
+        self._iWorkers: int = max(1, _iWorkers)
+        self._xExecutor: ThreadPoolExecutor = None
+        self._iListed: int = 0
+        self._iReused: int = 0
+
+    # enddef
+
+    @property
+    def iListed(self) -> int:
+        return self._iListed
+
+    # enddef
+
+    @property
+    def iReused(self) -> int:
+        return self._iReused
+
+    # enddef
+
+    # ######################################################################################################
+    def _GetKey(self, _xStat: os.stat_result) -> tuple:
+        if self._bCompareInode is True:
+            return (_xStat.st_mtime_ns, _xStat.st_ino, _xStat.st_size)
+        # endif
+        return (_xStat.st_mtime_ns,)
+
+    # enddef
+
+    # ######################################################################################################
+    # Read the listing of a directory or reuse the previous one.
+    # Returns the listing and whether it was reused. May run in a worker thread.
+    def _ReadListing(self, _sPath: str) -> tuple[CDirListing, bool]:
+        xStat = os.stat(_sPath)
+        tKey: tuple = self._GetKey(xStat)
+
+        tPrev: tuple = self._dicPrevious.get(_sPath)
+        if tPrev is not None and tPrev[0] == tKey:
+            return CDirListing(*tPrev), True
+        # endif
+
+        iTimeNs = time.time_ns()
+        lNames: list[str] = []
+        lTypes: list[str] = []
+        with os.scandir(_sPath) as xIter:
+            for xEntry in xIter:
+                lNames.append(xEntry.name)
+                if xEntry.is_dir():
+                    lTypes.append("d")
+                elif xEntry.is_file():
+                    lTypes.append("f")
+                else:
+                    lTypes.append("o")
+                # endif
+            # endfor
+        # endwith
+
+        if xStat.st_mtime_ns > iTimeNs - self.c_iRacyTimeNs:
+            tKey = None
+        # endif
+        return CDirListing(tKey, tuple(lNames), "".join(lTypes)), False
+
+    # enddef
+
+    # ######################################################################################################
+    # Start listing the given directories in the thread pool. Errors are raised,
+    # when the listing of the respective directory is requested by GetListing().
+    def Prefetch(self, _lPathDirs: list[Path]):
+        if self._iWorkers <= 1 or len(_lPathDirs) == 0:
+            return
+        # endif
+
+        if self._xExecutor is None:
+            self._xExecutor = ThreadPoolExecutor(max_workers=self._iWorkers, thread_name_prefix="dir-scan")
+        # endif
+
+        for pathDir in _lPathDirs:
+            sPath: str = pathDir.as_posix()
+            if sPath in self._dicListings or sPath in self._dicPending:
+                continue
+            # endif
+            self._dicPending[sPath] = self._xExecutor.submit(self._ReadListing, sPath)
+        # endfor
+
+    # enddef
+
+    # ######################################################################################################
+    # Shut down the thread pool. Pending listings are discarded.
+    def Close(self):
+        if self._xExecutor is not None:
+            for xFuture in self._dicPending.values():
+                xFuture.cancel()
+            # endfor
+            self._dicPending.clear()
+            self._xExecutor.shutdown(wait=True)
+            self._xExecutor = None
+        # endif
+
+    # enddef
+
+    # ######################################################################################################
+    def GetListing(self, _pathDir: Path) -> CDirListing:
+        sPath: str = _pathDir.as_posix()
+        xListing: CDirListing = self._dicListings.get(sPath)
+        if xListing is not None:
+            return xListing
+        # endif
+
+        xFuture: Future = self._dicPending.pop(sPath, None)
+        if xFuture is not None:
+            xListing, bReused = xFuture.result()
+        else:
+            xListing, bReused = self._ReadListing(sPath)
+        # endif
+
+        if bReused is True:
+            self._iReused += 1
+        else:
+            self._iListed += 1
+        # endif
+
+        self._dicListings[sPath] = xListing
+        return xListing
+
+    # enddef
+
+    # ######################################################################################################
+    # Iterate over all entries of a directory, like Path.iterdir().
+    # Yields tuples (path, is directory, is file).
+    def IterDir(self, _pathDir: Path) -> Iterator[tuple[Path, bool, bool]]:
+        xListing = self.GetListing(_pathDir)
+        for sName, cType in zip(xListing.tNames, xListing.sTypes):
+            yield (_pathDir / sName, cType == "d", cType == "f")
+        # endfor
+
+    # enddef
+
+    # ######################################################################################################
+    # Keep the previous listings of all directories that have not been listed in this scan.
+    # Used when only part of the products is scanned.
+    def KeepPrevious(self):
+        for sPath, tPrev in self._dicPrevious.items():
+            if sPath not in self._dicListings:
+                self._dicListings[sPath] = CDirListing(*tPrev)
+            # endif
+        # endfor
+
+    # enddef
+
+    # ######################################################################################################
+    def Serialize(self) -> dict[str, tuple]:
+        return {
+            sPath: (xListing.tKey, xListing.tNames, xListing.sTypes)
+            for sPath, xListing in self._dicListings.items()
+            if xListing.tKey is not None
+        }
+
+    # enddef
+
+
+# endclass
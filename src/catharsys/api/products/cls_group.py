@@ -22,6 +22,7 @@
 
 import re
 import json
+import functools
 
 from pathlib import Path
 from dataclasses import dataclass
@@ -40,6 +41,8 @@ from anybase.cls_any_error import CAnyError_Message
 
 from .cls_node import CNode, ENodeType
 from .cls_path_structure import CPathStructure, CPathVar, EPathVarType
+from .cls_dir_cache import CDirCache
+from .cls_scan_columns import CScanColumns
 from .cls_category_collection import CCategoryCollection, CCategory
 from .cls_category_data import CCategoryData
 
@@ -83,6 +86,8 @@ class CGroup:
         self._xPathStruct: CPathStructure = None
         self._dicArtTypes: dict[str, CArtefactType] = None
         self._xTree: CNode = None
+        # Columns of a loaded scan, from which the tree is created on first access
+        self._xScanColumns: Optional[CScanColumns] = None
         self._xCatCln: CCategoryCollection = CCategoryCollection()
         self._xCatData: CCategoryData = CCategoryData()
         self._pathOutput: Path | None = _pathOutput
@@ -101,6 +106,9 @@ class CGroup:
 
     @property
     def xTree(self) -> CNode:
+        if self._xTree is None and self._xScanColumns is not None:
+            self._xTree = self._CreateTreeFromColumns()
+        # endif
         return self._xTree
 
     # enddef
@@ -114,6 +122,9 @@ class CGroup:
     @property
     def bHasData(self) -> bool:
         if self._xTree is None:
+            if self._xScanColumns is not None:
+                return self._xScanColumns.GetChildCount(0) > 0
+            # endif
             return False
         # endif
         return len(self._xTree.children) > 0
@@ -370,12 +381,7 @@ class CGroup:
             lChildren.append(self._DoSerializeNode(xChild))
         # endfor
 
-        xData = None
-        if isinstance(_xNode._xData, CArtefactType):
-            xData = f"CArtefactType({_xNode._xData.sId})"
-        else:
-            xData = _xNode._xData
-        # endif
+        xData = self._GetSerialNodeData(_xNode._xData)
 
         if _xNode.name == _xNode._sPathName:
             sPathName = None
@@ -387,11 +393,20 @@ class CGroup:
 
     # enddef
 
+    # ######################################################################################################
+    def _GetSerialNodeData(self, _xData: Any) -> Any:
+        if isinstance(_xData, CArtefactType):
+            return f"CArtefactType({_xData.sId})"
+        # endif
+        return _xData
+
+    # enddef
+
     # ######################################################################################################
     def SerializeScan(self) -> list[tuple]:
         lChildren = []
         if self.bHasData is True:
-            for xChild in self._xTree.children:
+            for xChild in self.xTree.children:
                 lChildren.append(self._DoSerializeNode(xChild))
             # endfor
         # endif
@@ -412,16 +427,7 @@ class CGroup:
             sPathName = sName
         # endif
 
-        xNode: CNode
-        if isinstance(xData, str) and xData.startswith("CArtefactType("):
-            xArtType = self._dicArtTypes.get(sName)
-            if xArtType is None:
-                raise RuntimeError(f"Invalid artefact type '{sName}'")
-            # endif
-            xNode = CNode(sName, parent=_xParent, _iLevel=0, _eType=ENodeType.ARTGROUP, _xData=xArtType)
-        else:
-            xNode = CNode(sName, parent=_xParent, _iLevel=iLevel, _eType=iType, _sPathName=sPathName, _xData=xData)
-        # endif
+        xNode: CNode = self._CreateSerialNode(_xParent, sName, sPathName, iLevel, iType, xData)
 
         for tChild in lChildren:
             self._DoDeserializeNode(xNode, tChild)
@@ -429,8 +435,26 @@ class CGroup:
 
     # enddef
 
+    # ######################################################################################################
+    def _CreateSerialNode(
+        self, _xParent: CNode, _sName: str, _sPathName: str, _iLevel: int, _iType: int, _xData: Any
+    ) -> CNode:
+        if isinstance(_xData, str) and _xData.startswith("CArtefactType("):
+            xArtType = self._dicArtTypes.get(_sName)
+            if xArtType is None:
+                raise RuntimeError(f"Invalid artefact type '{_sName}'")
+            # endif
+            return CNode(_sName, parent=_xParent, _iLevel=0, _eType=ENodeType.ARTGROUP, _xData=xArtType)
+        # endif
+        return CNode(
+            _sName, parent=_xParent, _iLevel=_iLevel, _eType=ENodeType(_iType), _sPathName=_sPathName, _xData=_xData
+        )
+
+    # enddef
+
     # ######################################################################################################
     def DeserializeScan(self, _lChildren: list[tuple]):
+        self._xScanColumns = None
         self._xTree = CNode(self._sId, _iLevel=0, _eType=ENodeType.GROUP, _xData=self)
         for tChild in _lChildren:
             self._DoDeserializeNode(self._xTree, tChild)
@@ -438,6 +462,92 @@ class CGroup:
 
     # enddef
 
+    # ######################################################################################################
+    # Get the scan as columns. Returns None, if there is no scan.
+    def GetScanColumns(self) -> Optional[CScanColumns]:
+        if self._xTree is None:
+            return self._xScanColumns
+        # endif
+        return CScanColumns.FromTree(self._xTree, self._GetSerialNodeData)
+
+    # enddef
+
+    # ######################################################################################################
+    # Use the columns of a loaded scan. Queries on the group variable values are answered
+    # from the columns directly. The nodes of the tree are only created, when they are accessed.
+    def DeserializeScanColumns(self, _xColumns: CScanColumns):
+        self._xScanColumns = _xColumns
+        self._xTree = None
+
+    # enddef
+
+    # ######################################################################################################
+    # The children of each node are created from the columns, when they are first accessed
+    def _CreateTreeFromColumns(self) -> CNode:
+        xRoot = CNode(self._sId, _iLevel=0, _eType=ENodeType.GROUP, _xData=self)
+        self._SetColumnChildLoader(xRoot, self._xScanColumns, 0)
+        return xRoot
+
+    # enddef
+
+    # ######################################################################################################
+    def _SetColumnChildLoader(self, _xNode: CNode, _xColumns: CScanColumns, _iNode: int):
+        if _xColumns.GetChildCount(_iNode) > 0:
+            _xNode.SetChildLoader(functools.partial(self._LoadColumnChildren, _xColumns=_xColumns, _iNode=_iNode))
+        # endif
+
+    # enddef
+
+    # ######################################################################################################
+    def _LoadColumnChildren(self, _xNode: CNode, *, _xColumns: CScanColumns, _iNode: int):
+        for iChild in _xColumns.GetChildren(_iNode).tolist():
+            xChild = self._CreateSerialNode(
+                _xNode,
+                _xColumns.GetName(iChild),
+                _xColumns.GetPathName(iChild),
+                _xColumns.GetLevel(iChild),
+                _xColumns.GetType(iChild),
+                _xColumns.GetData(iChild),
+            )
+            self._SetColumnChildLoader(xChild, _xColumns, iChild)
+        # endfor
+
+    # enddef
+
+    # ######################################################################################################
+    def _ScanArtefactTypeNode(
+        self, _xArtTypeNode: CNode, *, _xArtType: CArtefactType, _pathScan: Path, _xDirCache: CDirCache
+    ):
+        _xArtType.xPathStruct.ScanFileSystem(
+            _pathScan=_pathScan,
+            _nodeParent=_xArtTypeNode,
+            _iLevel=0,
+            _xDirCache=_xDirCache,
+        )
+
+    # enddef
+
+    # ######################################################################################################
+    # Child loader of artefact type nodes for lazy scans. The directory cache is shared with the
+    # scan of the group paths, which has been closed when the loader is called. Closing the cache
+    # again shuts down the thread pool that is started by prefetching directories in this scan.
+    def _LoadArtefactTypeNode(
+        self, _xArtTypeNode: CNode, *, _xArtType: CArtefactType, _pathScan: Path, _xDirCache: CDirCache
+    ):
+        try:
+            self._ScanArtefactTypeNode(_xArtTypeNode, _xArtType=_xArtType, _pathScan=_pathScan, _xDirCache=_xDirCache)
+        finally:
+            _xDirCache.Close()
+        # endtry
+
+    # enddef
+
+    # ######################################################################################################
+    def _IsTreeLoaded(self) -> bool:
+        return self._xTree is not None or self._xScanColumns is None
+
+    # enddef
+
     # ######################################################################################################
     def ScanArtefacts(
         self,
@@ -445,18 +555,28 @@ class CGroup:
         _funcStatus: Optional[Callable[[str], None]] = None,
         _funcIterInit: Optional[Callable[[str, int], None]] = None,
         _funcIterUpdate: Optional[Callable[[int], None]] = None,
+        _xDirCache: Optional[CDirCache] = None,
+        _bLazyArtefacts: bool = False,
     ):
+        # If '_bLazyArtefacts' is true, only the group paths are scanned. The artefacts of a
+        # group path are scanned, when the children of its artefact type node are first accessed.
         if _funcStatus is not None:
             _funcStatus("Scanning group paths...")
         # endif
 
+        if _xDirCache is None:
+            _xDirCache = CDirCache()
+        # endif
+
         # Scan group path structure
         pathScan: Path = None
+        self._xScanColumns = None
         self._xTree = CNode(self._sId, _iLevel=0, _eType=ENodeType.GROUP, _xData=self)
         self._xPathStruct.ScanFileSystem(
             _pathScan=pathScan,
             _nodeParent=self._xTree,
             _iLevel=0,
+            _xDirCache=_xDirCache,
         )
         iMaxGroupLevel: int = self._xPathStruct.iMaxLevel
 
@@ -495,6 +615,29 @@ class CGroup:
 
         bHasFuncIter: bool = _funcIterInit is not None and _funcIterUpdate is not None
 
+        if _bLazyArtefacts is True:
+            for xNode in tGroupLeafNodes:
+                pathScan = xNode.pathFS
+                for sArtTypeId, xArtType in self._dicArtTypes.items():
+                    xArtTypeNode = CNode(
+                        sArtTypeId, parent=xNode, _iLevel=0, _eType=ENodeType.ARTGROUP, _xData=xArtType
+                    )
+                    xArtTypeNode.SetChildLoader(
+                        functools.partial(
+                            self._LoadArtefactTypeNode, _xArtType=xArtType, _pathScan=pathScan, _xDirCache=_xDirCache
+                        )
+                    )
+                # endfor
+            # endfor
+            return
+        # endif
+
+        # List the artefact folders ahead of the artefact scans
+        lGroupLeafPaths: list[Path] = [xNode.pathFS for xNode in tGroupLeafNodes]
+        for xArtType in self._dicArtTypes.values():
+            xArtType.xPathStruct.PrefetchDirs(_xDirCache=_xDirCache, _lPathScan=lGroupLeafPaths, _iLevel=0)
+        # endfor
+
         # Scan all artefact types
         sArtTypeId: str = ""
         for sArtTypeId in self._dicArtTypes:
@@ -511,10 +654,8 @@ class CGroup:
                 # endif
 
                 xArtTypeNode = CNode(sArtTypeId, parent=xNode, _iLevel=0, _eType=ENodeType.ARTGROUP, _xData=xArtType)
-                xArtType.xPathStruct.ScanFileSystem(
-                    _pathScan=xNode.pathFS,
-                    _nodeParent=xArtTypeNode,
-                    _iLevel=0,
+                self._ScanArtefactTypeNode(
+                    xArtTypeNode, _xArtType=xArtType, _pathScan=xNode.pathFS, _xDirCache=_xDirCache
                 )
             # endfor
             if bHasFuncIter is True:
@@ -565,6 +706,13 @@ class CGroup:
     # ######################################################################################################
     def _GetVarValueLists(self, *, _xNode: CNode, _iMaxLevel: int) -> list[list[str]]:
         lVarValueSets = self._GetVarValueSets(_xNode=_xNode, _iMaxLevel=_iMaxLevel)
+        return self._SortVarValueSets(lVarValueSets)
+
+    # enddef
+
+    # ######################################################################################################
+    def _SortVarValueSets(self, _lVarValueSets: list[set[str]]) -> list[list[str]]:
+        lVarValueSets = _lVarValueSets
 
         lVarValues = [list(x) for x in lVarValueSets[1:]]
         for lX in lVarValues:
@@ -697,6 +845,9 @@ class CGroup:
     # ######################################################################################################
     def GetGroupVarValueLists(self) -> list[list[str]]:
         iGroupVarCnt: int = self._xPathStruct.iPathVarCount
+        if not self._IsTreeLoaded():
+            return self._SortVarValueSets(self._xScanColumns.GetLevelNameSets(0, iGroupVarCnt + 1))
+        # endif
         return self._GetVarValueLists(_xNode=self._xTree, _iMaxLevel=iGroupVarCnt + 1)
 
     # enddef
@@ -722,7 +873,7 @@ class CGroup:
 
         # Find those group leaf nodes whose path satisfies the group variable value selections
         lValues: list[str] = None
-        lNodes: list[CNode] = [self._xTree]
+        lNodes: list[CNode] = [self.xTree]
         for lValues in _lGroupVarValueSelLists:
             lChildNodes: list[CNode] = []
             if len(lValues) == 1 and lValues[0] == "*":
@@ -742,38 +893,86 @@ class CGroup:
 
     # enddef
 
+    # ######################################################################################################
+    # Same as GetGroupVarNodeList() but for the columns of a loaded scan. Returns node indices.
+    def _GetGroupVarNodeIndices(self, _lGroupVarValueSelLists: list[list[str]]) -> list[int]:
+        iGroupVarCnt: int = self._xPathStruct.iPathVarCount
+        if len(_lGroupVarValueSelLists) != iGroupVarCnt:
+            raise RuntimeError(f"The group variable value selection list must have {iGroupVarCnt} elements")
+        # endif
+
+        xColumns: CScanColumns = self._xScanColumns
+        lNodes: list[int] = [0]
+        for lValues in _lGroupVarValueSelLists:
+            lChildNodes: list[int] = []
+            if len(lValues) == 1 and lValues[0] == "*":
+                for iNode in lNodes:
+                    lChildNodes.extend(xColumns.GetChildren(iNode).tolist())
+                # endfor
+            else:
+                setValues = set(lValues)
+                for iNode in lNodes:
+                    lChildNodes.extend(xColumns.GetChildrenByName(iNode, setValues).tolist())
+                # endfor
+            # endif
+            lNodes = lChildNodes
+        # endfor
+
+        return lNodes
+
+    # enddef
+
+    # ######################################################################################################
+    # Iterate over the artefact type ids and variable value sets of the artefacts below the
+    # selected group nodes.
+    def _IterArtVarValueSets(self, _lGroupVarValueSelLists: list[list[str]]):
+        if self._IsTreeLoaded():
+            for xNode in self.GetGroupVarNodeList(_lGroupVarValueSelLists):
+                for xChild in xNode.children:
+                    sArtType: str = str(xChild.name)
+                    iPathVarCount: int = self._dicArtTypes[sArtType].xPathStruct.iPathVarCount
+                    yield sArtType, self._GetVarValueSets(_xNode=xChild, _iMaxLevel=iPathVarCount + 1)[1:]
+                # endfor
+            # endfor
+        else:
+            xColumns: CScanColumns = self._xScanColumns
+            for iNode in self._GetGroupVarNodeIndices(_lGroupVarValueSelLists):
+                for iChild in xColumns.GetChildren(iNode).tolist():
+                    sArtType: str = xColumns.GetName(iChild)
+                    iPathVarCount: int = self._dicArtTypes[sArtType].xPathStruct.iPathVarCount
+                    yield sArtType, xColumns.GetLevelNameSets(iChild, iPathVarCount + 1)[1:]
+                # endfor
+            # endfor
+        # endif
+
+    # enddef
+
     # ######################################################################################################
     def GetArtefactVarValues(
         self, _lGroupVarValueSelLists: list[list[str]], *, _bSameVarValueUnion: bool = True
     ) -> tuple[dict[str, list[list[str]]], dict[str, list[str]]]:
-        lNodes = self.GetGroupVarNodeList(_lGroupVarValueSelLists)
-
         # Create a union over all artefact values of the same type,
         # for different groups paths, e.g. different cameras.
         dicArtVarValueSets: dict[str, list[set[str]]] = dict()
-        for xNode in lNodes:
-            for xChild in xNode.children:
-                sArtType: str = str(xChild.name)
-                iPathVarCount: int = self._dicArtTypes[sArtType].xPathStruct.iPathVarCount
-                lValueSets = self._GetVarValueSets(_xNode=xChild, _iMaxLevel=iPathVarCount + 1)[1:]
-                # if there are no artefacts for a child, then ignore the whole path var list
-                if len(lValueSets) < iPathVarCount:
-                    continue
-                # endif
+        for sArtType, lValueSets in self._IterArtVarValueSets(_lGroupVarValueSelLists):
+            iPathVarCount: int = self._dicArtTypes[sArtType].xPathStruct.iPathVarCount
+            # if there are no artefacts for a child, then ignore the whole path var list
+            if len(lValueSets) < iPathVarCount:
+                continue
+            # endif
 
-                lArtVarValues: list[set[str]] = dicArtVarValueSets.get(sArtType)
-                # print(f"sArtType, lArtVarValues: {sArtType}, {lArtVarValues}")
-                # print(f"lValueSets: {lValueSets}")
+            lArtVarValues: list[set[str]] = dicArtVarValueSets.get(sArtType)
+            # print(f"sArtType, lArtVarValues: {sArtType}, {lArtVarValues}")
+            # print(f"lValueSets: {lValueSets}")
 
-                if lArtVarValues is None:
-                    dicArtVarValueSets[sArtType] = lValueSets
-                else:
-                    for iIdx, setValues in enumerate(lArtVarValues):
-                        setValues.update(lValueSets[iIdx])
-                    # endfor
-                # endif
-            # endfor children
-        # endfor nodes
+            if lArtVarValues is None:
+                dicArtVarValueSets[sArtType] = lValueSets
+            else:
+                for iIdx, setValues in enumerate(lArtVarValues):
+                    setValues.update(lValueSets[iIdx])
+                # endfor
+            # endif
+        # endfor artefact value sets
 
         # print(f"dicArtVarValueSets: {dicArtVarValueSets}")
 
@@ -878,9 +1077,9 @@ class CGroup:
 
     # ######################################################################################################
     def GetGroupVarNode(self, _lGrpPath: list[str]) -> CNode | None:
-        xNode: CNode = self._xTree
+        xNode: CNode = self.xTree
         for sName in _lGrpPath:
-            xNode = next((xChild for xChild in xNode.children if xChild.name == sName), None)
+            xNode = xNode.GetChild(sName)
             if xNode is None:
                 return None
             # endif
@@ -891,13 +1090,13 @@ class CGroup:
 
     # ######################################################################################################
     def GetArtVarNode(self, *, _xNode: CNode, _sArtType: str, _lArtPath: list[str]) -> CNode | None:
-        xNode = next((xChild for xChild in _xNode.children if xChild.name == _sArtType), None)
+        xNode = _xNode.GetChild(_sArtType)
         if xNode is None:
             return None
         # endif
 
         for sName in _lArtPath:
-            xNode = next((xChild for xChild in xNode.children if xChild.name == sName), None)
+            xNode = xNode.GetChild(sName)
             if xNode is None:
                 return None
             # endif
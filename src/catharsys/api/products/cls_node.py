@@ -23,7 +23,7 @@
 import enum
 import anytree
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, Callable
 
 
 class ENodeType(int, enum.Enum):
@@ -50,7 +50,13 @@ class CNode(anytree.NodeMixin):
         _sPathName: Optional[str] = None,
     ):
         super().__init__()
-        self.name = name
+        # Index of the children by name. For children with the same name,
+        # the first one in the children order is referenced.
+        self._dicChildren: dict[str, "CNode"] = dict()
+        # Function that creates the children, when they are first accessed
+        self._funcLoadChildren: Optional[Callable[["CNode"], None]] = None
+        self._bLoadingChildren: bool = False
+        self._sName: str = name
         if _sPathName is not None:
             self._sPathName = _sPathName
         else:
@@ -93,6 +99,143 @@ class CNode(anytree.NodeMixin):
 
     # enddef
 
+    # Call the child loader, if one is set. The loader is only removed, if it succeeds.
+    # Otherwise, the children attached by the loader are detached again.
+    def _LoadChildren(self):
+        if self._funcLoadChildren is None or self._bLoadingChildren is True:
+            return
+        # endif
+
+        self._bLoadingChildren = True
+        try:
+            self._funcLoadChildren(self)
+            self._funcLoadChildren = None
+        except Exception:
+            for xChild in anytree.NodeMixin.children.fget(self):
+                xChild.parent = None
+            # endfor
+            raise
+        finally:
+            self._bLoadingChildren = False
+        # endtry
+
+    # enddef
+
+    # Set a function that creates the children of this node, when they are first accessed.
+    # The function is called with this node as argument and must attach the children to it.
+    def SetChildLoader(self, _funcLoad: Callable[["CNode"], None]):
+        if len(anytree.NodeMixin.children.fget(self)) > 0:
+            raise RuntimeError(f"Cannot set child loader for node '{self.name}', which already has children")
+        # endif
+        self._funcLoadChildren = _funcLoad
+
+    # enddef
+
+    # All anytree functions access the children via the 'children' property, apart from
+    # attaching a node to a parent, 'is_leaf' and 'height'. So these are overridden to load
+    # the children first, if a child loader is set.
+    @property
+    def children(self) -> tuple["CNode", ...]:
+        self._LoadChildren()
+        return anytree.NodeMixin.children.fget(self)
+
+    # enddef
+
+    @children.setter
+    def children(self, _lChildren):
+        self._LoadChildren()
+        anytree.NodeMixin.children.fset(self, _lChildren)
+
+    # enddef
+
+    @children.deleter
+    def children(self):
+        self._LoadChildren()
+        anytree.NodeMixin.children.fdel(self)
+
+    # enddef
+
+    @property
+    def is_leaf(self) -> bool:
+        return len(self.children) == 0
+
+    # enddef
+
+    @property
+    def height(self) -> int:
+        tChildren = self.children
+        if len(tChildren) == 0:
+            return 0
+        # endif
+        return max(xChild.height for xChild in tChildren) + 1
+
+    # enddef
+
+    def _pre_attach(self, parent: "CNode"):
+        if isinstance(parent, CNode):
+            parent._LoadChildren()
+        # endif
+
+    # enddef
+
+    @property
+    def bChildrenLoaded(self) -> bool:
+        return self._funcLoadChildren is None
+
+    # enddef
+
+    # Keep the child index of the parent consistent, as children are attached and detached
+    def _post_attach(self, parent: "CNode"):
+        parent._dicChildren.setdefault(self._sName, self)
+
+    # enddef
+
+    def _post_detach(self, parent: "CNode"):
+        parent._RemoveFromChildIndex(self)
+
+    # enddef
+
+    def _RemoveFromChildIndex(self, _xChild: "CNode"):
+        if self._dicChildren.get(_xChild._sName) is not _xChild:
+            return
+        # endif
+        xNext: CNode = next(
+            (xNode for xNode in self.children if xNode._sName == _xChild._sName and xNode is not _xChild), None
+        )
+        if xNext is None:
+            del self._dicChildren[_xChild._sName]
+        else:
+            self._dicChildren[_xChild._sName] = xNext
+        # endif
+
+    # enddef
+
+    @property
+    def name(self) -> str:
+        return self._sName
+
+    @name.setter
+    def name(self, _sName: str):
+        xParent: CNode = self.parent
+        if xParent is not None:
+            xParent._RemoveFromChildIndex(self)
+        # endif
+        self._sName = _sName
+        if xParent is not None:
+            # Re-insert at the position given by the children order
+            xFirst: CNode = next((xNode for xNode in xParent.children if xNode._sName == _sName), None)
+            xParent._dicChildren[_sName] = xFirst
+        # endif
+
+    # enddef
+
+    # Get the child with the given name or None, if there is no such child
+    def GetChild(self, _sName: str) -> Optional["CNode"]:
+        self._LoadChildren()
+        return self._dicChildren.get(_sName)
+
+    # enddef
+
     @property
     def iLevel(self) -> int:
         return self._iLevel
@@ -28,6 +28,7 @@ from dataclasses import dataclass
 import enum
 
 from .cls_node import CNode, ENodeType
+from .cls_dir_cache import CDirCache
 from .cls_category_collection import CCategoryCollection, CCategory
 
 
@@ -63,6 +64,8 @@ class CPathVar:
     sReReplaceValue: str = None
     funcLabel: Callable[["CPathVar", str], str] = None
     lCategories: list[CCategory] = None
+    # Whether the handler of a system variable lists the directory it is given
+    bListsDir: bool = True
 
 
 # endclass
@@ -245,7 +248,65 @@ class CPathStructure:
     # enddef
 
     # #######################################################################################################################
-    def ScanFileSystem(self, *, _pathScan: Path, _nodeParent: CNode, _iLevel: int):
+    # Get the first directory that is listed, when scanning the given path at the given level.
+    # Leading fixed path elements are appended to the path. Returns None, if no directory is listed.
+    def GetFirstListedPath(self, _pathScan: Path, _iLevel: int) -> Optional[Path]:
+        pathDir: Path = _pathScan
+        for iLevel in range(_iLevel, self.iPathVarCount):
+            xPathVar: CPathVar = self.dicVars[self.lPathVarIds[iLevel]]
+            if xPathVar.eType == EPathVarType.FIXED:
+                if pathDir is None or xPathVar.eNodeType != ENodeType.PATH:
+                    return None
+                # endif
+                pathDir = pathDir / xPathVar.sId
+
+            elif xPathVar.eType in [EPathVarType.USER, EPathVarType.REGEX]:
+                return pathDir
+
+            elif xPathVar.eType == EPathVarType.SYSTEM:
+                if xPathVar.funcHandler is None or not xPathVar.bListsDir:
+                    return None
+                # endif
+                return pathDir
+            else:
+                return None
+            # endif
+        # endfor
+
+        return None
+
+    # enddef
+
+    # #######################################################################################################################
+    # Let the directory cache list the directories ahead, which are listed first when
+    # scanning each of the given paths at the given level.
+    def PrefetchDirs(self, *, _xDirCache: CDirCache, _lPathScan: list[Path], _iLevel: int):
+        if _iLevel >= self.iPathVarCount:
+            return
+        # endif
+
+        lPathDirs: list[Path] = []
+        for pathScan in _lPathScan:
+            pathDir = self.GetFirstListedPath(pathScan, _iLevel)
+            if pathDir is not None:
+                lPathDirs.append(pathDir)
+            # endif
+        # endfor
+        _xDirCache.Prefetch(lPathDirs)
+
+    # enddef
+
+    # #######################################################################################################################
+    # Scan the file system along the path structure and add the found elements to the tree.
+    # The directory listings are obtained from the directory cache, which may list sibling
+    # directories in parallel ahead of the scan. The nodes are always created in listing order.
+    def ScanFileSystem(
+        self, *, _pathScan: Path, _nodeParent: CNode, _iLevel: int, _xDirCache: Optional[CDirCache] = None
+    ):
+        if _xDirCache is None:
+            _xDirCache = CDirCache()
+        # endif
+
         nodeX: CNode = None
         lPathVarIds = self.lPathVarIds
         sPathVarId: str = lPathVarIds[_iLevel]
@@ -254,13 +315,23 @@ class CPathStructure:
         # print(f"lPathVarIds: {lPathVarIds}")
         # print(f"{sPathVarId} ({xPathVar.eType}) in {_pathScan}")
 
+        bScanNextLevel: bool = len(lPathVarIds) > _iLevel + 1
+
         if xPathVar.eType == EPathVarType.SYSTEM:
             if xPathVar.funcHandler is not None:
+                lResults: list[CPathVarHandlerResult] = [
+                    xResult for xResult in xPathVar.funcHandler(_pathScan) if xResult.sName is not None
+                ]
+                if bScanNextLevel:
+                    self.PrefetchDirs(
+                        _xDirCache=_xDirCache,
+                        _lPathScan=[xResult.pathScan for xResult in lResults if xResult.pathScan is not None],
+                        _iLevel=_iLevel + 1,
+                    )
+                # endif
+
                 xResult: CPathVarHandlerResult = None
-                for xResult in xPathVar.funcHandler(_pathScan):
-                    if xResult.sName is None:
-                        continue
-                    # endif
+                for xResult in lResults:
                     nodeX = CNode(
                         xResult.sName,
                         parent=_nodeParent,
@@ -269,11 +340,12 @@ class CPathStructure:
                         _xData=xResult.xData,
                         _sPathName=xResult.sPathName,
                     )
-                    if xResult.pathScan is not None and len(lPathVarIds) > _iLevel + 1:
+                    if xResult.pathScan is not None and bScanNextLevel:
                         self.ScanFileSystem(
                             _pathScan=xResult.pathScan,
                             _nodeParent=nodeX,
                             _iLevel=_iLevel + 1,
+                            _xDirCache=_xDirCache,
                         )
                     # enddef
                 # endfor
@@ -288,15 +360,15 @@ class CPathStructure:
                 reValue = re.compile(xPathVar.sReParseValue)
             # endif
 
-            for pathItem in _pathScan.iterdir():
-                if (xPathVar.eNodeType == ENodeType.PATH and not pathItem.is_dir()) or (
-                    xPathVar.eNodeType == ENodeType.ARTEFACT and not pathItem.is_file()
+            lItems: list[tuple[Path, str]] = []
+            for pathItem, bIsDir, bIsFile in _xDirCache.IterDir(_pathScan):
+                if (xPathVar.eNodeType == ENodeType.PATH and not bIsDir) or (
+                    xPathVar.eNodeType == ENodeType.ARTEFACT and not bIsFile
                 ):
                     continue
                 # endif
 
                 sName = pathItem.name
-                sPathName = pathItem.name
                 if reValue is not None:
                     xMatch = reValue.fullmatch(pathItem.name)
                     if xMatch is None:
@@ -304,15 +376,27 @@ class CPathStructure:
                     # endif
                     sName = xMatch.group(1)
                 # endif
+                lItems.append((pathItem, sName))
+            # endfor
 
+            bScanItems: bool = xPathVar.eNodeType == ENodeType.PATH and bScanNextLevel
+            if bScanItems:
+                self.PrefetchDirs(
+                    _xDirCache=_xDirCache, _lPathScan=[pathItem for pathItem, _ in lItems], _iLevel=_iLevel + 1
+                )
+            # endif
+
+            for pathItem, sName in lItems:
+                sPathName = pathItem.name
                 nodeX = CNode(
                     sName, parent=_nodeParent, _iLevel=_iLevel, _eType=xPathVar.eNodeType, _sPathName=sPathName
                 )
-                if xPathVar.eNodeType == ENodeType.PATH and len(lPathVarIds) > _iLevel + 1:
+                if bScanItems:
                     self.ScanFileSystem(
                         _pathScan=pathItem,
                         _nodeParent=nodeX,
                         _iLevel=_iLevel + 1,
+                        _xDirCache=_xDirCache,
                     )
                 # enddef
             # endfor
@@ -335,6 +419,7 @@ class CPathStructure:
                         _pathScan=pathItem,
                         _nodeParent=nodeX,
                         _iLevel=_iLevel + 1,
+                        _xDirCache=_xDirCache,
                     )
                 # enddef
             # endif
@@ -349,9 +434,9 @@ class CPathStructure:
                 raise RuntimeError("A regular expression variable must have a 'sRegExParseValue' entry")
             # endif
 
-            for pathItem in pathScan.iterdir():
-                if (xPathVar.eNodeType == ENodeType.PATH and not pathItem.is_dir()) or (
-                    xPathVar.eNodeType == ENodeType.ARTEFACT and not pathItem.is_file()
+            for pathItem, bIsDir, bIsFile in _xDirCache.IterDir(pathScan):
+                if (xPathVar.eNodeType == ENodeType.PATH and not bIsDir) or (
+                    xPathVar.eNodeType == ENodeType.ARTEFACT and not bIsFile
                 ):
                     continue
                 # endif
@@ -373,6 +458,7 @@ class CPathStructure:
                         _pathScan=pathItem,
                         _nodeParent=nodeX,
                         _iLevel=_iLevel + 1,
+                        _xDirCache=_xDirCache,
                     )
                 # enddef    
                 # Use only the first match
@@ -94,7 +94,7 @@ class CProductAvailability:
         xMissing = CMissing(_xRoot, _iLevel, [])
         for xGrpVarVal in lSelGrpVarVal:
             sGrpVarVal: str = str(xGrpVarVal)
-            xNode: CNode = next((node for node in _xRoot.children if node.name == sGrpVarVal), None)
+            xNode: CNode = _xRoot.GetChild(sGrpVarVal)
             if xNode is None:
                 xMissing.lNames.append(sGrpVarVal)
             elif _iLevel + 1 < len(self._lSelGrpVarValLists):
@@ -115,7 +115,7 @@ class CProductAvailability:
                 self._dicMissing[sArtTypeId] = []
             # endif
 
-            xNode: CNode = next((node for node in _xGrpRoot.children if node.name == sArtTypeId), None)
+            xNode: CNode = _xGrpRoot.GetChild(sArtTypeId)
             if xNode is None:
                 self._dicMissing[sArtTypeId].append(CMissing(_xGrpRoot, 0, lArtVarValLists[0]))
             else:
@@ -132,7 +132,7 @@ class CProductAvailability:
         xMissing = CMissing(_xRoot, _iLevel, [])
         for xArtVarVal in lSelArtVarVal:
             sArtVarVal = str(xArtVarVal)
-            xNode: CNode = next((node for node in _xRoot.children if node.name == sArtVarVal), None)
+            xNode: CNode = _xRoot.GetChild(sArtVarVal)
             if xNode is None:
                 xMissing.lNames.append(sArtVarVal)
             elif _iLevel + 1 < len(lSelArtVarValLists):
@@ -22,7 +22,10 @@
 
 import os
 import math
+import bisect
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, Future, as_completed
 import anybase
 import anybase.config
 import anybase.file
@@ -57,7 +60,7 @@ except ImportError as e:
 # from anybase import file as anyfile
 from anybase import path as anypath
 from anybase.cls_any_error import CAnyError_Message
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 
 # from ison.util import data as isondata
 from anybase import convert, config
@@ -85,6 +88,22 @@ def _IterInit(sText: str, iCount: int):
 def _IterUpdate(iCount: int, bDone: bool):
     pass
 
+
+# Export a single shard in a worker process. The export is prepared again from the
+# scan file, which results in the same list of samples as in the parent process.
+def _ExportShard(
+    _sConfigName: str,
+    _sGroupName: str,
+    _sProdCfgFile: str,
+    _sScanFile: str,
+    _sOutputPath: str,
+    _dicArgs: dict[str, Any],
+) -> int:
+    xExport = CProductExport(_sConfigName, _sGroupName, _sProdCfgFile=_sProdCfgFile)
+    xExport.ProvideProductScan(_sScanFile)
+    xExport.PrepareExport(_bStoreMissingArtefacts=False)
+    return xExport.ExportArtefacts(_sOutputPath, **_dicArgs)
+
 @dataclass
 class CGroupConfig:
     sId: str
@@ -128,7 +147,64 @@ class CLabelExport:
     xCameraCalibEnc: CameraCalibEncoder | None = None
 
 
+@dataclass
+class CExportShard:
+    pathXtar: Path
+    iSampleStart: int
+    iSampleCount: int
+
+# endclass
+
+
+# Index of a sharded export, as written by CProductExport.MergeShards().
+# Each shard folder is a separate xtar dataset, which contains the samples
+# [iSampleStart, iSampleStart + iSampleCount) of the whole export. The meta data
+# in 'dicMeta' refers to all samples of the export in shard order.
+# GetShard() maps a sample index of the export to the shard and the sample index in the shard.
+@dataclass
+class CExportShardIndex:
+    pathMain: Path
+    iSampleCount: int
+    lShards: list[CExportShard]
+    dicMeta: dict[str, Any]
+
+    # Load the index from the given shard index file or export folder
+    @classmethod
+    def Load(cls, _xPath: str | Path) -> "CExportShardIndex":
+        pathIndex: Path = Path(_xPath)
+        if pathIndex.is_dir():
+            pathIndex = pathIndex / CProductExport.c_sShardIndexFilename
+        # endif
+        if not pathIndex.exists():
+            raise RuntimeError(f"Shard index file not found: {pathIndex.as_posix()}")
+        # endif
+
+        dicIndex: dict[str, Any] = anybase.file.LoadJson(pathIndex)
+        lShards: list[CExportShard] = [
+            CExportShard(pathIndex.parent / dicShard["sFolder"], dicShard["iSampleStart"], dicShard["iSampleCount"])
+            for dicShard in dicIndex["lShards"]
+        ]
+        return cls(pathIndex.parent, dicIndex["iSampleCount"], lShards, dicIndex["mMeta"])
+    # enddef
+
+    def GetShard(self, _iSampleIdx: int) -> tuple[CExportShard, int]:
+        if _iSampleIdx < 0 or _iSampleIdx >= self.iSampleCount:
+            raise IndexError(f"Sample index {_iSampleIdx} out of range for {self.iSampleCount} samples")
+        # endif
+        # Empty shards start at the same sample as the next shard, which is the one found.
+        iShardIdx: int = bisect.bisect_right(self.lShards, _iSampleIdx, key=lambda xShard: xShard.iSampleStart) - 1
+        xShard: CExportShard = self.lShards[iShardIdx]
+        return xShard, _iSampleIdx - xShard.iSampleStart
+    # enddef
+
+# endclass
+
+
 class CProductExport:
+    c_sShardInfoFilename: str = "shard-info.json"
+    c_sShardIndexFilename: str = "shards.json"
+    # Number of group variable combinations that are enumerated at once
+    c_iCfgChunkSize: int = 65536
 
     def __init__(
         self, 
@@ -244,8 +320,7 @@ class CProductExport:
         self._bHasScan = True
     # enddef
 
-
-    def PrepareExport(self) -> None:
+    def PrepareExport(self, _bStoreMissingArtefacts: bool = True) -> None:
         
         if not self._bHasScan:
             raise RuntimeError("Artefact scan not available.")
@@ -319,16 +394,9 @@ class CProductExport:
             # endfor all names
         # endfor sArtVarId
 
+        # The group variable combinations are enumerated by a flat index, where the last variable varies fastest
         lCfgValueCounts = [len(xGroupConfig.lValues) for xGroupConfig in lGroupDimConfigs]
-        iCfgValListCount = len(lCfgValueCounts)
         iCfgTotalCount = math.prod(lCfgValueCounts)
-        lCfgValueMod = [0] * iCfgValListCount
-        for iIdx in range(iCfgValListCount):
-            if iIdx < iCfgValListCount - 1:
-                lCfgValueMod[iIdx] = math.prod(lCfgValueCounts[iIdx + 1:])
-            else:
-                lCfgValueMod[iIdx] = 1
-        # endfor
 
         lExportVarIds = [x.sId for x in lGroupDimConfigs]
         lExportVarNames = [x.sName for x in lGroupDimConfigs]
@@ -347,74 +415,15 @@ class CProductExport:
             )
 
         self._funcStatus(f"Found {len(lArtefactConfigs)} artefact types for {iCfgTotalCount} configurations.")
-        self._funcIterInit("Collecting artefacts...", iCfgTotalCount)
+        lFilterDims, aIsIncluded = self._GetFilterMask(xGroup.dicFilters, lGroupDimConfigs)
+        iSelCfgCount: int = int(np.count_nonzero(aIsIncluded)) * (iCfgTotalCount // max(1, aIsIncluded.size))
+        self._funcStatus(f"Filters select {iSelCfgCount} of {iCfgTotalCount} configurations.")
+
+        self._funcIterInit("Collecting artefacts...", iSelCfgCount)
         self._bHasMissingArtefacts = False
-        for iIdx in range(iCfgTotalCount):
+        for lCfgIndices in self._IterSelectedCfgIndices(lCfgValueCounts, lFilterDims, aIsIncluded):
             self._funcIterUpdate(1, False)
-            lCfgValues = []
-            lCfgIndices = []
-            iValueRemIdx = iIdx
-            for iValueListIdx, iValueCount in enumerate(lCfgValueCounts):
-                iValueIdx = iValueRemIdx // lCfgValueMod[iValueListIdx]
-                iValueRemIdx = iValueRemIdx % lCfgValueMod[iValueListIdx]
-                lCfgValues.append(lGroupDimConfigs[iValueListIdx].lValues[iValueIdx])
-                lCfgIndices.append(iValueIdx)
-            # endfor
-            dicVars = {k.sId: v for k, v in zip(lGroupDimConfigs, lCfgValues)}
-            
-            dicProcFilters: dict = ison.Parser(dicVars).Process(xGroup.dicFilters)
-
-            lExcFilters: list[list[str] | str | int | float | bool] = dicProcFilters.get("lExclude", [])
-            lIncFilters: list[list[str] | str | int | float | bool] = dicProcFilters.get("lInclude", [])
-            if not isinstance(lExcFilters, list):
-                raise TypeError(f"Element 'lExclude' in 'mFilters' of production group '{self._sGroupName}' is not a list: {type(lExcFilters)}")
-            # endif 
-            if not isinstance(lIncFilters, list):
-                raise TypeError(f"Element 'lInclude' in 'mFilters' of production group '{self._sGroupName}' is not a list: {type(lIncFilters)}")
-            # endif
-            bDoInclude = False
-            if len(lIncFilters) == 0:
-                bDoInclude = True
-            else:
-                for xIncFilter in lIncFilters:
-                    if not isinstance(xIncFilter, list):
-                        if convert.ToBool(xIncFilter):
-                            bDoInclude = True
-                            break
-                        # endif
-                    else:
-                        if all((convert.ToBool(x) for x in xIncFilter)):
-                            bDoInclude = True
-                            break
-                        # endif
-                    # endif
-                # endfor
-            # endif
-
-            if not bDoInclude:
-                continue
-            # endif
-            bDoExclude = False
-            if len(lExcFilters) == 0:
-                bDoExclude = False
-            else:
-                for xExcFilter in lExcFilters:
-                    if not isinstance(xExcFilter, list):
-                        if convert.ToBool(xExcFilter):
-                            bDoExclude = True
-                            break
-                        # endif
-                    else:
-                        if all((convert.ToBool(x) for x in xExcFilter)):
-                            bDoExclude = True
-                            break
-                        # endif
-                    # endif
-                # endfor
-            # endif 
-            if bDoExclude:
-                continue
-            # endif
+            lCfgValues: list[str] = [xCfg.lValues[iValueIdx] for xCfg, iValueIdx in zip(lGroupDimConfigs, lCfgIndices)]
 
             if iProductionIndex >= 0:
                 lCfgValues.insert(iProductionIndex, sProductionValue)
@@ -447,7 +456,99 @@ class CProductExport:
         # endfor group configs
         self._funcIterUpdate(0, True)
 
-        self._StoreMissingArtefacts()
+        if _bStoreMissingArtefacts:
+            self._StoreMissingArtefacts()
+        # endif
+    # enddef
+
+    # Evaluate the group filters for all combinations of group variable values.
+    # The filters only depend on the values of the variables they reference. They are therefore
+    # evaluated once per combination of values of those variables, instead of once per combination
+    # of all variables. A variable is regarded as referenced, if its id occurs anywhere in the filter definition.
+    # Returns the list of referenced variable indices and a boolean array with one dimension per
+    # referenced variable. Without filters, the array only has a single element.
+    def _GetFilterMask(
+            self,
+            _dicFilters: dict[str, Any],
+            _lGroupDimConfigs: list[CGroupConfig]) -> tuple[list[int], np.ndarray]:
+        if len(_dicFilters) == 0:
+            return [], np.ones((), dtype=bool)
+        # endif
+
+        sFilters: str = repr(_dicFilters)
+        lVarDims: list[int] = [iIdx for iIdx, xCfg in enumerate(_lGroupDimConfigs) if xCfg.sId in sFilters]
+        lVarCfgs: list[CGroupConfig] = [_lGroupDimConfigs[iDim] for iDim in lVarDims]
+
+        # Variables that are not referenced, are set to their first value
+        dicVars: dict[str, str] = {xCfg.sId: xCfg.lValues[0] for xCfg in _lGroupDimConfigs if len(xCfg.lValues) > 0}
+        aIsIncluded: np.ndarray = np.zeros([len(xCfg.lValues) for xCfg in lVarCfgs], dtype=bool)
+        for tValueIdx in np.ndindex(aIsIncluded.shape):
+            for xCfg, iValueIdx in zip(lVarCfgs, tValueIdx):
+                dicVars[xCfg.sId] = xCfg.lValues[iValueIdx]
+            # endfor
+            aIsIncluded[tValueIdx] = self._EvalFilters(_dicFilters, dict(dicVars))
+        # endfor
+
+        return lVarDims, aIsIncluded
+    # enddef
+
+    # Iterate over the value indices of all group variable combinations, which are included by the filters.
+    # The combinations are enumerated in chunks, so that the full array of combinations is never created.
+    def _IterSelectedCfgIndices(
+            self,
+            _lCfgValueCounts: list[int],
+            _lFilterDims: list[int],
+            _aIsIncluded: np.ndarray) -> Iterator[list[int]]:
+        iCfgTotalCount: int = math.prod(_lCfgValueCounts)
+        if len(_lCfgValueCounts) == 0:
+            if _aIsIncluded.all():
+                yield []
+            # endif
+            return
+        # endif
+
+        for iChunkStart in range(0, iCfgTotalCount, self.c_iCfgChunkSize):
+            aFlatIdx = np.arange(iChunkStart, min(iChunkStart + self.c_iCfgChunkSize, iCfgTotalCount), dtype=np.int64)
+            aCfgIndices: np.ndarray = np.stack(np.unravel_index(aFlatIdx, _lCfgValueCounts), axis=1)
+            if len(_lFilterDims) > 0:
+                aMask = _aIsIncluded[tuple(aCfgIndices[:, iDim] for iDim in _lFilterDims)]
+                aCfgIndices = aCfgIndices[aMask]
+            elif not _aIsIncluded.all():
+                return
+            # endif
+            yield from aCfgIndices.tolist()
+        # endfor
+    # enddef
+
+    def _EvalFilters(self, _dicFilters: dict[str, Any], _dicVars: dict[str, str]) -> bool:
+        dicProcFilters: dict = ison.Parser(_dicVars).Process(_dicFilters)
+
+        lExcFilters: list[list[str] | str | int | float | bool] = dicProcFilters.get("lExclude", [])
+        lIncFilters: list[list[str] | str | int | float | bool] = dicProcFilters.get("lInclude", [])
+        if not isinstance(lExcFilters, list):
+            raise TypeError(f"Element 'lExclude' in 'mFilters' of production group '{self._sGroupName}' is not a list: {type(lExcFilters)}")
+        # endif
+        if not isinstance(lIncFilters, list):
+            raise TypeError(f"Element 'lInclude' in 'mFilters' of production group '{self._sGroupName}' is not a list: {type(lIncFilters)}")
+        # endif
+
+        if len(lIncFilters) > 0 and not any(self._IsFilterTrue(xFilter) for xFilter in lIncFilters):
+            return False
+        # endif
+
+        if any(self._IsFilterTrue(xFilter) for xFilter in lExcFilters):
+            return False
+        # endif
+
+        return True
+    # enddef
+
+    # A filter is either a single value or a list of values, which must all be true.
+    def _IsFilterTrue(self, _xFilter: list[str] | str | int | float | bool) -> bool:
+        if not isinstance(_xFilter, list):
+            return convert.ToBool(_xFilter)
+        # endif
+        return all(convert.ToBool(x) for x in _xFilter)
     # enddef
 
     def _StoreMissingArtefacts(self, _sFilePath: str | Path | None = None) -> None:
@@ -501,26 +602,30 @@ class CProductExport:
             _sOutputPath: str | Path, 
             _iSamplesPerGroup: int = 1000, 
             _bOverwrite: bool = False, 
-            _iMaxSamples: int = -1) -> None:
+            _iMaxSamples: int = -1,
+            _iWorkers: int = 1,
+            _iPrefetch: int = 0,
+            _iShardCount: int = 1,
+            _iShardIndex: int = 0) -> int:
+        # If more than one worker is given, the samples are read and decoded by a thread pool,
+        # while this thread writes them in their original order. At most '_iPrefetch' samples
+        # are read ahead of the writer, which defaults to twice the number of workers.
+        # If more than one shard is given, only the samples of shard '_iShardIndex' are written
+        # to the sub-folder 'shard-[index]' of the output path. Use MergeShards() to create
+        # the index over all shards. Returns the number of exported samples.
         if not self._bHasScan:
             raise RuntimeError("Artefact scan not available.")
         # endif
 
-        pathXtar: Path = anypath.MakeNormPath(_sOutputPath)
-        if not pathXtar.is_absolute():
-            pathXtar = self._xPrj.xConfig.pathMain / pathXtar
+        if _iShardCount < 1 or _iShardIndex < 0 or _iShardIndex >= _iShardCount:
+            raise ValueError(f"Invalid shard index {_iShardIndex} for {_iShardCount} shards")
         # endif
-        if pathXtar.exists():
-            if not pathXtar.is_dir():
-                raise RuntimeError(f"Output path is not a directory: {pathXtar.as_posix()}")
-            # endif
-            if _bOverwrite:
-                shutil.rmtree(pathXtar)
-            else:
-                raise RuntimeError(f"Output path already exists: {pathXtar.as_posix()}")
-            # endif
+
+        pathXtar: Path = self._GetOutputPath(_sOutputPath)
+        if _iShardCount > 1:
+            pathXtar = pathXtar / self._GetShardFolderName(_iShardIndex)
         # endif
-        pathXtar.mkdir(parents=True, exist_ok=True)
+        self._ProvideOutputPath(pathXtar, _bOverwrite)
 
         lTypes: list[xtar.IOType] = []
         lMetaTypes: list[xtar.IOType] = []
@@ -661,6 +766,11 @@ class CProductExport:
             # endif
         # endfor
 
+        if _iMaxSamples > 0:
+            iElementCount = min(iElementCount, _iMaxSamples)
+        # endif
+        iSampleStart, iSampleEnd = self._GetShardRange(iElementCount, _iSamplesPerGroup, _iShardCount, _iShardIndex)
+
         self._funcStatus(f"Exporting artefacts to: {pathXtar.as_posix()}")
         xWriter = xtar.ContiguousDatasetWriter(pathXtar, lTypes, samples_per_group=_iSamplesPerGroup, meta_writer_types=lMetaTypes)
 
@@ -674,54 +784,258 @@ class CProductExport:
                     "var_ids": xExport.lVarIds,
                     "var_names": xExport.lVarNames,
                     "var_values": xExport.lVarValues,
-                    "value_indices_per_sample": xExport.lArtIdxLists,
+                    "value_indices_per_sample": (
+                        xExport.lArtIdxLists if _iShardCount == 1 else xExport.lArtIdxLists[iSampleStart:iSampleEnd]
+                    ),
                 }
             })
         # endfor meta
         xWriter.add_meta(0, **dicMeta)
 
-        if _iMaxSamples > 0:
-            iElementCount = min(iElementCount, _iMaxSamples)
-        
-        self._funcIterInit("Writing artefacts...", iElementCount)
-        for iIdx in range(iElementCount):
+        iSampleCount: int = iSampleEnd - iSampleStart
+        self._funcIterInit("Writing artefacts...", iSampleCount)
+        for dicData in self._IterSamples(lTypes, iSampleStart, iSampleEnd, _iWorkers=_iWorkers, _iPrefetch=_iPrefetch):
             self._funcIterUpdate(1, False)
-            dicData: dict[str, Any] = {}
-            for xType in lTypes:
-                if xType.content_id.startswith("__"):
-                    continue
-                # endif
-                xExport = self._dicExport[xType.content_id]
-                if iIdx < len(xExport.lArtFilePaths):
-                    # Export OpenEXR images as numpy arrays
-                    if xExport.lDataType[0] == "image" and xExport.lDataType[1] == "exr":
-                        dicData[xType.content_id] = self._Process_OpenExr(xExport.lArtFilePaths[iIdx])
-                    else:
-                        dicData[xType.content_id] = xExport.lArtFilePaths[iIdx]
-                    # endif
-                else:
-                    print(f"  WARNING: Missing artefact: {xType.content_id}")
+            xWriter.add(**dicData)
+        # endfor data
+        self._funcIterUpdate(0, True)
+
+        xWriter.flush()
+
+        if _iShardCount > 1:
+            anybase.file.SaveJson(pathXtar / self.c_sShardInfoFilename, {
+                "iShardIndex": _iShardIndex,
+                "iShardCount": _iShardCount,
+                "iSampleStart": iSampleStart,
+                "iSampleCount": iSampleCount,
+                "iSamplesPerGroup": _iSamplesPerGroup,
+                "mMeta": dicMeta,
+            }, iIndent=4)
+        # endif
+
+        self._funcStatus(f"Exported {iSampleCount} artefacts to: {pathXtar.as_posix()}")
+        return iSampleCount
+    # enddef
+
+    # Export all shards in parallel worker processes and merge them afterwards.
+    def ExportArtefactsSharded(
+            self,
+            _sOutputPath: str | Path,
+            _iShardCount: int,
+            _iSamplesPerGroup: int = 1000,
+            _bOverwrite: bool = False,
+            _iMaxSamples: int = -1,
+            _iWorkers: int = 1,
+            _iPrefetch: int = 0) -> int:
+        if not self._bHasScan:
+            raise RuntimeError("Artefact scan not available.")
+        # endif
+
+        pathXtar: Path = self._GetOutputPath(_sOutputPath)
+        self._ProvideOutputPath(pathXtar, _bOverwrite)
+
+        self._funcStatus(f"Exporting {_iShardCount} shards to: {pathXtar.as_posix()}")
+        with ProcessPoolExecutor(max_workers=_iShardCount) as xExecutor:
+            dicFutures: dict[Future, int] = {}
+            for iShardIdx in range(_iShardCount):
+                dicArgs: dict[str, Any] = dict(
+                    _iSamplesPerGroup=_iSamplesPerGroup,
+                    _iMaxSamples=_iMaxSamples,
+                    _iWorkers=_iWorkers,
+                    _iPrefetch=_iPrefetch,
+                    _iShardCount=_iShardCount,
+                    _iShardIndex=iShardIdx,
+                )
+                xFuture = xExecutor.submit(
+                    _ExportShard,
+                    self._sConfigName,
+                    self._sGroupName,
+                    self._pathProdCfg.as_posix(),
+                    self._pathScan.as_posix(),
+                    pathXtar.as_posix(),
+                    dicArgs,
+                )
+                dicFutures[xFuture] = iShardIdx
+            # endfor
+
+            for xFuture in as_completed(dicFutures):
+                iShardIdx = dicFutures[xFuture]
+                try:
+                    iSampleCount = xFuture.result()
+                except Exception as xEx:
+                    raise CAnyError_Message(f"Failed to export shard {iShardIdx}", xEx) from xEx
+                # endtry
+                self._funcStatus(f"  Shard {iShardIdx}: exported {iSampleCount} samples")
+            # endfor
+        # endwith
+
+        return self.MergeShards(pathXtar, _iShardCount)
+    # enddef
+
+    # Create the index over all shards of a sharded export. The index contains the meta data
+    # of the whole dataset, i.e. the variables and the value indices of all samples in shard
+    # order, and the sample range of each shard. Returns the total number of samples.
+    # The index can be read with CExportShardIndex.Load().
+    def MergeShards(self, _sOutputPath: str | Path, _iShardCount: int) -> int:
+        pathXtar: Path = self._GetOutputPath(_sOutputPath)
+
+        lShards: list[dict[str, Any]] = []
+        dicMeta: dict[str, dict[str, Any]] = {}
+        iSampleCount: int = 0
+        for iShardIdx in range(_iShardCount):
+            sShardFolder: str = self._GetShardFolderName(iShardIdx)
+            pathInfo: Path = pathXtar / sShardFolder / self.c_sShardInfoFilename
+            if not pathInfo.exists():
+                raise RuntimeError(f"Shard {iShardIdx} has not been exported completely: {pathInfo.as_posix()}")
+            # endif
+            dicInfo: dict[str, Any] = anybase.file.LoadJson(pathInfo)
+            if dicInfo["iShardCount"] != _iShardCount or dicInfo["iSampleStart"] != iSampleCount:
+                raise RuntimeError(
+                    f"Shard {iShardIdx} does not belong to an export with {_iShardCount} shards: {pathInfo.as_posix()}"
+                )
+            # endif
+
+            for sContentId, dicShardMeta in dicInfo["mMeta"].items():
+                dicContentMeta = dicMeta.get(sContentId)
+                if dicContentMeta is None:
+                    dicContentMeta = dicMeta[sContentId] = dict(dicShardMeta, value_indices_per_sample=[])
+                elif any(dicContentMeta[sKey] != dicShardMeta[sKey] for sKey in ["var_ids", "var_names", "var_values"]):
+                    raise RuntimeError(f"Meta data of '{sContentId}' differs between shards")
                 # endif
+                dicContentMeta["value_indices_per_sample"].extend(dicShardMeta["value_indices_per_sample"])
             # endfor
 
-            for xLabelExport in self._dicLabelExport.values():
-                if iIdx < len(xLabelExport.lLabelFilePaths):
-                    if xLabelExport.lDataType[0] == "label" and xLabelExport.lDataType[1] == "json":
-                        dicData.update(self._Process_Label(xLabelExport.sName, xLabelExport.lLabelFilePaths[iIdx]))
-                    else:
-                        print(f"  WARNING: Unsupported label data type: {xLabelExport.sName}")
-                    # endif
+            lShards.append({
+                "sFolder": sShardFolder,
+                "iSampleStart": dicInfo["iSampleStart"],
+                "iSampleCount": dicInfo["iSampleCount"],
+            })
+            iSampleCount += dicInfo["iSampleCount"]
+        # endfor
+
+        pathIndex: Path = pathXtar / self.c_sShardIndexFilename
+        anybase.file.SaveJson(pathIndex, {
+            "iSampleCount": iSampleCount,
+            "lShards": lShards,
+            "mMeta": dicMeta,
+        }, iIndent=4)
+
+        self._funcStatus(f"Merged {_iShardCount} shards with {iSampleCount} samples: {pathIndex.as_posix()}")
+        return iSampleCount
+    # enddef
+
+    def _GetOutputPath(self, _sOutputPath: str | Path) -> Path:
+        pathXtar: Path = anypath.MakeNormPath(_sOutputPath)
+        if not pathXtar.is_absolute():
+            pathXtar = self._xPrj.xConfig.pathMain / pathXtar
+        # endif
+        return pathXtar
+    # enddef
+
+    def _ProvideOutputPath(self, _pathXtar: Path, _bOverwrite: bool) -> None:
+        if _pathXtar.exists():
+            if not _pathXtar.is_dir():
+                raise RuntimeError(f"Output path is not a directory: {_pathXtar.as_posix()}")
+            # endif
+            if _bOverwrite:
+                shutil.rmtree(_pathXtar)
+            else:
+                raise RuntimeError(f"Output path already exists: {_pathXtar.as_posix()}")
+            # endif
+        # endif
+        _pathXtar.mkdir(parents=True, exist_ok=True)
+    # enddef
+
+    def _GetShardFolderName(self, _iShardIndex: int) -> str:
+        return f"shard-{_iShardIndex:04d}"
+    # enddef
+
+    # Get the sample range [start, end) of a shard. The shards are split at the boundaries
+    # of the xtar sample groups, so that only the last group of the last shard is incomplete.
+    def _GetShardRange(
+            self,
+            _iElementCount: int,
+            _iSamplesPerGroup: int,
+            _iShardCount: int,
+            _iShardIndex: int) -> tuple[int, int]:
+        iGroupCount: int = math.ceil(_iElementCount / _iSamplesPerGroup)
+        iGroupStart: int = (_iShardIndex * iGroupCount) // _iShardCount
+        iGroupEnd: int = ((_iShardIndex + 1) * iGroupCount) // _iShardCount
+        return (
+            min(iGroupStart * _iSamplesPerGroup, _iElementCount),
+            min(iGroupEnd * _iSamplesPerGroup, _iElementCount),
+        )
+    # enddef
+
+    def _IterSamples(
+            self,
+            _lTypes: list[xtar.IOType],
+            _iSampleStart: int,
+            _iSampleEnd: int,
+            *,
+            _iWorkers: int = 1,
+            _iPrefetch: int = 0):
+        if _iWorkers <= 1:
+            for iIdx in range(_iSampleStart, _iSampleEnd):
+                yield self._ReadSample(iIdx, _lTypes)
+            # endfor
+            return
+        # endif
+
+        iPrefetch: int = _iPrefetch if _iPrefetch > 0 else 2 * _iWorkers
+        # The queue of pending samples is bounded, so that only a limited number of decoded
+        # samples is held in memory. The samples are yielded in the order of submission.
+        dqPending: deque[Future] = deque()
+        iNextIdx: int = _iSampleStart
+        with ThreadPoolExecutor(max_workers=_iWorkers, thread_name_prefix="export-read") as xExecutor:
+            try:
+                while iNextIdx < _iSampleEnd or len(dqPending) > 0:
+                    while iNextIdx < _iSampleEnd and len(dqPending) < iPrefetch:
+                        dqPending.append(xExecutor.submit(self._ReadSample, iNextIdx, _lTypes))
+                        iNextIdx += 1
+                    # endwhile
+                    yield dqPending.popleft().result()
+                # endwhile
+            finally:
+                for xFuture in dqPending:
+                    xFuture.cancel()
+                # endfor
+            # endtry
+        # endwith
+    # enddef
+
+    def _ReadSample(self, _iIdx: int, _lTypes: list[xtar.IOType]) -> dict[str, Any]:
+        dicData: dict[str, Any] = {}
+        for xType in _lTypes:
+            if xType.content_id.startswith("__"):
+                continue
+            # endif
+            xExport = self._dicExport[xType.content_id]
+            if _iIdx < len(xExport.lArtFilePaths):
+                # Export OpenEXR images as numpy arrays
+                if xExport.lDataType[0] == "image" and xExport.lDataType[1] == "exr":
+                    dicData[xType.content_id] = self._Process_OpenExr(xExport.lArtFilePaths[_iIdx])
                 else:
-                    print(f"  WARNING: Missing label artefact: {xLabelExport.sName}")
+                    dicData[xType.content_id] = xExport.lArtFilePaths[_iIdx]
                 # endif
-            # endfor label export
+            else:
+                print(f"  WARNING: Missing artefact: {xType.content_id}")
+            # endif
+        # endfor
 
-            xWriter.add(**dicData)
-        # endfor data
-        self._funcIterUpdate(0, True)
+        for xLabelExport in self._dicLabelExport.values():
+            if _iIdx < len(xLabelExport.lLabelFilePaths):
+                if xLabelExport.lDataType[0] == "label" and xLabelExport.lDataType[1] == "json":
+                    dicData.update(self._Process_Label(xLabelExport.sName, xLabelExport.lLabelFilePaths[_iIdx]))
+                else:
+                    print(f"  WARNING: Unsupported label data type: {xLabelExport.sName}")
+                # endif
+            else:
+                print(f"  WARNING: Missing label artefact: {xLabelExport.sName}")
+            # endif
+        # endfor label export
 
-        xWriter.flush()
-        self._funcStatus(f"Exported {iElementCount} artefacts to: {pathXtar.as_posix()}")
+        return dicData
     # enddef
 
     def _Process_OpenExr(self, _sFilePath: str | Path) -> np.ndarray:
@@ -389,9 +389,17 @@ class CProductView:
         _funcStatus: Optional[Callable[[str], None]] = None,
         _funcIterInit: Optional[Callable[[str, int], None]] = None,
         _funcIterUpdate: Optional[Callable[[int, bool], None]] = None,
+        _xPrevScanFilePath: Union[str, list, tuple, Path, None] = None,
+        _bLazyArtefacts: bool = False,
     ):
+        # With '_bLazyArtefacts' the artefacts of a group path are only scanned, when they are first accessed
         self._xProdData.ScanArtefacts(
-            _sGroupId=_sGroupId, _funcStatus=_funcStatus, _funcIterInit=_funcIterInit, _funcIterUpdate=_funcIterUpdate
+            _sGroupId=_sGroupId,
+            _funcStatus=_funcStatus,
+            _funcIterInit=_funcIterInit,
+            _funcIterUpdate=_funcIterUpdate,
+            _xPrevScanFilePath=_xPrevScanFilePath,
+            _bLazyArtefacts=_bLazyArtefacts,
         )
 
     # enddef
@@ -23,6 +23,7 @@
 import re
 import os
 import copy
+import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterator, Optional, Union, Callable
@@ -32,11 +33,14 @@ from catharsys.api.cls_project import CProject
 
 from anybase import config
 from anybase import file as anyfile
+from anybase import path as anypath
 from anybase.cls_any_error import CAnyError_Message
 
 from .cls_path_structure import CPathVar, EPathVarType, CPathVarHandlerResult
 from .cls_group import CGroup
 from .cls_node import ENodeType
+from .cls_dir_cache import CDirCache
+from .cls_scan_columns import CScanColumns
 
 
 class CProducts:
@@ -55,6 +59,13 @@ class CProducts:
         self._dtScanProdFile: datetime = None
         self._lMessages: list[str] = []
         self._pathOutput: str | None = _pathOutput
+        # Directory listings of the last scan, used for incremental scans
+        self._xDirCache: CDirCache = CDirCache()
+        # Directory listings file of a deserialized scan. The listings are only
+        # loaded for a rescan, so for a deserialized scan the file is copied as is.
+        self._pathScanDirCache: Optional[Path] = None
+        # Columns folder of a deserialized scan, whose files may be memory mapped by the groups
+        self._pathScanColumns: Optional[Path] = None
 
         self._dicSystemVars: dict[str, CPathVar] = {
             "production": CPathVar(
@@ -63,6 +74,7 @@ class CProducts:
                 eType=EPathVarType.SYSTEM,
                 eNodeType=ENodeType.PATH,
                 funcHandler=self._OnVarProduction,
+                bListsDir=False,
             ),
             "top": CPathVar(
                 sId="top",
@@ -84,6 +96,7 @@ class CProducts:
                 eType=EPathVarType.SYSTEM,
                 eNodeType=ENodeType.PATH,
                 funcHandler=self._OnVarProject,
+                bListsDir=False,
             ),
             "frame": CPathVar(
                 sId="frame",
@@ -214,9 +227,66 @@ class CProducts:
         _funcStatus: Optional[Callable[[str], None]] = None,
         _funcIterInit: Optional[Callable[[str, int], None]] = None,
         _funcIterUpdate: Optional[Callable[[int, bool], None]] = None,
+        _xPrevScanFilePath: Union[str, list, tuple, Path, None] = None,
+        _bCompareInode: bool = False,
+        _iScanWorkers: int = 8,
+        _bLazyArtefacts: bool = False,
     ):
         # print(f"Scanning for production group '{_sGroupId}'...")
 
+        # For an incremental scan, only directories that changed since the previous scan are listed again.
+        dicPrevDirs: Optional[dict[str, tuple]] = None
+        if _xPrevScanFilePath is not None:
+            dicPrevDirs = self._LoadScanDirCache(_xPrevScanFilePath)
+            if _funcStatus is not None:
+                if dicPrevDirs is None:
+                    _funcStatus("No directory data available from previous scan, running full scan")
+                else:
+                    _funcStatus(f"Using {len(dicPrevDirs)} directory listings from previous scan")
+                # endif
+            # endif
+        # endif
+        # Directories are listed ahead of the scan by '_iScanWorkers' threads
+        self._pathScanDirCache = None
+        self._pathScanColumns = None
+        self._xDirCache = CDirCache(_dicPrevious=dicPrevDirs, _bCompareInode=_bCompareInode, _iWorkers=_iScanWorkers)
+        try:
+            self._ScanGroups(
+                _sGroupId=_sGroupId,
+                _funcStatus=_funcStatus,
+                _funcIterInit=_funcIterInit,
+                _funcIterUpdate=_funcIterUpdate,
+                _bLazyArtefacts=_bLazyArtefacts,
+            )
+        finally:
+            self._xDirCache.Close()
+        # endtry
+
+        if _funcStatus is not None and dicPrevDirs is not None:
+            _funcStatus(
+                f"Listed {self._xDirCache.iListed} directories, "
+                f"reused {self._xDirCache.iReused} unchanged directories"
+            )
+        # endif
+
+        # print(f"self._dtProdFile: {self._dtProdFile}")
+        if self._dtProdFile is not None:
+            self._dtScanProdFile = self._dtProdFile
+            # print(f"self._dtScanProdFile: {self._dtScanProdFile}")
+        # endif
+
+    # enddef
+
+    # #####################################################################################################
+    def _ScanGroups(
+        self,
+        *,
+        _sGroupId: Optional[str],
+        _funcStatus: Optional[Callable[[str], None]],
+        _funcIterInit: Optional[Callable[[str, int], None]],
+        _funcIterUpdate: Optional[Callable[[int, bool], None]],
+        _bLazyArtefacts: bool,
+    ):
         if _sGroupId is None:
             for sGroup in self._dicGroups:
                 if sGroup.startswith("__"):
@@ -231,6 +301,8 @@ class CProducts:
                     _funcStatus=_funcStatus,
                     _funcIterInit=_funcIterInit,
                     _funcIterUpdate=_funcIterUpdate,
+                    _xDirCache=self._xDirCache,
+                    _bLazyArtefacts=_bLazyArtefacts,
                 )
             # endfor
         else:
@@ -246,32 +318,109 @@ class CProducts:
                 _funcStatus=_funcStatus,
                 _funcIterInit=_funcIterInit,
                 _funcIterUpdate=_funcIterUpdate,
+                _xDirCache=self._xDirCache,
+                _bLazyArtefacts=_bLazyArtefacts,
             )
+
+            # Keep the listings of the other groups for later incremental scans
+            self._xDirCache.KeepPrevious()
         # endif
 
-        # print(f"self._dtProdFile: {self._dtProdFile}")
-        if self._dtProdFile is not None:
-            self._dtScanProdFile = self._dtProdFile
-            # print(f"self._dtScanProdFile: {self._dtScanProdFile}")
+    # enddef
+
+    # ######################################################################################################
+    # The folder with the columns of the groups is stored next to the scan file
+    def _GetScanColumnsPath(self, _pathFile: Path) -> Path:
+        return _pathFile.parent / f"{_pathFile.stem}.columns"
+
+    # enddef
+
+    # ######################################################################################################
+    # Remove columns folders that were replaced by previous calls of SerializeScan(),
+    # unless they are memory mapped by the groups of this instance.
+    def _RemoveReplacedScanColumns(self, _pathColumns: Path):
+        if not _pathColumns.parent.exists():
+            return
         # endif
 
+        sPrefix: str = f"{_pathColumns.name}.old-"
+        for pathItem in _pathColumns.parent.iterdir():
+            if pathItem.name.startswith(sPrefix) and pathItem != self._pathScanColumns:
+                shutil.rmtree(pathItem, ignore_errors=True)
+            # endif
+        # endfor
+
     # enddef
 
     # ######################################################################################################
+    # The directory listings are stored in a separate file next to the scan file,
+    # as they are only needed for incremental scans.
+    def _GetScanDirCachePath(self, _pathFile: Path) -> Path:
+        return _pathFile.parent / f"{_pathFile.stem}.dircache.pickle"
+
+    # enddef
+
+    # ######################################################################################################
+    # Write the scan to a pickle file, which contains the project information.
+    # The node trees of the groups are stored as memory mappable columns in the
+    # folder '[file stem].columns' and the directory listings in the file
+    # '[file stem].dircache.pickle' next to the scan file.
+    # The columns are written to a temporary folder, which then replaces the columns folder.
+    # The previous columns folder is renamed and only removed, if its files are not memory mapped.
     def SerializeScan(self, _xFilePath: Union[str, list, tuple, Path]):
-        dicGroups: dict[str, list[tuple]] = dict()
-        for sGroup in self._dicGroups:
-            dicGroups[sGroup] = self._dicGroups[sGroup].SerializeScan()
+        pathFile: Path = anypath.MakeNormPath(_xFilePath)
+        pathColumns: Path = self._GetScanColumnsPath(pathFile)
+        self._RemoveReplacedScanColumns(pathColumns)
+
+        pathColumnsTemp: Path = pathColumns.parent / f"{pathColumns.name}.tmp-{os.getpid()}"
+        if pathColumnsTemp.exists():
+            shutil.rmtree(pathColumnsTemp)
+        # endif
+        pathColumnsTemp.mkdir(parents=True)
+
+        dicGroups: dict[str, Optional[str]] = dict()
+        for iGroupIdx, sGroup in enumerate(self._dicGroups):
+            xColumns: Optional[CScanColumns] = self._dicGroups[sGroup].GetScanColumns()
+            if xColumns is None:
+                dicGroups[sGroup] = None
+                continue
+            # endif
+            sFolder: str = f"group-{iGroupIdx:04d}"
+            xColumns.Save(pathColumnsTemp / sFolder)
+            dicGroups[sGroup] = sFolder
         # endfor
 
+        if pathColumns.exists():
+            sSuffix: str = f"old-{os.getpid()}-{datetime.now():%Y%m%d%H%M%S%f}"
+            pathColumnsOld: Path = pathColumns.parent / f"{pathColumns.name}.{sSuffix}"
+            os.replace(pathColumns, pathColumnsOld)
+            if self._pathScanColumns == pathColumns:
+                self._pathScanColumns = pathColumnsOld
+            # endif
+        # endif
+        os.replace(pathColumnsTemp, pathColumns)
+        self._RemoveReplacedScanColumns(pathColumns)
+
+        pathDirCache: Path = self._GetScanDirCachePath(pathFile)
+        if self._pathScanDirCache is None:
+            anyfile.SavePickle(pathDirCache, self._xDirCache.Serialize())
+        elif self._pathScanDirCache != pathDirCache:
+            if self._pathScanDirCache.exists():
+                shutil.copyfile(self._pathScanDirCache, pathDirCache)
+            else:
+                anyfile.SavePickle(pathDirCache, dict())
+            # endif
+        # endif
+
         dicData = {
-            "sDTI": "/catharsys/production/scan:1.0",
+            "sDTI": "/catharsys/production/scan:1.2",
             "sProjectId": self._xProject.sId,
             "fProdFileTimestamp": self._dtProdFile.timestamp(),
             "mGroups": dicGroups,
+            "sDirCacheFile": pathDirCache.name,
         }
 
-        anyfile.SavePickle(_xFilePath, dicData)
+        anyfile.SavePickle(pathFile, dicData)
 
     # enddef
 
@@ -279,10 +428,13 @@ class CProducts:
     def DeserializeScan(self, _xFilePath: Union[str, list, tuple, Path], *, _bDoPrint=True):
         self._lMessages.clear()
 
-        dicData = anyfile.LoadPickle(_xFilePath)
+        pathFile: Path = anypath.MakeNormPath(_xFilePath)
+        dicData = anyfile.LoadPickle(pathFile)
         if not config.IsConfigType(dicData, "/catharsys/production/scan:1"):
             raise RuntimeError("Invalid file type")
         # endif
+        # Version 1.0 stores the node trees as nested tuples in the scan file
+        bHasColumns: bool = dicData.get("sDTI") != "/catharsys/production/scan:1.0"
 
         sProjectId = dicData.get("sProjectId")
         if sProjectId is None:
@@ -307,6 +459,16 @@ class CProducts:
             raise RuntimeError("No group data given in product scan file")
         # endif
 
+        # Version 1.1 stores the directory listings in the scan file. Later versions
+        # store them in a separate file, which is only loaded for incremental scans.
+        self._xDirCache = CDirCache(_dicPrevious=dicData.get("mDirCache"))
+        self._xDirCache.KeepPrevious()
+        self._pathScanDirCache = None
+        sDirCacheFile: Optional[str] = dicData.get("sDirCacheFile")
+        if sDirCacheFile is not None:
+            self._pathScanDirCache = pathFile.parent / sDirCacheFile
+        # endif
+
         for sGroup in dicGroups:
             if sGroup not in self._dicGroups:
                 sMsg = f"WARNING: Group '{sGroup}' given in scan not found in current configuration"
@@ -317,11 +479,55 @@ class CProducts:
                 continue
             # endif
 
-            self._dicGroups[sGroup].DeserializeScan(dicGroups[sGroup])
+            if not bHasColumns:
+                self._dicGroups[sGroup].DeserializeScan(dicGroups[sGroup])
+            elif dicGroups[sGroup] is None:
+                self._dicGroups[sGroup].DeserializeScan([])
+            else:
+                self._pathScanColumns = self._GetScanColumnsPath(pathFile)
+                pathColumns: Path = self._pathScanColumns / dicGroups[sGroup]
+                self._dicGroups[sGroup].DeserializeScanColumns(CScanColumns.Load(pathColumns))
+            # endif
         # endfor
 
     # enddef
 
+    # ######################################################################################################
+    # Load the directory listings stored in a previous scan file.
+    # Returns None, if the file does not exist or is not a scan of this project.
+    def _LoadScanDirCache(self, _xFilePath: Union[str, list, tuple, Path]) -> Optional[dict[str, tuple]]:
+        pathFile: Path = anypath.MakeNormPath(_xFilePath)
+        if not pathFile.exists():
+            return None
+        # endif
+
+        try:
+            dicData = anyfile.LoadPickle(pathFile)
+        except Exception:
+            return None
+        # endtry
+
+        if not config.IsConfigType(dicData, "/catharsys/production/scan:1"):
+            return None
+        # endif
+
+        if dicData.get("sProjectId") != self._xProject.sId:
+            return None
+        # endif
+
+        sDirCacheFile: Optional[str] = dicData.get("sDirCacheFile")
+        if sDirCacheFile is None:
+            return dicData.get("mDirCache")
+        # endif
+
+        try:
+            return anyfile.LoadPickle(pathFile.parent / sDirCacheFile)
+        except Exception:
+            return None
+        # endtry
+
+    # enddef
+
     # ######################################################################################################
     def RegisterSystemVar(self, xPathVar: CPathVar):
         self._dicSystemVars[xPathVar.sId] = copy.copy(xPathVar)
@@ -353,8 +559,8 @@ class CProducts:
             raise RuntimeError("Path variable 'top' must not be the first element of a path structure")
         # endif
 
-        for pathItem in _pathScan.iterdir():
-            if not pathItem.is_dir() or pathItem.name.startswith("rq"):
+        for pathItem, bIsDir, _ in self._xDirCache.IterDir(_pathScan):
+            if not bIsDir or pathItem.name.startswith("rq"):
                 continue
             # endif
 
@@ -368,9 +574,9 @@ class CProducts:
         if _pathScan is None:
             raise RuntimeError("Path variable 'rq' must not be the first element of a path structure")
         # endif
-        for pathItem in _pathScan.iterdir():
+        for pathItem, bIsDir, _ in self._xDirCache.IterDir(_pathScan):
             xMatch = CProducts.c_reRenderQuality.fullmatch(pathItem.name)
-            if not pathItem.is_dir() or xMatch is None:
+            if not bIsDir or xMatch is None:
                 continue
             # endif
 
@@ -398,9 +604,9 @@ class CProducts:
         if _pathScan is None:
             raise RuntimeError("Path variable 'frame' must not be the first element of a path structure")
         # endif
-        for pathItem in _pathScan.iterdir():
+        for pathItem, _, bIsFile in self._xDirCache.IterDir(_pathScan):
             xMatch = CProducts.c_reFrame.fullmatch(pathItem.name)
-            if not pathItem.is_file() or xMatch is None:
+            if not bIsFile or xMatch is None:
                 continue
             # endif
             yield CPathVarHandlerResult(
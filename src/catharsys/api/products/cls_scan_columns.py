@@ -0,0 +1,380 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import pickle
+import numpy as np
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .cls_node import CNode
+
+
+# ##########################################################################################################
+# Columnar representation of a product scan tree.
+#
+# The nodes are stored in pre-order, so that the subtree of node i consists of the nodes
+# [i, i + size[i]). Node names and path names are ids into a string table and the node
+# data are ids into a data table. The children of node i are the node indices
+# children[child_start[i]:child_start[i + 1]], in the order of the tree.
+#
+# The string table is a single UTF-8 byte array with the strings sorted by their bytes,
+# where string i is string_data[string_offsets[i]:string_offsets[i + 1]]. The data table
+# is stored in the same way, with each value pickled separately. Strings and data values
+# are only decoded when they are requested.
+#
+# All arrays are stored as separate '.npy' files in a folder and are memory mapped when loaded.
+class CScanColumns:
+    c_lArrayNames: list[str] = [
+        "parent",
+        "size",
+        "depth",
+        "name",
+        "path_name",
+        "level",
+        "type",
+        "data",
+        "children",
+        "child_start",
+        "string_data",
+        "string_offsets",
+        "data_data",
+        "data_offsets",
+    ]
+
+    def __init__(self, _dicArrays: dict[str, np.ndarray]):
+        self._aParent: np.ndarray = _dicArrays["parent"]
+        self._aSize: np.ndarray = _dicArrays["size"]
+        self._aDepth: np.ndarray = _dicArrays["depth"]
+        self._aName: np.ndarray = _dicArrays["name"]
+        self._aPathName: np.ndarray = _dicArrays["path_name"]
+        self._aLevel: np.ndarray = _dicArrays["level"]
+        self._aType: np.ndarray = _dicArrays["type"]
+        self._aData: np.ndarray = _dicArrays["data"]
+        self._aChildren: np.ndarray = _dicArrays["children"]
+        self._aChildStart: np.ndarray = _dicArrays["child_start"]
+        self._aStringData: np.ndarray = _dicArrays["string_data"]
+        self._aStringOffsets: np.ndarray = _dicArrays["string_offsets"]
+        self._aDataData: np.ndarray = _dicArrays["data_data"]
+        self._aDataOffsets: np.ndarray = _dicArrays["data_offsets"]
+        # Decoded strings, string ids and data values
+        self._dicStrings: dict[int, str] = dict()
+        self._dicStringIds: dict[str, int] = dict()
+        self._dicData: dict[int, Any] = dict()
+
+    # enddef
+
+    @property
+    def iNodeCount(self) -> int:
+        return len(self._aParent)
+
+    # enddef
+
+    # ######################################################################################################
+    # Create the columns from a node tree. The function '_funcData' maps the node data to
+    # a picklable value. The data of the root node is not stored.
+    @classmethod
+    def FromTree(cls, _xRoot: CNode, _funcData: Callable[[Any], Any]) -> "CScanColumns":
+        lParent: list[int] = []
+        lDepth: list[int] = []
+        lName: list[int] = []
+        lPathName: list[int] = []
+        lLevel: list[int] = []
+        lType: list[int] = []
+        lDataIdx: list[int] = []
+
+        dicStringIds: dict[str, int] = dict()
+        dicDataIds: dict[Any, int] = dict()
+        lData: list[Any] = []
+
+        def _GetStringId(_sValue: str) -> int:
+            return dicStringIds.setdefault(_sValue, len(dicStringIds))
+
+        # enddef
+
+        def _GetDataId(_xValue: Any) -> int:
+            if _xValue is None:
+                return -1
+            # endif
+            try:
+                iId = dicDataIds.get(_xValue)
+            except TypeError:
+                # Unhashable values are not shared
+                lData.append(_xValue)
+                return len(lData) - 1
+            # endtry
+            if iId is None:
+                iId = dicDataIds[_xValue] = len(lData)
+                lData.append(_xValue)
+            # endif
+            return iId
+
+        # enddef
+
+        # The subtree size of a node is set, when the marker after its subtree is popped from the stack
+        lSize: list[int] = []
+        lStack: list[tuple[Optional[CNode], int, int]] = [(_xRoot, -1, 0)]
+        while len(lStack) > 0:
+            xNode, iParent, iDepth = lStack.pop()
+            if xNode is None:
+                lSize[iParent] = len(lParent) - iParent
+                continue
+            # endif
+            iIdx = len(lParent)
+            lSize.append(1)
+            lParent.append(iParent)
+            lDepth.append(iDepth)
+            lName.append(_GetStringId(str(xNode.name)))
+            lPathName.append(-1 if xNode._sPathName == xNode.name else _GetStringId(str(xNode._sPathName)))
+            lLevel.append(xNode._iLevel)
+            lType.append(int(xNode._eType))
+            lDataIdx.append(-1 if iParent < 0 else _GetDataId(_funcData(xNode._xData)))
+            tChildren = xNode.children
+            if len(tChildren) > 0:
+                lStack.append((None, iIdx, 0))
+                lStack.extend((xChild, iIdx, iDepth + 1) for xChild in reversed(tChildren))
+            # endif
+        # endwhile
+
+        aParent = np.array(lParent, dtype=np.int64)
+        iNodeCnt: int = len(aParent)
+
+        # Sort the string table by the UTF-8 bytes, so that string ids can be found by bisection
+        lStringBytes: list[bytes] = [sValue.encode("utf-8", "surrogatepass") for sValue in dicStringIds]
+        lOrder: list[int] = sorted(range(len(lStringBytes)), key=lStringBytes.__getitem__)
+        aStringIds = np.empty(len(lOrder) + 1, dtype=np.int32)
+        aStringIds[lOrder] = np.arange(len(lOrder), dtype=np.int32)
+        # Maps -1 to -1 for path names, which are the same as the names
+        aStringIds[-1] = -1
+        aStringData, aStringOffsets = cls._CreateBlob([lStringBytes[iIdx] for iIdx in lOrder])
+        aDataData, aDataOffsets = cls._CreateBlob(
+            [pickle.dumps(xValue, protocol=pickle.HIGHEST_PROTOCOL) for xValue in lData]
+        )
+
+        # The stable sort keeps the children of each node in tree order
+        aChildren = np.argsort(aParent[1:], kind="stable").astype(np.int64) + 1
+        aChildStart = np.zeros(iNodeCnt + 1, dtype=np.int64)
+        np.cumsum(np.bincount(aParent[1:], minlength=iNodeCnt), out=aChildStart[1:])
+
+        dicArrays: dict[str, np.ndarray] = {
+            "parent": aParent,
+            "size": np.array(lSize, dtype=np.int64),
+            "depth": np.array(lDepth, dtype=np.int32),
+            "name": aStringIds[np.array(lName, dtype=np.int64)],
+            "path_name": aStringIds[np.array(lPathName, dtype=np.int64)],
+            "level": np.array(lLevel, dtype=np.int32),
+            "type": np.array(lType, dtype=np.int8),
+            "data": np.array(lDataIdx, dtype=np.int32),
+            "children": aChildren,
+            "child_start": aChildStart,
+            "string_data": aStringData,
+            "string_offsets": aStringOffsets,
+            "data_data": aDataData,
+            "data_offsets": aDataOffsets,
+        }
+        return cls(dicArrays)
+
+    # enddef
+
+    # ######################################################################################################
+    # Concatenate byte strings to a single byte array and an array of offsets with one more element
+    @staticmethod
+    def _CreateBlob(_lBytes: list[bytes]) -> tuple[np.ndarray, np.ndarray]:
+        aOffsets = np.zeros(len(_lBytes) + 1, dtype=np.int64)
+        np.cumsum(np.array([len(bytValue) for bytValue in _lBytes], dtype=np.int64), out=aOffsets[1:])
+        aData = np.frombuffer(b"".join(_lBytes), dtype=np.uint8).copy()
+        return aData, aOffsets
+
+    # enddef
+
+    # ######################################################################################################
+    def Save(self, _pathFolder: Path):
+        _pathFolder.mkdir(parents=True, exist_ok=True)
+        for sName in self.c_lArrayNames:
+            np.save(_pathFolder / f"{sName}.npy", getattr(self, self._GetAttrName(sName)), allow_pickle=False)
+        # endfor
+
+    # enddef
+
+    # ######################################################################################################
+    @classmethod
+    def Load(cls, _pathFolder: Path, *, _bMemoryMap: bool = True) -> "CScanColumns":
+        sMode: Optional[str] = "r" if _bMemoryMap is True else None
+        dicArrays: dict[str, np.ndarray] = {
+            sName: np.load(_pathFolder / f"{sName}.npy", mmap_mode=sMode, allow_pickle=False)
+            for sName in cls.c_lArrayNames
+        }
+        return cls(dicArrays)
+
+    # enddef
+
+    @staticmethod
+    def _GetAttrName(_sArrayName: str) -> str:
+        return "_a" + "".join(x.capitalize() for x in _sArrayName.split("_"))
+
+    # enddef
+
+    @property
+    def iStringCount(self) -> int:
+        return len(self._aStringOffsets) - 1
+
+    # enddef
+
+    # ######################################################################################################
+    def _GetStringBytes(self, _iId: int) -> bytes:
+        return self._aStringData[self._aStringOffsets[_iId] : self._aStringOffsets[_iId + 1]].tobytes()
+
+    # enddef
+
+    def _GetString(self, _iId: int) -> str:
+        sValue: Optional[str] = self._dicStrings.get(_iId)
+        if sValue is None:
+            sValue = self._dicStrings[_iId] = self._GetStringBytes(_iId).decode("utf-8", "surrogatepass")
+        # endif
+        return sValue
+
+    # enddef
+
+    # Get the id of a string by bisection of the sorted string table, or -1 if it is not in the table
+    def _GetStringId(self, _sValue: str) -> int:
+        iId: Optional[int] = self._dicStringIds.get(_sValue)
+        if iId is not None:
+            return iId
+        # endif
+
+        bytValue: bytes = _sValue.encode("utf-8", "surrogatepass")
+        iLow: int = 0
+        iHigh: int = self.iStringCount
+        while iLow < iHigh:
+            iMid = (iLow + iHigh) // 2
+            if self._GetStringBytes(iMid) < bytValue:
+                iLow = iMid + 1
+            else:
+                iHigh = iMid
+            # endif
+        # endwhile
+
+        iId = iLow if iLow < self.iStringCount and self._GetStringBytes(iLow) == bytValue else -1
+        self._dicStringIds[_sValue] = iId
+        return iId
+
+    # enddef
+
+    # ######################################################################################################
+    def GetName(self, _iNode: int) -> str:
+        return self._GetString(int(self._aName[_iNode]))
+
+    # enddef
+
+    def GetPathName(self, _iNode: int) -> str:
+        iId = self._aPathName[_iNode]
+        if iId < 0:
+            return self.GetName(_iNode)
+        # endif
+        return self._GetString(int(iId))
+
+    # enddef
+
+    def GetLevel(self, _iNode: int) -> int:
+        return int(self._aLevel[_iNode])
+
+    # enddef
+
+    def GetType(self, _iNode: int) -> int:
+        return int(self._aType[_iNode])
+
+    # enddef
+
+    def GetData(self, _iNode: int) -> Any:
+        iId = int(self._aData[_iNode])
+        if iId < 0:
+            return None
+        # endif
+
+        if iId not in self._dicData:
+            bytValue = self._aDataData[self._aDataOffsets[iId] : self._aDataOffsets[iId + 1]].tobytes()
+            self._dicData[iId] = pickle.loads(bytValue)
+        # endif
+        return self._dicData[iId]
+
+    # enddef
+
+    def GetSubtreeSize(self, _iNode: int) -> int:
+        return int(self._aSize[_iNode])
+
+    # enddef
+
+    # ######################################################################################################
+    def GetChildren(self, _iNode: int) -> np.ndarray:
+        return self._aChildren[self._aChildStart[_iNode] : self._aChildStart[_iNode + 1]]
+
+    # enddef
+
+    def GetChildCount(self, _iNode: int) -> int:
+        return int(self._aChildStart[_iNode + 1] - self._aChildStart[_iNode])
+
+    # enddef
+
+    # Get the index of the first child with the given name or -1, if there is none
+    def GetChild(self, _iNode: int, _sName: str) -> int:
+        iNameId = self._GetStringId(_sName)
+        if iNameId < 0:
+            return -1
+        # endif
+        aChildren = self.GetChildren(_iNode)
+        aMatch = np.flatnonzero(self._aName[aChildren] == iNameId)
+        if len(aMatch) == 0:
+            return -1
+        # endif
+        return int(aChildren[aMatch[0]])
+
+    # enddef
+
+    # Get the children whose names are in the given set, in tree order
+    def GetChildrenByName(self, _iNode: int, _setNames: set[str]) -> np.ndarray:
+        aNameIds = np.array([self._GetStringId(sName) for sName in _setNames], dtype=np.int32)
+        aChildren = self.GetChildren(_iNode)
+        return aChildren[np.isin(self._aName[aChildren], aNameIds)]
+
+    # enddef
+
+    # ######################################################################################################
+    # Get the sets of names per depth of the subtree of the given node, starting with the node itself.
+    # At most '_iMaxLevel' depths are returned and the list ends before the first empty depth,
+    # like the level groups of anytree.LevelGroupOrderIter().
+    def GetLevelNameSets(self, _iNode: int, _iMaxLevel: int) -> list[set[str]]:
+        iEnd: int = _iNode + int(self._aSize[_iNode])
+        aRelDepth = self._aDepth[_iNode:iEnd] - self._aDepth[_iNode]
+        aNames = self._aName[_iNode:iEnd]
+
+        lNameSets: list[set[str]] = []
+        for iDepth in range(_iMaxLevel):
+            aNameIds = np.unique(aNames[aRelDepth == iDepth])
+            if len(aNameIds) == 0:
+                break
+            # endif
+            lNameSets.append(set(self._GetString(iId) for iId in aNameIds.tolist()))
+        # endfor
+        return lNameSets
+
+    # enddef
+
+
+# endclass
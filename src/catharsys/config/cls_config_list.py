@@ -29,6 +29,7 @@ import os
 from anybase import assertion
 from catharsys.util import config, path
 from catharsys.config.cls_project import CProjectConfig
+from catharsys.util.cls_config_store import CConfigStore
 from anybase.cls_any_error import CAnyError, CAnyError_Message
 
 from catharsys.decs.decorator_log import logFunctionCall
@@ -168,6 +169,13 @@ class CConfigList:
         # endif
         self._dicGrpCfg = dicLoadCfg["dicCfg"]
 
+        # Large elements may be stored in a config store shared by all job configs
+        sConfigStore = self._dicGrpCfg.get("sConfigStore")
+        if sConfigStore is not None:
+            xConfigStore = CConfigStore(pathFile.parent / sConfigStore)
+            self._dicGrpCfg = xConfigStore.ResolveRefs(self._dicGrpCfg)
+        # endif
+
         # Get Project Config instance
         dicPrjCfg = self._dicGrpCfg.get("mPrjCfg")
         if dicPrjCfg is None:
@@ -32,13 +32,23 @@ from anybase.cls_process_handler import CProcessHandler
 # Base class for job configurations for different action classes
 class CConfigExecJob:
     ######################################################################################
-    def __init__(self, *, _iIdx: int, _sName: str, _sLabel: str, _pathConfig: Path, _dicConfig: dict):
+    # If '_xProcHandler' is not given, the job gets its own process handler.
+    def __init__(
+        self,
+        *,
+        _iIdx: int,
+        _sName: str,
+        _sLabel: str,
+        _pathConfig: Path,
+        _dicConfig: dict,
+        _xProcHandler: Optional[CProcessHandler] = None,
+    ):
         self._iIdx: int = _iIdx
         self._sName: str = _sName
         self._sLabel: str = _sLabel
         self._pathConfig: Path = _pathConfig
         self._dicConfig: dict = copy.deepcopy(_dicConfig)
-        self._xProcHandler: CProcessHandler = CProcessHandler()
+        self._xProcHandler: CProcessHandler = CProcessHandler() if _xProcHandler is None else _xProcHandler
 
     # enddef
 
@@ -78,5 +88,12 @@ class CConfigExecJob:
 
     # enddef
 
+    ######################################################################################
+    # Release the configuration data, for example after it has been saved to the job file.
+    def ReleaseConfig(self):
+        self._dicConfig = None
+
+    # enddef
+
 
 # endclass
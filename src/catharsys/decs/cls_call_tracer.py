@@ -0,0 +1,279 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Base Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import os
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from time import perf_counter_ns
+from typing import Any, Callable, Optional, Union
+
+
+##########################################################################################
+# Records the calls of functions decorated with 'logFunctionCall' in an in-memory ring buffer.
+# Each call is stored as a single tuple (function, thread id, start time, duration), with
+# monotonic timestamps in nanoseconds. Appending to the ring buffer is thread safe and does
+# not block. If the buffer is full, the oldest events are dropped.
+# Names and source locations of the functions are only resolved when the events are exported
+# to the Chrome trace format (chrome://tracing, Perfetto) or the speedscope format.
+class CCallTracer:
+    c_sSpeedscopeSchema: str = "https://www.speedscope.app/file-format-schema.json"
+
+    ######################################################################################
+    def __init__(self, *, _iMaxEvents: int = 1000000):
+        self._iMaxEvents: int = _iMaxEvents
+        self._dqEvents: deque = deque(maxlen=_iMaxEvents)
+        # Number of added events. It is not locked, so it may miss some events of concurrent threads.
+        self._iEventCount: int = 0
+        self._iTimeStartNs: int = perf_counter_ns()
+        self._iPid: int = os.getpid()
+
+    # enddef
+
+    @property
+    def iMaxEvents(self) -> int:
+        return self._iMaxEvents
+
+    # enddef
+
+    # The number of events, which have been dropped because the ring buffer was full
+    @property
+    def iDroppedEvents(self) -> int:
+        return max(0, self._iEventCount - self._iMaxEvents)
+
+    # enddef
+
+    ######################################################################################
+    def AddCall(self, _funcCalled: Callable, _iTimeStartNs: int, _iTimeEndNs: int):
+        self._dqEvents.append((_funcCalled, threading.get_ident(), _iTimeStartNs, _iTimeEndNs - _iTimeStartNs))
+        self._iEventCount += 1
+
+    # enddef
+
+    ######################################################################################
+    # Add a message as instant event. Messages have a negative duration.
+    def AddMessage(self, _sMessage: str):
+        self._dqEvents.append((_sMessage, threading.get_ident(), perf_counter_ns(), -1))
+        self._iEventCount += 1
+
+    # enddef
+
+    ######################################################################################
+    def Clear(self):
+        self._dqEvents.clear()
+        self._iEventCount = 0
+
+    # enddef
+
+    ######################################################################################
+    @staticmethod
+    def _GetFrameInfo(_funcCalled: Callable) -> tuple[str, str, int]:
+        sName: str = getattr(_funcCalled, "__qualname__", None) or getattr(_funcCalled, "__name__", str(_funcCalled))
+        xCode = getattr(_funcCalled, "__code__", None)
+        if xCode is None:
+            return sName, "", 0
+        # endif
+        return sName, xCode.co_filename, xCode.co_firstlineno
+
+    # enddef
+
+    ######################################################################################
+    @staticmethod
+    def _GetThreadNames() -> dict[int, str]:
+        return {xThread.ident: xThread.name for xThread in threading.enumerate() if xThread.ident is not None}
+
+    # enddef
+
+    ######################################################################################
+    # Export the events in the Chrome trace event format. Timestamps are in microseconds
+    # relative to the start of the tracer.
+    def GetChromeTrace(self) -> dict:
+        lEvents: list = list(self._dqEvents.copy())
+        dicFrames: dict[Any, tuple[str, str, int]] = {}
+        setThreadIds: set[int] = set()
+        lTraceEvents: list[dict] = []
+
+        for xEvent, iTid, iTimeStartNs, iDurationNs in lEvents:
+            setThreadIds.add(iTid)
+            fTs: float = (iTimeStartNs - self._iTimeStartNs) / 1e3
+            if iDurationNs < 0:
+                lTraceEvents.append(
+                    {"name": xEvent, "cat": "log", "ph": "i", "s": "t", "ts": fTs, "pid": self._iPid, "tid": iTid}
+                )
+                continue
+            # endif
+
+            tFrame = dicFrames.get(xEvent)
+            if tFrame is None:
+                tFrame = dicFrames[xEvent] = self._GetFrameInfo(xEvent)
+            # endif
+            lTraceEvents.append(
+                {
+                    "name": tFrame[0],
+                    "cat": "call",
+                    "ph": "X",
+                    "ts": fTs,
+                    "dur": iDurationNs / 1e3,
+                    "pid": self._iPid,
+                    "tid": iTid,
+                    "args": {"file": tFrame[1], "line": tFrame[2]},
+                }
+            )
+        # endfor
+
+        dicThreadNames = self._GetThreadNames()
+        for iTid in sorted(setThreadIds):
+            lTraceEvents.append(
+                {
+                    "name": "thread_name",
+                    "ph": "M",
+                    "pid": self._iPid,
+                    "tid": iTid,
+                    "args": {"name": dicThreadNames.get(iTid, f"Thread {iTid}")},
+                }
+            )
+        # endfor
+
+        return {
+            "traceEvents": lTraceEvents,
+            "displayTimeUnit": "ms",
+            "otherData": {"iDroppedEvents": self.iDroppedEvents},
+        }
+
+    # enddef
+
+    ######################################################################################
+    # Export the calls in the speedscope file format, with one evented profile per thread.
+    # Messages are not exported.
+    def GetSpeedscope(self, _sName: str = "catharsys") -> dict:
+        lEvents: list = list(self._dqEvents.copy())
+        dicFrameIdx: dict[Any, int] = {}
+        lFrames: list[dict] = []
+        dicThreadCalls: dict[int, list[tuple[int, int, int]]] = {}
+
+        for xEvent, iTid, iTimeStartNs, iDurationNs in lEvents:
+            if iDurationNs < 0:
+                continue
+            # endif
+            iFrameIdx = dicFrameIdx.get(xEvent)
+            if iFrameIdx is None:
+                sName, sFile, iLine = self._GetFrameInfo(xEvent)
+                iFrameIdx = dicFrameIdx[xEvent] = len(lFrames)
+                lFrames.append({"name": sName, "file": sFile, "line": iLine})
+            # endif
+            iStart: int = iTimeStartNs - self._iTimeStartNs
+            dicThreadCalls.setdefault(iTid, []).append((iStart, iStart + iDurationNs, iFrameIdx))
+        # endfor
+
+        dicThreadNames = self._GetThreadNames()
+        lProfiles: list[dict] = []
+        for iTid, lCalls in sorted(dicThreadCalls.items()):
+            # Outer calls start before or together with their inner calls and last longer
+            lCalls.sort(key=lambda tCall: (tCall[0], -tCall[1]))
+            lOpenClose: list[dict] = []
+            lStack: list[tuple[int, int, int]] = []
+            iLastAt: int = 0
+
+            def _Close(_tCall: tuple[int, int, int]):
+                nonlocal iLastAt
+                iLastAt = max(iLastAt, _tCall[1])
+                lOpenClose.append({"type": "C", "frame": _tCall[2], "at": iLastAt})
+
+            # enddef
+
+            for tCall in lCalls:
+                while len(lStack) > 0 and lStack[-1][1] <= tCall[0]:
+                    _Close(lStack.pop())
+                # endwhile
+                iLastAt = max(iLastAt, tCall[0])
+                lOpenClose.append({"type": "O", "frame": tCall[2], "at": iLastAt})
+                lStack.append(tCall)
+            # endfor
+            while len(lStack) > 0:
+                _Close(lStack.pop())
+            # endwhile
+
+            lProfiles.append(
+                {
+                    "type": "evented",
+                    "name": dicThreadNames.get(iTid, f"Thread {iTid}"),
+                    "unit": "nanoseconds",
+                    "startValue": lCalls[0][0],
+                    "endValue": iLastAt,
+                    "events": lOpenClose,
+                }
+            )
+        # endfor
+
+        return {
+            "$schema": self.c_sSpeedscopeSchema,
+            "name": _sName,
+            "exporter": "catharsys",
+            "shared": {"frames": lFrames},
+            "profiles": lProfiles,
+        }
+
+    # enddef
+
+    ######################################################################################
+    # Save the events to a file. Files ending with '.speedscope.json' are saved in the
+    # speedscope format, all other files in the Chrome trace format.
+    def Save(self, _xPathFile: Union[str, Path]):
+        pathFile = Path(_xPathFile)
+        if pathFile.name.endswith(".speedscope.json"):
+            dicData = self.GetSpeedscope(pathFile.name[: -len(".speedscope.json")])
+        else:
+            dicData = self.GetChromeTrace()
+        # endif
+
+        pathFile.parent.mkdir(parents=True, exist_ok=True)
+        with open(pathFile, "w") as xFile:
+            json.dump(dicData, xFile)
+        # endwith
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# Get the trace file path from a path template, which may contain the placeholder '{pid}',
+# so that every process writes its own file, e.g. when cathy starts Blender processes.
+# Without the placeholder, the process id is appended to the file name before the suffixes,
+# e.g. 'trace.json' becomes 'trace_1234.json', so that processes do not overwrite their files.
+def GetTraceFilePath(_sPathTemplate: str) -> Optional[Path]:
+    if not _sPathTemplate:
+        return None
+    # endif
+    sPid: str = str(os.getpid())
+    if "{pid}" in _sPathTemplate:
+        return Path(_sPathTemplate.replace("{pid}", sPid))
+    # endif
+
+    pathTrace = Path(_sPathTemplate)
+    sSuffixes: str = "".join(pathTrace.suffixes)
+    sStem: str = pathTrace.name[: len(pathTrace.name) - len(sSuffixes)]
+    return pathTrace.with_name(f"{sStem}_{sPid}{sSuffixes}")
+
+
+# enddef
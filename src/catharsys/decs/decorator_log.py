@@ -23,8 +23,14 @@
 #
 # </LICENSE>
 ###
-from functools import partial
+import os
+import atexit
 import datetime
+import functools
+import threading
+from time import perf_counter_ns
+
+from catharsys.decs.cls_call_tracer import CCallTracer, GetTraceFilePath
 
 """this decorator may log inside a class static file all entering and leaving of functions inclusive the function depth
 
@@ -32,6 +38,10 @@ import datetime
 G_DEC_ENABLE_LOGGING (default False): the functionality can be switched on/off (but this is done normally in cmd line option --log-call )
 G_DEC_LOGGING_PATH (default None): the application, that controls the execution and switches the logging functionality on
         may set the Path (as it switches the functionality on)
+G_DEC_CALL_TRACER (default None): if set, all calls are recorded with timestamps, durations and thread ids
+        in an in-memory ring buffer, which can be exported to the Chrome trace or speedscope format.
+        Use SwitchTracingOn() / SwitchTracingOff(), or set the environment variable CATHARSYS_TRACE_FILE
+        to the trace file path, which may contain the placeholder '{pid}'. The trace is saved when the process exits.
 
 --- Usage:
 from catharsys.decs.decorator_log import logFunctionCall
@@ -55,9 +65,130 @@ One special method is callable: LogDateTime( sApplicationName). This will print
 # ###################################################################
 # private attributes inside class: during import time, different code-objects will be created, and class attributes are duplicated
 # !! -> global attribute works, class Attributes are not unique !!
-G_DEC_LOGGING_FUNCTION_DEPTH: int = 0
+G_DEC_LOGGING_FUNCTION_DEPTH = threading.local()
 G_DEC_ENABLE_LOGGING: bool = False
 G_DEC_LOGGING_PATH = None
+# The log file stays open while logging is enabled
+G_DEC_LOGGING_FILE = None
+G_DEC_LOGGING_LOCK = threading.Lock()
+G_DEC_CALL_TRACER: CCallTracer = None
+# True, if logging or tracing is enabled. This is the only test on the call path, if both are disabled.
+G_DEC_ACTIVE: bool = False
+
+
+# ---------------------------------------------------------------------------------------
+def _GetLoggingDepth() -> int:
+    return getattr(G_DEC_LOGGING_FUNCTION_DEPTH, "iDepth", 0)
+
+
+# enddef
+
+
+# ---------------------------------------------------------------------------------------
+def _WriteLog(sText: str, bFlush: bool = False):
+    """writes to the open log file, which is opened on first use.
+    The file is buffered, so the text is only written on flush, e.g. when a top-level call ends,
+    or when the file is closed. Processes that end via os._exit() lose unflushed text."""
+    global G_DEC_LOGGING_FILE
+    global G_DEC_LOGGING_PATH
+    with G_DEC_LOGGING_LOCK:
+        if G_DEC_LOGGING_FILE is None:
+            openMode = "a+"
+            if G_DEC_LOGGING_PATH is None:
+                from pathlib import Path
+
+                G_DEC_LOGGING_PATH = Path(os.getcwd()) / "cathy.call.md"
+                openMode = "w"
+            # endif
+            G_DEC_LOGGING_FILE = open(G_DEC_LOGGING_PATH, openMode, buffering=1 << 16)
+        # endif
+        G_DEC_LOGGING_FILE.write(sText)
+        if bFlush:
+            G_DEC_LOGGING_FILE.flush()
+        # endif
+    # endwith
+
+
+# enddef
+
+
+# ---------------------------------------------------------------------------------------
+def _FlushLog():
+    with G_DEC_LOGGING_LOCK:
+        if G_DEC_LOGGING_FILE is not None:
+            G_DEC_LOGGING_FILE.flush()
+        # endif
+    # endwith
+
+
+# enddef
+
+
+# ---------------------------------------------------------------------------------------
+def _ReopenLogAfterFork():
+    """the child process appends to the log file with its own file object,
+    as the buffer of the inherited file object is shared with the parent"""
+    global G_DEC_LOGGING_FILE
+    global G_DEC_LOGGING_LOCK
+    G_DEC_LOGGING_LOCK = threading.Lock()
+    if G_DEC_LOGGING_FILE is not None:
+        # The buffer has been flushed before the fork
+        G_DEC_LOGGING_FILE = None
+    # endif
+
+
+# enddef
+
+
+# ---------------------------------------------------------------------------------------
+def _CloseLog():
+    global G_DEC_LOGGING_FILE
+    with G_DEC_LOGGING_LOCK:
+        if G_DEC_LOGGING_FILE is not None:
+            G_DEC_LOGGING_FILE.close()
+            G_DEC_LOGGING_FILE = None
+        # endif
+    # endwith
+
+
+# enddef
+
+
+# ---------------------------------------------------------------------------------------
+def _CallLogged(wrappedFunc, args, kwargs):
+    """calls the wrapped function and logs and traces the call, as enabled"""
+    bLogging: bool = G_DEC_ENABLE_LOGGING
+    xTracer: CCallTracer = G_DEC_CALL_TRACER
+
+    if bLogging:
+        # -- logging header
+        iDepth = _GetLoggingDepth()
+        xCode = getattr(wrappedFunc, "__code__", None)
+        sLocation = "" if xCode is None else f"(file:\\\\{xCode.co_filename}#L{xCode.co_firstlineno})"
+        _WriteLog(f"{'| '*iDepth}+ [{wrappedFunc.__name__}]{sLocation}\n")
+        G_DEC_LOGGING_FUNCTION_DEPTH.iDepth = iDepth + 1
+    # endif
+
+    iTimeStartNs: int = perf_counter_ns()
+    try:
+        # ----------------------------------------------------------------------------------------
+        return wrappedFunc(*args, **kwargs)
+        # ----------------------------------------------------------------------------------------
+    finally:
+        if xTracer is not None:
+            xTracer.AddCall(wrappedFunc, iTimeStartNs, perf_counter_ns())
+        # endif
+
+        if bLogging:
+            # -- logging footer
+            iDepth = max(_GetLoggingDepth() - 1, 0)
+            G_DEC_LOGGING_FUNCTION_DEPTH.iDepth = iDepth
+            _WriteLog(f"{'| '*iDepth}- {wrappedFunc.__name__}\n", bFlush=(iDepth == 0))
+        # endif
+    # endtry
+
+
+# enddef
 
 
 class __CLogFunctionCall:
@@ -80,53 +211,21 @@ class __CLogFunctionCall:
     # __FUNCTION_DEPTH: int = 0
 
     # ---------------------------------------------------------------------------------------
-    def __init__(self, wrappedFunc):
-        """forwards the __name__ and __doc__ from original function to decorator"""
-        self.__name__ = wrappedFunc.__name__
-        self.__doc__ = wrappedFunc.__doc__
-
-        self.wrappedFunc = wrappedFunc
-        # print(f"log Function-Calls of: {wrappedFunc.__name__}")
-        pass
-
-    # end __init__
-
-    def __get__(self, obj, objtype):
-        """Support instance methods."""
-        return partial(self.__call__, obj)
-
-    # ---------------------------------------------------------------------------------------
-    def __call__(self, *args, **kwargs):
-        """the decorator itself"""
-        global G_DEC_ENABLE_LOGGING
-        global G_DEC_LOGGING_PATH
-        if G_DEC_ENABLE_LOGGING:
-            # -- logging header
-            with open(G_DEC_LOGGING_PATH, "a+") as logFile:
-                global G_DEC_LOGGING_FUNCTION_DEPTH
+    def __new__(cls, wrappedFunc):
+        """returns a plain function wrapper, which is bound to instances like the original function.
+        If logging and tracing are disabled, a call only tests a single global flag."""
 
-                logFile.write(
-                    f"{'| '*G_DEC_LOGGING_FUNCTION_DEPTH}+ [{self.wrappedFunc.__name__}](file:\\\\{self.wrappedFunc.__code__.co_filename}#L{self.wrappedFunc.__code__.co_firstlineno})\n"
-                )
-                G_DEC_LOGGING_FUNCTION_DEPTH += 1
-                # logFile.write(f"{'| '*self.__FUNCTION_DEPTH}+ {self.wrappedFunc.__name__}()\n")
-                # self.__FUNCTION_DEPTH += 1
-                logFile.flush()
+        @functools.wraps(wrappedFunc)
+        def LogWrapper(*args, **kwargs):
+            if not G_DEC_ACTIVE:
+                return wrappedFunc(*args, **kwargs)
+            # endif
+            return _CallLogged(wrappedFunc, args, kwargs)
 
-            # ----------------------------------------------------------------------------------------
-            retVal = self.wrappedFunc(*args, **kwargs)
-            # ----------------------------------------------------------------------------------------
+        # enddef
 
-            # -- logging footer
-            with open(G_DEC_LOGGING_PATH, "a+") as logFile:
-                G_DEC_LOGGING_FUNCTION_DEPTH -= 1
-                logFile.write(f"{'| '*G_DEC_LOGGING_FUNCTION_DEPTH}- {self.wrappedFunc.__name__}\n")
-                # self.__FUNCTION_DEPTH -= 1
-                # logFile.write(f"{'| '*self.__FUNCTION_DEPTH}- {self.wrappedFunc.__name__}\n")
-                logFile.flush()
-        else:
-            retVal = self.wrappedFunc(*args, **kwargs)
-        return retVal
+        LogWrapper.wrappedFunc = wrappedFunc
+        return LogWrapper
 
     # enddef
 
@@ -146,48 +245,46 @@ class __CLogFunctionCall:
 
     # enddef
 
+    # ---------------------------------------------------------------------------------------
+    @classmethod
+    def GetCallTracer(cls) -> CCallTracer:
+        """returns the active call tracer or None"""
+        return G_DEC_CALL_TRACER
+
+    # enddef
+
     # ---------------------------------------------------------------------------------------
     @classmethod
     def PrintLog(cls, f_msg: str):
         """print some debug info for debug logging"""
-        global G_DEC_ENABLE_LOGGING
-        if G_DEC_ENABLE_LOGGING and isinstance(f_msg, str):
-            global G_DEC_LOGGING_PATH
+        if not G_DEC_ACTIVE or not isinstance(f_msg, str):
+            return
+        # endif
+
+        if G_DEC_CALL_TRACER is not None:
+            G_DEC_CALL_TRACER.AddMessage(f_msg)
+        # endif
+
+        if G_DEC_ENABLE_LOGGING:
             # -- logging header
-            with open(G_DEC_LOGGING_PATH, "a+") as logFile:
-                global G_DEC_LOGGING_FUNCTION_DEPTH
-                lines = [line for line in f_msg.split("\n") if line]
-                for line in lines:
-                    logFile.write(f"{'| '*G_DEC_LOGGING_FUNCTION_DEPTH}| {line}\n")
-                logFile.flush()
+            iDepth = _GetLoggingDepth()
+            lines = [line for line in f_msg.split("\n") if line]
+            _WriteLog("".join(f"{'| '*iDepth}| {line}\n" for line in lines), bFlush=True)
+        # endif
 
-        # enddef
+    # enddef
 
     @classmethod
     def LogDateTime(cls, sApplication=None):
         global G_DEC_ENABLE_LOGGING
 
         if G_DEC_ENABLE_LOGGING:
-            openMode = "a+"
             if sApplication is None:
                 sApplication = "catharsys"
 
-            global G_DEC_LOGGING_PATH
-            if G_DEC_LOGGING_PATH is None:
-                import os
-                from pathlib import Path
-
-                G_DEC_LOGGING_PATH = Path(os.getcwd()) / "cathy.call.md"
-                openMode = "w"
-
-            with open(G_DEC_LOGGING_PATH, openMode) as logFile:
-                now = datetime.datetime.now()
-                logFile.write(f"{'-'*120}\n")
-                datStr = f"{sApplication}: {now.strftime('%Y-%m-%d')} @ {now.strftime('%H-%M-%S')}\n"
-                logFile.write(datStr)
-                logFile.write(f"{'-'*120}\n\n")
-                logFile.flush()
-            # endif LOGGING_PATH
+            now = datetime.datetime.now()
+            datStr = f"{sApplication}: {now.strftime('%Y-%m-%d')} @ {now.strftime('%H-%M-%S')}\n"
+            _WriteLog(f"{'-'*120}\n{datStr}{'-'*120}\n\n")
         # endif ENABLE_LOGGING
 
     # enddef
@@ -264,10 +361,15 @@ logFunctionCall = __CLogFunctionCall
 # ---------------------------------------------------------------------------------------
 def SwitchLoggingOn(pathLogFile: str = None, sApplication: str = None):
     global G_DEC_ENABLE_LOGGING
+    global G_DEC_ACTIVE
     G_DEC_ENABLE_LOGGING = True
+    G_DEC_ACTIVE = True
 
     if isinstance(pathLogFile, str):
         global G_DEC_LOGGING_PATH
+        if pathLogFile != G_DEC_LOGGING_PATH:
+            _CloseLog()
+        # endif
         G_DEC_LOGGING_PATH = pathLogFile
     # endif
 
@@ -284,11 +386,15 @@ def SwitchLoggingOff(sApplication: str = None):
     global G_DEC_ENABLE_LOGGING
     global logFunctionCall
 
+    global G_DEC_ACTIVE
+
     if G_DEC_ENABLE_LOGGING:
         logFunctionCall.LogDateTime(sApplication)
     # endif log stop logging
 
     G_DEC_ENABLE_LOGGING = False
+    G_DEC_ACTIVE = G_DEC_CALL_TRACER is not None
+    _CloseLog()
 
     # don't bend back functionality to wrapper function
     # disabled functionality must be capsulated in single class when
@@ -296,3 +402,62 @@ def SwitchLoggingOff(sApplication: str = None):
 
 
 # end def
+
+
+# ---------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------
+def SwitchTracingOn(iMaxEvents: int = 1000000) -> CCallTracer:
+    """records all calls of decorated functions in a new call tracer, which is returned"""
+    global G_DEC_CALL_TRACER
+    global G_DEC_ACTIVE
+
+    G_DEC_CALL_TRACER = CCallTracer(_iMaxEvents=iMaxEvents)
+    G_DEC_ACTIVE = True
+    return G_DEC_CALL_TRACER
+
+
+# end def
+
+
+# ---------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------
+def SwitchTracingOff() -> CCallTracer:
+    """stops recording calls and returns the call tracer with the recorded calls"""
+    global G_DEC_CALL_TRACER
+    global G_DEC_ACTIVE
+
+    xTracer = G_DEC_CALL_TRACER
+    G_DEC_CALL_TRACER = None
+    G_DEC_ACTIVE = G_DEC_ENABLE_LOGGING
+    return xTracer
+
+
+# end def
+
+
+# ---------------------------------------------------------------------------------------
+# ---------------------------------------------------------------------------------------
+def __SaveTraceAtExit(pathTraceFile):
+    xTracer = SwitchTracingOff()
+    if xTracer is not None:
+        xTracer.Save(pathTraceFile)
+    # endif
+
+
+# end def
+
+
+# flush the log file, if the application does not switch logging off
+atexit.register(_CloseLog)
+
+# forked processes, like config workers, may end via os._exit() without running the atexit handlers
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_FlushLog, after_in_child=_ReopenLogAfterFork)
+# endif
+
+# tracing of the whole process, e.g. of production launches and the processes started by them
+pathTraceFileEnv = GetTraceFilePath(os.environ.get("CATHARSYS_TRACE_FILE", ""))
+if pathTraceFileEnv is not None:
+    SwitchTracingOn()
+    atexit.register(__SaveTraceAtExit, pathTraceFileEnv)
+# endif
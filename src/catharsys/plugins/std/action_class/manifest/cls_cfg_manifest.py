@@ -26,29 +26,22 @@
 
 # Class to handle manifest files
 import copy
-from dataclasses import dataclass
-from typing import Optional, Union
+from collections.abc import Sequence
+from typing import Optional
 from anybase.cls_any_error import CAnyError_Message
 from catharsys.util import config
 from catharsys.util.cls_configcml import CConfigCML
 from anybase import convert, path
-import ison
-from ison.core.defines import reLambdaPar
 from pathlib import Path
 
 from catharsys.decs.decorator_log import logFunctionCall
-
-
-@dataclass
-class CLoopRange:
-    iMin: int
-    iMax: int
-    iStep: int
-    iStepCnt: int = 0
-    iStride: int = 0
-
-
-# endclass
+from .cls_control_loop import (
+    CLoopRange,
+    CControlLoopIter,
+    CControlLoopValues,
+    CControlLoopValueChain,
+    CNestedRangeIndices,
+)
 
 
 class CConfigManifest:
@@ -173,136 +166,35 @@ class CConfigManifest:
     # enddef
 
     ######################################################################################
-    def _GetControlLoopIterCfg(
+    # Create the iteration configs of a control loop for the given indices.
+    # The configs are only created when accessed. The first config is created here,
+    # so that errors in the iteration config are reported when the trial is loaded.
+    def _CreateControlLoopValues(
         self,
         *,
-        _xIdx: Union[int, list[int]],
-        _dicIterCfg: dict,
         _dicCtrl: dict,
         _sImportPath: str,
         _iProcVersion: int,
-    ) -> dict:
-        dicCtrlIter = {}
-        if _dicIterCfg is not None:
-            dicCtrlIter = copy.deepcopy(_dicIterCfg)
-        # endif
-
-        bIsSingleIdx: bool = True
-
-        if _iProcVersion == 1:
-            if isinstance(_xIdx, list):
-                raise RuntimeError("Multiple iteration indices not supported for process type 1")
-            # endif
-
-            # Execute lambda function call on dicCtrlIter with parameter str(iIdx)
-            dicCtrlIter = ison.lambda_parser.Parse(dicCtrlIter, [str(_xIdx)])
-
-        elif _iProcVersion == 2:
-            if "__func_locals__" in dicCtrlIter or "__func_globals__" in dicCtrlIter:
-                raise RuntimeError(
-                    "You must define '__func_locals__' and '__func_globals__' outside the 'mIterationConfig' element.\n"
-                    "You can define these blocks at the top level of the loop configuration, as all variable blocks "
-                    "are copied into each iteration configuration block."
-                )
-            # endif
-
-            # In this new version, starting with Catharsys 3.2.32,
-            # the whole mIterationConfig element is regared as a lambda dictionary,
-            # as it was initially intended. However, this means, that instead of
-            # referencing the iteration index with '$L{%0}', you simply write '%0'.
-            sLambda = ison.lambda_parser.ToLambdaString(dicCtrlIter)
-            sCtrlIterLambda = f"$L{{{sLambda}}}"
-            # print(f"dicCtrlIter: {dicCtrlIter}")
-            # print(f"sCtrlIterLambda: {sCtrlIterLambda}")
-
-            if isinstance(_xIdx, int):
-                # Execute lambda function call on dicCtrlIter with parameter str(iIdx)
-                sCtrlIter = ison.lambda_parser.Parse(sCtrlIterLambda, [str(_xIdx)])
-
-            elif isinstance(_xIdx, list):
-                lStrIdx: list[str] = [str(i) for i in _xIdx]
-                sCtrlIter = ison.lambda_parser.Parse(sCtrlIterLambda, lStrIdx)
-                bIsSingleIdx = False
-
-            else:
-                raise RuntimeError(f"Invalid index type: {_xIdx}")
-            # endif
-
-            if sCtrlIter.startswith("$L{"):
-                lVars = [f"%{x[1]}" for x in reLambdaPar.findall(sCtrlIter)]
-                raise RuntimeError(
-                    "Not all lambda parameters could be replaced in the iteration configuration block.\n"
-                    "You must define lambda functions outside the 'mIterationConfig' block.\n"
-                    "Define lambda functions in a '__func_locals__' or '__func_globals__' block "
-                    "at the top level of the loop configuration, \nas all variable blocks "
-                    "are copied into each iteration configuration block.\n"
-                    f"The remaining variables are: {lVars}\n"
-                    f"This is the remaining lambda string:\n{sCtrlIter}"
-                )
-            # endif
-
-            dicCtrlIter = ison.lambda_parser.ToLambdaObject(sCtrlIter)
-
-        else:
-            raise RuntimeError(f"Unsupported control loop iteration config process version {_iProcVersion}")
-        # endif
-
-        # Add locally defined variables from loop config
-        for sVarType in [
-            "__locals__",
-            "__globals__",
-            "__eval_locals__",
-            "__eval_globals__",
-            "__func_locals__",
-            "__func_globals__",
-            "__runtime_vars__",
-        ]:
-            if sVarType not in _dicCtrl:
-                continue
-            # endif
-
-            if sVarType in dicCtrlIter:
-                dicCtrlIter[sVarType].update(_dicCtrl[sVarType])
-            else:
-                dicCtrlIter[sVarType] = copy.deepcopy(_dicCtrl[sVarType])
-            # endif
-        # endfor
-
-        # Store 'sId' in 'sCtrlId'
-        dicCtrlIter["sCtrlId"] = _dicCtrl.get("sId", "_")
-
-        # Replace 'sId' with the processed 'dIterId' if it exists
-        if "sId" not in dicCtrlIter:
-            sIdx: str = None
-            if bIsSingleIdx is True:
-                sIdx = str(_xIdx)
-            else:
-                sIdx = "/".join(_xIdx)
-            # endif
-
-            dicCtrlIter["sId"] = sIdx
-        else:
-            # process 'sId' in case it contains functions/variables
-            lProcId = self.xCML.Process(
-                dicCtrlIter,
-                sImportPath=_sImportPath,
-                lProcessPaths=["sId"],
-            )
-            dicCtrlIter["sId"] = convert.DictElementToString(lProcId[0], "sId")
+        _lIndices: Sequence,
+        _dicLoopInfo: Optional[dict] = None,
+    ) -> CControlLoopValues:
+        xIter = CControlLoopIter(
+            _xCML=self.xCML,
+            _dicIterCfg=_dicCtrl.get("mIterationConfig"),
+            _dicCtrl=_dicCtrl,
+            _sImportPath=_sImportPath,
+            _iProcVersion=_iProcVersion,
+        )
+        xValues = CControlLoopValues(_xIter=xIter, _lIndices=_lIndices, _dicLoopInfo=_dicLoopInfo)
+        if len(xValues) > 0:
+            xValues[0]  # noqa: B018
         # endif
+        return xValues
 
-        # add element 'idx' to config
-        dicCtrlIter["idx"] = _xIdx
-
-        # set iteration DTI
-        dicCtrlIter["sDTI"] = "/catharsys/manifest/control/loop/iter:1.0"
-
-        return dicCtrlIter
-
-    # endif
+    # enddef
 
     ######################################################################################
-    def _ProcessControlLoopRange(self, *, _pathCfgFile: Path, _dicCtrl: dict, _iProcVersion: int) -> list:
+    def _ProcessControlLoopRange(self, *, _pathCfgFile: Path, _dicCtrl: dict, _iProcVersion: int) -> Sequence:
         # xCML = CConfigCML(xPrjCfg=self.xPrjCfg, dicConstVars=_dicCfgVars)
 
         sImportPath = _pathCfgFile.parent.as_posix()
@@ -327,6 +219,12 @@ class CConfigManifest:
 
         if lRange[3] is not None:
             lActiveIndices = convert.DictElementToIntList(lRange[3], "lActiveIndices")
+            if not all(isinstance(x, int) and not isinstance(x, bool) for x in lActiveIndices):
+                raise RuntimeError(
+                    f"Element 'lActiveIndices' must be a list of integers, not: {lActiveIndices}. "
+                    f"See file: {_pathCfgFile.name}"
+                )
+            # endif
             if len(lActiveIndices) == 0:
                 lActiveIndices: list = None
             # endif
@@ -334,92 +232,20 @@ class CConfigManifest:
             lActiveIndices: list = None
         # endif
 
-        dicIterCfg = _dicCtrl.get("mIterationConfig")
-        lCtrlValues: list = []
-
-        for iIdx in range(iMin, iMax + 1, iStep):
-            if lActiveIndices is not None and iIdx not in lActiveIndices:
-                continue
-            # endif
-
-            dicCtrlIter = self._GetControlLoopIterCfg(
-                _xIdx=iIdx,
-                _dicIterCfg=dicIterCfg,
-                _dicCtrl=_dicCtrl,
-                _sImportPath=sImportPath,
-                _iProcVersion=_iProcVersion,
-            )
-            dicCtrlIter["iMin"] = iMin
-            dicCtrlIter["iMax"] = iMax
-            dicCtrlIter["iStep"] = iStep
-
-            # add iter config to value list
-            lCtrlValues.append(dicCtrlIter)
-        # endfor
-
-        return lCtrlValues
-
-    # enddef
-
-    ######################################################################################
-    def _IterControlLoopNestedRange(
-        self,
-        *,
-        _lLoops: list[CLoopRange],
-        _iDim: int,
-        _lIdx: list[int],
-        _lCtrlValues: list[dict],
-        _dicIterCfg: dict,
-        _dicCtrl: dict,
-        _sImportPath: str,
-        _iProcVersion: int,
-        _setActivePosList: Optional[set[int]] = None,
-    ):
-        xLoopRange = _lLoops[_iDim]
-        lIdx = _lIdx.copy()
-        lIdx.append(0)
-        bLastLoop: bool = len(lIdx) == len(_lLoops)
-
-        for iIdx in range(xLoopRange.iMin, xLoopRange.iMax + 1, xLoopRange.iStep):
-            lIdx[_iDim] = iIdx
-            if bLastLoop is False:
-                self._IterControlLoopNestedRange(
-                    _lLoops=_lLoops,
-                    _iDim=_iDim + 1,
-                    _lIdx=lIdx,
-                    _lCtrlValues=_lCtrlValues,
-                    _dicIterCfg=_dicIterCfg,
-                    _dicCtrl=_dicCtrl,
-                    _sImportPath=_sImportPath,
-                    _iProcVersion=_iProcVersion,
-                    _setActivePosList=_setActivePosList,
-                )
-            else:
-                if _setActivePosList is not None:
-                    iPos = sum([(iIdx - xLoop.iMin) * xLoop.iStride for iIdx, xLoop in zip(lIdx, _lLoops)])
-                    if iPos not in _setActivePosList:
-                        # print(f"Ignoring index {lIdx} with position {iPos}")
-                        continue
-                    # endif
-                # endif
-
-                dicCtrlIter = self._GetControlLoopIterCfg(
-                    _xIdx=lIdx.copy(),
-                    _dicIterCfg=_dicIterCfg,
-                    _dicCtrl=_dicCtrl,
-                    _sImportPath=_sImportPath,
-                    _iProcVersion=_iProcVersion,
-                )
-                dicCtrlIter["lMin"] = [xLoop.iMin for xLoop in _lLoops]
-                dicCtrlIter["lMax"] = [xLoop.iMax for xLoop in _lLoops]
-                dicCtrlIter["lStep"] = [xLoop.iStep for xLoop in _lLoops]
-
-                # add iter config to value list
-                _lCtrlValues.append(dicCtrlIter)
-
-            # endif
+        # Only the active indices that are part of the range are used, in the order of the range
+        lIndices: Sequence = range(iMin, iMax + 1, iStep)
+        if lActiveIndices is not None:
+            xRange = lIndices
+            lIndices = sorted((iIdx for iIdx in set(lActiveIndices) if iIdx in xRange), key=xRange.index)
+        # endif
 
-        # endfor
+        return self._CreateControlLoopValues(
+            _dicCtrl=_dicCtrl,
+            _sImportPath=sImportPath,
+            _iProcVersion=_iProcVersion,
+            _lIndices=lIndices,
+            _dicLoopInfo={"iMin": iMin, "iMax": iMax, "iStep": iStep},
+        )
 
     # enddef
 
@@ -430,7 +256,7 @@ class CConfigManifest:
         _pathCfgFile: Path,
         _dicCtrl: dict,
         _iProcVersion: int,
-    ) -> list:
+    ) -> Sequence:
         sImportPath = _pathCfgFile.parent.as_posix()
         lProcData = self.xCML.Process(
             _dicCtrl,
@@ -475,16 +301,9 @@ class CConfigManifest:
             lLoops.append(CLoopRange(iMin, iMax, iStep, iStepCnt))
         # endfor
 
-        lStrides: list[int] = [1]
-        iStride = 1
-        for xLoop in reversed(lLoops[1:]):
-            iStride *= xLoop.iMax - xLoop.iMin + 1
-            lStrides.insert(0, iStride)
-        # endfor
-
-        for xLoop, iStride in zip(lLoops, lStrides):
-            xLoop.iStride = iStride
-        # endfor
+        CNestedRangeIndices.SetLoopStrides(lLoops)
+        xGridIndices = CNestedRangeIndices(lLoops)
+        lIndices: Sequence = xGridIndices
 
         # Expects lActiveIndices to be a list of lists of indices.
         # Example of lActiveIndices for 2d nested list:
@@ -492,7 +311,6 @@ class CConfigManifest:
         # Example of lActiveIndices for 3d nested list:
         #   [ [2,3,1], [1,5,3] ]
 
-        setActivePosList: set[int] = None
         if lProcData[1] is not None:
             lActiveIndices = lProcData[1]["lActiveIndices"]
             if not isinstance(lActiveIndices, list):
@@ -501,40 +319,33 @@ class CConfigManifest:
                 )
             # endif
 
-            if not all((isinstance(x, list) for x in lActiveIndices)):
+            if not all(
+                isinstance(x, list) and all(isinstance(i, int) and not isinstance(i, bool) for i in x)
+                for x in lActiveIndices
+            ):
                 raise RuntimeError(
                     f"Element 'lActiveIndices' must be a list of lists of integers, not: {lActiveIndices}"
                 )
             # endif
 
             if len(lActiveIndices) > 0:
-                setActivePosList = set(
-                    [
-                        sum([(iIdx - xLoop.iMin) * xLoop.iStride for iIdx, xLoop in zip(lActIdx, lLoops)])
-                        for lActIdx in lActiveIndices
-                    ]
-                )
-                # print(f"setActivePosList: {setActivePosList}")
+                # Only the grid positions of the active indices are enumerated
+                lIndices = CNestedRangeIndices(lLoops, xGridIndices.EncodeIndices(lActiveIndices))
             # endif
         # endif
 
-        dicIterCfg = _dicCtrl.get("mIterationConfig")
-        lCtrlValues: list = []
-
-        self._IterControlLoopNestedRange(
-            _lLoops=lLoops,
-            _iDim=0,
-            _lIdx=[],
-            _lCtrlValues=lCtrlValues,
-            _dicIterCfg=dicIterCfg,
+        return self._CreateControlLoopValues(
             _dicCtrl=_dicCtrl,
             _sImportPath=sImportPath,
-            _setActivePosList=setActivePosList,
             _iProcVersion=_iProcVersion,
+            _lIndices=lIndices,
+            _dicLoopInfo={
+                "lMin": [xLoop.iMin for xLoop in lLoops],
+                "lMax": [xLoop.iMax for xLoop in lLoops],
+                "lStep": [xLoop.iStep for xLoop in lLoops],
+            },
         )
 
-        return lCtrlValues
-
     # enddef
 
     ######################################################################################
@@ -544,7 +355,7 @@ class CConfigManifest:
         _pathCfgFile: Path,
         _dicCtrl: dict,
         _iProcVersion: int,
-    ) -> list:
+    ) -> Sequence:
         # xCML = CConfigCML(xPrjCfg=self.xPrjCfg, dicConstVars=_dicCfgVars)
 
         sImportPath = _pathCfgFile.parent.as_posix()
@@ -598,26 +409,13 @@ class CConfigManifest:
 
         iStep = convert.DictElementToInt(lRange[3], "iStep", iDefault=1)
 
-        dicIterCfg = _dicCtrl.get("mIterationConfig")
-        lCtrlValues: list = []
-
-        for iListIdx in range(iMin, iMax + 1, iStep):
-            # The actual index to use
-            iIdx: int = lIndices[iListIdx]
-
-            dicCtrlIter = self._GetControlLoopIterCfg(
-                _xIdx=iIdx,
-                _dicIterCfg=dicIterCfg,
-                _dicCtrl=_dicCtrl,
-                _sImportPath=sImportPath,
-                _iProcVersion=_iProcVersion,
-            )
-
-            # add iter config to value list
-            lCtrlValues.append(dicCtrlIter)
-        # endfor
-
-        return lCtrlValues
+        # The actual indices to use
+        return self._CreateControlLoopValues(
+            _dicCtrl=_dicCtrl,
+            _sImportPath=sImportPath,
+            _iProcVersion=_iProcVersion,
+            _lIndices=lIndices[iMin : iMax + 1 : iStep],
+        )
 
     # enddef
 
@@ -673,7 +471,8 @@ class CConfigManifest:
                 # Process manifest control configs
                 dicRes = config.CheckDti(sCfgDti, "/catharsys/manifest/control/*:*")
                 if dicRes["bOK"] is True and sCfgForm.startswith("file/"):
-                    lCtrlValues = []
+                    # The iteration configs are only created when they are accessed
+                    lCtrlValues: list[Sequence] = []
                     sTrialPath = config.GetDictValue(
                         _dicTrial,
                         "__locals__/path",
@@ -711,7 +510,7 @@ class CConfigManifest:
                                 iProcVersion = 2
                             # endif
 
-                            lCtrlValues.extend(
+                            lCtrlValues.append(
                                 self._ProcessControlLoopRange(
                                     _pathCfgFile=pathCfgFile,
                                     _dicCtrl=dicCtrl,
@@ -725,7 +524,7 @@ class CConfigManifest:
                                 iProcVersion = 2
                             # endif
 
-                            lCtrlValues.extend(
+                            lCtrlValues.append(
                                 self._ProcessControlLoopList(
                                     _pathCfgFile=pathCfgFile,
                                     _dicCtrl=dicCtrl,
@@ -734,7 +533,7 @@ class CConfigManifest:
                             )
 
                         elif lCtrlType[0] == "loop" and lCtrlType[1] == "nested-range" and lCtrlVer[0] == 1:
-                            lCtrlValues.extend(
+                            lCtrlValues.append(
                                 self._ProcessControlLoopNestedRange(
                                     _pathCfgFile=pathCfgFile,
                                     _dicCtrl=dicCtrl,
@@ -752,7 +551,7 @@ class CConfigManifest:
                     # endfor loop config
 
                     # store loop indices as values in trial configuration
-                    dicCfg["lValues"] = copy.deepcopy(lCtrlValues)
+                    dicCfg["lValues"] = CControlLoopValueChain(lCtrlValues)
                     dicCfg["sForm"] = "value"
 
                 else:
@@ -0,0 +1,409 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+#####################################################################
+# Lazy iteration configs of manifest control loops
+import copy
+import bisect
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Any, Optional, Union
+
+import numpy as np
+import ison
+from ison.core.defines import reLambdaPar
+from anybase import convert
+
+from catharsys.util.cls_configcml import CConfigCML
+
+
+@dataclass
+class CLoopRange:
+    iMin: int
+    iMax: int
+    iStep: int
+    iStepCnt: int = 0
+    iStride: int = 0
+
+
+# endclass
+
+
+##########################################################################################
+# Compiled iteration config of a control loop.
+# The 'mIterationConfig' element and the variable blocks of the loop config are prepared
+# once, so that creating the iteration config for an index only needs to substitute
+# the index into the iteration config.
+class CControlLoopIter:
+    c_lVarTypes: list[str] = [
+        "__locals__",
+        "__globals__",
+        "__eval_locals__",
+        "__eval_globals__",
+        "__func_locals__",
+        "__func_globals__",
+        "__runtime_vars__",
+    ]
+
+    def __init__(
+        self,
+        *,
+        _xCML: CConfigCML,
+        _dicIterCfg: Optional[dict],
+        _dicCtrl: dict,
+        _sImportPath: str,
+        _iProcVersion: int,
+    ):
+        self._xCML: CConfigCML = _xCML
+        self._sImportPath: str = _sImportPath
+        self._iProcVersion: int = _iProcVersion
+
+        self._dicIterCfg: dict = {}
+        if _dicIterCfg is not None:
+            self._dicIterCfg = copy.deepcopy(_dicIterCfg)
+        # endif
+
+        self._sIterLambda: Optional[str] = None
+        if _iProcVersion == 2:
+            if "__func_locals__" in self._dicIterCfg or "__func_globals__" in self._dicIterCfg:
+                raise RuntimeError(
+                    "You must define '__func_locals__' and '__func_globals__' outside the 'mIterationConfig' element.\n"
+                    "You can define these blocks at the top level of the loop configuration, as all variable blocks "
+                    "are copied into each iteration configuration block."
+                )
+            # endif
+
+            # In this new version, starting with Catharsys 3.2.32,
+            # the whole mIterationConfig element is regared as a lambda dictionary,
+            # as it was initially intended. However, this means, that instead of
+            # referencing the iteration index with '$L{%0}', you simply write '%0'.
+            sLambda = ison.lambda_parser.ToLambdaString(self._dicIterCfg)
+            self._sIterLambda = f"$L{{{sLambda}}}"
+
+        elif _iProcVersion != 1:
+            raise RuntimeError(f"Unsupported control loop iteration config process version {_iProcVersion}")
+        # endif
+
+        # Locally defined variables from loop config
+        self._dicVarBlocks: dict[str, dict] = {
+            sVarType: copy.deepcopy(_dicCtrl[sVarType]) for sVarType in self.c_lVarTypes if sVarType in _dicCtrl
+        }
+        self._sCtrlId: str = _dicCtrl.get("sId", "_")
+
+    # enddef
+
+    ######################################################################################
+    # Create the iteration config for the given index or list of indices
+    def Create(self, _xIdx: Union[int, list[int]]) -> dict:
+        bIsSingleIdx: bool = True
+
+        if self._iProcVersion == 1:
+            if isinstance(_xIdx, list):
+                raise RuntimeError("Multiple iteration indices not supported for process type 1")
+            # endif
+
+            # Execute lambda function call on dicCtrlIter with parameter str(iIdx)
+            dicCtrlIter = ison.lambda_parser.Parse(copy.deepcopy(self._dicIterCfg), [str(_xIdx)])
+
+        else:
+            if isinstance(_xIdx, int):
+                # Execute lambda function call on dicCtrlIter with parameter str(iIdx)
+                sCtrlIter = ison.lambda_parser.Parse(self._sIterLambda, [str(_xIdx)])
+
+            elif isinstance(_xIdx, list):
+                lStrIdx: list[str] = [str(i) for i in _xIdx]
+                sCtrlIter = ison.lambda_parser.Parse(self._sIterLambda, lStrIdx)
+                bIsSingleIdx = False
+
+            else:
+                raise RuntimeError(f"Invalid index type: {_xIdx}")
+            # endif
+
+            if sCtrlIter.startswith("$L{"):
+                lVars = [f"%{x[1]}" for x in reLambdaPar.findall(sCtrlIter)]
+                raise RuntimeError(
+                    "Not all lambda parameters could be replaced in the iteration configuration block.\n"
+                    "You must define lambda functions outside the 'mIterationConfig' block.\n"
+                    "Define lambda functions in a '__func_locals__' or '__func_globals__' block "
+                    "at the top level of the loop configuration, \nas all variable blocks "
+                    "are copied into each iteration configuration block.\n"
+                    f"The remaining variables are: {lVars}\n"
+                    f"This is the remaining lambda string:\n{sCtrlIter}"
+                )
+            # endif
+
+            dicCtrlIter = ison.lambda_parser.ToLambdaObject(sCtrlIter)
+        # endif
+
+        # Add locally defined variables from loop config
+        for sVarType, dicVars in self._dicVarBlocks.items():
+            if sVarType in dicCtrlIter:
+                dicCtrlIter[sVarType].update(copy.deepcopy(dicVars))
+            else:
+                dicCtrlIter[sVarType] = copy.deepcopy(dicVars)
+            # endif
+        # endfor
+
+        # Store 'sId' in 'sCtrlId'
+        dicCtrlIter["sCtrlId"] = self._sCtrlId
+
+        # Replace 'sId' with the processed 'dIterId' if it exists
+        if "sId" not in dicCtrlIter:
+            if bIsSingleIdx is True:
+                dicCtrlIter["sId"] = str(_xIdx)
+            else:
+                dicCtrlIter["sId"] = "/".join(str(i) for i in _xIdx)
+            # endif
+        else:
+            # process 'sId' in case it contains functions/variables
+            lProcId = self._xCML.Process(
+                dicCtrlIter,
+                sImportPath=self._sImportPath,
+                lProcessPaths=["sId"],
+            )
+            dicCtrlIter["sId"] = convert.DictElementToString(lProcId[0], "sId")
+        # endif
+
+        # add element 'idx' to config
+        dicCtrlIter["idx"] = _xIdx
+
+        # set iteration DTI
+        dicCtrlIter["sDTI"] = "/catharsys/manifest/control/loop/iter:1.0"
+
+        return dicCtrlIter
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# Base class of the sequences, which create their elements only when accessed.
+# They are shown and converted like the list of all their elements, so that their text
+# form does not depend on the instance and they can be converted to JSON via ToList().
+class CLazySequence(Sequence):
+    def ToList(self) -> list:
+        return list(self)
+
+    # enddef
+
+    def __repr__(self) -> str:
+        return repr(self.ToList())
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# Sequence of the indices of a nested range loop, ordered with the last loop varying fastest.
+# Each element is the list of loop indices. Grid points are identified by their position
+# in the full grid, which is the sum of the step indices of all loops times the loop strides.
+# The strides of the loops must be set, e.g. by SetLoopStrides().
+# If '_aPositions' is given, only the grid points at these positions are part of the sequence.
+# Their indices are decoded at once, so that the cost is proportional to the number of positions.
+class CNestedRangeIndices(CLazySequence):
+    def __init__(self, _lLoops: list[CLoopRange], _aPositions: Optional[np.ndarray] = None):
+        self._lLoops: list[CLoopRange] = _lLoops
+        self._aMin = np.array([xLoop.iMin for xLoop in _lLoops], dtype=np.int64)
+        self._aStep = np.array([xLoop.iStep for xLoop in _lLoops], dtype=np.int64)
+        self._aStepCnt = np.array([max(xLoop.iStepCnt, 0) for xLoop in _lLoops], dtype=np.int64)
+        self._aStride = np.array([xLoop.iStride for xLoop in _lLoops], dtype=np.int64)
+        self._iGridCnt: int = int(np.prod(self._aStepCnt))
+
+        self._aIndices: Optional[np.ndarray] = None
+        if _aPositions is not None:
+            self._aIndices = self.DecodePositions(_aPositions)
+        # endif
+
+    # enddef
+
+    ######################################################################################
+    # Set the strides of the loops, so that the last loop varies fastest
+    @staticmethod
+    def SetLoopStrides(_lLoops: list[CLoopRange]):
+        iStride: int = 1
+        for xLoop in reversed(_lLoops):
+            xLoop.iStride = iStride
+            iStride *= max(xLoop.iStepCnt, 0)
+        # endfor
+
+    # enddef
+
+    ######################################################################################
+    # Decode an array of grid positions into an array of loop indices of shape (positions, loops)
+    def DecodePositions(self, _aPositions: np.ndarray) -> np.ndarray:
+        aPositions = np.asarray(_aPositions, dtype=np.int64).reshape(-1, 1)
+        return self._aMin + (aPositions // self._aStride) % self._aStepCnt * self._aStep
+
+    # enddef
+
+    ######################################################################################
+    # Get the sorted, unique grid positions of the given lists of loop indices.
+    # Indices that are not part of the grid are ignored.
+    def EncodeIndices(self, _lIndices: list[list[int]]) -> np.ndarray:
+        iDimCnt: int = len(self._lLoops)
+        if len(_lIndices) == 0 or self._iGridCnt == 0:
+            return np.zeros(0, dtype=np.int64)
+        # endif
+
+        for lIdx in _lIndices:
+            if len(lIdx) != iDimCnt:
+                raise RuntimeError(f"Active index {lIdx} must have one index for each of the {iDimCnt} nested loops")
+            # endif
+        # endfor
+
+        try:
+            aIndices = np.array(_lIndices, dtype=np.int64).reshape(-1, iDimCnt)
+        except (TypeError, ValueError) as xEx:
+            raise RuntimeError(f"Active indices must be lists of integers, not: {_lIndices}") from xEx
+        # endtry
+
+        aOffset = aIndices - self._aMin
+        aStepIdx = aOffset // self._aStep
+        aValid = np.all((aOffset % self._aStep == 0) & (aStepIdx >= 0) & (aStepIdx < self._aStepCnt), axis=1)
+        return np.unique(aStepIdx[aValid] @ self._aStride)
+
+    # enddef
+
+    def __len__(self) -> int:
+        return self._iGridCnt if self._aIndices is None else len(self._aIndices)
+
+    # enddef
+
+    def __getitem__(self, _iIdx: int) -> list[int]:
+        if isinstance(_iIdx, slice):
+            return [self[i] for i in range(*_iIdx.indices(len(self)))]
+        # endif
+        if self._aIndices is not None:
+            return self._aIndices[_iIdx].tolist()
+        # endif
+        iPos: int = range(self._iGridCnt)[_iIdx]
+        return self.DecodePositions(np.array([iPos]))[0].tolist()
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# The iteration configs of a control loop as a sequence, which creates the configs only
+# when they are accessed. The last few accessed configs are kept, as the config loop
+# accesses the value of an outer loop level for all steps of the inner levels.
+# Each access returns a copy of the config, so that the sequence is immutable and
+# copies of it can share the same instance.
+class CControlLoopValues(CLazySequence):
+    def __init__(
+        self,
+        *,
+        _xIter: CControlLoopIter,
+        _lIndices: Sequence,
+        _dicLoopInfo: Optional[dict] = None,
+        _iCacheSize: int = 8,
+    ):
+        self._xIter: CControlLoopIter = _xIter
+        self._lIndices: Sequence = _lIndices
+        self._dicLoopInfo: dict = _dicLoopInfo if _dicLoopInfo is not None else {}
+        self._iCacheSize: int = _iCacheSize
+        self._dicCache: OrderedDict[int, dict] = OrderedDict()
+
+    # enddef
+
+    def __len__(self) -> int:
+        return len(self._lIndices)
+
+    # enddef
+
+    def __getitem__(self, _iIdx: int) -> dict:
+        if isinstance(_iIdx, slice):
+            return [self[i] for i in range(*_iIdx.indices(len(self)))]
+        # endif
+        iIdx: int = range(len(self))[_iIdx]
+
+        dicCtrlIter: Optional[dict] = self._dicCache.get(iIdx)
+        if dicCtrlIter is not None:
+            self._dicCache.move_to_end(iIdx)
+            return copy.deepcopy(dicCtrlIter)
+        # endif
+
+        xIdx = self._lIndices[iIdx]
+        dicCtrlIter = self._xIter.Create(list(xIdx) if isinstance(xIdx, (list, tuple)) else int(xIdx))
+        dicCtrlIter.update(copy.deepcopy(self._dicLoopInfo))
+
+        self._dicCache[iIdx] = dicCtrlIter
+        if len(self._dicCache) > self._iCacheSize:
+            self._dicCache.popitem(last=False)
+        # endif
+        return copy.deepcopy(dicCtrlIter)
+
+    # enddef
+
+    def __deepcopy__(self, _dicMemo: dict) -> "CControlLoopValues":
+        return self
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# Concatenation of the values of several control loops
+class CControlLoopValueChain(CLazySequence):
+    def __init__(self, _lParts: list[Sequence]):
+        self._lParts: list[Sequence] = [xPart for xPart in _lParts if len(xPart) > 0]
+        # Index of the first element of each part
+        self._lStarts: list[int] = []
+        iStart: int = 0
+        for xPart in self._lParts:
+            self._lStarts.append(iStart)
+            iStart += len(xPart)
+        # endfor
+        self._iCnt: int = iStart
+
+    # enddef
+
+    def __len__(self) -> int:
+        return self._iCnt
+
+    # enddef
+
+    def __getitem__(self, _iIdx: int) -> Any:
+        if isinstance(_iIdx, slice):
+            return [self[i] for i in range(*_iIdx.indices(len(self)))]
+        # endif
+        iIdx: int = range(self._iCnt)[_iIdx]
+        iPart: int = bisect.bisect_right(self._lStarts, iIdx) - 1
+        return self._lParts[iPart][iIdx - self._lStarts[iPart]]
+
+    # enddef
+
+    def __deepcopy__(self, _dicMemo: dict) -> "CControlLoopValueChain":
+        return self
+
+    # enddef
+
+
+# endclass
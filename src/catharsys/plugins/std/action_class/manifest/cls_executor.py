@@ -29,11 +29,15 @@ import os
 import sys
 import math
 import copy
+import heapq
 import random
+import itertools
+import threading
+from collections import deque
 import numpy as np
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Callable
+from typing import Optional, Callable, Iterable, Iterator
 from timeit import default_timer as timer
 
 import ison
@@ -47,8 +51,13 @@ from anybase.cls_process_handler import CProcessHandler
 from catharsys.util import config
 from catharsys.util import path
 from catharsys.util import file
+from catharsys.util import lsf
 from catharsys.decs.decorator_log import logFunctionCall
 from catharsys.util.cls_configcml import CConfigCML
+from catharsys.util.cls_disk_cache import CDiskCache, GetConfigCachePath
+from catharsys.util.cls_job_status_store import CJobStatusStore
+from catharsys.util.cls_config_store import CConfigStore
+from catharsys.util.cls_launch_profile import ProfilePhase, ProfileCount, ProfileIter, ProfileInfo
 from catharsys.action import job
 from catharsys.plugins.std.action_class.manifest.cls_cfg_manifest import CConfigManifest
 from catharsys.plugins.std.action_class.manifest.cls_cfg_manifest_job import (
@@ -65,7 +74,68 @@ from .cls_loopconfigs import CLoopConfigs
 import concurrent.futures
 
 
+######################################################################################
+# Reports the end of a job, which is executed as separate work units, to the process
+# handler of the job. The 'Ended' handler of the job is called once, when all units
+# have ended, with the worst return code of all units and the messages of the failed units.
+class CWorkUnitEndHandler:
+    def __init__(self, _xProcHandler: CProcessHandler, _iUnitCnt: int):
+        self._xProcHandler: CProcessHandler = _xProcHandler
+        self._iUnitCnt: int = _iUnitCnt
+        self._setEndedUnits: set[int] = set()
+        self._iReturnCode: int = 0
+        self._lMsgs: list[str] = []
+        self._lockEnded: threading.Lock = threading.Lock()
+
+    # enddef
+
+    ######################################################################################
+    # Record the end of a unit. Further calls for the same unit are ignored.
+    def Ended(self, _iUnitIdx: int, _iReturnCode: int, _sMsg: str):
+        with self._lockEnded:
+            if _iUnitIdx in self._setEndedUnits:
+                return
+            # endif
+            self._setEndedUnits.add(_iUnitIdx)
+            if abs(_iReturnCode) > abs(self._iReturnCode):
+                self._iReturnCode = _iReturnCode
+            # endif
+            if _iReturnCode != 0 and _sMsg:
+                self._lMsgs.append(_sMsg)
+            # endif
+            bAllEnded: bool = len(self._setEndedUnits) == self._iUnitCnt
+        # endwith
+
+        if bAllEnded is True and self._xProcHandler.bEndedAvailable is True:
+            self._xProcHandler.Ended(self._iReturnCode, "\n".join(self._lMsgs))
+        # endif
+
+    # enddef
+
+
+# endclass
+
+
 class CActionClassManifestExecutor(CActionClassExecutor):
+    # Launch arguments read by the executor, which control how the jobs are executed,
+    # but do not influence their result. They are ignored by the keys of the job status store.
+    c_tLaunchOnlyArgs: tuple[str, ...] = (
+        "bResume",
+        "iMaxLocalWorkers",
+        "bStreamJobs",
+        "iConfigWorkers",
+        "iConfigsPerChunk",
+        "bConfigCache",
+        "iConfigCacheMaxSizeMB",
+        "bEarlyConfigFilter",
+        "bLsfJobArray",
+        "iLsfJobArrayMaxParallel",
+        "bLocalWorkUnits",
+        "sLocalJobOrder",
+        "bJobConfigStore",
+        "iJobConfigStoreMaxSizeMB",
+    )
+
     ######################################################################################
     def __init__(
         self,
@@ -94,6 +164,9 @@ class CActionClassManifestExecutor(CActionClassExecutor):
         self.xCML: CConfigCML = None
 
         self.dicJobFutures: dict = {}
+        # Optional store of the large elements of the job configs
+        self.xJobConfigStore: Optional[CConfigStore] = None
+        self._dicActArgsOverride: Optional[dict] = dicActArgsOverride
 
         super().__init__(
             xPrjCfg=xPrjCfg,
@@ -171,18 +244,20 @@ class CActionClassManifestExecutor(CActionClassExecutor):
 
         self.pathTrialFile = config.ProvideReadFilepathExt((self.sPathTrialConfig, sTrialFile))
 
-        self.dicTrial = config.Load(self.pathTrialFile, sDTI="trial:1", bAddPathVars=True, dicCustomVars=dicVars)
-        try:
-            self.dicTrial = self.xCML.Process(self.dicTrial, sImportPath=self.pathTrialFile.parent.as_posix())
+        with ProfilePhase("init/trial"):
+            self.dicTrial = config.Load(self.pathTrialFile, sDTI="trial:1", bAddPathVars=True, dicCustomVars=dicVars)
+            try:
+                self.dicTrial = self.xCML.Process(self.dicTrial, sImportPath=self.pathTrialFile.parent.as_posix())
 
-        except CParserError as xEx:
-            raise CAnyError_TaskMessage(sTask="Processing trial configuration", sMsg=xEx.ToString())
-        # endtry
+            except CParserError as xEx:
+                raise CAnyError_TaskMessage(sTask="Processing trial configuration", sMsg=xEx.ToString())
+            # endtry
 
-        # add the processed trial data to the variables, so that
-        # they can be used when processing the execution config
-        self.dicCfgVars["trial"] = copy.deepcopy(self.dicTrial)
-        self.xCML.UpdateConstVars(self.dicCfgVars, _bAllowOverwrite=True, _bPrintWarnings=False)
+            # add the processed trial data to the variables, so that
+            # they can be used when processing the execution config
+            self.dicCfgVars["trial"] = copy.deepcopy(self.dicTrial)
+            self.xCML.UpdateConstVars(self.dicCfgVars, _bAllowOverwrite=True, _bPrintWarnings=False)
+        # endwith
 
         ######################################################################################
         # Load & process EXECUTION configuration
@@ -202,15 +277,17 @@ class CActionClassManifestExecutor(CActionClassExecutor):
         #     dicRtVars=self.xCfgLaunch.dicRuntimeVars,
         #     setRtVarsEval=self.xCfgLaunch.setRuntimeVarsEval,
         # )
-        self.dicExec = config.Load(self.pathExecFile, sDTI=sExecDti, dicCustomVars=dicVars, bAddPathVars=True)
-        try:
-            self.dicExec = self.xCML.Process(self.dicExec, sImportPath=self.pathExecFile.parent.as_posix())
-        except CParserError as xEx:
-            raise CAnyError_TaskMessage(sTask="Processing execution configuration", sMsg=xEx.ToString())
-        # endtry
-
-        self.dicCfgVars["exec"] = copy.deepcopy(self.dicExec)
-        self.xCML.UpdateConstVars(self.dicCfgVars, _bAllowOverwrite=True, _bPrintWarnings=False)
+        with ProfilePhase("init/exec"):
+            self.dicExec = config.Load(self.pathExecFile, sDTI=sExecDti, dicCustomVars=dicVars, bAddPathVars=True)
+            try:
+                self.dicExec = self.xCML.Process(self.dicExec, sImportPath=self.pathExecFile.parent.as_posix())
+            except CParserError as xEx:
+                raise CAnyError_TaskMessage(sTask="Processing execution configuration", sMsg=xEx.ToString())
+            # endtry
+
+            self.dicCfgVars["exec"] = copy.deepcopy(self.dicExec)
+            self.xCML.UpdateConstVars(self.dicCfgVars, _bAllowOverwrite=True, _bPrintWarnings=False)
+        # endwith
 
         ######################################################################################
         # Load & process MANIFEST specified in trial
@@ -221,9 +298,14 @@ class CActionClassManifestExecutor(CActionClassExecutor):
             raise Exception("No manifest file given in trial file '{0}'".format(self.dicActArgs.get("sTrialFile")))
         # endif
         self.pathManifestFile = config.ProvideReadFilepathExt((self.sPathTrialConfig, sFileManifest))
-        self.xManifest.LoadFile(self.pathManifestFile)
+        with ProfilePhase("init/manifest-load"):
+            self.xManifest.LoadFile(self.pathManifestFile)
+        # endwith
+
         # Get trial configurations according to manifest
-        self.lTrialCfgs = self.xManifest.GetTrialConfigs(self.sAction, self.dicTrial)  # , dicCfgVars=self.dicCfgVars)
+        with ProfilePhase("init/control-loops"):
+            self.lTrialCfgs = self.xManifest.GetTrialConfigs(self.sAction, self.dicTrial)
+        # endwith
 
     # enddef
 
@@ -252,8 +334,31 @@ class CActionClassManifestExecutor(CActionClassExecutor):
     # enddef
 
     ######################################################################################
-    # Get Manifest Job Config
-    def GetJobConfig(self, *, _funcStatus: Optional[Callable[[int, int], None]] = None) -> CConfigManifestJob:
+    # Create the config loop instance for the trial. If the launch argument 'bConfigCache'
+    # is true, loaded and processed configs are also cached on disk between launches.
+    # If 'bEarlyConfigFilter' is true, manifest filters are evaluated before processing, if possible.
+    def _CreateLoopConfigs(self) -> CLoopConfigs:
+        xDiskCache: CDiskCache = None
+        if convert.DictElementToBool(self.dicActArgs, "bConfigCache", bDefault=False) is True:
+            iMaxSizeMB = convert.DictElementToInt(self.dicActArgs, "iConfigCacheMaxSizeMB", iDefault=1024)
+            xDiskCache = CDiskCache(GetConfigCachePath(self.xPrjCfg), _iMaxSizeBytes=iMaxSizeMB * 1024**2)
+        # endif
+
+        return CLoopConfigs(
+            xPrjCfg=self.xPrjCfg,
+            sId=self.dicTrial.get("sId"),
+            sCfgFilePath=self.pathTrialFile,
+            lScheme=self.lTrialCfgs,
+            xDiskCache=xDiskCache,
+            bEarlyFilter=convert.DictElementToBool(self.dicActArgs, "bEarlyConfigFilter", bDefault=False),
+        )
+
+    # enddef
+
+    ######################################################################################
+    # Prepare the job configuration without the list of processed configs.
+    # Returns the job dictionary, the config loop instance and the job group id.
+    def _PrepareJobConfig(self) -> tuple[dict, CLoopConfigs, str]:
         sDT = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
 
         # Get the configuration loops
@@ -271,59 +376,221 @@ class CActionClassManifestExecutor(CActionClassExecutor):
 
         # sFpTrial = config.GetElementAtPath(self.dicTrial, "__locals__/filepath")
 
-        # dTimeStart = time.perf_counter()
-        xLoopConfigs = CLoopConfigs(
-            xPrjCfg=self.xPrjCfg,
-            sId=self.dicTrial.get("sId"),
-            sCfgFilePath=self.pathTrialFile,
-            lScheme=self.lTrialCfgs,
-        )
-        iCfgCnt = xLoopConfigs.GetTotalStepCount()
+        with ProfilePhase("configs/prepare"):
+            xLoopConfigs = self._CreateLoopConfigs()
+            iCfgCnt = xLoopConfigs.GetTotalStepCount()
+        # endwith
         if iCfgCnt == 0:
             raise RuntimeError("No configurations available to execute")
         # endif
-
-        # dTimeEnd = time.perf_counter()
-        # print("Init Job config and count total number: {:5.2f}s".format(dTimeEnd - dTimeStart))
+        ProfileInfo("iConfigCount", iCfgCnt)
 
         # Add the starting time of the action
         self.dicCfgVars["now"] = sDT
 
-        sActName = self.sAction.replace("/", "-").replace(".", "_")
-        sPathJobConfigMain = os.path.join(self.xPrjCfg.sActProdPath, "_temp", "actions", sActName, sDT)
-        lJobConfigs = []
+        sPathJobConfigMain = os.path.join(self._GetActionTempPath(), sDT)
+
+        dicRes = config.CheckConfigType(self.dicActArgs, "/catharsys/launch/args:1")
+        if dicRes["bOK"] is False:
+            raise Exception("Launch arguments type error: {0}".format(dicRes["sMsg"]))
+        # endif
+
+        iConfigsPerGroup: int = None
+        iFramesPerGroup: int = None
 
-        # dTimeStart = timer()
+        if dicRes["lCfgVer"][1] == 0:
+            # Number of groups all frames are split in
+            iFrameGroups = convert.DictElementToInt(self.dicActArgs, "iJobsPerConfig", iDefault=1)
+            lUnsupported: list[str] = ["iFrameGroups", "iFramesPerGroup", "iConfigsPerGroup",
+                                       "iConfigGroups", "iMaxLocalWorkers"]
+            for sKey in lUnsupported:
+                if sKey in self.dicActArgs:
+                    raise RuntimeError(f"Argument '{sKey}' is not supported in this version of the action arguments.\n"
+                                       "Change the 'sDTI' to '/catharsys/launch/args:1.1' or higher.")
+                # endif
+            # endfor
+
+            # Each config triggers a new job
+            iConfigGroups = 0
+            iMaxLocalWorkers = 1
+
+        elif dicRes["lCfgVer"][1] >= 1:
+            iFrameGroups = convert.DictElementToInt(self.dicActArgs, "iFrameGroups", iDefault=1)
+            iConfigGroups = convert.DictElementToInt(self.dicActArgs, "iConfigGroups", iDefault=0)
+            iMaxLocalWorkers = convert.DictElementToInt(self.dicActArgs, "iMaxLocalWorkers", iDefault=1)
+            iConfigsPerGroup = convert.DictElementToInt(self.dicActArgs, "iConfigsPerGroup", bDoRaise=False)
+            iFramesPerGroup = convert.DictElementToInt(self.dicActArgs, "iFramesPerGroup", bDoRaise=False)
+        # endif
+
+        dicJob = {
+            "sDTI": "/catharsys/action-class/python/manifest-based/job-config:1.0",
+            "sAction": self.sAction,
+            "sActDti": self.sActDti,
+            "mPrjCfg": self.xPrjCfg.Serialize(),
+            "iFrameGroups": iFrameGroups,
+            "iConfigGroups": iConfigGroups,
+            "iConfigsPerGroup": iConfigsPerGroup,
+            "iFramesPerGroup": iFramesPerGroup,
+            "iMaxLocalWorkers": iMaxLocalWorkers,
+            "sPathJobConfigMain": sPathJobConfigMain,
+            "mExec": self.dicExec,
+            "lConfigs": [],
+        }
+
+        return dicJob, xLoopConfigs, sDT
+
+    # enddef
+
+    ######################################################################################
+    # Get Manifest Job Config
+    def GetJobConfig(self, *, _funcStatus: Optional[Callable[[int, int], None]] = None) -> CConfigManifestJob:
+        dicJob, xLoopConfigs, sDT = self._PrepareJobConfig()
+
+        with ProfilePhase("configs/all"):
+            dicJob["lConfigs"] = list(
+                self._IterJobConfigs(_xLoopConfigs=xLoopConfigs, _sJobGroupId=sDT, _funcStatus=_funcStatus)
+            )
+        # endwith
+
+        return CConfigManifestJob(dicJob)
+
+    # enddef
+
+    ######################################################################################
+    # Create the job configuration data for a single, processed config set
+    def _CreateJobConfigData(self, *, _iCfgIdx: int, _iCfgCnt: int, _dicData: dict, _sJobGroupId: str) -> dict:
+        dicRelPathTrgAct = _dicData["dicRelPathTrgAct"]
+        dicPathTrgAct = {}
+        dicActDtiToName = {}
+
+        for sAct in dicRelPathTrgAct:
+            # Construct absolute target paths from relative paths
+            dicPathTrgAct[sAct] = os.path.join(self.xPrjCfg.sActProdPath, dicRelPathTrgAct[sAct])
+            # Create Action DTI to Action Name dictionary
+            sDti = self.dicActions[sAct].get("sActionDTI")
+            dicActDtiToName[sDti] = sAct
+        # endfor
+
+        sPathTrgMain = os.path.join(self.xPrjCfg.sActProdPath, _dicData.get("sRelPathTrgMain"))
+
+        with ProfilePhase("configs/job-data", _iCfgIdx):
+            dicProcConfig = copy.deepcopy(self.dicActArgs)
+
+            dicProcConfig.update(
+                {
+                    "sDTI": "/catharsys/action/config:1.0",
+                    "iCfgIdx": _iCfgIdx,
+                    "iCfgCnt": _iCfgCnt,
+                    "mConfig": _dicData,
+                    "sPathTrgMain": sPathTrgMain,
+                    "dicPathTrgAct": dicPathTrgAct,
+                    "dicActDtiToName": dicActDtiToName,
+                    "lActions": copy.deepcopy(_dicData.get("lActions")),
+                    "sJobGroupId": _sJobGroupId,
+                }
+            )
+        # endwith
+
+        return dicProcConfig
+
+    # enddef
+
+    ######################################################################################
+    def _PrintConfigStatus(self, _iCfgIdx: int, _iCfgIdxEnd: int, _iCfgCnt: int):
+        logFunctionCall.PrintLog("Creating configs {}-{} of {}".format(_iCfgIdx, _iCfgIdxEnd, _iCfgCnt))
+        sys.stdout.write("Creating configs {}-{} of {}           \r".format(_iCfgIdx, _iCfgIdxEnd, _iCfgCnt))
+        sys.stdout.flush()
+
+    # enddef
+
+    ######################################################################################
+    # Generator over the job configuration data of all config sets that are not filtered.
+    # Config sets are only processed when the next element is requested.
+    def _IterJobConfigs(
+        self,
+        *,
+        _xLoopConfigs: CLoopConfigs,
+        _sJobGroupId: str,
+        _funcStatus: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[dict]:
+        iCfgCnt = _xLoopConfigs.GetTotalStepCount()
+        iConfigWorkers = convert.DictElementToInt(self.dicActArgs, "iConfigWorkers", iDefault=1)
+        iConfigsPerChunk = convert.DictElementToInt(self.dicActArgs, "iConfigsPerChunk", bDoRaise=False)
+
+        if iConfigWorkers > 1 and iCfgCnt > 1:
+            yield from self._IterJobConfigsParallel(
+                _iCfgCnt=iCfgCnt,
+                _sJobGroupId=_sJobGroupId,
+                _iWorkers=iConfigWorkers,
+                _iConfigsPerChunk=iConfigsPerChunk,
+                _funcStatus=_funcStatus,
+            )
+        else:
+            yield from self._IterJobConfigsSerial(
+                _xLoopConfigs=_xLoopConfigs, _sJobGroupId=_sJobGroupId, _funcStatus=_funcStatus
+            )
+        # endif
+
+        xDiskCache: CDiskCache = _xLoopConfigs.xDiskCache
+        if xDiskCache is not None:
+            # Hits and misses are only counted in this process
+            logFunctionCall.PrintLog(
+                f"Config disk cache: {xDiskCache.iHits} hits, {xDiskCache.iMisses} misses [{xDiskCache.pathCache}]"
+            )
+            ProfileCount("config-disk-cache/hits", xDiskCache.iHits)
+            ProfileCount("config-disk-cache/misses", xDiskCache.iMisses)
+            with ProfilePhase("configs/disk-cache-evict"):
+                xDiskCache.Evict()
+            # endwith
+        # endif
+
+        if _funcStatus is not None:
+            _funcStatus(iCfgCnt, iCfgCnt)
+        else:
+            sys.stdout.write("                                             \r")
+            sys.stdout.flush()
+        # endif
+
+    # enddef
+
+    ######################################################################################
+    # Process all config sets one after the other in this process
+    def _IterJobConfigsSerial(
+        self,
+        *,
+        _xLoopConfigs: CLoopConfigs,
+        _sJobGroupId: str,
+        _funcStatus: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[dict]:
+        iCfgCnt = _xLoopConfigs.GetTotalStepCount()
 
         # Loop over all configs
-        while xLoopConfigs.Next():
-            iCfgIdx = xLoopConfigs.GetTotalStepIdx()
+        while _xLoopConfigs.Next():
+            iCfgIdx = _xLoopConfigs.GetTotalStepIdx()
 
             if iCfgIdx % 10 == 0:
                 if _funcStatus is not None:
                     _funcStatus(iCfgIdx, iCfgCnt)
                 else:
-                    logFunctionCall.PrintLog("Creating configs {}-{} of {}".format(iCfgIdx, iCfgIdx + 9, iCfgCnt))
-                    sys.stdout.write("Creating configs {}-{} of {}           \r".format(iCfgIdx, iCfgIdx + 9, iCfgCnt))
-                    sys.stdout.flush()
+                    self._PrintConfigStatus(iCfgIdx, iCfgIdx + 9, iCfgCnt)
                 # endif
             # endif
 
             # print(f"Create config {iCfgIdx} of {iCfgCnt}")
 
-            # dTimeStart = timer()
             # The GetData() function copies the state of self.xCML into a new parser instance,
             # which is then used to parse the configs for one config set.
-            dicData = xLoopConfigs.GetData(self.xCML)
-
-            # dTimeEnd = timer()
-            # print("GetData: {:5.3f}s       ".format(dTimeEnd - dTimeStart))
+            with ProfilePhase("configs/get-data", iCfgIdx):
+                dicData = _xLoopConfigs.GetData(self.xCML)
+            # endwith
 
             # If returned data is none, then this config is filtered.
             # So we can continue with the next one.
             if dicData is None:
+                ProfileCount("configs/filtered")
                 continue
             # endif
+            ProfileCount("configs/processed")
 
             # # Add the action globals to the config dictionary
             # ison.util.data.AddLocalGlobalVars(
@@ -335,104 +602,123 @@ class CActionClassManifestExecutor(CActionClassExecutor):
             #     "globals",
             # )
 
-            # print("Configuration index: {0}".format(iCfgIdx))
-
-            dicRelPathTrgAct = dicData["dicRelPathTrgAct"]
-            dicPathTrgAct = {}
-            dicActDtiToName = {}
+            yield self._CreateJobConfigData(
+                _iCfgIdx=iCfgIdx, _iCfgCnt=iCfgCnt, _dicData=dicData, _sJobGroupId=_sJobGroupId
+            )
+            # print("...finished")
+        # endwhile configs
 
-            for sAct in dicRelPathTrgAct:
-                # Construct absolute target paths from relative paths
-                dicPathTrgAct[sAct] = os.path.join(self.xPrjCfg.sActProdPath, dicRelPathTrgAct[sAct])
-                # Create Action DTI to Action Name dictionary
-                sDti = self.dicActions[sAct].get("sActionDTI")
-                dicActDtiToName[sDti] = sAct
-            # endfor
+    # enddef
 
-            sPathTrgMain = os.path.join(self.xPrjCfg.sActProdPath, dicData.get("sRelPathTrgMain"))
+    ######################################################################################
+    # Process the config sets with flat indices in the range [_iCfgStart, _iCfgEnd).
+    # This is called in the config worker processes.
+    def _GetJobConfigListChunk(
+        self,
+        *,
+        _xLoopConfigs: CLoopConfigs,
+        _iCfgStart: int,
+        _iCfgEnd: int,
+        _sJobGroupId: str,
+    ) -> list[dict]:
+        iCfgCnt = _xLoopConfigs.GetTotalStepCount()
+        lJobConfigs = []
 
-            # dTimeStart = time.perf_counter()
-            dicProcConfig = copy.deepcopy(self.dicActArgs)
+        for iCfgIdx in range(_iCfgStart, _iCfgEnd):
+            dicData = _xLoopConfigs.GetDataAt(iCfgIdx, self.xCML)
+            if dicData is None:
+                continue
+            # endif
 
-            dicProcConfig.update(
-                {
-                    "sDTI": "/catharsys/action/config:1.0",
-                    "iCfgIdx": iCfgIdx,
-                    "iCfgCnt": iCfgCnt,
-                    "mConfig": dicData,
-                    "sPathTrgMain": sPathTrgMain,
-                    "dicPathTrgAct": dicPathTrgAct,
-                    "dicActDtiToName": dicActDtiToName,
-                    "lActions": copy.deepcopy(dicData.get("lActions")),
-                    "sJobGroupId": sDT,
-                }
+            lJobConfigs.append(
+                self._CreateJobConfigData(
+                    _iCfgIdx=iCfgIdx, _iCfgCnt=iCfgCnt, _dicData=dicData, _sJobGroupId=_sJobGroupId
+                )
             )
-            # dTimeEnd = time.perf_counter()
-            # print("Creating config dict: {:5.2f}s".format(dTimeEnd - dTimeStart))
+        # endfor
 
-            lJobConfigs.append(dicProcConfig)
-            # print("...finished")
-        # endwhile configs
+        return lJobConfigs
 
-        if _funcStatus is not None:
-            _funcStatus(iCfgCnt, iCfgCnt)
-        else:
-            sys.stdout.write("                                             \r")
-            sys.stdout.flush()
+    # enddef
+
+    ######################################################################################
+    # Process the config sets in a pool of worker processes.
+    # The flat config index range is split into contiguous chunks. Each worker process
+    # creates its own instance of this action, with its own parser and config caches.
+    # The chunk results are returned in chunk order, so that the resultant sequence of
+    # configs is the same as for the serial processing. Only a limited number of chunks
+    # is submitted ahead of the chunk that is currently consumed.
+    # If the trial defines a random seed, the random generators are re-seeded at the
+    # start of each chunk from the trial seed and the chunk start index. Random values
+    # in configs are therefore deterministic for a given chunk size but differ from
+    # those generated by the serial processing.
+    def _IterJobConfigsParallel(
+        self,
+        *,
+        _iCfgCnt: int,
+        _sJobGroupId: str,
+        _iWorkers: int,
+        _iConfigsPerChunk: Optional[int] = None,
+        _funcStatus: Optional[Callable[[int, int], None]] = None,
+    ) -> Iterator[dict]:
+        if _iConfigsPerChunk is None:
+            # Use a number of chunks per worker, to balance uneven processing times,
+            # while keeping the chunks large enough to benefit from the config caches.
+            _iConfigsPerChunk = int(math.ceil(_iCfgCnt / (4 * _iWorkers)))
+        elif _iConfigsPerChunk < 1:
+            raise RuntimeError(f"Value of 'iConfigsPerChunk' must be greater than zero but is '{_iConfigsPerChunk}'")
         # endif
 
-        # dTimeEnd = timer()
-        # dTimeDelta = dTimeEnd - dTimeStart
-        # print("Loop Configs: {:5.2f}s, mean per config: {:5.2f}".format(dTimeDelta, dTimeDelta/iCfgCnt))
+        lChunks: list[tuple[int, int]] = [
+            (iCfgStart, min(iCfgStart + _iConfigsPerChunk, _iCfgCnt))
+            for iCfgStart in range(0, _iCfgCnt, _iConfigsPerChunk)
+        ]
+        _iWorkers = min(_iWorkers, len(lChunks))
+        iMaxPendingChunks = 2 * _iWorkers
+
+        tWorkerArgs = (
+            type(self),
+            self.xPrjCfg,
+            self.sAction,
+            self.dicActCfg,
+            self.xCfgLaunch,
+            self._dicActArgsOverride,
+            _sJobGroupId,
+        )
 
-        dicRes = config.CheckConfigType(self.dicActArgs, "/catharsys/launch/args:1")
-        if dicRes["bOK"] is False:
-            raise Exception("Launch arguments type error: {0}".format(dicRes["sMsg"]))
-        # endif
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=_iWorkers, initializer=_InitConfigWorker, initargs=tWorkerArgs
+        ) as xExecutor:
+            iterChunks = iter(lChunks)
+            dqPending: deque = deque()
 
-        iConfigsPerGroup: int = None
-        iFramesPerGroup: int = None
+            for iCfgStart, iCfgEnd in itertools.islice(iterChunks, iMaxPendingChunks):
+                dqPending.append((iCfgStart, iCfgEnd, xExecutor.submit(_GetConfigWorkerChunk, iCfgStart, iCfgEnd)))
+            # endfor
 
-        if dicRes["lCfgVer"][1] == 0:
-            # Number of groups all frames are split in
-            iFrameGroups = convert.DictElementToInt(self.dicActArgs, "iJobsPerConfig", iDefault=1)
-            lUnsupported: list[str] = ["iFrameGroups", "iFramesPerGroup", "iConfigsPerGroup",
-                                       "iConfigGroups", "iMaxLocalWorkers"]
-            for sKey in lUnsupported:
-                if sKey in self.dicActArgs:
-                    raise RuntimeError(f"Argument '{sKey}' is not supported in this version of the action arguments.\n"
-                                       "Change the 'sDTI' to '/catharsys/launch/args:1.1' or higher.")
+            # Consume the results in chunk order
+            while len(dqPending) > 0:
+                iCfgStart, iCfgEnd, futChunk = dqPending.popleft()
+                if _funcStatus is not None:
+                    _funcStatus(iCfgStart, _iCfgCnt)
+                else:
+                    self._PrintConfigStatus(iCfgStart, iCfgEnd - 1, _iCfgCnt)
                 # endif
-            # endfor
-            
-            # Each config triggers a new job
-            iConfigGroups = 0
-            iMaxLocalWorkers = 1
 
-        elif dicRes["lCfgVer"][1] >= 1:
-            iFrameGroups = convert.DictElementToInt(self.dicActArgs, "iFrameGroups", iDefault=1)
-            iConfigGroups = convert.DictElementToInt(self.dicActArgs, "iConfigGroups", iDefault=0)
-            iMaxLocalWorkers = convert.DictElementToInt(self.dicActArgs, "iMaxLocalWorkers", iDefault=1)
-            iConfigsPerGroup = convert.DictElementToInt(self.dicActArgs, "iConfigsPerGroup", bDoRaise=False)
-            iFramesPerGroup = convert.DictElementToInt(self.dicActArgs, "iFramesPerGroup", bDoRaise=False)
-        # endif
+                # The configs are processed in the worker processes, which are not profiled
+                with ProfilePhase("configs/wait-chunk", f"{iCfgStart}-{iCfgEnd - 1}"):
+                    lJobConfigs: list[dict] = futChunk.result()
+                # endwith
+                ProfileCount("configs/processed", len(lJobConfigs))
 
-        dicJob = {
-            "sDTI": "/catharsys/action-class/python/manifest-based/job-config:1.0",
-            "sAction": self.sAction,
-            "sActDti": self.sActDti,
-            "mPrjCfg": self.xPrjCfg.Serialize(),
-            "iFrameGroups": iFrameGroups,
-            "iConfigGroups": iConfigGroups,
-            "iConfigsPerGroup": iConfigsPerGroup,
-            "iFramesPerGroup": iFramesPerGroup,
-            "iMaxLocalWorkers": iMaxLocalWorkers,
-            "sPathJobConfigMain": sPathJobConfigMain,
-            "mExec": self.dicExec,
-            "lConfigs": lJobConfigs,
-        }
+                tNextChunk = next(iterChunks, None)
+                if tNextChunk is not None:
+                    dqPending.append((*tNextChunk, xExecutor.submit(_GetConfigWorkerChunk, *tNextChunk)))
+                # endif
 
-        return CConfigManifestJob(dicJob)
+                yield from lJobConfigs
+            # endwhile
+        # endwith
 
     # enddef
 
@@ -462,11 +748,136 @@ class CActionClassManifestExecutor(CActionClassExecutor):
 
     # enddef
 
+    ######################################################################################
+    # Generator over executable jobs, which processes the config sets only as the jobs
+    # are requested. The returned job dictionary has an empty list of configs.
+    # As the number of configs that are not filtered is not known in advance, the
+    # config groups are laid out for the total number of config sets. The total job count
+    # in the job names is therefore an upper bound, if configs are filtered.
+    # For the distribution type 'per-frame;configs' the jobs are ordered by config group
+    # first and then by frame.
+    def IterExecJobConfigs(
+        self, *, _funcStatus: Optional[Callable[[int, int], None]] = None
+    ) -> tuple[CConfigManifestJob, Iterator[CConfigExecJob]]:
+        dicJob, xLoopConfigs, sDT = self._PrepareJobConfig()
+        iterConfigs = self._IterJobConfigs(_xLoopConfigs=xLoopConfigs, _sJobGroupId=sDT, _funcStatus=_funcStatus)
+        iConfigCnt = xLoopConfigs.GetTotalStepCount()
+
+        if self.sJobDistType == "single;all":
+            dicJob["iFrameGroups"] = 1
+            dicJob["iConfigGroups"] = 0
+            iterJobs = self._IterJobs_FramesConfigs(
+                sId=self.sId, dicJob=dicJob, iterConfigs=iterConfigs, iConfigCnt=iConfigCnt
+            )
+
+        elif self.sJobDistType == "frames;configs":
+            iterJobs = self._IterJobs_FramesConfigs(
+                sId=self.sId, dicJob=dicJob, iterConfigs=iterConfigs, iConfigCnt=iConfigCnt
+            )
+
+        elif self.sJobDistType == "per-frame;configs":
+            iterJobs = self._IterJobs_ConfigsPerFrame(
+                sId=self.sId, dicJob=dicJob, iterConfigs=iterConfigs, iConfigCnt=iConfigCnt
+            )
+        else:
+            raise CAnyError_Message(sMsg=f"Unsupported job distribution type '{self.sJobDistType}'")
+        # endif
+
+        return CConfigManifestJob(dicJob), iterJobs
+
+    # enddef
+
+    ######################################################################################
+    # The folder of the temporary data of this action, like the job configs of all launches
+    def _GetActionTempPath(self) -> str:
+        sActName = self.sAction.replace("/", "-").replace(".", "_")
+        return os.path.join(self.xPrjCfg.sActProdPath, "_temp", "actions", sActName)
+
+    # enddef
+
+    ######################################################################################
+    # The store of the completed jobs of this action. It is shared by all launches of the action.
+    def GetJobStatusStore(self) -> CJobStatusStore:
+        return CJobStatusStore(
+            os.path.join(self._GetActionTempPath(), "_job-status"), _iterLaunchOnlyArgs=self.c_tLaunchOnlyArgs
+        )
+
+    # enddef
+
+    ######################################################################################
+    # The store of the job config elements of this action. It is shared by all launches of the action.
+    def GetJobConfigStore(self) -> CConfigStore:
+        iMaxSizeMB = convert.DictElementToInt(self.dicActArgs, "iJobConfigStoreMaxSizeMB", iDefault=4096)
+        return CConfigStore(
+            os.path.join(self._GetActionTempPath(), "_config-store"), _iMaxSizeBytes=iMaxSizeMB * 1024**2
+        )
+
+    # enddef
+
     ######################################################################################
     # Execute Job List
-    def ExecuteJobList(self, _lExecJobs: list[CConfigExecJob]):
+    def ExecuteJobList(self, _lExecJobs: Iterable[CConfigExecJob], *, _iMaxPendingJobs: Optional[int] = None):
         iMaxLocalWorkers: int = convert.DictElementToInt(self.dicActArgs, "iMaxLocalWorkers", iDefault=1)
-        self._ExecJobsParallel(_lJobs=_lExecJobs, _iMaxLocalWorkers=iMaxLocalWorkers)
+        bLsfJobArray: bool = convert.DictElementToBool(self.dicActArgs, "bLsfJobArray", bDefault=False)
+        bResume: bool = convert.DictElementToBool(self.dicActArgs, "bResume", bDefault=False)
+        xJobStatusStore: CJobStatusStore = self.GetJobStatusStore()
+
+        self.xJobConfigStore = None
+        if convert.DictElementToBool(self.dicActArgs, "bJobConfigStore", bDefault=False) is True:
+            self.xJobConfigStore = self.GetJobConfigStore()
+            with ProfilePhase("jobs/config-store-evict"):
+                self.xJobConfigStore.Evict()
+            # endwith
+        # endif
+
+        bLocalWorkUnits: bool = convert.DictElementToBool(self.dicActArgs, "bLocalWorkUnits", bDefault=False)
+        sLocalJobOrder: str = self.dicActArgs.get("sLocalJobOrder", "fifo")
+        if sLocalJobOrder not in ["fifo", "longest-first"]:
+            raise CAnyError_Message(
+                sMsg=f"Unsupported local job order '{sLocalJobOrder}'. Expect one of 'fifo', 'longest-first'"
+            )
+        # endif
+
+        if bLocalWorkUnits is True or sLocalJobOrder != "fifo":
+            if self._IsLocalExecution() is True:
+                self._ExecJobsScheduled(
+                    _lJobs=_lExecJobs,
+                    _iMaxLocalWorkers=iMaxLocalWorkers,
+                    _iMaxPendingJobs=_iMaxPendingJobs,
+                    _xJobStatusStore=xJobStatusStore,
+                    _bResume=bResume,
+                    _bWorkUnits=bLocalWorkUnits,
+                    _bLongestFirst=(sLocalJobOrder == "longest-first"),
+                )
+                return
+            # endif
+            print("WARNING: Arguments 'bLocalWorkUnits' and 'sLocalJobOrder' only apply to local execution")
+        # endif
+
+        if bLsfJobArray is False:
+            self._ExecJobsParallel(
+                _lJobs=_lExecJobs,
+                _iMaxLocalWorkers=iMaxLocalWorkers,
+                _iMaxPendingJobs=_iMaxPendingJobs,
+                _xJobStatusStore=xJobStatusStore,
+                _bResume=bResume,
+            )
+            return
+        # endif
+
+        # All LSF jobs are collected and submitted as job arrays, when the last job has been started
+        iMaxParallel: int = convert.DictElementToInt(self.dicActArgs, "iLsfJobArrayMaxParallel", iDefault=0)
+        sName: str = f"{self.sId}-{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}"
+        with lsf.CLsfArraySubmission(_sName=sName, _iMaxParallel=iMaxParallel) as xArraySubmission:
+            self._ExecJobsParallel(
+                _lJobs=_lExecJobs,
+                _iMaxLocalWorkers=iMaxLocalWorkers,
+                _iMaxPendingJobs=_iMaxPendingJobs,
+                _xLsfArraySubmission=xArraySubmission,
+                _xJobStatusStore=xJobStatusStore,
+                _bResume=bResume,
+            )
+        # endwith
 
     # enddef
 
@@ -476,10 +887,24 @@ class CActionClassManifestExecutor(CActionClassExecutor):
     def Execute(self, *, bDoProcess: bool = True, dicDebug: bool = None) -> CConfigManifestJob:
         self.dicDebug = dicDebug
 
+        bStreamJobs = convert.DictElementToBool(self.dicActArgs, "bStreamJobs", bDefault=False)
+        if bDoProcess is True and bStreamJobs is True:
+            # Jobs are started while the configs of later jobs are still processed.
+            # Only a limited number of jobs is held in memory at any time.
+            iMaxLocalWorkers: int = convert.DictElementToInt(self.dicActArgs, "iMaxLocalWorkers", iDefault=1)
+            xJob, iterExecJobs = self.IterExecJobConfigs()
+            # The configs of a job are processed, when the job is requested
+            self.ExecuteJobList(ProfileIter("jobs/split", iterExecJobs), _iMaxPendingJobs=2 * iMaxLocalWorkers)
+            return xJob
+        # endif
+
         xJob: CConfigManifestJob = self.GetJobConfig()
 
         if bDoProcess is True:
-            lExecJobs = self.GetExecJobConfigList(xJob)
+            with ProfilePhase("jobs/split"):
+                lExecJobs = self.GetExecJobConfigList(xJob)
+            # endwith
+            ProfileInfo("iJobCount", len(lExecJobs))
             self.ExecuteJobList(lExecJobs)
         # endif
 
@@ -501,10 +926,64 @@ class CActionClassManifestExecutor(CActionClassExecutor):
 
     # enddef
 
+    ######################################################################################
+    # Get the number of config groups and the number of configs per group
+    def _GetConfigGroupLayout(self, *, dicJob: dict, iConfigCnt: int) -> tuple[int, int]:
+        iConfigGroups = dicJob["iConfigGroups"]
+        iConfigsPerGroup: int = dicJob["iConfigsPerGroup"]
+
+        if iConfigsPerGroup is None:
+            iConfigGroups = iConfigCnt if iConfigGroups <= 0 else min(iConfigCnt, iConfigGroups)
+            iConfigsPerGroup = int(math.floor(iConfigCnt / iConfigGroups)) + (
+                1 if iConfigCnt % iConfigGroups > 0 else 0
+            )
+
+        else:
+            if iConfigsPerGroup < 1:
+                raise RuntimeError(f"Value of 'iConfigsPerGroup' must be greater than zero but is '{iConfigsPerGroup}'")
+            # endif
+            iConfigsPerGroup = min(iConfigCnt, iConfigsPerGroup)
+            iConfigGroups = int(math.floor(iConfigCnt / iConfigsPerGroup)) + (
+                1 if iConfigCnt % iConfigsPerGroup > 0 else 0
+            )
+        # endif
+
+        return iConfigGroups, iConfigsPerGroup
+
+    # enddef
+
+    ######################################################################################
+    # Generator over consecutive groups of configs
+    def _IterConfigGroups(self, _iterConfigs: Iterable[dict], _iConfigsPerGroup: int) -> Iterator[list[dict]]:
+        iterConfigs = iter(_iterConfigs)
+        while True:
+            lJobConfigs = list(itertools.islice(iterConfigs, _iConfigsPerGroup))
+            if len(lJobConfigs) == 0:
+                break
+            # endif
+            yield lJobConfigs
+        # endwhile
+
+    # enddef
+
     ######################################################################################
     # Execute jobs with distribution over frames
     @logFunctionCall
     def _GetJobs_FramesConfigs(self, *, sId, dicJob) -> list[CConfigExecJob]:
+        return list(
+            self._IterJobs_FramesConfigs(
+                sId=sId, dicJob=dicJob, iterConfigs=dicJob["lConfigs"], iConfigCnt=len(dicJob["lConfigs"])
+            )
+        )
+
+    # enddef
+
+    ######################################################################################
+    # Generator over jobs with distribution over frames.
+    # The configs are consumed group by group as the jobs are requested.
+    def _IterJobs_FramesConfigs(
+        self, *, sId, dicJob, iterConfigs: Iterable[dict], iConfigCnt: int
+    ) -> Iterator[CConfigExecJob]:
         iFrameFirst = convert.DictElementToInt(self.dicActArgs, "iFrameFirst", iDefault=0)
         iFrameLast = convert.DictElementToInt(self.dicActArgs, "iFrameLast", iDefault=0)
         iFrameStep = convert.DictElementToInt(self.dicActArgs, "iFrameStep", iDefault=1)
@@ -522,25 +1001,7 @@ class CActionClassManifestExecutor(CActionClassExecutor):
             iFrameGroups = int(math.floor(iFrameCnt / iFramesPerGroup)) + (1 if iFrameCnt % iFramesPerGroup > 0 else 0)
         # endif
 
-        iConfigCnt = len(dicJob["lConfigs"])
-        iConfigGroups = dicJob["iConfigGroups"]
-        iConfigsPerGroup: int = dicJob["iConfigsPerGroup"]
-
-        if iConfigsPerGroup is None:
-            iConfigGroups = iConfigCnt if iConfigGroups <= 0 else min(iConfigCnt, iConfigGroups)
-            iConfigsPerGroup = int(math.floor(iConfigCnt / iConfigGroups)) + (
-                1 if iConfigCnt % iConfigGroups > 0 else 0
-            )
-
-        else:
-            if iConfigsPerGroup < 1:
-                raise RuntimeError(f"Value of 'iConfigsPerGroup' must be greater than zero but is '{iConfigsPerGroup}'")
-            # endif
-            iConfigsPerGroup = min(iConfigCnt, iConfigsPerGroup)
-            iConfigGroups = int(math.floor(iConfigCnt / iConfigsPerGroup)) + (
-                1 if iConfigCnt % iConfigsPerGroup > 0 else 0
-            )
-        # endif
+        iConfigGroups, iConfigsPerGroup = self._GetConfigGroupLayout(dicJob=dicJob, iConfigCnt=iConfigCnt)
 
         logFunctionCall.PrintLog(
             f"FrameConfigs: 'iConfigGroups':{iConfigGroups} 'iConfigCnt':{iConfigCnt}"
@@ -556,14 +1017,8 @@ class CActionClassManifestExecutor(CActionClassExecutor):
         sIdName = self._ToIdName(sId)
 
         # iMaxLocalWorkers = dicJob["iMaxLocalWorkers"]
-        lJobs: list[CConfigExecJob] = []
         iJobIdx = 0
-        for iConfigGrpIdx in range(iConfigGroups):
-            iCfgStart = iConfigGrpIdx * iConfigsPerGroup
-            iCfgEnd = iCfgStart + iConfigsPerGroup
-            iCfgEnd = min(iCfgEnd, iConfigCnt)
-            lJobConfigs = dicJob["lConfigs"][iCfgStart:iCfgEnd]
-
+        for iConfigGrpIdx, lJobConfigs in enumerate(self._IterConfigGroups(iterConfigs, iConfigsPerGroup)):
             for iFrameGrpIdx in range(iFrameGroups):
                 sFileJobConfig = "{0}_job{1:02d}.json".format(sIdName, iJobIdx + 1)
                 pathJobConfig = Path(dicJob["sPathJobConfigMain"]) / sFileJobConfig
@@ -594,27 +1049,22 @@ class CActionClassManifestExecutor(CActionClassExecutor):
                     "lConfigs": lJobConfigs,
                 }
 
-                lJobs.append(
-                    CConfigExecJob(
-                        _iIdx=iJobIdx,
-                        _sName=sJobName,
-                        _sLabel=sFileJobConfig,
-                        _pathConfig=pathJobConfig,
-                        _dicConfig=dicJobConfig,
-                    )
+                yield CConfigExecJob(
+                    _iIdx=iJobIdx,
+                    _sName=sJobName,
+                    _sLabel=sFileJobConfig,
+                    _pathConfig=pathJobConfig,
+                    _dicConfig=dicJobConfig,
                 )
                 iJobIdx += 1
             # endfor frame groups
         # endfor config groups
 
-        return lJobs
-
     # enddef
 
     ######################################################################################
-    # Execute jobs with distribution over frames
-    @logFunctionCall
-    def _GetJobs_PerFrameConfigs(self, *, sId, dicJob) -> list[CConfigExecJob]:
+    # Get the frame range and the sub-frame group layout for jobs per frame
+    def _GetSubFrameGroupLayout(self, *, dicJob: dict) -> tuple[int, int, int, int, int]:
         iFrameFirst = convert.DictElementToInt(self.dicActArgs, "iFrameFirst", iDefault=0)
         iFrameLast = convert.DictElementToInt(self.dicActArgs, "iFrameLast", iDefault=0)
         iFrameStep = convert.DictElementToInt(self.dicActArgs, "iFrameStep", iDefault=1)
@@ -642,25 +1092,82 @@ class CActionClassManifestExecutor(CActionClassExecutor):
             )
         # endif
 
-        iConfigCnt = len(dicJob["lConfigs"])
-        iConfigGroups = dicJob["iConfigGroups"]
-        iConfigsPerGroup: int = dicJob["iConfigsPerGroup"]
+        return iFrameFirst, iFrameLast, iFrameStep, iFrameCnt, iSubFrameGroups
 
-        if iConfigsPerGroup is None:
-            iConfigGroups = iConfigCnt if iConfigGroups <= 0 else min(iConfigCnt, iConfigGroups)
-            iConfigsPerGroup = int(math.floor(iConfigCnt / iConfigGroups)) + (
-                1 if iConfigCnt % iConfigGroups > 0 else 0
-            )
+    # enddef
 
-        else:
-            if iConfigsPerGroup < 1:
-                raise RuntimeError(f"Value of 'iConfigsPerGroup' must be greater than zero but is '{iConfigsPerGroup}'")
-            # endif
-            iConfigsPerGroup = min(iConfigCnt, iConfigsPerGroup)
-            iConfigGroups = int(math.floor(iConfigCnt / iConfigsPerGroup)) + (
-                1 if iConfigCnt % iConfigsPerGroup > 0 else 0
+    ######################################################################################
+    # Create a single job of a config group for a single frame
+    def _CreateExecJob_PerFrame(
+        self,
+        *,
+        dicJob: dict,
+        sIdName: str,
+        lJobConfigs: list[dict],
+        iJobIdx: int,
+        iJobCnt: int,
+        iFrameIdx: int,
+        iConfigGrpIdx: int,
+        iConfigGroups: int,
+        iSubFrameIdx: int,
+        iSubFrameGroups: int,
+    ) -> CConfigExecJob:
+        sFileJobConfig = "{0}_frm{1:02d}_job{2:02d}.json".format(sIdName, iFrameIdx, iJobIdx + 1)
+        pathJobConfig = Path(dicJob["sPathJobConfigMain"]) / sFileJobConfig
+        sJobName = "{0}:{1}/{2}>{3}.{4}.{5}".format(
+            sIdName,
+            iJobIdx + 1,
+            iJobCnt,
+            iFrameIdx,
+            iConfigGrpIdx,
+            iSubFrameIdx,
+        )
+
+        for dicConfig in lJobConfigs:
+            # Update the render config for this job
+            dicConfig.update(
+                {
+                    "iFrameFirst": iFrameIdx,
+                    "iFrameLast": iFrameIdx,
+                    "iFrameStep": 1,
+                    "iSubFrameOffset": iSubFrameIdx,
+                    "iSubFrameStep": iSubFrameGroups,
+                }
             )
-        # endif
+        # endfor
+
+        dicJobConfig = {
+            "sDTI": "/catharsys/action/config-list:1.1",
+            "sAction": dicJob["sAction"],
+            "sActDti": dicJob["sActDti"],
+            "mPrjCfg": dicJob["mPrjCfg"],
+            "iConfigGroupIdx": iConfigGrpIdx,
+            "iConfigGroups": iConfigGroups,
+            "iFrameGroupIdx": iSubFrameIdx,
+            "iFrameGroups": iSubFrameGroups,
+            "sPathJobConfigMain": dicJob["sPathJobConfigMain"],
+            "mExec": dicJob["mExec"],
+            "lConfigs": lJobConfigs,
+        }
+
+        return CConfigExecJob(
+            _iIdx=iJobIdx,
+            _sName=sJobName,
+            _sLabel=sFileJobConfig,
+            _pathConfig=pathJobConfig,
+            _dicConfig=dicJobConfig,
+        )
+
+    # enddef
+
+    ######################################################################################
+    # Execute jobs with distribution over frames
+    @logFunctionCall
+    def _GetJobs_PerFrameConfigs(self, *, sId, dicJob) -> list[CConfigExecJob]:
+        iFrameFirst, iFrameLast, iFrameStep, iFrameCnt, iSubFrameGroups = self._GetSubFrameGroupLayout(dicJob=dicJob)
+
+        iConfigCnt = len(dicJob["lConfigs"])
+        iConfigGroups, iConfigsPerGroup = self._GetConfigGroupLayout(dicJob=dicJob, iConfigCnt=iConfigCnt)
 
         logFunctionCall.PrintLog(
             f"PerFrameConfigs: 'iConfigGroups':{iConfigGroups} 'iConfigCnt':{iConfigCnt}"
@@ -683,51 +1190,18 @@ class CActionClassManifestExecutor(CActionClassExecutor):
 
                 # Loop over jobs per frame
                 for iSubFrameIdx in range(iSubFrameGroups):
-                    sFileJobConfig = "{0}_frm{1:02d}_job{2:02d}.json".format(sIdName, iFrameIdx, iJobIdx + 1)
-                    pathJobConfig = Path(dicJob["sPathJobConfigMain"]) / sFileJobConfig
-                    sJobName = "{0}:{1}/{2}>{3}.{4}.{5}".format(
-                        sIdName,
-                        iJobIdx + 1,
-                        iJobCnt,
-                        iFrameIdx,
-                        iConfigGrpIdx,
-                        iSubFrameIdx,
-                    )
-
-                    for dicConfig in lJobConfigs:
-                        # Update the render config for this job
-                        dicConfig.update(
-                            {
-                                "iFrameFirst": iFrameIdx,
-                                "iFrameLast": iFrameIdx,
-                                "iFrameStep": 1,
-                                "iSubFrameOffset": iSubFrameIdx,
-                                "iSubFrameStep": iSubFrameGroups,
-                            }
-                        )
-                    # endfor
-
-                    dicJobConfig = {
-                        "sDTI": "/catharsys/action/config-list:1.1",
-                        "sAction": dicJob["sAction"],
-                        "sActDti": dicJob["sActDti"],
-                        "mPrjCfg": dicJob["mPrjCfg"],
-                        "iConfigGroupIdx": iConfigGrpIdx,
-                        "iConfigGroups": iConfigGroups,
-                        "iFrameGroupIdx": iSubFrameIdx,
-                        "iFrameGroups": iSubFrameGroups,
-                        "sPathJobConfigMain": dicJob["sPathJobConfigMain"],
-                        "mExec": dicJob["mExec"],
-                        "lConfigs": lJobConfigs,
-                    }
-
                     lJobs.append(
-                        CConfigExecJob(
-                            _iIdx=iJobIdx,
-                            _sName=sJobName,
-                            _sLabel=sFileJobConfig,
-                            _pathConfig=pathJobConfig,
-                            _dicConfig=dicJobConfig,
+                        self._CreateExecJob_PerFrame(
+                            dicJob=dicJob,
+                            sIdName=sIdName,
+                            lJobConfigs=lJobConfigs,
+                            iJobIdx=iJobIdx,
+                            iJobCnt=iJobCnt,
+                            iFrameIdx=iFrameIdx,
+                            iConfigGrpIdx=iConfigGrpIdx,
+                            iConfigGroups=iConfigGroups,
+                            iSubFrameIdx=iSubFrameIdx,
+                            iSubFrameGroups=iSubFrameGroups,
                         )
                     )
                     iJobIdx += 1
@@ -740,11 +1214,86 @@ class CActionClassManifestExecutor(CActionClassExecutor):
     # enddef
 
     ######################################################################################
-    def _ExecJobsParallel(self, *, _lJobs: list[CConfigExecJob], _iMaxLocalWorkers: int):
-        if len(_lJobs) == 0:
-            return
-        # endif
+    # Generator over jobs with distribution over frames, ordered by config group.
+    # The configs are consumed group by group as the jobs are requested.
+    def _IterJobs_ConfigsPerFrame(
+        self, *, sId, dicJob, iterConfigs: Iterable[dict], iConfigCnt: int
+    ) -> Iterator[CConfigExecJob]:
+        iFrameFirst, iFrameLast, iFrameStep, iFrameCnt, iSubFrameGroups = self._GetSubFrameGroupLayout(dicJob=dicJob)
+        iConfigGroups, iConfigsPerGroup = self._GetConfigGroupLayout(dicJob=dicJob, iConfigCnt=iConfigCnt)
 
+        logFunctionCall.PrintLog(
+            f"ConfigsPerFrame: 'iConfigGroups':{iConfigGroups} 'iConfigCnt':{iConfigCnt}"
+            f"\n                'iConfigsPerGroup':{iConfigsPerGroup} 'iFrameCnt':{iFrameCnt}"
+        )
+
+        iJobCnt = iFrameCnt * iConfigGroups * iSubFrameGroups
+        sIdName = self._ToIdName(sId)
+
+        iJobIdx = 0
+        # Loop over configs
+        for iConfigGrpIdx, lJobConfigs in enumerate(self._IterConfigGroups(iterConfigs, iConfigsPerGroup)):
+            # Loop over frames
+            for iFrameIdx in range(iFrameFirst, iFrameLast + 1, iFrameStep):
+                # Loop over jobs per frame
+                for iSubFrameIdx in range(iSubFrameGroups):
+                    yield self._CreateExecJob_PerFrame(
+                        dicJob=dicJob,
+                        sIdName=sIdName,
+                        lJobConfigs=lJobConfigs,
+                        iJobIdx=iJobIdx,
+                        iJobCnt=iJobCnt,
+                        iFrameIdx=iFrameIdx,
+                        iConfigGrpIdx=iConfigGrpIdx,
+                        iConfigGroups=iConfigGroups,
+                        iSubFrameIdx=iSubFrameIdx,
+                        iSubFrameGroups=iSubFrameGroups,
+                    )
+                    iJobIdx += 1
+                # endfor sub-frames
+            # endfor frames
+        # endfor configs
+
+    # enddef
+
+    ######################################################################################
+    # Handle the result of a finished job
+    def _EndJobFuture(self, _futJob: concurrent.futures.Future):
+        dicArgs = self.dicJobFutures.pop(_futJob)
+        try:
+            sName = dicArgs["sJobNameLong"]
+            # print(f"Finished job: {sName}")
+            _futJob.result()
+        except Exception as xEx:
+            sMsg = f"Exception running job:\n{(str(xEx))}"
+            xProcHander: CProcessHandler = dicArgs["xProcessHandler"]
+            if xProcHander is not None and xProcHander.bEndedAvailable is True:
+                xProcHander.Ended(1, sMsg)
+            # endif
+            print(sMsg)
+        # endtry
+
+    # enddef
+
+    ######################################################################################
+    # Save and start all jobs in a thread pool. The jobs may also be given by a generator.
+    # If '_iMaxPendingJobs' is given, a new job is only requested from '_lJobs', when less
+    # than this number of jobs are waiting or running. The configuration of a started job
+    # is released, as the job itself loads it from the saved file.
+    # If '_xLsfArraySubmission' is given, the scripts of the LSF job arrays are stored in the
+    # job config folder of the first job.
+    # If '_xJobStatusStore' is given, the completion of each job is recorded in the store.
+    # If additionally '_bResume' is true, jobs that are recorded as completed are skipped.
+    def _ExecJobsParallel(
+        self,
+        *,
+        _lJobs: Iterable[CConfigExecJob],
+        _iMaxLocalWorkers: int,
+        _iMaxPendingJobs: Optional[int] = None,
+        _xLsfArraySubmission: Optional[lsf.CLsfArraySubmission] = None,
+        _xJobStatusStore: Optional[CJobStatusStore] = None,
+        _bResume: bool = False,
+    ):
         with concurrent.futures.ThreadPoolExecutor(max_workers=_iMaxLocalWorkers) as xExecutor:
             xExecJob: CConfigExecJob = None
             for xExecJob in _lJobs:
@@ -752,42 +1301,277 @@ class CActionClassManifestExecutor(CActionClassExecutor):
                     continue
                 # endif
 
-                sPathJobConfigMain: str = xExecJob.dicConfig["sPathJobConfigMain"]
-                path.CreateDir(sPathJobConfigMain)
-
-                # Start the actual job
-                # Save the render config to a file
-                file.SaveJson(xExecJob.pathConfig, xExecJob.dicConfig, iIndent=4)
-                logFunctionCall.PrintLog(f"save and start [job](file:\\\\{str(xExecJob.pathConfig)})")
-                self.StartJobParallel(
-                    pathJobConfig=xExecJob.pathConfig,
-                    sJobName=xExecJob.sName,
-                    sJobNameLong=xExecJob.sLabel,
-                    xProcHandler=xExecJob.xProcHandler,
-                    xExecutor=xExecutor,
+                sJobStatusKey: Optional[str] = None
+                if _xJobStatusStore is not None:
+                    sJobStatusKey = _xJobStatusStore.CreateJobKey(xExecJob.dicConfig)
+                    if _bResume is True and _xJobStatusStore.IsDone(sJobStatusKey):
+                        self._SkipCompletedJob(xExecJob, _bReleaseConfig=(_iMaxPendingJobs is not None))
+                        continue
+                    # endif
+                # endif
+
+                if _xLsfArraySubmission is not None and _xLsfArraySubmission.pathScripts is None:
+                    _xLsfArraySubmission.pathScripts = Path(xExecJob.dicConfig["sPathJobConfigMain"]) / "lsf-arrays"
+                # endif
+
+                self._SaveAndStartJob(
+                    xExecJob, xExecutor=xExecutor, xJobStatusStore=_xJobStatusStore, sJobStatusKey=sJobStatusKey
                 )
+
+                if _iMaxPendingJobs is not None:
+                    xExecJob.ReleaseConfig()
+                    while len(self.dicJobFutures) >= _iMaxPendingJobs:
+                        setDone, setPending = concurrent.futures.wait(
+                            self.dicJobFutures, return_when=concurrent.futures.FIRST_COMPLETED
+                        )
+                        for futJob in setDone:
+                            self._EndJobFuture(futJob)
+                        # endfor
+                    # endwhile
+                # endif
             # endfor job
 
-            for futJob in concurrent.futures.as_completed(self.dicJobFutures):
-                dicArgs = self.dicJobFutures[futJob]
-                try:
-                    sName = dicArgs["sJobNameLong"]
-                    # print(f"Finished job: {sName}")
-                    futJob.result()
-                except Exception as xEx:
-                    sMsg = f"Exception running job:\n{(str(xEx))}"
-                    xProcHander: CProcessHandler = dicArgs["xProcessHandler"]
-                    if xProcHander is not None and xProcHander.bEndedAvailable is True:
-                        xProcHander.Ended(1, sMsg)
-                    # endif
-                    print(sMsg)
-                # endtry
+            for futJob in concurrent.futures.as_completed(list(self.dicJobFutures)):
+                self._EndJobFuture(futJob)
             # endfor
 
         # end with thread pool
 
     # enddef
 
+    ######################################################################################
+    # Save the job config to its file and start the job in the thread pool
+    def _SaveAndStartJob(
+        self,
+        _xExecJob: CConfigExecJob,
+        *,
+        xExecutor: concurrent.futures.ThreadPoolExecutor,
+        xJobStatusStore: Optional[CJobStatusStore] = None,
+        sJobStatusKey: Optional[str] = None,
+    ):
+        with ProfilePhase("jobs/write-config", _xExecJob.sName):
+            path.CreateDir(_xExecJob.dicConfig["sPathJobConfigMain"])
+
+            dicJobConfig: dict = _xExecJob.dicConfig
+            if self.xJobConfigStore is not None:
+                dicJobConfig = self._GetJobConfigWithRefs(dicJobConfig, _pathJobConfig=_xExecJob.pathConfig)
+            # endif
+
+            # Start the actual job
+            # Save the render config to a file
+            file.SaveJson(_xExecJob.pathConfig, dicJobConfig, iIndent=4)
+        # endwith
+
+        logFunctionCall.PrintLog(f"save and start [job](file:\\\\{str(_xExecJob.pathConfig)})")
+        self.StartJobParallel(
+            pathJobConfig=_xExecJob.pathConfig,
+            sJobName=_xExecJob.sName,
+            sJobNameLong=_xExecJob.sLabel,
+            xProcHandler=_xExecJob.xProcHandler,
+            xExecutor=xExecutor,
+            xJobStatusStore=xJobStatusStore,
+            sJobStatusKey=sJobStatusKey,
+        )
+        ProfileCount("jobs/started")
+
+    # enddef
+
+    ######################################################################################
+    # Get a copy of the job config, where the project and execution configs and the
+    # processed data of each config are replaced by references into the job config store.
+    # Configs shared by several jobs, e.g. by the frame jobs of a config, are stored only once.
+    def _GetJobConfigWithRefs(self, _dicJobConfig: dict, *, _pathJobConfig: Path) -> dict:
+        pathStore: Path = self.xJobConfigStore.pathStore.absolute()
+        try:
+            sPathStore = Path(os.path.relpath(pathStore, _pathJobConfig.parent.absolute())).as_posix()
+        except ValueError:
+            # No relative path between different drives
+            sPathStore = pathStore.as_posix()
+        # endtry
+
+        dicJobRefs: dict = dict(_dicJobConfig)
+        dicJobRefs["sConfigStore"] = sPathStore
+        for sKey in ["mPrjCfg", "mExec"]:
+            if sKey in dicJobRefs:
+                dicJobRefs[sKey] = self.xJobConfigStore.Put(dicJobRefs[sKey])
+            # endif
+        # endfor
+
+        lConfigRefs: list[dict] = []
+        for dicConfig in _dicJobConfig["lConfigs"]:
+            dicConfigRefs = dict(dicConfig)
+            if "mConfig" in dicConfigRefs:
+                dicConfigRefs["mConfig"] = self.xJobConfigStore.Put(dicConfigRefs["mConfig"])
+            # endif
+            lConfigRefs.append(dicConfigRefs)
+        # endfor
+        dicJobRefs["lConfigs"] = lConfigRefs
+
+        return dicJobRefs
+
+    # enddef
+
+    ######################################################################################
+    def _SkipCompletedJob(self, _xExecJob: CConfigExecJob, *, _bReleaseConfig: bool):
+        ProfileCount("jobs/skipped")
+        print(f"Skipping job completed in a previous launch: {_xExecJob.sLabel}")
+        if _xExecJob.xProcHandler.bEndedAvailable is True:
+            _xExecJob.xProcHandler.Ended(0, "Job completed in a previous launch")
+        # endif
+        if _bReleaseConfig is True:
+            _xExecJob.ReleaseConfig()
+        # endif
+
+    # enddef
+
+    ######################################################################################
+    # True, if the jobs are executed on the local machine
+    def _IsLocalExecution(self) -> bool:
+        dicDti: dict = config.CheckConfigType(self.dicExec, "/catharsys/exec/*:*")
+        return dicDti["bOK"] is True and dicDti["lCfgType"][-1] == "std"
+
+    # enddef
+
+    ######################################################################################
+    # Split a job into work units of a single config and a single frame.
+    # The units are stored next to the job config file. Jobs of a single unit are returned unchanged.
+    # The process handlers of the units pass the output and the termination polls to the
+    # process handler of the job, which ends when the last unit has ended.
+    def _IterWorkUnits(self, _xExecJob: CConfigExecJob) -> Iterator[CConfigExecJob]:
+        dicJobConfig: dict = _xExecJob.dicConfig
+        lUnits: list[tuple[dict, Optional[int]]] = []
+        for dicConfig in dicJobConfig["lConfigs"]:
+            iFrameFirst: Optional[int] = dicConfig.get("iFrameFirst")
+            iFrameLast: Optional[int] = dicConfig.get("iFrameLast")
+            iFrameStep: Optional[int] = dicConfig.get("iFrameStep")
+            if iFrameFirst is None or iFrameLast is None or iFrameStep is None or iFrameFirst == iFrameLast:
+                lUnits.append((dicConfig, None))
+            else:
+                lUnits.extend((dicConfig, iFrame) for iFrame in range(iFrameFirst, iFrameLast + 1, iFrameStep))
+            # endif
+        # endfor
+
+        if len(lUnits) <= 1:
+            yield _xExecJob
+            return
+        # endif
+
+        iUnitCnt: int = len(lUnits)
+        pathJobConfig: Path = _xExecJob.pathConfig
+        xUnitEndHandler = CWorkUnitEndHandler(_xExecJob.xProcHandler, iUnitCnt)
+        for iUnitIdx, (dicConfig, iFrame) in enumerate(lUnits):
+            dicUnitConfig: dict = dict(dicConfig)
+            if iFrame is not None:
+                dicUnitConfig.update({"iFrameFirst": iFrame, "iFrameLast": iFrame, "iFrameStep": 1})
+            # endif
+            dicUnitJobConfig: dict = dict(dicJobConfig)
+            dicUnitJobConfig["lConfigs"] = [dicUnitConfig]
+
+            sFileUnitConfig = "{0}_unit{1:03d}.json".format(pathJobConfig.stem, iUnitIdx + 1)
+            yield CConfigExecJob(
+                _iIdx=_xExecJob.iIdx,
+                _sName="{0}>{1}/{2}".format(_xExecJob.sName, iUnitIdx + 1, iUnitCnt),
+                _sLabel=sFileUnitConfig,
+                _pathConfig=pathJobConfig.parent / sFileUnitConfig,
+                _dicConfig=dicUnitJobConfig,
+                _xProcHandler=self._CreateJobProcHandler(
+                    _xExecJob.xProcHandler,
+                    lambda iReturnCode, sMsg, iUnitIdx=iUnitIdx: xUnitEndHandler.Ended(iUnitIdx, iReturnCode, sMsg),
+                ),
+            )
+        # endfor
+
+    # enddef
+
+    ######################################################################################
+    # Local scheduler that hands out the jobs one by one to free workers from a priority queue.
+    # If '_bWorkUnits' is true, each job is split into work units of a single config and frame,
+    # so that workers do not idle while a few workers process large groups of expensive renders.
+    # If '_bLongestFirst' is true, the jobs with the longest expected duration are started first.
+    # The expected duration of a job is its duration in a previous launch, as recorded in the
+    # job status store. Jobs without a recorded duration are started before all other jobs,
+    # as they may take longest. Otherwise, the jobs are started in the order they are given.
+    # Without '_iMaxPendingJobs', all jobs are queued before the first job is started, so that
+    # the order applies to all jobs. Otherwise, at most that many jobs are queued.
+    def _ExecJobsScheduled(
+        self,
+        *,
+        _lJobs: Iterable[CConfigExecJob],
+        _iMaxLocalWorkers: int,
+        _iMaxPendingJobs: Optional[int] = None,
+        _xJobStatusStore: CJobStatusStore,
+        _bResume: bool = False,
+        _bWorkUnits: bool = False,
+        _bLongestFirst: bool = False,
+    ):
+        iterJobs: Iterator[CConfigExecJob] = iter(_lJobs)
+        if _bWorkUnits is True:
+            iterJobs = (xUnit for xExecJob in iterJobs for xUnit in self._IterWorkUnits(xExecJob))
+        # endif
+
+        # Release the configs of started jobs, if they are not held by the caller anyway
+        bReleaseConfig: bool = _bWorkUnits is True or _iMaxPendingJobs is not None
+        iMaxQueued: Optional[int] = None if _iMaxPendingJobs is None else max(_iMaxPendingJobs, _iMaxLocalWorkers)
+
+        # Queue entries are (priority, sequence index, job status key, job). Smaller priorities come first.
+        lQueue: list[tuple[float, int, str, CConfigExecJob]] = []
+        iSeqIdx: int = 0
+        bJobsAvailable: bool = True
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=_iMaxLocalWorkers) as xExecutor:
+            while True:
+                while bJobsAvailable is True and (iMaxQueued is None or len(lQueue) < iMaxQueued):
+                    xExecJob: Optional[CConfigExecJob] = next(iterJobs, None)
+                    if xExecJob is None:
+                        bJobsAvailable = False
+                        break
+                    # endif
+                    # The process handlers of work units poll the process handler of their job
+                    if xExecJob.xProcHandler.bPollTerminateAvailable and xExecJob.xProcHandler.PollTerminate() is True:
+                        continue
+                    # endif
+
+                    sJobStatusKey: str = _xJobStatusStore.CreateJobKey(xExecJob.dicConfig)
+                    if _bResume is True and _xJobStatusStore.IsDone(sJobStatusKey):
+                        self._SkipCompletedJob(xExecJob, _bReleaseConfig=bReleaseConfig)
+                        continue
+                    # endif
+
+                    fPriority: float = 0.0
+                    if _bLongestFirst is True:
+                        fDuration: Optional[float] = _xJobStatusStore.GetDuration(sJobStatusKey)
+                        fPriority = -math.inf if fDuration is None else -fDuration
+                    # endif
+                    heapq.heappush(lQueue, (fPriority, iSeqIdx, sJobStatusKey, xExecJob))
+                    iSeqIdx += 1
+                # endwhile
+
+                # Hand out queued jobs to all free workers
+                while len(lQueue) > 0 and len(self.dicJobFutures) < _iMaxLocalWorkers:
+                    _, _, sJobStatusKey, xExecJob = heapq.heappop(lQueue)
+                    self._SaveAndStartJob(
+                        xExecJob, xExecutor=xExecutor, xJobStatusStore=_xJobStatusStore, sJobStatusKey=sJobStatusKey
+                    )
+                    if bReleaseConfig is True:
+                        xExecJob.ReleaseConfig()
+                    # endif
+                # endwhile
+
+                if len(self.dicJobFutures) == 0:
+                    break
+                # endif
+
+                setDone, setPending = concurrent.futures.wait(
+                    self.dicJobFutures, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for futJob in setDone:
+                    self._EndJobFuture(futJob)
+                # endfor
+            # endwhile
+        # endwith
+
+    # enddef
+
     ###############################################################################
     @logFunctionCall
     def StartJob(
@@ -821,6 +1605,8 @@ class CActionClassManifestExecutor(CActionClassExecutor):
         sJobNameLong: str,
         xProcHandler: CProcessHandler,
         xExecutor: concurrent.futures.ThreadPoolExecutor,
+        xJobStatusStore: Optional[CJobStatusStore] = None,
+        sJobStatusKey: Optional[str] = None,
     ):
         dicArgs = {
             "pathJobConfig": pathJobConfig,
@@ -831,10 +1617,132 @@ class CActionClassManifestExecutor(CActionClassExecutor):
             "xProcessHandler": xProcHandler,
         }
 
-        futJob = xExecutor.submit(job.Start, xPrjCfg=self.xPrjCfg, dicExec=self.dicExec, dicArgs=dicArgs)
+        if xJobStatusStore is None:
+            futJob = xExecutor.submit(job.Start, xPrjCfg=self.xPrjCfg, dicExec=self.dicExec, dicArgs=dicArgs)
+        else:
+            futJob = xExecutor.submit(
+                self._StartJobWithStatus, dicArgs=dicArgs, xJobStatusStore=xJobStatusStore, sJobStatusKey=sJobStatusKey
+            )
+        # endif
         self.dicJobFutures[futJob] = dicArgs
 
     # enddef
 
+    ###############################################################################
+    # Create a process handler for a job, which passes the output and the termination
+    # polls to '_xProcHandler', and calls '_funcEnded' when the job has ended.
+    @staticmethod
+    def _CreateJobProcHandler(
+        _xProcHandler: Optional[CProcessHandler], _funcEnded: Callable[[int, str], None]
+    ) -> CProcessHandler:
+        xJobProcHandler = CProcessHandler()
+        if _xProcHandler is not None:
+            if _xProcHandler.bStdOutAvailable is True:
+                xJobProcHandler.AddHandlerStdOut(_xProcHandler.StdOut)
+            # endif
+            if _xProcHandler.bStdErrAvailable is True:
+                xJobProcHandler.AddHandlerStdErr(_xProcHandler.StdErr)
+            # endif
+            if _xProcHandler.bPollTerminateAvailable is True:
+                xJobProcHandler.AddHandlerPollTerminate(_xProcHandler.PollTerminate)
+            # endif
+        # endif
+        xJobProcHandler.AddHandlerEnded(_funcEnded)
+        return xJobProcHandler
+
+    # enddef
+
+    ###############################################################################
+    # Start a job and record its completion. Executors that only submit the job,
+    # like LSF, let the job itself record its completion. Otherwise, the job is only
+    # recorded as done, if its process handler reports that it ended with return code 0.
+    # The duration of jobs executed locally is recorded as well.
+    def _StartJobWithStatus(self, *, dicArgs: dict, xJobStatusStore: CJobStatusStore, sJobStatusKey: str):
+        xProcHandler: Optional[CProcessHandler] = dicArgs["xProcessHandler"]
+        lReturnCodes: list[int] = []
+
+        def _Ended(_iReturnCode: int, _sMsg: str):
+            lReturnCodes.append(_iReturnCode)
+            if xProcHandler is not None and xProcHandler.bEndedAvailable is True:
+                xProcHandler.Ended(_iReturnCode, _sMsg)
+            # endif
+
+        # enddef
+
+        dicJobArgs: dict = dict(dicArgs)
+        dicJobArgs["xProcessHandler"] = self._CreateJobProcHandler(xProcHandler, _Ended)
+
+        fTimeStart: float = timer()
+        with xJobStatusStore.JobContext(sJobStatusKey, _sJobName=dicArgs["sJobNameLong"]) as xJobStatus:
+            # For LSF execution this is the submission of the job, otherwise the job itself
+            with ProfilePhase("jobs/start", dicArgs["sJobNameLong"]):
+                job.Start(xPrjCfg=self.xPrjCfg, dicExec=self.dicExec, dicArgs=dicJobArgs)
+            # endwith
+        # endwith
+        if xJobStatus.bDeferred is False and len(lReturnCodes) > 0 and all(x == 0 for x in lReturnCodes):
+            xJobStatusStore.SetDone(
+                sJobStatusKey, _sJobName=dicArgs["sJobNameLong"], _fDuration=round(timer() - fTimeStart, 3)
+            )
+        # endif
+
+    # enddef
+
 
 # endclass
+
+
+######################################################################################
+# Config worker processes for the parallel config generation.
+# Each worker process holds its own action instance with parser and loop config caches.
+g_xConfigWorkerAction: CActionClassManifestExecutor = None
+g_xConfigWorkerLoop: CLoopConfigs = None
+g_xConfigWorkerSeed = None
+g_sConfigWorkerJobGroupId: str = None
+
+
+######################################################################################
+def _InitConfigWorker(
+    _clsAction: type,
+    _xPrjCfg: CProjectConfig,
+    _sAction: str,
+    _dicActCfg: dict,
+    _xCfgLaunch: CConfigLaunch,
+    _dicActArgsOverride: Optional[dict],
+    _sJobGroupId: str,
+):
+    global g_xConfigWorkerAction, g_xConfigWorkerLoop, g_xConfigWorkerSeed, g_sConfigWorkerJobGroupId
+
+    xAction: CActionClassManifestExecutor = _clsAction(
+        xPrjCfg=_xPrjCfg,
+        sAction=_sAction,
+        dicActCfg=_dicActCfg,
+        xCfgLaunch=_xCfgLaunch,
+        dicActArgsOverride=_dicActArgsOverride,
+    )
+    xAction.Init()
+    xAction.dicCfgVars["now"] = _sJobGroupId
+
+    g_xConfigWorkerSeed = utils.ApplyConfigRandomSeed(xAction.dicTrial, _bApplyToConfig=True)
+    g_xConfigWorkerLoop = xAction._CreateLoopConfigs()
+    g_xConfigWorkerAction = xAction
+    g_sConfigWorkerJobGroupId = _sJobGroupId
+
+
+# enddef
+
+
+######################################################################################
+def _GetConfigWorkerChunk(_iCfgStart: int, _iCfgEnd: int) -> list[dict]:
+    if g_xConfigWorkerSeed is not None:
+        utils.ApplyConfigRandomSeed({"xRandomSeed": f"{g_xConfigWorkerSeed}:{_iCfgStart}"})
+    # endif
+
+    return g_xConfigWorkerAction._GetJobConfigListChunk(
+        _xLoopConfigs=g_xConfigWorkerLoop,
+        _iCfgStart=_iCfgStart,
+        _iCfgEnd=_iCfgEnd,
+        _sJobGroupId=g_sConfigWorkerJobGroupId,
+    )
+
+
+# enddef
@@ -27,21 +27,30 @@
 #####################################################################
 # Class that implements nested configuration loops based on a scheme
 import os
+import re
 import copy
+import json
+import hashlib
 from dataclasses import dataclass
+from typing import Optional
+from importlib import metadata
 
 # from pathlib import Path
 from anybase import path
 from catharsys.util import config
+from catharsys.util import version
 from catharsys.util.cls_configcml import CConfigCML
+from catharsys.util.cls_disk_cache import CDiskCache, GetPathFingerprint
+from catharsys.util.cls_frozen_data import FreezeData, ThawData
+from catharsys.util.cls_launch_profile import ProfilePhase, ProfileCount
 from catharsys.decs.decorator_log import logFunctionCall
 
 # from catharsys.config.cls_project import CProjectConfig
 import ison
 
-# from timeit import default_timer as timer
-
 
+# Entry of the processed config cache. The config and variable dictionaries
+# are frozen, so that they can be shared between config sets without copying.
 @dataclass
 class CProcCache:
     dicCfg: dict
@@ -56,10 +65,82 @@ class CProcCache:
 # endclass
 
 
+#####################################################################
+def _GetParserVersion() -> str:
+    try:
+        return metadata.version("ison")
+    except Exception:
+        return str(os.path.getmtime(ison.__file__))
+    # endtry
+
+
+# enddef
+
+
+#####################################################################
+# Convert data to a canonical form for hashing, which only contains
+# dictionaries with string keys, lists and JSON scalars. Raises a
+# TypeError for all other values, so that the caller can skip caching
+# instead of hashing a representation that depends on object addresses.
+def _GetCanonicalData(_xData):
+    if _xData is None or isinstance(_xData, (str, bool, int, float)):
+        return _xData
+    elif isinstance(_xData, dict):
+        dicData = {}
+        for xKey, xValue in _xData.items():
+            if not isinstance(xKey, str):
+                raise TypeError(f"Dictionary key of type '{type(xKey).__name__}' cannot be hashed")
+            # endif
+            dicData[xKey] = _GetCanonicalData(xValue)
+        # endfor
+        return dicData
+    elif isinstance(_xData, (list, tuple)):
+        return [_GetCanonicalData(xValue) for xValue in _xData]
+    # endif
+
+    raise TypeError(f"Value of type '{type(_xData).__name__}' cannot be hashed")
+
+
+# enddef
+
+
+#####################################################################
+# Return a canonical JSON string of the given data, or None, if the
+# data contains values that have no canonical form.
+def _GetCanonicalJson(_xData) -> Optional[str]:
+    try:
+        return json.dumps(_GetCanonicalData(_xData), sort_keys=True, allow_nan=True)
+    except (TypeError, ValueError, RecursionError):
+        return None
+    # endtry
+
+
+# enddef
+
+
 class CLoopConfigs:
+    # Version of the data stored in the disk cache
+    c_sDiskCacheVersion: str = "1"
+    # Suffixes of files in the workspace config folder whose content is part of the disk cache keys
+    c_setDiskCacheContentSuffixes: set[str] = {".json", ".json5", ".ison", ".py"}
+    # Processed configs that reference one of these names are not stored in the disk cache,
+    # as their result varies between launches.
+    c_reDiskCacheVolatile: re.Pattern = re.compile(r"\b(now|rand\w*)\b")
+    # References to config id variables, which are available before the configs are processed
+    c_reFilterIdVar: re.Pattern = re.compile(r"\$\{id:[^:{}$]+:(cfg-id|rel-path-cfg|folder|dti)\}")
+
     #################################################################
     # Constructor
-    def __init__(self, *, xPrjCfg, sId, sCfgFilePath, lScheme):
+    def __init__(
+        self,
+        *,
+        xPrjCfg,
+        sId,
+        sCfgFilePath,
+        lScheme,
+        xDiskCache: Optional[CDiskCache] = None,
+        bEarlyFilter: bool = False,
+    ):
         self.sId = sId
 
         self.xPrjCfg = xPrjCfg
@@ -70,7 +151,18 @@ class CLoopConfigs:
         self.lScheme = copy.deepcopy(lScheme)
 
         self.dicCfgCache: dict = None
-        self.dicProcCfgCache: dict[str, CProcCache] = None
+        # Processed config cache per level id. Each level cache maps
+        # (value index, data list index) to the cache entry.
+        self.dicProcCfgCache: dict[str, dict[tuple[int, int], CProcCache]] = None
+
+        # Optional persistent cache of loaded and fully processed configs
+        self.xDiskCache: CDiskCache = xDiskCache
+        self._sDiskCacheBaseKey: str = None
+
+        # Evaluate manifest filters before the configs are processed, if possible.
+        # Filtered configs are then not processed, which changes the consumption
+        # of seeded random streams. Therefore, this is only done on request.
+        self.bEarlyFilter: bool = bEarlyFilter
 
         # Initialize loop
         self.Init()
@@ -143,7 +235,7 @@ class CLoopConfigs:
             bTest = True
 
             if sEval is not None:
-                bTest = eval(sEval)
+                bTest = eval(self._CompileFilter(sEval))
             # endif
 
         except Exception as xEx:
@@ -158,7 +250,7 @@ class CLoopConfigs:
             bCfgTest = True
 
             if sCfgEval is not None:
-                bCfgTest = eval(sCfgEval)
+                bCfgTest = eval(self._CompileFilter(sCfgEval))
             # endif
 
         except Exception as xEx:
@@ -235,6 +327,122 @@ class CLoopConfigs:
 
     # enddef
 
+    #################################################################
+    # Compile a python filter expression. The compiled code is cached by
+    # the expression source, i.e. after the variables have been substituted.
+    def _CompileFilter(self, _sEval: str):
+        xCode = self.dicFilterCodeCache.get(_sEval)
+        if xCode is None:
+            xCode = self.dicFilterCodeCache[_sEval] = compile(_sEval, "<filter>", "eval")
+        # endif
+        return xCode
+
+    # enddef
+
+    #################################################################
+    # Test whether a manifest filter or enable expression only refers to
+    # config id variables, which are known before the configs are processed.
+    def _IsEarlyFilter(self, _xFilter) -> bool:
+        if isinstance(_xFilter, (bool, int, float)):
+            return True
+        elif not isinstance(_xFilter, str):
+            return False
+        # endif
+
+        sRest = self.c_reFilterIdVar.sub("", _xFilter)
+        return "${" not in sRest and "id:" not in sRest and "value" not in sRest
+
+    # enddef
+
+    #################################################################
+    # Test whether an unprocessed config value is a literal, whose
+    # 'sFilter' and 'bEnable' elements do not change by processing.
+    def _IsLiteralConfigValue(self, _xValue) -> bool:
+        if isinstance(_xValue, str):
+            return "$" not in _xValue
+        elif isinstance(_xValue, dict):
+            for xKey in _xValue:
+                if not isinstance(xKey, str) or "$" in xKey or (xKey.startswith("__") and xKey != "__locals__"):
+                    return False
+                # endif
+            # endfor
+            return True
+        # endif
+
+        return _xValue is None or isinstance(_xValue, (bool, int, float, list))
+
+    # enddef
+
+    #################################################################
+    # Find the manifest filters per level, which can be evaluated before
+    # the configs are processed. Maps the level id to the tuple (sFilter, bEnable),
+    # of which only one element is not None.
+    # Returns an empty dictionary, if early filtering is not enabled.
+    def _GetEarlyFilters(self) -> dict[str, tuple]:
+        dicEarlyFilter: dict[str, tuple] = {}
+        if self.bEarlyFilter is False:
+            return dicEarlyFilter
+        # endif
+
+        for dicLevel in self.lScheme:
+            sFilter = dicLevel.get("sFilter")
+            xEnable = dicLevel.get("bEnable")
+            if sFilter is not None:
+                if self._IsEarlyFilter(sFilter):
+                    dicEarlyFilter[dicLevel["sId"]] = (sFilter, None)
+                # endif
+            elif xEnable is not None and self._IsEarlyFilter(xEnable):
+                dicEarlyFilter[dicLevel["sId"]] = (None, xEnable)
+            # endif
+        # endfor
+        return dicEarlyFilter
+
+    # enddef
+
+    #################################################################
+    # Evaluate the early manifest filters before the configs are processed,
+    # so that filtered combinations are not processed at all.
+    # Returns True, if the combination is filtered. Filters that cannot be
+    # evaluated here, are evaluated again by IsFiltered() after processing,
+    # which also reports any errors.
+    def _IsFilteredEarly(self, _xCfgVars) -> bool:
+        dicVarCfgId = _xCfgVars.GetVarData().get("id")
+        for sId, tFilter in self.dicEarlyFilter.items():
+            sFilter, xEnable = tFilter
+            xCfgValue = dicVarCfgId[sId].get("value")
+            self._SetCfgVarsCurrentId(_xCfgVars, sId)
+
+            try:
+                if sFilter is not None:
+                    bTest = eval(self._CompileFilter(_xCfgVars.Process(sFilter)))
+                else:
+                    # An enable element or filter in the config itself takes precedence.
+                    # If the config is not a literal, it may only define them when processed.
+                    if not self._IsLiteralConfigValue(xCfgValue):
+                        continue
+                    elif isinstance(xCfgValue, dict) and ("sFilter" in xCfgValue or "bEnable" in xCfgValue):
+                        continue
+                    # endif
+
+                    xEval = _xCfgVars.Process(xEnable)
+                    if not isinstance(xEval, (bool, int, float)):
+                        continue
+                    # endif
+                    bTest = xEval != 0
+                # endif
+            except Exception:
+                continue
+            # endtry
+
+            if not bTest:
+                return True
+            # endif
+        # endfor
+
+        return False
+
+    # enddef
+
     #################################################################
     def _SetCfgVarsCurrentId(self, _xCfgVars, _sId):
         dicVar = _xCfgVars.GetVarData()
@@ -247,6 +455,58 @@ class CLoopConfigs:
 
     # enddef
 
+    #################################################################
+    # Get the per level indices for a flat configuration index.
+    # The last level is stepped fastest, like in Next().
+    def GetLevelIndices(self, _iTotalIdx: int) -> list[int]:
+        if _iTotalIdx < 0 or _iTotalIdx >= self.iTotalCnt:
+            raise Exception(
+                f"Configuration index '{_iTotalIdx}' is out of range for a total of '{self.iTotalCnt}' configurations."
+            )
+        # endif
+
+        lLevelIndices: list[int] = [0] * len(self.lScheme)
+        iIdx = _iTotalIdx
+        for iLevel in range(len(self.lScheme) - 1, -1, -1):
+            iIdx, lLevelIndices[iLevel] = divmod(iIdx, self.lScheme[iLevel]["iCnt"])
+        # endfor
+
+        return lLevelIndices
+
+    # enddef
+
+    #################################################################
+    # Get the flat configuration index for a list of per level indices
+    def GetTotalIdx(self, _lLevelIndices: list[int]) -> int:
+        if len(_lLevelIndices) != len(self.lScheme):
+            raise Exception(
+                f"Expect '{len(self.lScheme)}' level indices for configuration loop but got '{len(_lLevelIndices)}'"
+            )
+        # endif
+
+        iTotalIdx = 0
+        for dicLevel, iIdx in zip(self.lScheme, _lLevelIndices):
+            iCnt = dicLevel["iCnt"]
+            if iIdx < 0 or iIdx >= iCnt:
+                raise Exception(
+                    f"Index '{iIdx}' is out of range for configuration level '{dicLevel.get('sId')}' "
+                    f"with '{iCnt}' elements."
+                )
+            # endif
+            iTotalIdx = iTotalIdx * iCnt + iIdx
+        # endfor
+
+        return iTotalIdx
+
+    # enddef
+
+    #################################################################
+    # Get the per level indices of the current loop step
+    def GetCurrentLevelIndices(self) -> list[int]:
+        return [dicLevel["iIdx"] for dicLevel in self.lScheme]
+
+    # enddef
+
     #################################################################
     # Get config data for current loop step
     @logFunctionCall
@@ -257,6 +517,26 @@ class CLoopConfigs:
             )
         # endif
 
+        return self._GetDataForLevelIndices(self.GetCurrentLevelIndices(), _xCML)
+
+    # enddef
+
+    #################################################################
+    # Get config data for the given flat configuration index.
+    # This does not depend on or change the loop state of Next().
+    # The processed config cache is reused as long as the outer
+    # levels do not change between calls, so calling this with
+    # ascending indices is as efficient as stepping with Next().
+    @logFunctionCall
+    def GetDataAt(self, _iTotalIdx: int, _xCML: CConfigCML = None):
+        return self._GetDataForLevelIndices(self.GetLevelIndices(_iTotalIdx), _xCML)
+
+    # enddef
+
+    #################################################################
+    def _GetDataForLevelIndices(self, _lLevelIndices: list[int], _xCML: CConfigCML = None):
+        self._UpdateProcCfgCache(_lLevelIndices)
+
         # dicVars = copy.deepcopy(dicCfgVars)
 
         lCfgIds = []
@@ -271,146 +551,139 @@ class CLoopConfigs:
             xParser=_xCML,  # dicConstVars=dicCfgVars, dicRtVars=dicRuntimeVars, setRtVarsEval=setRuntimeVarsEval
         )
         dicVars = {}
-        # dTimeStart = timer()
+        with ProfilePhase("get-data/load-configs"):
 
-        for dicLevel in self.lScheme:
-            # xConfigCML.Clear()
-
-            iIdx = dicLevel.get("iIdx")
-            sDti = dicLevel.get("sDTI")
-            sForm = dicLevel.get("sForm")
-            sId = dicLevel.get("sId")
-            sAct = dicLevel.get("sAction")
-            if sAct not in lAct:
-                lAct.append(sAct)
-            # endif
-            sFolderFormat = dicLevel.get("sFolderFormat", "")
-            sFolderPrefix = dicLevel.get("sFolderPrefix", "")
-            lFolderPrefix = sFolderPrefix.split("/")
-            bAddToPath = dicLevel.get("bAddToPath", True) and dicLevel.get("iAddToPath", 1) != 0
-            lValues = dicLevel.get("lValues")
+            for dicLevel, iIdx in zip(self.lScheme, _lLevelIndices):
+                # xConfigCML.Clear()
 
-            lIds.append(sId)
+                sDti = dicLevel.get("sDTI")
+                sForm = dicLevel.get("sForm")
+                sId = dicLevel.get("sId")
+                sAct = dicLevel.get("sAction")
+                if sAct not in lAct:
+                    lAct.append(sAct)
+                # endif
+                sFolderFormat = dicLevel.get("sFolderFormat", "")
+                sFolderPrefix = dicLevel.get("sFolderPrefix", "")
+                lFolderPrefix = sFolderPrefix.split("/")
+                bAddToPath = dicLevel.get("bAddToPath", True) and dicLevel.get("iAddToPath", 1) != 0
+                lValues = dicLevel.get("lValues")
 
-            lData = dicData.get(sDti)
-            if lData is None:
-                lData = dicData[sDti] = []
-            # endif
+                lIds.append(sId)
 
-            dicCfg = None
-            if sForm == "file/json":
-                pathCfgFile = config.ProvideReadFilepathExt((self.sCfgPath, lValues[iIdx]))
-                sFpCfg = pathCfgFile.as_posix()
-                dicCfgData = self.dicCfgCache.get(sFpCfg)
-                if dicCfgData is None:
-                    # print(f"adding to cache: {sFpCfg}")
-                    dicPathVars = self.xPrjCfg.GetFilepathVarDict(sFpCfg)
-                    dicCfg = config.Load(
-                        (self.sCfgPath, lValues[iIdx]),
-                        sDTI=sDti,
-                        dicCustomVars=dicPathVars,
-                        bAddPathVars=True,
-                    )
-
-                    if "sId" in dicCfg:
-                        lId = xCML.Process(
-                            dicCfg,
-                            lProcessPaths=["sId"],
-                            sImportPath=dicCfg["__locals__"]["path"],
-                        )
-                        sCfgId = lId[0]["sId"]
-                    else:
-                        sCfgId = "_"
-                    # endif
+                lData = dicData.get(sDti)
+                if lData is None:
+                    lData = dicData[sDti] = []
+                # endif
+
+                dicCfg = None
+                if sForm == "file/json":
+                    pathCfgFile = config.ProvideReadFilepathExt((self.sCfgPath, lValues[iIdx]))
+                    sFpCfg = pathCfgFile.as_posix()
+                    dicCfgData = self.dicCfgCache.get(sFpCfg)
+                    if dicCfgData is None:
+                        # print(f"adding to cache: {sFpCfg}")
+                        ProfileCount("config-files/loaded")
+                        dicCfg = self._LoadConfig(pathCfgFile, lValues[iIdx], sDti)
+
+                        if "sId" in dicCfg:
+                            lId = xCML.Process(
+                                dicCfg,
+                                lProcessPaths=["sId"],
+                                sImportPath=dicCfg["__locals__"]["path"],
+                            )
+                            sCfgId = lId[0]["sId"]
+                        else:
+                            sCfgId = "_"
+                        # endif
+
+                        if len(sFolderFormat) > 0:
+                            sCfgId = sFolderFormat.format(sCfgId)
+                        # endif
+
+                        # The loaded config is shared by all config sets and only read by the parser
+                        dicCfg = FreezeData(dicCfg)
+                        dicCfgData = self.dicCfgCache[sFpCfg] = {}
+                        dicCfgData["dicCfg"] = dicCfg
+                        dicCfgData["sCfgId"] = sCfgId
 
-                    if len(sFolderFormat) > 0:
-                        sCfgId = sFolderFormat.format(sCfgId)
+                    else:
+                        # print(f"loading from cache: {sFpCfg}")
+                        dicCfg = dicCfgData["dicCfg"]
+                        sCfgId = dicCfgData["sCfgId"]
                     # endif
 
-                    dicCfgData = self.dicCfgCache[sFpCfg] = {}
-                    dicCfgData["dicCfg"] = dicCfg
-                    dicCfgData["sCfgId"] = sCfgId
+                    lData.append(dicCfg)
 
+                elif sForm == "value" or sForm == "const-value":
+                    xValue = lValues[iIdx]
+                    lData.append(xValue)
+                    if isinstance(xValue, dict):
+                        sCfgId = xValue.get("sId", "_")
+                        if len(sFolderFormat) > 0:
+                            sCfgId = sFolderFormat.format(sCfgId)
+                        # endif
+                    else:
+                        if len(sFolderFormat) > 0:
+                            sCfgId = sFolderFormat.format(xValue)
+                        else:
+                            sCfgId = str(xValue)
+                        # endif
+                    # endif
                 else:
-                    # print(f"loading from cache: {sFpCfg}")
-                    dicCfg = dicCfgData["dicCfg"]
-                    sCfgId = dicCfgData["sCfgId"]
+                    raise Exception("Unsupported config data form '{0}'.".format(sForm))
                 # endif
 
-                lData.append(dicCfg)
+                lCfgIds.append(sCfgId)
+                if bAddToPath:
+                    # Construct list of folders per actions
+                    if sAct not in dicActCfgIdFolders:
+                        dicActCfgIdFolders[sAct] = []
+                    # endif
+                    lActCfgIdFolders = dicActCfgIdFolders.get(sAct)
 
-            elif sForm == "value" or sForm == "const-value":
-                xValue = lValues[iIdx]
-                lData.append(xValue)
-                if isinstance(xValue, dict):
-                    sCfgId = xValue.get("sId", "_")
-                    if len(sFolderFormat) > 0:
-                        sCfgId = sFolderFormat.format(sCfgId)
+                    if len(lFolderPrefix) > 1:
+                        lCfgIdFolders.extend(lFolderPrefix[0:-1])
+                        lActCfgIdFolders.extend(lFolderPrefix[0:-1])
                     # endif
-                else:
-                    if len(sFolderFormat) > 0:
-                        sCfgId = sFolderFormat.format(xValue)
+
+                    # HACK to support relative paths within values and ids
+                    if sCfgId == "." or sCfgId == "..":
+                        sCfgIdFolder = sCfgId
                     else:
-                        sCfgId = str(xValue)
+                        sCfgIdFolder = lFolderPrefix[-1] + sCfgId.replace(".", "_").replace(" ", "_")
+                    # endif
+                    # Due to the "sFolderFormat" option, sCfgId may also include '/'.
+                    # So, here we need to split the resultant config folder again by '/'
+                    # and add potentiel subfolders to the folder list.
+                    lFolder = sCfgIdFolder.split("/")
+                    if len(lFolder) > 1:
+                        lCfgIdFolders.extend(lFolder[0:-1])
+                        lActCfgIdFolders.extend(lFolder[0:-1])
+                        sCfgIdFolder = lFolder[-1]
                     # endif
-                # endif
-            else:
-                raise Exception("Unsupported config data form '{0}'.".format(sForm))
-            # endif
-
-            lCfgIds.append(sCfgId)
-            if bAddToPath:
-                # Construct list of folders per actions
-                if sAct not in dicActCfgIdFolders:
-                    dicActCfgIdFolders[sAct] = []
-                # endif
-                lActCfgIdFolders = dicActCfgIdFolders.get(sAct)
 
-                if len(lFolderPrefix) > 1:
-                    lCfgIdFolders.extend(lFolderPrefix[0:-1])
-                    lActCfgIdFolders.extend(lFolderPrefix[0:-1])
+                    lCfgIdFolders.append(sCfgIdFolder)
+                    lActCfgIdFolders.append(sCfgIdFolder)
                 # endif
 
-                # HACK to support relative paths within values and ids
-                if sCfgId == "." or sCfgId == "..":
-                    sCfgIdFolder = sCfgId
-                else:
-                    sCfgIdFolder = lFolderPrefix[-1] + sCfgId.replace(".", "_").replace(" ", "_")
-                # endif
-                # Due to the "sFolderFormat" option, sCfgId may also include '/'.
-                # So, here we need to split the resultant config folder again by '/'
-                # and add potentiel subfolders to the folder list.
-                lFolder = sCfgIdFolder.split("/")
-                if len(lFolder) > 1:
-                    lCfgIdFolders.extend(lFolder[0:-1])
-                    lActCfgIdFolders.extend(lFolder[0:-1])
-                    sCfgIdFolder = lFolder[-1]
-                # endif
-
-                lCfgIdFolders.append(sCfgIdFolder)
-                lActCfgIdFolders.append(sCfgIdFolder)
-            # endif
-
-            # Dictionary per config, containing for example the relative path
-            dicCfgIdMeta[sId] = {
-                "sDTI": sDti,
-                "iDataListIdx": len(lData) - 1,
-                "sFolder": sCfgIdFolder if bAddToPath else None,
-                "sRelPathCfg": os.path.normpath(os.path.sep.join(lCfgIdFolders)),
-                "iCfgIdx": len(lCfgIds) - 1,
-                "sCfgId": sCfgId,
-                "iLevelIdx": iIdx,
-                "iLevelCnt": dicLevel["iCnt"],
-            }
-        # endfor
-        # dTimeEnd = timer()
-        # print(">> Load configs: {}s".format(dTimeEnd - dTimeStart))
+                # Dictionary per config, containing for example the relative path
+                dicCfgIdMeta[sId] = {
+                    "sDTI": sDti,
+                    "iDataListIdx": len(lData) - 1,
+                    "sFolder": sCfgIdFolder if bAddToPath else None,
+                    "sRelPathCfg": os.path.normpath(os.path.sep.join(lCfgIdFolders)),
+                    "iCfgIdx": len(lCfgIds) - 1,
+                    "sCfgId": sCfgId,
+                    "iLevelIdx": iIdx,
+                    "iLevelCnt": dicLevel["iCnt"],
+                }
+            # endfor
+        # endwith
 
         # ##########################################################################################
         # ##########################################################################################
 
-        # dTimeStart = timer()
-
         sRelPathTrgMain = path.MakeNormPath((self.sId, lCfgIdFolders)).as_posix()
 
         dicRelPathTrgAct = {}
@@ -438,7 +711,7 @@ class CLoopConfigs:
                 "rel-path-cfg": dicCfgMeta.get("sRelPathCfg"),
                 "folder": dicCfgMeta.get("sFolder"),
                 "dti": sDti,
-                "value": copy.deepcopy(dicData.get(sDti)[iDataListIdx]),
+                "value": FreezeData(dicData.get(sDti)[iDataListIdx]),
             }
         # endfor
         dicVars["id"] = dicVarCfgId
@@ -480,201 +753,218 @@ class CLoopConfigs:
             )
         # endfor
 
-        # dTimeEnd = timer()
-        # print(">> Prepare Vars: {}s".format(dTimeEnd - dTimeStart))
+        ######################################################################
+        # Skip combinations, which are filtered by manifest filters that do not
+        # depend on the processed configs.
+        if self._IsFilteredEarly(xCML):
+            return None
+        # endif
 
         ######################################################################
         # Process all config variables
 
-        # dTimeStart = timer()
-
-        bDoPreProc: bool = False
-        iFirstProcPass: int = 0 if bDoPreProc is True else 1
-
-        # Pre-process all configs first and then parse them normally.
-        for iProcPass in range(iFirstProcPass, 3):
-            bPreProcessOnly = iProcPass == 0
-
-            if iProcPass == 2:
-                ######################################################################
-                # Define variables that should not be stored in cached configs,
-                # as they will vary with all loop levels. Therefore, a config
-                # at a lower level depends on the loop index of a higher level.
-                dicVars["rel-path-trg"] = sRelPathTrgMain
-                dicVars["path-trg"] = path.MakeNormPath((self.xPrjCfg.pathActProd, sRelPathTrgMain)).as_posix()
-
-                ###################################
-                # Create variables for key 'action'
-                dicVarAct = {}
-                for sAct in lAct:
-                    dicVarAct[sAct] = {"rel-path-trg": dicRelPathTrgAct.get(sAct)}
-                # endfor
-                dicVars["actions"] = dicVarAct
-
-                ###################################
-                xCML.UpdateConstVars(dicVars, _bAllowOverwrite=True)
-            # endif
+        with ProfilePhase("get-data/process-configs"):
+
+            bDoPreProc: bool = False
+            iFirstProcPass: int = 0 if bDoPreProc is True else 1
+
+            # Pre-process all configs first and then parse them normally.
+            for iProcPass in range(iFirstProcPass, 3):
+                bPreProcessOnly = iProcPass == 0
+
+                if iProcPass == 2:
+                    ######################################################################
+                    # Define variables that should not be stored in cached configs,
+                    # as they will vary with all loop levels. Therefore, a config
+                    # at a lower level depends on the loop index of a higher level.
+                    dicVars["rel-path-trg"] = sRelPathTrgMain
+                    dicVars["path-trg"] = path.MakeNormPath((self.xPrjCfg.pathActProd, sRelPathTrgMain)).as_posix()
+
+                    ###################################
+                    # Create variables for key 'action'
+                    dicVarAct = {}
+                    for sAct in lAct:
+                        dicVarAct[sAct] = {"rel-path-trg": dicRelPathTrgAct.get(sAct)}
+                    # endfor
+                    dicVars["actions"] = dicVarAct
+
+                    ###################################
+                    xCML.UpdateConstVars(dicVars, _bAllowOverwrite=True)
+                # endif
 
-            # for sId, dicCfgMeta in dicCfgIdMeta.items():
-            for sId in lIds:
-                bParseInPlace: bool = False
-                bIsFullyProcessed: bool = False
-
-                dicCfgMeta = dicCfgIdMeta[sId]
-                sDti = dicCfgMeta.get("sDTI")
-                iDataListIdx = dicCfgMeta.get("iDataListIdx")
-                iLevelIdx = dicCfgMeta["iLevelIdx"]
-                # iLevelCnt = dicCfgMeta["iLevelCnt"]
-                lCfgData = dicData.get(sDti)
-
-                # Test whether data is in process cache
-                sProcCfgCacheHash = self._GetProcCfgCacheHash(sId, iLevelIdx, iDataListIdx)
-                # Load from cache only in process pass 0
-                if iProcPass >= iFirstProcPass and sProcCfgCacheHash in self.dicProcCfgCache:
-                    xProcCache = self.dicProcCfgCache[sProcCfgCacheHash]
-                    if xProcCache.bIsFullyProcessed is True:
-                        xCfg = xProcCache.dicCfg
-                        xCML.dicVarGlo.update(xProcCache.dicVarGlobal)
-                        xCML.setVarGloEval.update(xProcCache.setVarGlobalEval)
-                        xCML.dicVarFuncGlo.update(xProcCache.dicVarFuncGlobal)
-                        xCML.dicVarRtv.update(xProcCache.dicVarRt)
-                        xCML.setVarRtvEval.update(xProcCache.setVarRtEval)
-                        bIsFullyProcessed = True
-
-                        # print(f"{iProcPass}> {sId} [{iLevelIdx}, {iDataListIdx}]: Load from cache, fully processed")
-                    else:
-                        xCfg = copy.deepcopy(xProcCache.dicCfg)
-                        bParseInPlace = True
-                        # print(
-                        #     f"{iProcPass}> {sId} [{iLevelIdx}, {iDataListIdx}]: Load from cache, deep copy, parse in place"
-                        # )
+                # for sId, dicCfgMeta in dicCfgIdMeta.items():
+                for sId in lIds:
+                    bParseInPlace: bool = False
+                    bIsFullyProcessed: bool = False
+
+                    dicCfgMeta = dicCfgIdMeta[sId]
+                    sDti = dicCfgMeta.get("sDTI")
+                    iDataListIdx = dicCfgMeta.get("iDataListIdx")
+                    iLevelIdx = dicCfgMeta["iLevelIdx"]
+                    # iLevelCnt = dicCfgMeta["iLevelCnt"]
+                    lCfgData = dicData.get(sDti)
+
+                    self._SetCfgVarsCurrentId(xCML, sId)
+
+                    # Test whether data is in process cache
+                    dicLevelCache = self._GetProcCfgLevelCache(sId)
+                    tProcCfgCacheKey = (iLevelIdx, iDataListIdx)
+                    xProcCache: CProcCache = None
+                    sDiskCacheKey: str = None
+                    # Load from cache only in process pass 0
+                    if iProcPass >= iFirstProcPass:
+                        xProcCache = dicLevelCache.get(tProcCfgCacheKey)
+                        if xProcCache is None and iProcPass == 1 and self.xDiskCache is not None:
+                            sDiskCacheKey = self._GetProcCfgDiskCacheKey(sId, lCfgData[iDataListIdx], xCML)
+                            if sDiskCacheKey is not None:
+                                xProcCache = self.xDiskCache.Get(sDiskCacheKey)
+                                if xProcCache is not None:
+                                    dicLevelCache[tProcCfgCacheKey] = xProcCache
+                                # endif
+                            # endif
+                        # endif
+                        if iProcPass == 1:
+                            ProfileCount(
+                                "config-proc-cache/hits" if xProcCache is not None else "config-proc-cache/misses"
+                            )
+                        # endif
                     # endif
 
-                else:
-                    xCfg = lCfgData[iDataListIdx]
-                # endif data in process cache
-
-                self._SetCfgVarsCurrentId(xCML, sId)
-                if isinstance(xCfg, dict):
-                    sImportPath = config.GetDictValue(
-                        xCfg,
-                        "__locals__/path",
-                        str,
-                        bAllowKeyPath=True,
-                        sWhere="configuration data",
-                    )
-                    # sImportPath = config.GetElementAtPath(xCfg, "__locals__/path")
-                    # sFpCmlVars = os.path.join(sImportPath, "cml-vars_{0}.json".format(sId.replace("/", "_")))
-                    # file.SaveJson(sFpCmlVars, xCfgVars.GetVarData(), iIndent=4)
-                else:
-                    sImportPath = None
-                # endif
+                    if xProcCache is not None:
+                        if xProcCache.bIsFullyProcessed is True:
+                            # The frozen data stays in the cache, the parser gets mutable copies
+                            xCfg = xProcCache.dicCfg
+                            xCML.dicVarGlo.update(ThawData(xProcCache.dicVarGlobal))
+                            xCML.setVarGloEval.update(xProcCache.setVarGlobalEval)
+                            xCML.dicVarFuncGlo.update(ThawData(xProcCache.dicVarFuncGlobal))
+                            xCML.dicVarRtv.update(ThawData(xProcCache.dicVarRt))
+                            xCML.setVarRtvEval.update(xProcCache.setVarRtEval)
+                            bIsFullyProcessed = True
+                        else:
+                            xCfg = ThawData(xProcCache.dicCfg)
+                            bParseInPlace = True
+                        # endif
 
-                try:
-                    if bIsFullyProcessed is True:
-                        lCfgData[iDataListIdx] = xCfg
                     else:
-                        dicCfg = xCML.Process(
+                        xCfg = lCfgData[iDataListIdx]
+                    # endif data in process cache
+
+                    if isinstance(xCfg, dict):
+                        sImportPath = config.GetDictValue(
                             xCfg,
-                            sImportPath=sImportPath,
-                            bPreProcessOnly=bPreProcessOnly,
-                            bInPlace=bParseInPlace,
+                            "__locals__/path",
+                            str,
+                            bAllowKeyPath=True,
+                            sWhere="configuration data",
                         )
-                        lCfgData[iDataListIdx] = dicCfg
-
-                        # print(
-                        #     f"{iProcPass}> {sId} [{iLevelIdx}, {iDataListIdx}]: Processed [full: {xCML.bIsFullyProcessed}]"
-                        # )
-
-                        # Cache a copy of the processed config in process pass 1.
-                        if iProcPass == 1:
-                            if sProcCfgCacheHash not in self.dicProcCfgCache:
-                                xProcCache = self.dicProcCfgCache[sProcCfgCacheHash] = CProcCache(
-                                    copy.deepcopy(dicCfg), xCML.bIsFullyProcessed
-                                )
-                                if xCML.bIsFullyProcessed is True:
-                                    xProcCache.dicVarGlobal = copy.deepcopy(xCML.dicVarGlo)
-                                    xProcCache.setVarGlobalEval = xCML.setVarGloEval.copy()
-                                    xProcCache.dicVarRt = copy.deepcopy(xCML.dicVarRtv)
-                                    xProcCache.setVarRtEval = xCML.setVarRtvEval.copy()
-                                    xProcCache.dicVarFuncGlobal = copy.deepcopy(xCML.dicVarFuncGlo)
-                                # endif
+                        # sImportPath = config.GetElementAtPath(xCfg, "__locals__/path")
+                        # sFpCmlVars = os.path.join(sImportPath, "cml-vars_{0}.json".format(sId.replace("/", "_")))
+                        # file.SaveJson(sFpCmlVars, xCfgVars.GetVarData(), iIndent=4)
+                    else:
+                        sImportPath = None
+                    # endif
 
-                                # print(
-                                #     f"{iProcPass}> {sId} [{iLevelIdx}, {iDataListIdx}]: Store in cache [full: {xCML.bIsFullyProcessed}]"
-                                # )
-                            # endif
-                        elif iProcPass == 2:
-                            xWarnings = xCML.GetWarnings().FilterList(
-                                {ison.EWarningType.UNDEF_VAR: ["for-each-object", "render"]}
+                    try:
+                        if bIsFullyProcessed is True:
+                            lCfgData[iDataListIdx] = xCfg
+                        else:
+                            dicCfg = xCML.Process(
+                                xCfg,
+                                sImportPath=sImportPath,
+                                bPreProcessOnly=bPreProcessOnly,
+                                bInPlace=bParseInPlace,
                             )
-                            if xWarnings.bHasWarnings is True:
-                                sFilePath = config.GetDictValue(
-                                    xCfg,
-                                    "__locals__/filepath",
-                                    str,
-                                    bAllowKeyPath=True,
-                                    sWhere="configuration data",
+                            lCfgData[iDataListIdx] = dicCfg
+
+                            # Cache a frozen copy of the processed config in process pass 1.
+                            # Frozen data is shared with all config sets that hit the cache entry.
+                            if iProcPass == 1:
+                                if tProcCfgCacheKey not in dicLevelCache:
+                                    xProcCache = dicLevelCache[tProcCfgCacheKey] = CProcCache(
+                                        FreezeData(dicCfg), xCML.bIsFullyProcessed
+                                    )
+                                    if xCML.bIsFullyProcessed is True:
+                                        xProcCache.dicVarGlobal = FreezeData(xCML.dicVarGlo)
+                                        xProcCache.setVarGlobalEval = xCML.setVarGloEval.copy()
+                                        xProcCache.dicVarRt = FreezeData(xCML.dicVarRtv)
+                                        xProcCache.setVarRtEval = xCML.setVarRtvEval.copy()
+                                        xProcCache.dicVarFuncGlobal = FreezeData(xCML.dicVarFuncGlo)
+
+                                        if sDiskCacheKey is not None:
+                                            self.xDiskCache.Set(sDiskCacheKey, xProcCache)
+                                        # endif
+                                    # endif
+                                # endif
+                            elif iProcPass == 2:
+                                xWarnings = xCML.GetWarnings().FilterList(
+                                    {ison.EWarningType.UNDEF_VAR: ["for-each-object", "render"]}
                                 )
+                                if xWarnings.bHasWarnings is True:
+                                    sFilePath = config.GetDictValue(
+                                        xCfg,
+                                        "__locals__/filepath",
+                                        str,
+                                        bAllowKeyPath=True,
+                                        sWhere="configuration data",
+                                    )
+
+                                    print("\n================================================")
+                                    print("PARSE WARNINGS:")
+                                    print(f"Configuration '{sId}'")
+                                    print(f"Path: {sFilePath}")
+                                    print("---------------")
+                                    print(xWarnings)
+                                    print("================================================\n")
+                                # endif
 
-                                print("\n================================================")
-                                print("PARSE WARNINGS:")
-                                print(f"Configuration '{sId}'")
-                                print(f"Path: {sFilePath}")
-                                print("---------------")
-                                print(xWarnings)
-                                print("================================================\n")
                             # endif
-
                         # endif
-                    # endif
-                except ison.ParserError as xEx:
-                    sFpConfig = config.GetDictValue(
-                        xCfg,
-                        "__locals__/filepath",
-                        str,
-                        bAllowKeyPath=True,
-                        sWhere="configuration data",
-                    )
-                    sFilename = config.GetDictValue(
-                        xCfg,
-                        "__locals__/filename",
-                        str,
-                        bAllowKeyPath=True,
-                        sWhere="configuration data",
-                    )
-
-                    # sFpConfig = config.GetElementAtPath(xCfg, "__locals__/filepath")
-                    # sFilename = config.GetElementAtPath(xCfg, "__locals__/filename")
-
-                    sMsg = (
-                        "Error parsing configuration:\n"
-                        "> Trial ID: {}\n"
-                        "> Trial data list index: {}\n"
-                        "> DTI: {}\n"
-                        "> File: {}\n"
-                        "> Import Path: {}\n"
-                        "> File Path: {}\n"
-                        "> PreProc only: {}\n"
-                        "Parsing trace:\n"
-                        "{}\n".format(
-                            sId,
-                            iDataListIdx,
-                            sDti,
-                            sFilename,
-                            sImportPath,
-                            sFpConfig,
-                            bPreProcessOnly,
-                            xEx.ToString(),
+                    except ison.ParserError as xEx:
+                        sFpConfig = config.GetDictValue(
+                            xCfg,
+                            "__locals__/filepath",
+                            str,
+                            bAllowKeyPath=True,
+                            sWhere="configuration data",
                         )
-                    )
-                    raise Exception(sMsg)
-                # endtry
-            # endfor
-        # endfor processing pass
+                        sFilename = config.GetDictValue(
+                            xCfg,
+                            "__locals__/filename",
+                            str,
+                            bAllowKeyPath=True,
+                            sWhere="configuration data",
+                        )
+
+                        # sFpConfig = config.GetElementAtPath(xCfg, "__locals__/filepath")
+                        # sFilename = config.GetElementAtPath(xCfg, "__locals__/filename")
+
+                        sMsg = (
+                            "Error parsing configuration:\n"
+                            "> Trial ID: {}\n"
+                            "> Trial data list index: {}\n"
+                            "> DTI: {}\n"
+                            "> File: {}\n"
+                            "> Import Path: {}\n"
+                            "> File Path: {}\n"
+                            "> PreProc only: {}\n"
+                            "Parsing trace:\n"
+                            "{}\n".format(
+                                sId,
+                                iDataListIdx,
+                                sDti,
+                                sFilename,
+                                sImportPath,
+                                sFpConfig,
+                                bPreProcessOnly,
+                                xEx.ToString(),
+                            )
+                        )
+                        raise Exception(sMsg)
+                    # endtry
+                # endfor
+            # endfor processing pass
 
-        # dTimeEnd = timer()
-        # print(">> Process configs: {}s".format(dTimeEnd - dTimeStart))
+        # endwith
 
         ######################################################################
         # Update dicVarData with processed configs
@@ -695,7 +985,8 @@ class CLoopConfigs:
                     dicNewId[sKey] = dicId[sKey]
                 # endif
             # endfor
-            dicNewId["value"] = copy.deepcopy(xCfgData)
+            # Configs from the process cache are already frozen and are shared
+            dicNewId["value"] = FreezeData(xCfgData)
             # dicVarCfgId.get(sId)["value"] = copy.deepcopy(xCfgData)
         # endfor
 
@@ -707,8 +998,10 @@ class CLoopConfigs:
             # endif
         # endfor
 
+        # Frozen configs are only shared within the caches. The returned data
+        # is a mutable copy, which shares the leaf values with the caches.
         return {
-            "mData": dicData,
+            "mData": ThawData(dicData),
             "lIds": lIds,
             "lCfgIdFolders": lCfgIdFolders,
             "lCfgIds": lCfgIds,
@@ -742,12 +1035,161 @@ class CLoopConfigs:
         # Reset configuration file cache
         self.dicCfgCache = dict()
         self.dicProcCfgCache = dict()
+        # The level indices the processed config cache is valid for
+        self.lProcCfgCacheLevelIndices: list[int] = None
+
+        # Compiled filter expressions and filters that are evaluated before processing
+        self.dicFilterCodeCache: dict = dict()
+        self.dicEarlyFilter: dict[str, tuple] = self._GetEarlyFilters()
+
+    # enddef
+
+    #################################################################
+    # The processed config of a level depends on the indices of all
+    # outer levels. If the level at position k changes, the cached
+    # configs of all levels after k are invalid.
+    def _UpdateProcCfgCache(self, _lLevelIndices: list[int]):
+        lPrevIndices = self.lProcCfgCacheLevelIndices
+        self.lProcCfgCacheLevelIndices = list(_lLevelIndices)
+        if lPrevIndices is None:
+            return
+        # endif
+
+        iLevelCnt = len(_lLevelIndices)
+        iChangedLevel = next((i for i in range(iLevelCnt) if lPrevIndices[i] != _lLevelIndices[i]), iLevelCnt)
+        for dicLevel in self.lScheme[iChangedLevel + 1 :]:
+            self._ClearProcCfgCacheLevel(dicLevel["sId"])
+        # endfor
 
     # enddef
 
     #################################################################
-    def _GetProcCfgCacheHash(self, _sId: str, _iLevelIdx: int, _iDataListIdx: int):
-        return f"{_sId}-{_iLevelIdx}-{_iDataListIdx}"
+    # Removes all cached configs of the level with the given id.
+    def _ClearProcCfgCacheLevel(self, _sId: str):
+        self.dicProcCfgCache.pop(_sId, None)
+
+    # enddef
+
+    #################################################################
+    def _GetProcCfgLevelCache(self, _sId: str) -> dict[tuple[int, int], CProcCache]:
+        dicLevelCache = self.dicProcCfgCache.get(_sId)
+        if dicLevelCache is None:
+            dicLevelCache = self.dicProcCfgCache[_sId] = dict()
+        # endif
+        return dicLevelCache
+
+    # enddef
+
+    #################################################################
+    # Set the loop to the given total step index.
+    # A subsequent call to Next() continues with the step after this one.
+    def SetTotalStepIdx(self, _iTotalIdx: int):
+        if _iTotalIdx < 0 or _iTotalIdx >= self.iTotalCnt:
+            raise Exception(
+                f"Configuration index '{_iTotalIdx}' is out of range for a total of '{self.iTotalCnt}' configurations."
+            )
+        # endif
+
+        for dicLevel, iIdx in zip(self.lScheme, self.GetLevelIndices(_iTotalIdx)):
+            dicLevel["iIdx"] = iIdx
+        # endfor
+        self.iTotalIdx = _iTotalIdx
+
+    # enddef
+
+    #################################################################
+    # Key parts common to all disk cache entries. Any change of a config
+    # file in the workspace config folder, of the parser or of Catharsys
+    # results in new keys.
+    def _GetDiskCacheBaseKey(self) -> str:
+        if self._sDiskCacheBaseKey is None:
+            self._sDiskCacheBaseKey = CDiskCache.CreateKey(
+                self.c_sDiskCacheVersion,
+                version.__version__,
+                _GetParserVersion(),
+                GetPathFingerprint(self.xPrjCfg.pathConfig, _setContentSuffixes=self.c_setDiskCacheContentSuffixes),
+            )
+        # endif
+        return self._sDiskCacheBaseKey
+
+    # enddef
+
+    #################################################################
+    # Load a config file, using the disk cache if available
+    def _LoadConfig(self, _pathCfgFile, _sCfgFile: str, _sDti: str) -> dict:
+        sFpCfg = _pathCfgFile.as_posix()
+        dicPathVars = self.xPrjCfg.GetFilepathVarDict(sFpCfg)
+
+        sKey: str = None
+        sPathVars: Optional[str] = None
+        if self.xDiskCache is not None:
+            sPathVars = _GetCanonicalJson(dicPathVars)
+        # endif
+
+        if sPathVars is not None:
+            sKey = CDiskCache.CreateKey(
+                "cfg",
+                self._GetDiskCacheBaseKey(),
+                sFpCfg,
+                hashlib.sha256(_pathCfgFile.read_bytes()).hexdigest(),
+                str(_sDti),
+                sPathVars,
+            )
+            dicCfg = self.xDiskCache.Get(sKey)
+            if dicCfg is not None:
+                return dicCfg
+            # endif
+        # endif
+
+        dicCfg = config.Load(
+            (self.sCfgPath, _sCfgFile),
+            sDTI=_sDti,
+            dicCustomVars=dicPathVars,
+            bAddPathVars=True,
+        )
+
+        if sKey is not None:
+            self.xDiskCache.Set(sKey, dicCfg)
+        # endif
+
+        return dicCfg
+
+    # enddef
+
+    #################################################################
+    # The disk cache key of a processed config consists of the unprocessed
+    # config and the complete parser state before processing.
+    # Returns None, if the config should not be cached. This is also the case,
+    # if the state contains values without a canonical JSON form.
+    def _GetProcCfgDiskCacheKey(self, _sId: str, _xCfg, _xCML: CConfigCML) -> Optional[str]:
+        dicVar = dict(_xCML.GetVarData())
+        dicVar.pop("now", None)
+
+        try:
+            lState = [
+                _sId,
+                _xCfg,
+                dicVar,
+                _xCML.dicVarGlo,
+                _xCML.dicVarRtv,
+                _xCML.dicVarFuncGlo,
+                sorted(_xCML.setVarGloEval),
+                sorted(_xCML.setVarRtvEval),
+            ]
+        except TypeError:
+            return None
+        # endtry
+
+        sState = _GetCanonicalJson(lState)
+        if sState is None:
+            return None
+        # endif
+
+        if self.c_reDiskCacheVolatile.search(sState) is not None:
+            return None
+        # endif
+
+        return CDiskCache.CreateKey("proc", self._GetDiskCacheBaseKey(), sState)
 
     # enddef
 
@@ -777,14 +1219,9 @@ class CLoopConfigs:
                 dicLevel["iIdx"] = iIdx
                 break
             else:
+                # The corresponding processed config cache is reset
+                # in the next call to GetData().
                 dicLevel["iIdx"] = 0
-                # Reset the corresponding processed config cache
-                sId: str = dicLevel["sId"]
-                sHash: str
-                lInvalidHashes: list[str] = [sHash for sHash in self.dicProcCfgCache if sHash.startswith(sId)]
-                for sHash in lInvalidHashes:
-                    del self.dicProcCfgCache[sHash]
-                # endfor
 
                 if iLevelIdx == 0:
                     bOK = False
@@ -0,0 +1,223 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import os
+import time
+import gzip
+import json
+import uuid
+import shutil
+import hashlib
+import threading
+from pathlib import Path
+from typing import Any, Union
+
+
+##########################################################################################
+# Content addressed store of JSON data, shared by the job config files of an action.
+# Each entry is stored once as compressed JSON, whose file name is the hash of its content.
+# The data is serialized to compact JSON with sorted keys.
+# The total size of the store is bounded by removing the least recently used entries in
+# Evict(). Entries used within the last '_fMinAge_s' seconds are never removed, so that
+# the jobs of recent launches can still resolve their references.
+# Job configs replace large elements by references of the form
+#   {"sDTI": "/catharsys/config-ref:1.0", "sHash": "[hash]"}
+# and store the path of the store relative to the job config file in 'sConfigStore'.
+# ResolveRefs() replaces all references in loaded data by the stored data.
+class CConfigStore:
+    c_sRefDti: str = "/catharsys/config-ref:1.0"
+    c_sSuffix: str = ".json.gz"
+
+    @property
+    def pathStore(self) -> Path:
+        return self._pathStore
+
+    # enddef
+
+    ######################################################################################
+    def __init__(
+        self,
+        _xPathStore: Union[str, Path],
+        *,
+        _iCompressLevel: int = 1,
+        _iMaxSizeBytes: int = 4 * 1024**3,
+        _fMinAge_s: float = 24 * 3600.0,
+    ):
+        self._pathStore: Path = Path(_xPathStore)
+        self._iCompressLevel: int = _iCompressLevel
+        self._iMaxSizeBytes: int = _iMaxSizeBytes
+        self._fMinAge_s: float = _fMinAge_s
+        # Hashes of entries known to exist in the store
+        self._setHashes: set[str] = set()
+        self._lockHashes: threading.Lock = threading.Lock()
+
+    # enddef
+
+    ######################################################################################
+    def _GetEntryPath(self, _sHash: str) -> Path:
+        return self._pathStore / _sHash[0:2] / f"{_sHash}{self.c_sSuffix}"
+
+    # enddef
+
+    ######################################################################################
+    @classmethod
+    def IsRef(cls, _xData: Any) -> bool:
+        return isinstance(_xData, dict) and _xData.get("sDTI") == cls.c_sRefDti and "sHash" in _xData
+
+    # enddef
+
+    ######################################################################################
+    # Mark an entry as recently used. Returns False, if the entry does not exist.
+    @staticmethod
+    def _TouchEntry(_pathEntry: Path) -> bool:
+        try:
+            os.utime(_pathEntry)
+        except OSError:
+            return False
+        # endtry
+        return True
+
+    # enddef
+
+    ######################################################################################
+    # Serialize the data to compact JSON with sorted keys, so that the hash does not
+    # depend on the order of the dictionary elements. Like file.SaveJson(), data that
+    # cannot be represented in JSON raises an error.
+    @staticmethod
+    def _SerializeData(_xData: Any) -> bytes:
+        return json.dumps(_xData, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+    # enddef
+
+    ######################################################################################
+    # Store the data, if it is not yet in the store, and return a reference to it.
+    # The data is written to a temporary file first, so that concurrent processes
+    # never read partially written entries.
+    def Put(self, _xData: Any) -> dict:
+        bytData: bytes = self._SerializeData(_xData)
+        sHash: str = hashlib.sha256(bytData).hexdigest()
+        dicRef: dict = {"sDTI": self.c_sRefDti, "sHash": sHash}
+
+        with self._lockHashes:
+            if sHash in self._setHashes:
+                return dicRef
+            # endif
+        # endwith
+
+        pathEntry = self._GetEntryPath(sHash)
+        if self._TouchEntry(pathEntry) is False:
+            pathEntry.parent.mkdir(parents=True, exist_ok=True)
+            pathTemp = pathEntry.parent / f".{sHash}.{uuid.uuid4().hex}.tmp"
+            try:
+                pathTemp.write_bytes(gzip.compress(bytData, compresslevel=self._iCompressLevel))
+                os.replace(pathTemp, pathEntry)
+            finally:
+                pathTemp.unlink(missing_ok=True)
+            # endtry
+        # endif
+
+        with self._lockHashes:
+            self._setHashes.add(sHash)
+        # endwith
+        return dicRef
+
+    # enddef
+
+    ######################################################################################
+    def Get(self, _sHash: str) -> Any:
+        pathEntry = self._GetEntryPath(_sHash)
+        try:
+            bytData = gzip.decompress(pathEntry.read_bytes())
+        except OSError as xEx:
+            raise RuntimeError(f"Error reading config store entry: {pathEntry.as_posix()}") from xEx
+        # endtry
+        self._TouchEntry(pathEntry)
+        return json.loads(bytData)
+
+    # enddef
+
+    ######################################################################################
+    # Remove the least recently used entries, until the store size is below 90% of the
+    # maximal size. Entries used within the minimal age are kept in any case.
+    def Evict(self):
+        if not self._pathStore.exists():
+            return
+        # endif
+
+        lEntries: list[tuple[float, int, Path]] = []
+        iTotalSize: int = 0
+        for pathEntry in self._pathStore.glob(f"*/*{self.c_sSuffix}"):
+            try:
+                xStat = pathEntry.stat()
+            except OSError:
+                continue
+            # endtry
+            lEntries.append((xStat.st_mtime, xStat.st_size, pathEntry))
+            iTotalSize += xStat.st_size
+        # endfor
+
+        if iTotalSize <= self._iMaxSizeBytes:
+            return
+        # endif
+
+        fTimeMin: float = time.time() - self._fMinAge_s
+        iTrgSize = int(0.9 * self._iMaxSizeBytes)
+        lEntries.sort(key=lambda x: x[0])
+        with self._lockHashes:
+            for fTime, iSize, pathEntry in lEntries:
+                if iTotalSize <= iTrgSize or fTime >= fTimeMin:
+                    break
+                # endif
+                pathEntry.unlink(missing_ok=True)
+                self._setHashes.discard(pathEntry.name[: -len(self.c_sSuffix)])
+                iTotalSize -= iSize
+            # endfor
+        # endwith
+
+    # enddef
+
+    ######################################################################################
+    def Clear(self):
+        if self._pathStore.exists():
+            shutil.rmtree(self._pathStore)
+        # endif
+        with self._lockHashes:
+            self._setHashes.clear()
+        # endwith
+
+    # enddef
+
+    ######################################################################################
+    # Replace all references in the given data by the stored data
+    def ResolveRefs(self, _xData: Any) -> Any:
+        if self.IsRef(_xData):
+            return self.Get(_xData["sHash"])
+        elif isinstance(_xData, dict):
+            return {xKey: self.ResolveRefs(xValue) for xKey, xValue in _xData.items()}
+        elif isinstance(_xData, list):
+            return [self.ResolveRefs(xValue) for xValue in _xData]
+        # endif
+        return _xData
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,227 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import os
+import uuid
+import shutil
+import pickle
+import hashlib
+from pathlib import Path
+from typing import Any, Optional, Union
+
+
+##########################################################################################
+# Content addressed cache of python objects on disk.
+# Each entry is stored as a pickle file, whose name is the key of the entry.
+# Keys are typically hashes of all data an entry depends on, so that entries never
+# have to be invalidated explicitly. The total size of the cache is bounded by
+# removing the least recently used entries in Evict().
+class CDiskCache:
+    @property
+    def pathCache(self) -> Path:
+        return self._pathCache
+
+    # enddef
+
+    @property
+    def iHits(self) -> int:
+        return self._iHits
+
+    # enddef
+
+    @property
+    def iMisses(self) -> int:
+        return self._iMisses
+
+    # enddef
+
+    ######################################################################################
+    def __init__(self, _xPathCache: Union[str, Path], *, _iMaxSizeBytes: int = 1024**3):
+        self._pathCache: Path = Path(_xPathCache)
+        self._iMaxSizeBytes: int = _iMaxSizeBytes
+        self._iHits: int = 0
+        self._iMisses: int = 0
+
+    # enddef
+
+    ######################################################################################
+    @staticmethod
+    def CreateKey(*_lParts: Union[str, bytes]) -> str:
+        xHash = hashlib.sha256()
+        for xPart in _lParts:
+            if isinstance(xPart, str):
+                xPart = xPart.encode("utf-8")
+            # endif
+            # Add the length, so that the concatenation of parts is unique
+            xHash.update(len(xPart).to_bytes(8, "little"))
+            xHash.update(xPart)
+        # endfor
+        return xHash.hexdigest()
+
+    # enddef
+
+    ######################################################################################
+    def _GetEntryPath(self, _sKey: str) -> Path:
+        return self._pathCache / _sKey[0:2] / f"{_sKey}.pickle"
+
+    # enddef
+
+    ######################################################################################
+    def Get(self, _sKey: str) -> Optional[Any]:
+        pathEntry = self._GetEntryPath(_sKey)
+        try:
+            with pathEntry.open("rb") as xFile:
+                xData = pickle.load(xFile)
+            # endwith
+        except Exception:
+            self._iMisses += 1
+            return None
+        # endtry
+
+        # Mark entry as recently used
+        try:
+            os.utime(pathEntry)
+        except OSError:
+            pass
+        # endtry
+
+        self._iHits += 1
+        return xData
+
+    # enddef
+
+    ######################################################################################
+    # Store an entry. Returns False, if the data cannot be pickled.
+    # The data is written to a temporary file first, so that concurrent
+    # processes never read partially written entries.
+    def Set(self, _sKey: str, _xData: Any) -> bool:
+        try:
+            bytData = pickle.dumps(_xData, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return False
+        # endtry
+
+        pathEntry = self._GetEntryPath(_sKey)
+        pathEntry.parent.mkdir(parents=True, exist_ok=True)
+        pathTemp = pathEntry.parent / f".{_sKey}.{uuid.uuid4().hex}.tmp"
+        try:
+            pathTemp.write_bytes(bytData)
+            os.replace(pathTemp, pathEntry)
+        except OSError:
+            pathTemp.unlink(missing_ok=True)
+            return False
+        # endtry
+
+        return True
+
+    # enddef
+
+    ######################################################################################
+    # Remove the least recently used entries, until the cache size is below
+    # 90% of the maximal size.
+    def Evict(self):
+        if not self._pathCache.exists():
+            return
+        # endif
+
+        lEntries: list[tuple[float, int, Path]] = []
+        iTotalSize: int = 0
+        for pathEntry in self._pathCache.glob("*/*.pickle"):
+            try:
+                xStat = pathEntry.stat()
+            except OSError:
+                continue
+            # endtry
+            lEntries.append((xStat.st_mtime, xStat.st_size, pathEntry))
+            iTotalSize += xStat.st_size
+        # endfor
+
+        if iTotalSize <= self._iMaxSizeBytes:
+            return
+        # endif
+
+        iTrgSize = int(0.9 * self._iMaxSizeBytes)
+        lEntries.sort(key=lambda x: x[0])
+        for _, iSize, pathEntry in lEntries:
+            if iTotalSize <= iTrgSize:
+                break
+            # endif
+            pathEntry.unlink(missing_ok=True)
+            iTotalSize -= iSize
+        # endfor
+
+    # enddef
+
+    ######################################################################################
+    def Clear(self):
+        if self._pathCache.exists():
+            shutil.rmtree(self._pathCache)
+        # endif
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# Fingerprint of all files below the given path. For files with one of the given
+# suffixes the content is hashed, for all other files only the size and the
+# modification time are used.
+def GetPathFingerprint(_xPath: Union[str, Path], *, _setContentSuffixes: Optional[set[str]] = None) -> str:
+    pathRoot = Path(_xPath)
+    if _setContentSuffixes is None:
+        _setContentSuffixes = set()
+    # endif
+
+    xHash = hashlib.sha256()
+    for sDirPath, lDirNames, lFileNames in os.walk(pathRoot):
+        lDirNames.sort()
+        for sFileName in sorted(lFileNames):
+            pathFile = Path(sDirPath) / sFileName
+            sRelPath = pathFile.relative_to(pathRoot).as_posix()
+            xHash.update(sRelPath.encode("utf-8"))
+            try:
+                if pathFile.suffix in _setContentSuffixes:
+                    xHash.update(hashlib.sha256(pathFile.read_bytes()).digest())
+                else:
+                    xStat = pathFile.stat()
+                    xHash.update(f"{xStat.st_size}:{xStat.st_mtime_ns}".encode("utf-8"))
+                # endif
+            except OSError:
+                xHash.update(b"?")
+            # endtry
+        # endfor
+    # endfor
+
+    return xHash.hexdigest()
+
+
+# enddef
+
+
+##########################################################################################
+# Path of the cache for loaded and processed configurations of a workspace
+def GetConfigCachePath(_xPrjCfg) -> Path:
+    return Path(_xPrjCfg.pathOutput) / "_cache" / "configs"
+
+
+# enddef
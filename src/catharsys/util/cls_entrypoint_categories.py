@@ -171,27 +171,26 @@ class CCatharsysCategories:
                     xPackageObject.__doc__ if xPackageObject.__doc__ is not None else "object DocString n/a"
                 )
                 # if callable(obj):
-                if inspect.isfunction(xPackageObject):
+                # Functions decorated with logFunctionCall are functions, too,
+                # so look in entry point decorators first
+                if hasattr(xPackageObject, "wrappedFunc"):
+                    xEntryType = CEntrypointInformation.GetEntryType(xPackageObject.wrappedFunc)
+                    xEpDescriptionDict = CEntrypointInformation.GetEntryInterfaceDoc(xPackageObject.wrappedFunc)
+                    if xEpDescriptionDict is not None:
+                        xEpInfo.definition = CEntrypointInformation.CDetailedDefinition(
+                            xEpInfo.definition, xEpDescriptionDict
+                        )
+                    xEpInfo.filename = f'"{sFilename}", line {xPackageObject.wrappedFunc.__code__.co_firstlineno}'
+                elif inspect.isfunction(xPackageObject):
                     xEntryType = CEntrypointInformation.EEntryType.FUNCTION
                     xEpInfo.filename = f'"{sFilename}", line {xPackageObject.__code__.co_firstlineno}'
                 elif inspect.isclass(xPackageObject):
                     xEntryType = CEntrypointInformation.EEntryType.CLASSES
                 else:
-                    # now look in entry point decorators
-                    if hasattr(xPackageObject, "wrappedFunc"):
-                        xEntryType = CEntrypointInformation.GetEntryType(xPackageObject.wrappedFunc)
-                        xEpDescriptionDict = CEntrypointInformation.GetEntryInterfaceDoc(xPackageObject.wrappedFunc)
-                        if xEpDescriptionDict is not None:
-                            xEpInfo.definition = CEntrypointInformation.CDetailedDefinition(
-                                xEpInfo.definition, xEpDescriptionDict
-                            )
-                        xEpInfo.filename = f'"{sFilename}", line {xPackageObject.wrappedFunc.__code__.co_firstlineno}'
-                    else:
-                        print(
-                            f" ?????? {_sModuleName} wie geht's weiter mit {_sObjectName}"
-                            " not in (isfunction, isclass, wrappedFunc)"
-                        )
-                    # endif wrappedFunc
+                    print(
+                        f" ?????? {_sModuleName} wie geht's weiter mit {_sObjectName}"
+                        " not in (isfunction, isclass, wrappedFunc)"
+                    )
                 # endif obj matching
             else:
                 print(f" ?????? {_sModuleName} wie geht's weiter mit {_sObjectName} not in dir(cat_package)")
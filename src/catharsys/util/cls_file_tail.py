@@ -0,0 +1,128 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import os
+from pathlib import Path
+
+
+# ##########################################################################################################
+# Reads the lines appended to a text file since the last read.
+# The reader remembers the byte offset up to which the file has been read and only
+# reads the new bytes. Incomplete last lines are kept until they are completed.
+# At most '_iMaxReadBytes' are read per call, so that the memory used per file is bounded.
+# If the file becomes smaller than the offset, it is assumed to be replaced and read from the start.
+class CFileTail:
+    def __init__(self, _pathFile: Path, *, _iMaxReadBytes: int = 1 << 20, _sEncoding: str = "utf-8"):
+        self._pathFile: Path = _pathFile
+        self._iMaxReadBytes: int = _iMaxReadBytes
+        self._sEncoding: str = _sEncoding
+        self._iOffset: int = 0
+        self._bytPartial: bytes = b""
+        self._bExists: bool = False
+
+    # enddef
+
+    @property
+    def pathFile(self) -> Path:
+        return self._pathFile
+
+    # enddef
+
+    @property
+    def iOffset(self) -> int:
+        return self._iOffset
+
+    # enddef
+
+    # True, if the file existed at the last read
+    @property
+    def bExists(self) -> bool:
+        return self._bExists
+
+    # enddef
+
+    # ######################################################################################################
+    # Returns the complete lines, including line endings, that were appended since the last call.
+    # If '_bFlush' is true, an incomplete last line is also returned.
+    def ReadLines(self, *, _bFlush: bool = False) -> list[str]:
+        try:
+            iSize: int = os.stat(self._pathFile).st_size
+        except OSError:
+            self._bExists = False
+            return self._FlushPartial() if _bFlush is True else []
+        # endtry
+        self._bExists = True
+
+        if iSize < self._iOffset:
+            self._iOffset = 0
+            self._bytPartial = b""
+        # endif
+
+        bytData: bytes = b""
+        if iSize > self._iOffset:
+            try:
+                with open(self._pathFile, "rb") as xFile:
+                    xFile.seek(self._iOffset)
+                    bytData = xFile.read(min(iSize - self._iOffset, self._iMaxReadBytes))
+                # endwith
+            except OSError:
+                return []
+            # endtry
+            self._iOffset += len(bytData)
+        # endif
+
+        bytData = self._bytPartial + bytData
+        iEnd: int = bytData.rfind(b"\n") + 1
+        self._bytPartial = bytData[iEnd:]
+        lLines: list[str] = bytData[:iEnd].decode(self._sEncoding, errors="replace").splitlines(keepends=True)
+
+        # Very long lines are returned in parts, to bound the buffer size
+        if _bFlush is True or len(self._bytPartial) >= self._iMaxReadBytes:
+            lLines.extend(self._FlushPartial())
+        # endif
+        return lLines
+
+    # enddef
+
+    # ######################################################################################################
+    def _FlushPartial(self) -> list[str]:
+        if len(self._bytPartial) == 0:
+            return []
+        # endif
+        sLine: str = self._bytPartial.decode(self._sEncoding, errors="replace")
+        self._bytPartial = b""
+        return [sLine]
+
+    # enddef
+
+    # ######################################################################################################
+    # True, if the whole file has been read
+    def IsAtEnd(self) -> bool:
+        try:
+            return os.stat(self._pathFile).st_size == self._iOffset
+        except OSError:
+            return False
+        # endtry
+
+    # enddef
+
+
+# endclass
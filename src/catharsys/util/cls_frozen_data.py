@@ -0,0 +1,150 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+##########################################################################################
+# Read-only dictionaries and lists for configuration data that is shared between
+# caches and config sets without copying.
+#
+# The frozen classes derive from 'dict' and 'list', so that they can be passed to all
+# functions that read configuration data. Any attempt to modify them raises a TypeError.
+# A mutable copy is obtained with ThawData(), which only copies the containers and
+# shares all leaf values. This is considerably faster than copy.deepcopy().
+# Calling copy.deepcopy() on frozen data also returns a mutable copy.
+
+from typing import Any
+
+
+def _RaiseReadOnly(self, *args, **kwargs):
+    raise TypeError(f"Object of type '{type(self).__name__}' is read-only")
+
+
+# enddef
+
+
+##########################################################################################
+class CFrozenDict(dict):
+    __slots__ = ()
+
+    __setitem__ = _RaiseReadOnly
+    __delitem__ = _RaiseReadOnly
+    __ior__ = _RaiseReadOnly
+    clear = _RaiseReadOnly
+    pop = _RaiseReadOnly
+    popitem = _RaiseReadOnly
+    setdefault = _RaiseReadOnly
+    update = _RaiseReadOnly
+
+    def __copy__(self):
+        return self
+
+    # enddef
+
+    def __deepcopy__(self, _dicMemo):
+        return ThawData(self)
+
+    # enddef
+
+    def __reduce__(self):
+        return (CFrozenDict, (dict(self),))
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+class CFrozenList(list):
+    __slots__ = ()
+
+    __setitem__ = _RaiseReadOnly
+    __delitem__ = _RaiseReadOnly
+    __iadd__ = _RaiseReadOnly
+    __imul__ = _RaiseReadOnly
+    append = _RaiseReadOnly
+    extend = _RaiseReadOnly
+    insert = _RaiseReadOnly
+    pop = _RaiseReadOnly
+    remove = _RaiseReadOnly
+    clear = _RaiseReadOnly
+    sort = _RaiseReadOnly
+    reverse = _RaiseReadOnly
+
+    def __copy__(self):
+        return self
+
+    # enddef
+
+    def __deepcopy__(self, _dicMemo):
+        return ThawData(self)
+
+    # enddef
+
+    def __reduce__(self):
+        return (CFrozenList, (list(self),))
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# Return a frozen version of the given data. Data that is already frozen is returned
+# as is, so that it is shared and not copied. Sets are converted to frozen sets and
+# tuples are frozen element-wise. All other values are expected to be immutable.
+def FreezeData(_xData: Any) -> Any:
+    if isinstance(_xData, (CFrozenDict, CFrozenList)):
+        return _xData
+    elif isinstance(_xData, dict):
+        return CFrozenDict((xKey, FreezeData(xValue)) for xKey, xValue in _xData.items())
+    elif isinstance(_xData, list):
+        return CFrozenList(FreezeData(xValue) for xValue in _xData)
+    elif isinstance(_xData, tuple):
+        return tuple(FreezeData(xValue) for xValue in _xData)
+    elif isinstance(_xData, set):
+        return frozenset(_xData)
+    # endif
+
+    return _xData
+
+
+# enddef
+
+
+##########################################################################################
+# Return a mutable copy of the given data. Dictionaries and lists are copied recursively,
+# sets and frozen sets are converted to sets and all other values are shared.
+def ThawData(_xData: Any) -> Any:
+    if isinstance(_xData, dict):
+        return {xKey: ThawData(xValue) for xKey, xValue in _xData.items()}
+    elif isinstance(_xData, list):
+        return [ThawData(xValue) for xValue in _xData]
+    elif isinstance(_xData, tuple):
+        return tuple(ThawData(xValue) for xValue in _xData)
+    elif isinstance(_xData, (set, frozenset)):
+        return set(_xData)
+    # endif
+
+    return _xData
+
+
+# enddef
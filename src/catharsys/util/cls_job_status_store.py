@@ -0,0 +1,228 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import os
+import json
+import uuid
+import shlex
+import shutil
+import threading
+import contextlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, Optional, Union
+
+from catharsys.util.cls_disk_cache import CDiskCache
+
+
+##########################################################################################
+# Status of a job while it is started. Executors that only submit a job, like LSF, extend
+# the job script with AddDoneCommand(), so that the job itself records its completion.
+# Otherwise, the job is recorded as done, when it has ended with return code 0.
+class CJobStatusContext:
+    def __init__(self, _pathStatus: Path, _sJobName: str):
+        self._pathStatus: Path = _pathStatus
+        self._sJobName: str = _sJobName
+        self._bDeferred: bool = False
+
+    # enddef
+
+    @property
+    def pathStatus(self) -> Path:
+        return self._pathStatus
+
+    # enddef
+
+    # True, if the job records its completion itself
+    @property
+    def bDeferred(self) -> bool:
+        return self._bDeferred
+
+    # enddef
+
+    ######################################################################################
+    # Extend a bash script, so that it records the job as done, if it exits with return code 0.
+    # The script is run unchanged in a subshell and the extended script exits with its return code.
+    def AddDoneCommand(self, _sScript: str) -> str:
+        self._bDeferred = True
+        sStatus: str = json.dumps({"sStatus": CJobStatusStore.c_sStatusDone, "sJobName": self._sJobName})
+        sPath: str = shlex.quote(self._pathStatus.as_posix())
+        sPathTemp: str = shlex.quote(self._pathStatus.as_posix() + ".tmp")
+        return (
+            f"(\n{_sScript}\n)\n"
+            "iCathJobResult=$?\n"
+            f"if [ $iCathJobResult -eq 0 ]; then printf '%s\\n' {shlex.quote(sStatus)} > {sPathTemp}"
+            f" && mv -f {sPathTemp} {sPath}; fi\n"
+            "exit $iCathJobResult\n"
+        )
+
+    # enddef
+
+
+# endclass
+
+
+g_xJobStatusLocal = threading.local()
+
+
+##########################################################################################
+# Get the status context of the job, which is started in the current thread
+def GetActiveJobStatusContext() -> Optional[CJobStatusContext]:
+    return getattr(g_xJobStatusLocal, "xContext", None)
+
+
+# enddef
+
+
+##########################################################################################
+# Records the completion of jobs, to skip completed jobs when an action is launched again.
+# Each completed job is stored as a small JSON file, whose name is the key of the job.
+# For jobs that were executed by the launcher itself, the file also contains the duration
+# of the job, which is used as expected duration when the job is scheduled again.
+# The key is a hash of the job configuration without the elements that change with
+# every launch, like the job config folder and the job group id, and without the
+# launch-only arguments given by the launcher.
+# Files are replaced atomically, so that jobs running on different hosts can record their
+# completion concurrently.
+class CJobStatusStore:
+    c_sStatusDone: str = "done"
+
+    # Elements of the job and config dictionaries that change with every launch
+    c_setVolatileKeys: set[str] = {"sPathJobConfigMain", "sJobGroupId"}
+
+    @property
+    def pathStore(self) -> Path:
+        return self._pathStore
+
+    # enddef
+
+    ######################################################################################
+    # The launch-only arguments are launch arguments that control how the jobs are executed
+    # but do not influence their result. They are ignored by the job keys, like the volatile keys.
+    def __init__(self, _xPathStore: Union[str, Path], *, _iterLaunchOnlyArgs: Iterable[str] = ()):
+        self._pathStore: Path = Path(_xPathStore)
+        self._setIgnoreKeys: frozenset[str] = frozenset(self.c_setVolatileKeys.union(_iterLaunchOnlyArgs))
+
+    # enddef
+
+    ######################################################################################
+    def _RemoveIgnoredKeys(self, _xConfig):
+        if isinstance(_xConfig, dict):
+            return {k: self._RemoveIgnoredKeys(v) for k, v in _xConfig.items() if k not in self._setIgnoreKeys}
+        elif isinstance(_xConfig, (list, tuple)):
+            return [self._RemoveIgnoredKeys(x) for x in _xConfig]
+        # endif
+        return _xConfig
+
+    # enddef
+
+    ######################################################################################
+    # The ignored keys are removed from all nested dictionaries, as the launch arguments
+    # are also copied into the job and config dictionaries at deeper levels.
+    def CreateJobKey(self, _dicJobConfig: dict) -> str:
+        dicJob: dict = self._RemoveIgnoredKeys(_dicJobConfig)
+        return CDiskCache.CreateKey(json.dumps(dicJob, sort_keys=True, default=str))
+
+    # enddef
+
+    ######################################################################################
+    def _GetStatusPath(self, _sKey: str) -> Path:
+        return self._pathStore / _sKey[0:2] / f"{_sKey}.json"
+
+    # enddef
+
+    ######################################################################################
+    def _ReadStatus(self, _sKey: str) -> dict:
+        try:
+            with open(self._GetStatusPath(_sKey), "r") as xFile:
+                dicStatus = json.load(xFile)
+            # endwith
+        except (OSError, ValueError):
+            return {}
+        # endtry
+        return dicStatus if isinstance(dicStatus, dict) else {}
+
+    # enddef
+
+    ######################################################################################
+    def IsDone(self, _sKey: str) -> bool:
+        return self._ReadStatus(_sKey).get("sStatus") == self.c_sStatusDone
+
+    # enddef
+
+    ######################################################################################
+    # Get the duration in seconds of the last completed run of the job, if it is known
+    def GetDuration(self, _sKey: str) -> Optional[float]:
+        fDuration = self._ReadStatus(_sKey).get("fDuration")
+        if not isinstance(fDuration, (int, float)):
+            return None
+        # endif
+        return float(fDuration)
+
+    # enddef
+
+    ######################################################################################
+    def SetDone(self, _sKey: str, *, _sJobName: str = "", _fDuration: Optional[float] = None):
+        pathStatus: Path = self._GetStatusPath(_sKey)
+        pathStatus.parent.mkdir(parents=True, exist_ok=True)
+        dicStatus: dict = {
+            "sStatus": self.c_sStatusDone,
+            "sJobName": _sJobName,
+            "sTime": datetime.now().isoformat(timespec="seconds"),
+        }
+        if _fDuration is not None:
+            dicStatus["fDuration"] = _fDuration
+        # endif
+        pathTemp: Path = pathStatus.parent / f"{pathStatus.name}.{uuid.uuid4().hex}.tmp"
+        with open(pathTemp, "w") as xFile:
+            json.dump(dicStatus, xFile)
+        # endwith
+        os.replace(pathTemp, pathStatus)
+
+    # enddef
+
+    ######################################################################################
+    # Set the status context of a job for the current thread, while the job is started
+    @contextlib.contextmanager
+    def JobContext(self, _sKey: str, *, _sJobName: str = "") -> Iterator[CJobStatusContext]:
+        pathStatus: Path = self._GetStatusPath(_sKey)
+        pathStatus.parent.mkdir(parents=True, exist_ok=True)
+        xContext = CJobStatusContext(pathStatus, _sJobName)
+        xPrevContext: Optional[CJobStatusContext] = GetActiveJobStatusContext()
+        g_xJobStatusLocal.xContext = xContext
+        try:
+            yield xContext
+        finally:
+            g_xJobStatusLocal.xContext = xPrevContext
+        # endtry
+
+    # enddef
+
+    ######################################################################################
+    def Clear(self):
+        if self._pathStore.exists():
+            shutil.rmtree(self._pathStore, ignore_errors=True)
+        # endif
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,410 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import html
+import json
+import heapq
+import threading
+import contextlib
+from datetime import datetime
+from pathlib import Path
+from timeit import default_timer as timer
+from typing import Any, Iterable, Iterator, Optional
+
+
+##########################################################################################
+# Timings of a single phase name, aggregated over all occurrences of the phase
+class CProfilePhaseStats:
+    def __init__(self, _sName: str):
+        self.sName: str = _sName
+        self.iCount: int = 0
+        self.fTotal: float = 0.0
+        self.fSelf: float = 0.0
+        self.fMin: float = None
+        self.fMax: float = None
+        # Heap of (duration, sequence index, detail) of the slowest occurrences
+        self.lSlowest: list[tuple[float, int, str]] = []
+
+    # enddef
+
+    ######################################################################################
+    def Add(self, _fDuration: float, _fSelf: float, _xDetail: Any, _iSeqIdx: int, _iMaxSlowest: int):
+        self.iCount += 1
+        self.fTotal += _fDuration
+        self.fSelf += _fSelf
+        self.fMin = _fDuration if self.fMin is None else min(self.fMin, _fDuration)
+        self.fMax = _fDuration if self.fMax is None else max(self.fMax, _fDuration)
+
+        if len(self.lSlowest) < _iMaxSlowest:
+            heapq.heappush(self.lSlowest, (_fDuration, _iSeqIdx, "" if _xDetail is None else str(_xDetail)))
+        elif _fDuration > self.lSlowest[0][0]:
+            heapq.heapreplace(self.lSlowest, (_fDuration, _iSeqIdx, "" if _xDetail is None else str(_xDetail)))
+        # endif
+
+    # enddef
+
+    ######################################################################################
+    def GetData(self) -> dict:
+        return {
+            "sName": self.sName,
+            "iCount": self.iCount,
+            "fTotal": round(self.fTotal, 6),
+            "fSelf": round(self.fSelf, 6),
+            "fMean": round(self.fTotal / self.iCount, 6) if self.iCount > 0 else 0.0,
+            "fMin": round(self.fMin or 0.0, 6),
+            "fMax": round(self.fMax or 0.0, 6),
+            "lSlowest": [
+                {"fDuration": round(fDuration, 6), "sDetail": sDetail}
+                for fDuration, _, sDetail in sorted(self.lSlowest, reverse=True)
+            ],
+        }
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# Records the timings of the phases of a launch and a set of counters.
+# Phases are given by names like 'configs/get-data' and may be nested. For each phase name,
+# the number of occurrences and the total, self, minimal and maximal durations are recorded.
+# The self time of a phase is its duration without the durations of nested phases, so that
+# the phases with the largest self times are the hotspots of a launch.
+# Phases are tracked per thread. Phases of jobs that run in parallel threads are summed,
+# so that their total time may be larger than the wall time of the launch.
+class CLaunchProfile:
+    c_sDti: str = "/catharsys/launch-profile:1.0"
+
+    ######################################################################################
+    def __init__(self, _sName: str = "", *, _iMaxSlowest: int = 10):
+        self._sName: str = _sName
+        self._iMaxSlowest: int = _iMaxSlowest
+        self._sTimeStart: str = datetime.now().isoformat(timespec="seconds")
+        self._fTimeStart: float = timer()
+        self._fTimeEnd: Optional[float] = None
+        self._iSeqIdx: int = 0
+
+        self._dicPhases: dict[str, CProfilePhaseStats] = {}
+        self._dicCounters: dict[str, float] = {}
+        self._dicInfo: dict[str, Any] = {}
+        self._lockData: threading.Lock = threading.Lock()
+        self._xLocal = threading.local()
+
+    # enddef
+
+    @property
+    def sName(self) -> str:
+        return self._sName
+
+    # enddef
+
+    ######################################################################################
+    def _GetStack(self) -> list[list]:
+        lStack = getattr(self._xLocal, "lStack", None)
+        if lStack is None:
+            lStack = self._xLocal.lStack = []
+        # endif
+        return lStack
+
+    # enddef
+
+    ######################################################################################
+    # Start a phase in the current thread. The returned token has to be passed to End().
+    # A detail, like the index of a config, is stored for the slowest occurrences of the phase.
+    def Begin(self, _sName: str, _xDetail: Any = None) -> list:
+        # Phase frame: [name, detail, start time, duration of nested phases]
+        lFrame: list = [_sName, _xDetail, timer(), 0.0]
+        self._GetStack().append(lFrame)
+        return lFrame
+
+    # enddef
+
+    ######################################################################################
+    # End the phase of the given token. Phases that were started after it in the same thread
+    # and have not been ended, e.g. because of an exception, are ended as well.
+    def End(self, _lToken: list):
+        fTimeEnd: float = timer()
+        lStack = self._GetStack()
+        if not any(lFrame is _lToken for lFrame in lStack):
+            return
+        # endif
+
+        while True:
+            lFrame = lStack.pop()
+            fDuration: float = fTimeEnd - lFrame[2]
+            if len(lStack) > 0:
+                lStack[-1][3] += fDuration
+            # endif
+
+            with self._lockData:
+                xStats = self._dicPhases.get(lFrame[0])
+                if xStats is None:
+                    xStats = self._dicPhases[lFrame[0]] = CProfilePhaseStats(lFrame[0])
+                # endif
+                xStats.Add(fDuration, fDuration - lFrame[3], lFrame[1], self._iSeqIdx, self._iMaxSlowest)
+                self._iSeqIdx += 1
+            # endwith
+
+            if lFrame is _lToken:
+                break
+            # endif
+        # endwhile
+
+    # enddef
+
+    ######################################################################################
+    @contextlib.contextmanager
+    def Phase(self, _sName: str, _xDetail: Any = None) -> Iterator[None]:
+        lToken = self.Begin(_sName, _xDetail)
+        try:
+            yield
+        finally:
+            self.End(lToken)
+        # endtry
+
+    # enddef
+
+    ######################################################################################
+    def AddCount(self, _sName: str, _xValue: float = 1):
+        with self._lockData:
+            self._dicCounters[_sName] = self._dicCounters.get(_sName, 0) + _xValue
+        # endwith
+
+    # enddef
+
+    ######################################################################################
+    # Store a general value of the launch, like the number of configs
+    def SetInfo(self, _sName: str, _xValue: Any):
+        with self._lockData:
+            self._dicInfo[_sName] = _xValue
+        # endwith
+
+    # enddef
+
+    ######################################################################################
+    def Stop(self):
+        if self._fTimeEnd is None:
+            self._fTimeEnd = timer()
+        # endif
+
+    # enddef
+
+    ######################################################################################
+    # Get the profile data. The phases are sorted by their self time, largest first.
+    def GetData(self) -> dict:
+        fTimeEnd: float = self._fTimeEnd if self._fTimeEnd is not None else timer()
+        with self._lockData:
+            lPhases = sorted(self._dicPhases.values(), key=lambda xStats: xStats.fSelf, reverse=True)
+            return {
+                "sDTI": self.c_sDti,
+                "sName": self._sName,
+                "sTimeStart": self._sTimeStart,
+                "fWallTime": round(fTimeEnd - self._fTimeStart, 6),
+                "mInfo": dict(self._dicInfo),
+                "mCounters": dict(sorted(self._dicCounters.items())),
+                "lPhases": [xStats.GetData() for xStats in lPhases],
+            }
+        # endwith
+
+    # enddef
+
+    ######################################################################################
+    def SaveJson(self, _pathFile: Path):
+        _pathFile.parent.mkdir(parents=True, exist_ok=True)
+        with open(_pathFile, "w") as xFile:
+            json.dump(self.GetData(), xFile, indent=4, default=str)
+        # endwith
+
+    # enddef
+
+    ######################################################################################
+    def SaveHtml(self, _pathFile: Path):
+        dicData: dict = self.GetData()
+        fWallTime: float = max(dicData["fWallTime"], 1e-9)
+
+        def _Esc(_xValue: Any) -> str:
+            return html.escape(str(_xValue))
+
+        # enddef
+
+        lRows: list[str] = []
+        for dicPhase in dicData["lPhases"]:
+            fPart: float = min(dicPhase["fSelf"] / fWallTime, 1.0)
+            sSlowest: str = "<br>".join(
+                f"{dicSlow['fDuration']:.3f}s {_Esc(dicSlow['sDetail'])}" for dicSlow in dicPhase["lSlowest"][0:3]
+            )
+            lRows.append(
+                "<tr>"
+                f"<td>{_Esc(dicPhase['sName'])}</td>"
+                f"<td class='num'>{dicPhase['iCount']}</td>"
+                f"<td class='num'>{dicPhase['fTotal']:.3f}</td>"
+                f"<td class='num'>{dicPhase['fSelf']:.3f}"
+                f"<div class='bar' style='width:{100.0 * fPart:.1f}%'></div></td>"
+                f"<td class='num'>{1e3 * dicPhase['fMean']:.2f}</td>"
+                f"<td class='num'>{1e3 * dicPhase['fMax']:.2f}</td>"
+                f"<td>{sSlowest}</td>"
+                "</tr>"
+            )
+        # endfor
+
+        lCounters: list[str] = [
+            f"<tr><td>{_Esc(sName)}</td><td class='num'>{_Esc(xValue)}</td></tr>"
+            for sName, xValue in dicData["mCounters"].items()
+        ]
+        lInfo: list[str] = [
+            f"<tr><td>{_Esc(sName)}</td><td>{_Esc(xValue)}</td></tr>" for sName, xValue in dicData["mInfo"].items()
+        ]
+
+        sHtml: str = (
+            "<!DOCTYPE html>\n<html>\n<head>\n<meta charset='utf-8'>\n"
+            f"<title>Launch profile: {_Esc(dicData['sName'])}</title>\n"
+            "<style>\n"
+            "body { font-family: sans-serif; font-size: 14px; }\n"
+            "table { border-collapse: collapse; margin-bottom: 2em; }\n"
+            "th, td { border: 1px solid #ccc; padding: 2px 8px; text-align: left; vertical-align: top; }\n"
+            "td.num { text-align: right; font-family: monospace; }\n"
+            ".bar { background: #e67e22; height: 4px; }\n"
+            "</style>\n</head>\n<body>\n"
+            f"<h1>Launch profile: {_Esc(dicData['sName'])}</h1>\n"
+            f"<p>Started {_Esc(dicData['sTimeStart'])}, wall time {dicData['fWallTime']:.3f}s</p>\n"
+            "<h2>Phases by self time</h2>\n"
+            "<table>\n<tr><th>Phase</th><th>Count</th><th>Total [s]</th><th>Self [s]</th>"
+            "<th>Mean [ms]</th><th>Max [ms]</th><th>Slowest</th></tr>\n"
+            + "\n".join(lRows)
+            + "\n</table>\n<h2>Counters</h2>\n<table>\n<tr><th>Counter</th><th>Value</th></tr>\n"
+            + "\n".join(lCounters)
+            + "\n</table>\n<h2>Info</h2>\n<table>\n<tr><th>Name</th><th>Value</th></tr>\n"
+            + "\n".join(lInfo)
+            + "\n</table>\n</body>\n</html>\n"
+        )
+
+        _pathFile.parent.mkdir(parents=True, exist_ok=True)
+        with open(_pathFile, "w", encoding="utf-8") as xFile:
+            xFile.write(sHtml)
+        # endwith
+
+    # enddef
+
+
+# endclass
+
+
+##########################################################################################
+# The profile of the current launch. If no profile is active, the functions below do nothing.
+g_xLaunchProfile: Optional[CLaunchProfile] = None
+g_xNullContext = contextlib.nullcontext()
+
+
+##########################################################################################
+def StartLaunchProfile(_sName: str = "") -> CLaunchProfile:
+    global g_xLaunchProfile
+    g_xLaunchProfile = CLaunchProfile(_sName)
+    return g_xLaunchProfile
+
+
+# enddef
+
+
+##########################################################################################
+# Stop the active profile and return it
+def StopLaunchProfile() -> Optional[CLaunchProfile]:
+    global g_xLaunchProfile
+    xProfile = g_xLaunchProfile
+    g_xLaunchProfile = None
+    if xProfile is not None:
+        xProfile.Stop()
+    # endif
+    return xProfile
+
+
+# enddef
+
+
+##########################################################################################
+def GetLaunchProfile() -> Optional[CLaunchProfile]:
+    return g_xLaunchProfile
+
+
+# enddef
+
+
+##########################################################################################
+# Context manager that records a phase in the active profile
+def ProfilePhase(_sName: str, _xDetail: Any = None):
+    if g_xLaunchProfile is None:
+        return g_xNullContext
+    # endif
+    return g_xLaunchProfile.Phase(_sName, _xDetail)
+
+
+# enddef
+
+
+##########################################################################################
+def ProfileCount(_sName: str, _xValue: float = 1):
+    if g_xLaunchProfile is not None:
+        g_xLaunchProfile.AddCount(_sName, _xValue)
+    # endif
+
+
+# enddef
+
+
+##########################################################################################
+def ProfileInfo(_sName: str, _xValue: Any):
+    if g_xLaunchProfile is not None:
+        g_xLaunchProfile.SetInfo(_sName, _xValue)
+    # endif
+
+
+# enddef
+
+
+##########################################################################################
+# Iterate over the given elements and record the time to create each element as a phase.
+# This is used for generators, whose work is done when the next element is requested.
+def ProfileIter(_sName: str, _iterData: Iterable) -> Iterator:
+    if g_xLaunchProfile is None:
+        return iter(_iterData)
+    # endif
+    return _ProfileIter(g_xLaunchProfile, _sName, iter(_iterData))
+
+
+# enddef
+
+
+##########################################################################################
+def _ProfileIter(_xProfile: CLaunchProfile, _sName: str, _iterData: Iterator) -> Iterator:
+    while True:
+        lToken = _xProfile.Begin(_sName)
+        try:
+            xData = next(_iterData)
+        except StopIteration:
+            return
+        finally:
+            _xProfile.End(lToken)
+        # endtry
+        yield xData
+    # endwhile
+
+
+# enddef
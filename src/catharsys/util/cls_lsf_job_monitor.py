@@ -0,0 +1,372 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import os
+import re
+import time
+import shutil
+import subprocess
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+# ##########################################################################################################
+# Get the command list used to call an LSF tool like 'bjobs' or 'bsub'.
+# The command can be replaced by setting the environment variable 'CATHARSYS_LSF_<TOOL>',
+# e.g. 'CATHARSYS_LSF_BJOBS', to the path of a stand-in script.
+# If the tool is not found on the path, it is called via a bash shell, which sources '~/.bashrc'
+# to set up the LSF environment.
+def GetLsfToolCmd(_sTool: str) -> list[str]:
+    sCmd: Optional[str] = os.environ.get(f"CATHARSYS_LSF_{_sTool.upper()}")
+    if sCmd is not None:
+        return [sCmd]
+    # endif
+
+    sPath: Optional[str] = shutil.which(_sTool)
+    if sPath is not None:
+        return [sPath]
+    # endif
+
+    sScript: str = (
+        "export PATH=$PATH:/usr/bin:/usr/sbin:/usr/local/bin:/usr/local/sbin; "
+        f'source ~/.bashrc > /dev/null 2>&1; {_sTool} "$@"'
+    )
+    return ["bash", "-c", sScript, _sTool]
+
+
+# enddef
+
+
+# ##########################################################################################################
+@dataclass
+class CLsfJobState:
+    iLsfId: int
+    sStat: str
+    # Index of the job in a job array or zero, if the job is not part of an array
+    iArrayIdx: int = 0
+    sUser: Optional[str] = None
+    sQueue: Optional[str] = None
+    sFromHost: Optional[str] = None
+    sExecHost: Optional[str] = None
+    sJobName: Optional[str] = None
+    sSubmitTime: Optional[str] = None
+
+
+# endclass
+
+
+@dataclass
+class CLsfJobEvent:
+    iLsfId: int
+    iArrayIdx: int
+    # The LSF status before the transition or None, if the job was not seen before
+    sPrevStat: Optional[str]
+    xState: CLsfJobState
+    # True, if the job has finished and is no longer monitored
+    bFinished: bool
+
+
+# endclass
+
+
+# ##########################################################################################################
+# Monitors the state of a set of LSF jobs.
+# Only the jobs added to the monitor are queried, with a single 'bjobs' call per poll.
+# Jobs are identified by their LSF job id and their index in a job array, which is zero
+# for jobs that are not part of an array. The elements of an array are queried by the array job id.
+# The poll interval starts at '_fMinInterval_s' and grows by '_fBackoff' with every poll
+# that shows no state change, up to '_fMaxInterval_s'. Any state change resets the interval.
+# State changes are passed to the event handlers and returned by Poll().
+# A job that is no longer listed by bjobs, is only regarded as finished with the status
+# 'NOTFOUND', if it is missing in '_iLostPolls' consecutive polls.
+class CLsfJobMonitor:
+    # The job name is the last field, as it may contain the delimiter
+    c_lFields: list[str] = [
+        "jobid",
+        "jobindex",
+        "stat",
+        "user",
+        "queue",
+        "from_host",
+        "exec_host",
+        "submit_time",
+        "job_name",
+    ]
+    c_sDelimiter: str = "|"
+    c_setStatFinished: set[str] = {"DONE", "EXIT"}
+    c_sStatNotFound: str = "NOTFOUND"
+
+    def __init__(
+        self,
+        *,
+        _lBjobsCmd: Optional[list[str]] = None,
+        _fMinInterval_s: float = 1.0,
+        _fMaxInterval_s: float = 30.0,
+        _fBackoff: float = 1.5,
+        _iMaxIdsPerQuery: int = 500,
+        _iNotFoundPolls: int = 10,
+        _iLostPolls: int = 3,
+        _fQueryTimeout_s: float = 60.0,
+    ):
+        if _lBjobsCmd is None:
+            _lBjobsCmd = GetLsfToolCmd("bjobs")
+        # endif
+
+        self._lBjobsCmd: list[str] = _lBjobsCmd
+        self._fMinInterval_s: float = _fMinInterval_s
+        self._fMaxInterval_s: float = _fMaxInterval_s
+        self._fBackoff: float = _fBackoff
+        self._iMaxIdsPerQuery: int = _iMaxIdsPerQuery
+        # Number of polls a job may not be found, before it has been seen once
+        self._iNotFoundPolls: int = _iNotFoundPolls
+        # Number of consecutive polls a job may not be found, after it has been seen
+        self._iLostPolls: int = max(1, _iLostPolls)
+        self._fQueryTimeout_s: float = _fQueryTimeout_s
+
+        self._reNotFound: re.Pattern = re.compile(r"Job\s<(?P<id>\d+)> is not found")
+
+        self._dicJobs: dict[tuple[int, int], Optional[CLsfJobState]] = dict()
+        # Number of consecutive polls, in which a job has not been found
+        self._dicNotFoundCount: dict[tuple[int, int], int] = dict()
+        self._setFinished: set[tuple[int, int]] = set()
+        self._lHandlerEvent: list[Callable[[CLsfJobEvent], None]] = []
+
+        self._fInterval_s: float = _fMinInterval_s
+        self._fNextPoll: float = 0.0
+        self._iQueryErrorCount: int = 0
+        self._iQueryCount: int = 0
+
+    # enddef
+
+    @property
+    def fInterval_s(self) -> float:
+        return self._fInterval_s
+
+    # enddef
+
+    @property
+    def fTimeToNextPoll_s(self) -> float:
+        return max(0.0, self._fNextPoll - time.monotonic())
+
+    # enddef
+
+    @property
+    def iQueryErrorCount(self) -> int:
+        return self._iQueryErrorCount
+
+    # enddef
+
+    @property
+    def iQueryCount(self) -> int:
+        return self._iQueryCount
+
+    # enddef
+
+    # List of (job id, array index) of all jobs, which have not finished
+    @property
+    def lActiveJobs(self) -> list[tuple[int, int]]:
+        return [tJob for tJob in self._dicJobs if tJob not in self._setFinished]
+
+    # enddef
+
+    @property
+    def bHasActiveJobs(self) -> bool:
+        return len(self._setFinished) < len(self._dicJobs)
+
+    # enddef
+
+    # ######################################################################################################
+    def AddHandlerEvent(self, _funcHandler: Callable[[CLsfJobEvent], None]):
+        self._lHandlerEvent.append(_funcHandler)
+
+    # enddef
+
+    # ######################################################################################################
+    def AddJob(self, _iLsfId: int, _iArrayIdx: int = 0):
+        tJob: tuple[int, int] = (_iLsfId, _iArrayIdx)
+        if tJob in self._dicJobs:
+            return
+        # endif
+        self._dicJobs[tJob] = None
+        self._dicNotFoundCount[tJob] = 0
+        self.Notify()
+
+    # enddef
+
+    # ######################################################################################################
+    def GetJobState(self, _iLsfId: int, _iArrayIdx: int = 0) -> Optional[CLsfJobState]:
+        return self._dicJobs.get((_iLsfId, _iArrayIdx))
+
+    # enddef
+
+    # ######################################################################################################
+    # Poll as soon as possible with the minimal interval, e.g. after a job has been added or killed
+    def Notify(self):
+        self._fInterval_s = self._fMinInterval_s
+        self._fNextPoll = time.monotonic()
+
+    # enddef
+
+    # ######################################################################################################
+    # Query the state of all active jobs, if the poll interval has passed or '_bForce' is true.
+    # Returns the list of state transitions.
+    def Poll(self, *, _bForce: bool = False) -> list[CLsfJobEvent]:
+        if _bForce is False and time.monotonic() < self._fNextPoll:
+            return []
+        # endif
+
+        lJobs: list[tuple[int, int]] = self.lActiveJobs
+        lEvents: list[CLsfJobEvent] = []
+        if len(lJobs) > 0:
+            # All elements of an array are listed by bjobs for the array job id
+            lIds: list[int] = list(dict.fromkeys(iLsfId for iLsfId, _ in lJobs))
+            dicStates: Optional[dict[tuple[int, int], CLsfJobState]] = self._Query(lIds)
+            if dicStates is None:
+                self._iQueryErrorCount += 1
+            else:
+                self._iQueryErrorCount = 0
+                lEvents = self._Update(lJobs, dicStates)
+            # endif
+        # endif
+
+        if len(lEvents) > 0:
+            self._fInterval_s = self._fMinInterval_s
+        else:
+            self._fInterval_s = min(self._fMaxInterval_s, self._fInterval_s * self._fBackoff)
+        # endif
+        self._fNextPoll = time.monotonic() + self._fInterval_s
+
+        for xEvent in lEvents:
+            for funcHandler in self._lHandlerEvent:
+                funcHandler(xEvent)
+            # endfor
+        # endfor
+
+        return lEvents
+
+    # enddef
+
+    # ######################################################################################################
+    def _Update(
+        self, _lJobs: list[tuple[int, int]], _dicStates: dict[tuple[int, int], CLsfJobState]
+    ) -> list[CLsfJobEvent]:
+        lEvents: list[CLsfJobEvent] = []
+        for tJob in _lJobs:
+            iLsfId, iArrayIdx = tJob
+            xPrevState: Optional[CLsfJobState] = self._dicJobs[tJob]
+            sPrevStat: Optional[str] = None if xPrevState is None else xPrevState.sStat
+            xState: Optional[CLsfJobState] = _dicStates.get(tJob)
+
+            if xState is None:
+                # A job that was not seen yet, may not be known to bjobs immediately after submission.
+                # A job that was seen, may be missing from a single bjobs output, e.g. while the LSF
+                # master fails over.
+                self._dicNotFoundCount[tJob] += 1
+                iMaxNotFound: int = self._iNotFoundPolls if xPrevState is None else self._iLostPolls
+                if self._dicNotFoundCount[tJob] < iMaxNotFound:
+                    continue
+                # endif
+                xState = CLsfJobState(iLsfId=iLsfId, sStat=self.c_sStatNotFound, iArrayIdx=iArrayIdx)
+            else:
+                self._dicNotFoundCount[tJob] = 0
+            # endif
+
+            if xState.sStat == sPrevStat:
+                continue
+            # endif
+
+            bFinished: bool = xState.sStat in self.c_setStatFinished or xState.sStat == self.c_sStatNotFound
+            self._dicJobs[tJob] = xState
+            if bFinished is True:
+                self._setFinished.add(tJob)
+            # endif
+            lEvents.append(
+                CLsfJobEvent(
+                    iLsfId=iLsfId, iArrayIdx=iArrayIdx, sPrevStat=sPrevStat, xState=xState, bFinished=bFinished
+                )
+            )
+        # endfor
+        return lEvents
+
+    # enddef
+
+    # ######################################################################################################
+    # Call bjobs for the given job ids. Returns None, if the call failed.
+    def _Query(self, _lIds: list[int]) -> Optional[dict[tuple[int, int], CLsfJobState]]:
+        sFormat: str = " ".join(self.c_lFields) + f" delimiter='{self.c_sDelimiter}'"
+        dicStates: dict[tuple[int, int], CLsfJobState] = dict()
+
+        for iStart in range(0, len(_lIds), self._iMaxIdsPerQuery):
+            lArgs: list[str] = ["-a", "-noheader", "-o", sFormat]
+            lArgs.extend(str(iLsfId) for iLsfId in _lIds[iStart : iStart + self._iMaxIdsPerQuery])
+            self._iQueryCount += 1
+            try:
+                xResult = subprocess.run(
+                    self._lBjobsCmd + lArgs, capture_output=True, text=True, timeout=self._fQueryTimeout_s
+                )
+            except (OSError, subprocess.SubprocessError):
+                return None
+            # endtry
+
+            dicResult: dict[tuple[int, int], CLsfJobState] = self.ParseBjobsOutput(xResult.stdout.splitlines())
+            # bjobs returns an error code, if any of the jobs is not found
+            bAnyNotFound: bool = self._reNotFound.search(xResult.stderr) is not None
+            if xResult.returncode != 0 and len(dicResult) == 0 and bAnyNotFound is False:
+                return None
+            # endif
+            dicStates.update(dicResult)
+        # endfor
+
+        return dicStates
+
+    # enddef
+
+    # ######################################################################################################
+    @classmethod
+    def ParseBjobsOutput(cls, _lLines: list[str]) -> dict[tuple[int, int], CLsfJobState]:
+        dicStates: dict[tuple[int, int], CLsfJobState] = dict()
+        iFieldCnt: int = len(cls.c_lFields)
+        for sLine in _lLines:
+            lValues: list[str] = [x.strip() for x in sLine.split(cls.c_sDelimiter, iFieldCnt - 1)]
+            if len(lValues) != iFieldCnt or not lValues[0].isdigit():
+                continue
+            # endif
+            lValues = [None if x in ("", "-") else x for x in lValues]
+            iLsfId: int = int(lValues[0])
+            iArrayIdx: int = int(lValues[1]) if lValues[1] is not None and lValues[1].isdigit() else 0
+            dicStates[(iLsfId, iArrayIdx)] = CLsfJobState(
+                iLsfId=iLsfId,
+                iArrayIdx=iArrayIdx,
+                sStat=lValues[2],
+                sUser=lValues[3],
+                sQueue=lValues[4],
+                sFromHost=lValues[5],
+                sExecHost=lValues[6],
+                sSubmitTime=lValues[7],
+                sJobName=lValues[8],
+            )
+        # endfor
+        return dicStates
+
+    # enddef
+
+
+# endclass
@@ -29,9 +29,12 @@
 # -----
 ###
 
+import re
+import shlex
 from pathlib import Path
 import tempfile
 import platform
+import threading
 
 from typing import Union, Tuple, Optional
 from anybase import assertion, shell
@@ -39,6 +42,9 @@ from anybase.cls_process_handler import CProcessHandler
 from anybase.cls_any_error import CAnyError_Message
 import catharsys.plugins.std
 from catharsys.config.cls_exec_lsf import CConfigExecLsf
+from catharsys.util.cls_job_status_store import GetActiveJobStatusContext
+from catharsys.util.cls_lsf_job_monitor import GetLsfToolCmd
+from catharsys.util.cls_launch_profile import ProfilePhase
 
 
 ################################################################################################
@@ -66,20 +72,24 @@ def ExecBSub(
     # In the current VSCode version, the path is destroyed when running in a Jupyter notebook.
     # We need to recreate it here.
     # This also shouldn't do any harm when running from the command line (I hope).
+    # The bsub command can be replaced by a stand-in script via the environment variable 'CATHARSYS_LSF_BSUB'.
+    sBsubCmd: str = shlex.join(GetLsfToolCmd("bsub"))
     lCmds = [
         "export PATH=$PATH:/usr/bin:/usr/sbin:/usr/local/bin:/usr/local/sbin",
         "source ~/.bashrc",
-        'bsub < "{}"'.format(pathFileBsub.as_posix()),
+        '{} < "{}"'.format(sBsubCmd, pathFileBsub.as_posix()),
     ]
 
-    bOk, lStdOut = shell.ExecBashCmds(
-        lCmds=lCmds,
-        bDoPrintOnError=bDoPrintOnError,
-        bDoPrint=bDoPrint,
-        bReturnStdOut=True,
-        sPrintPrefix=">> ",
-        xProcHandler=xProcHandler,
-    )
+    with ProfilePhase("jobs/lsf-bsub"):
+        bOk, lStdOut = shell.ExecBashCmds(
+            lCmds=lCmds,
+            bDoPrintOnError=bDoPrintOnError,
+            bDoPrint=bDoPrint,
+            bReturnStdOut=True,
+            sPrintPrefix=">> ",
+            xProcHandler=xProcHandler,
+        )
+    # endwith
 
     # Delete temporary file with BSUB commands
     pathFileBsub.unlink()
@@ -91,21 +101,8 @@ def ExecBSub(
 
 
 # #################################################################################################
-def Execute(
-    *,
-    _sJobName: str,
-    _xCfgExecLsf: CConfigExecLsf,
-    _sScript: str,
-    _bDoPrint: bool = True,
-    _bDoPrintOnError: bool = True,
-    _xProcHandler: Optional[CProcessHandler] = None,
-) -> Tuple[bool, list[str]]:
-    if len(_xCfgExecLsf.lModules) > 0:
-        sSetLoadModules = "module load {0}".format(" ".join(_xCfgExecLsf.lModules))
-    else:
-        sSetLoadModules = ""
-    # endif
-
+# Get the BSUB settings of an LSF configuration, apart from the job name and the output files
+def _GetBsubSettings(_xCfgExecLsf: CConfigExecLsf) -> str:
     if _xCfgExecLsf.iJobMemReqGb == 0:
         sSetMemReq = ""
     else:
@@ -149,22 +146,71 @@ def Execute(
         sSetJobExcludeHosts = f'#BSUB -R"{sCommand}"'
     # endif
 
-    sBsubScript = f"""
-        # ####################################
-        # #BSUB Settings
-
-        #BSUB -J {_sJobName}
-        #BSUB -o lsf/%J/stdout.txt
-        #BSUB -e lsf/%J/stderr.txt
+    return f"""
         {sSetJobMaxTime}
         {sSetJobQueue}
         {sSetGpuCount}
         {sSetMemReq}
         {sSetJobHosts}
         {sSetJobExcludeHosts}
+    """
+
+
+# enddef
 
+
+# #################################################################################################
+def _GetModuleCommands(_xCfgExecLsf: CConfigExecLsf) -> str:
+    if len(_xCfgExecLsf.lModules) > 0:
+        sSetLoadModules = "module load {0}".format(" ".join(_xCfgExecLsf.lModules))
+    else:
+        sSetLoadModules = ""
+    # endif
+
+    return f"""
         module purge
         {sSetLoadModules}
+    """
+
+
+# enddef
+
+
+# #################################################################################################
+def Execute(
+    *,
+    _sJobName: str,
+    _xCfgExecLsf: CConfigExecLsf,
+    _sScript: str,
+    _bDoPrint: bool = True,
+    _bDoPrintOnError: bool = True,
+    _xProcHandler: Optional[CProcessHandler] = None,
+) -> Tuple[bool, list[str]]:
+    # If the launcher records the job status, the job records its own completion
+    xJobStatus = GetActiveJobStatusContext()
+    if xJobStatus is not None:
+        _sScript = xJobStatus.AddDoneCommand(_sScript)
+    # endif
+
+    # If an array submission is active, the job is only added to it
+    xArraySubmission: Optional[CLsfArraySubmission] = CLsfArraySubmission.GetActive()
+    if xArraySubmission is not None:
+        xArraySubmission.AddJob(
+            _sJobName=_sJobName, _xCfgExecLsf=_xCfgExecLsf, _sScript=_sScript, _xProcHandler=_xProcHandler
+        )
+        return True, [f"Job '{_sJobName}' queued for LSF job array submission"]
+    # endif
+
+    sBsubScript = f"""
+        # ####################################
+        # #BSUB Settings
+
+        #BSUB -J {_sJobName}
+        #BSUB -o lsf/%J/stdout.txt
+        #BSUB -e lsf/%J/stderr.txt
+        {_GetBsubSettings(_xCfgExecLsf)}
+
+        {_GetModuleCommands(_xCfgExecLsf)}
 
         # ####################################
         # Script to execute
@@ -177,3 +223,216 @@ def Execute(
 
 
 # enddef
+
+
+# #################################################################################################
+# Collects LSF jobs and submits them as job arrays.
+# While the submission is active (i.e. within a 'with' block), calls to Execute() from any thread
+# only store the job scripts. On leaving the 'with' block, all jobs with the same LSF settings
+# are submitted with a single bsub call per array. The script of each job is stored in a separate
+# file in '_pathScripts', which the array element selects via '$LSB_JOBINDEX'.
+# The process handler of each job receives the line 'Job <id[idx]> is submitted ...',
+# where 'id' is the LSF array job id and 'idx' the index of the job in the array.
+# The job output is written to 'lsf/[id]/[idx]/stdout.txt' and 'lsf/[id]/[idx]/stderr.txt'.
+class CLsfArraySubmission:
+    c_xActive: Optional["CLsfArraySubmission"] = None
+    c_lockActive: threading.Lock = threading.Lock()
+
+    def __init__(
+        self,
+        *,
+        _sName: str,
+        _pathScripts: Optional[Path] = None,
+        _iMaxParallel: int = 0,
+        _iMaxArraySize: int = 1000,
+        _bDoPrint: bool = False,
+        _bDoPrintOnError: bool = True,
+    ):
+        # The name is used for the array job names and script folders
+        self._sName: str = re.sub(r"[^\w\-.]", "_", _sName)
+        self._pathScripts: Optional[Path] = _pathScripts
+        # Maximal number of array elements running at the same time. Zero means no limit.
+        self._iMaxParallel: int = _iMaxParallel
+        # The maximal array size is limited by the LSF setting 'MAX_JOB_ARRAY_SIZE'
+        self._iMaxArraySize: int = _iMaxArraySize
+        self._bDoPrint: bool = _bDoPrint
+        self._bDoPrintOnError: bool = _bDoPrintOnError
+
+        self._reJobSubmitted: re.Pattern = re.compile(r"Job\s<(?P<id>\d+)> is submitted")
+        self._lock: threading.Lock = threading.Lock()
+        # Jobs grouped by their BSUB settings and module commands
+        self._dicJobs: dict[str, list[tuple[str, str, Optional[CProcessHandler]]]] = dict()
+        self._lArrayIds: list[int] = []
+
+    # enddef
+
+    @property
+    def pathScripts(self) -> Optional[Path]:
+        return self._pathScripts
+
+    @pathScripts.setter
+    def pathScripts(self, _pathScripts: Path):
+        self._pathScripts = _pathScripts
+
+    # enddef
+
+    @property
+    def lArrayIds(self) -> list[int]:
+        return self._lArrayIds.copy()
+
+    # enddef
+
+    # ##############################################################################################
+    @classmethod
+    def GetActive(cls) -> Optional["CLsfArraySubmission"]:
+        with cls.c_lockActive:
+            return cls.c_xActive
+        # endwith
+
+    # enddef
+
+    def __enter__(self) -> "CLsfArraySubmission":
+        with self.c_lockActive:
+            if CLsfArraySubmission.c_xActive is not None:
+                raise RuntimeError("An LSF array submission is already active")
+            # endif
+            CLsfArraySubmission.c_xActive = self
+        # endwith
+        return self
+
+    # enddef
+
+    def __exit__(self, _xType, _xValue, _xTraceback):
+        with self.c_lockActive:
+            CLsfArraySubmission.c_xActive = None
+        # endwith
+        if _xType is None:
+            self.Submit()
+        # endif
+        return False
+
+    # enddef
+
+    # ##############################################################################################
+    # Add a job and return the number of collected jobs with the same settings, including this one
+    def AddJob(
+        self,
+        *,
+        _sJobName: str,
+        _xCfgExecLsf: CConfigExecLsf,
+        _sScript: str,
+        _xProcHandler: Optional[CProcessHandler] = None,
+    ) -> int:
+        sSettings: str = _GetBsubSettings(_xCfgExecLsf) + _GetModuleCommands(_xCfgExecLsf)
+        with self._lock:
+            lJobs = self._dicJobs.setdefault(sSettings, [])
+            lJobs.append((_sJobName, _sScript, _xProcHandler))
+            return len(lJobs)
+        # endwith
+
+    # enddef
+
+    # ##############################################################################################
+    # Submit all collected jobs. Returns true, if all arrays were submitted successfully.
+    def Submit(self) -> bool:
+        with self._lock:
+            dicJobs = self._dicJobs
+            self._dicJobs = dict()
+        # endwith
+
+        if len(dicJobs) == 0:
+            return True
+        # endif
+
+        if self._pathScripts is None:
+            raise RuntimeError("No path for the LSF job array scripts given")
+        # endif
+        pathScripts: Path = self._pathScripts.absolute()
+        pathScripts.mkdir(parents=True, exist_ok=True)
+
+        bAllOk: bool = True
+        iArrayIdx: int = 0
+        for sSettings, lJobs in dicJobs.items():
+            for iStart in range(0, len(lJobs), self._iMaxArraySize):
+                bOk = self._SubmitArray(
+                    _sSettings=sSettings,
+                    _lJobs=lJobs[iStart : iStart + self._iMaxArraySize],
+                    _pathArray=pathScripts / f"{self._sName}-{iArrayIdx}",
+                )
+                bAllOk = bAllOk and bOk
+                iArrayIdx += 1
+            # endfor
+        # endfor
+
+        return bAllOk
+
+    # enddef
+
+    # ##############################################################################################
+    def _SubmitArray(
+        self,
+        *,
+        _sSettings: str,
+        _lJobs: list[tuple[str, str, Optional[CProcessHandler]]],
+        _pathArray: Path,
+    ) -> bool:
+        _pathArray.mkdir(parents=True, exist_ok=True)
+        for iIdx, (sJobName, sScript, xProcHandler) in enumerate(_lJobs, start=1):
+            (_pathArray / f"job-{iIdx}.sh").write_text(f"# Job: {sJobName}\n{sScript}\n")
+        # endfor
+
+        sLimit: str = f"%{self._iMaxParallel}" if self._iMaxParallel > 0 else ""
+        sBsubScript = f"""
+        # ####################################
+        # #BSUB Settings
+
+        #BSUB -J {_pathArray.name}[1-{len(_lJobs)}]{sLimit}
+        #BSUB -o lsf/%J/%I/stdout.txt
+        #BSUB -e lsf/%J/%I/stderr.txt
+        {_sSettings}
+
+        # ####################################
+        # Script of the array element
+        source "{_pathArray.as_posix()}/job-${{LSB_JOBINDEX}}.sh"
+    """
+
+        bOk, lStdOut = ExecBSub(sCommands=sBsubScript, bDoPrint=self._bDoPrint, bDoPrintOnError=self._bDoPrintOnError)
+
+        iLsfId: Optional[int] = None
+        for sLine in lStdOut:
+            xMatch = self._reJobSubmitted.search(sLine)
+            if xMatch is not None:
+                iLsfId = int(xMatch.group("id"))
+                break
+            # endif
+        # endfor
+
+        if iLsfId is not None:
+            self._lArrayIds.append(iLsfId)
+        # endif
+
+        for iIdx, (sJobName, sScript, xProcHandler) in enumerate(_lJobs, start=1):
+            if xProcHandler is None:
+                continue
+            # endif
+            if xProcHandler.bStdOutAvailable is True:
+                if iLsfId is not None:
+                    xProcHandler.StdOut(f"Job <{iLsfId}[{iIdx}]> is submitted as element {iIdx} of job array\n")
+                else:
+                    xProcHandler.StdOut(f"Error submitting LSF job array '{_pathArray.name}'\n")
+                    for sLine in lStdOut:
+                        xProcHandler.StdOut(sLine)
+                    # endfor
+                # endif
+            # endif
+            if xProcHandler.bEndedAvailable is True:
+                xProcHandler.Ended(0 if iLsfId is not None else 1, "")
+            # endif
+        # endfor
+
+        return bOk and iLsfId is not None
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,102 @@
+# ##################################################################
+# Micro-benchmark of the processed config cache invalidation
+# in CLoopConfigs for deep trial schemes.
+#
+# Compares the per level cache of CLoopConfigs with the previous
+# flat cache, whose invalidation scanned all keys with startswith().
+# Only the cache bookkeeping is measured, no configs are parsed.
+#
+# Usage: python bench-loopconfigs-cache.py [levels] [values per level]
+# ##################################################################
+import sys
+from timeit import default_timer as timer
+from catharsys.plugins.std.action_class.manifest.cls_loopconfigs import CLoopConfigs, CProcCache
+
+
+####################################################################
+def CreateLoop(_iLevelCnt: int, _iValueCnt: int) -> CLoopConfigs:
+    # Create the instance without a project, as only the cache is used.
+    # The id of the innermost level 'cfg' is a prefix of the ids of all outer
+    # levels 'cfg1', 'cfg11', ... The flat cache therefore also removed the
+    # entries of the outer levels, whenever the innermost level was invalidated.
+    xLoop = CLoopConfigs.__new__(CLoopConfigs)
+    xLoop.lScheme = [{"sId": "cfg" + "1" * (_iLevelCnt - 1 - i), "iCnt": _iValueCnt} for i in range(_iLevelCnt)]
+    xLoop.iTotalCnt = _iValueCnt**_iLevelCnt
+    xLoop.dicProcCfgCache = dict()
+    xLoop.lProcCfgCacheLevelIndices = None
+    return xLoop
+
+
+# enddef
+
+
+####################################################################
+def RunPerLevelCache(_xLoop: CLoopConfigs) -> int:
+    iHits = 0
+    for iTotalIdx in range(_xLoop.iTotalCnt):
+        lLevelIndices = _xLoop.GetLevelIndices(iTotalIdx)
+        _xLoop._UpdateProcCfgCache(lLevelIndices)
+        for dicLevel, iIdx in zip(_xLoop.lScheme, lLevelIndices):
+            dicLevelCache = _xLoop._GetProcCfgLevelCache(dicLevel["sId"])
+            if (iIdx, 0) in dicLevelCache:
+                iHits += 1
+            else:
+                dicLevelCache[(iIdx, 0)] = CProcCache({}, True)
+            # endif
+        # endfor
+    # endfor
+    return iHits
+
+
+# enddef
+
+
+####################################################################
+def RunFlatCache(_xLoop: CLoopConfigs) -> int:
+    dicCache: dict[str, CProcCache] = dict()
+    lPrevIndices: list[int] = None
+    iHits = 0
+    for iTotalIdx in range(_xLoop.iTotalCnt):
+        lLevelIndices = _xLoop.GetLevelIndices(iTotalIdx)
+        if lPrevIndices is not None:
+            iLevelCnt = len(lLevelIndices)
+            iChangedLevel = next((i for i in range(iLevelCnt) if lPrevIndices[i] != lLevelIndices[i]), iLevelCnt)
+            for dicLevel in _xLoop.lScheme[iChangedLevel + 1 :]:
+                sId = dicLevel["sId"]
+                for sHash in [x for x in dicCache if x.startswith(sId)]:
+                    del dicCache[sHash]
+                # endfor
+            # endfor
+        # endif
+        lPrevIndices = lLevelIndices
+
+        for dicLevel, iIdx in zip(_xLoop.lScheme, lLevelIndices):
+            sHash = f"{dicLevel['sId']}-{iIdx}-0"
+            if sHash in dicCache:
+                iHits += 1
+            else:
+                dicCache[sHash] = CProcCache({}, True)
+            # endif
+        # endfor
+    # endfor
+    return iHits
+
+
+# enddef
+
+
+####################################################################
+if __name__ == "__main__":
+    iLevelCnt = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    iValueCnt = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    print(f"Scheme: {iLevelCnt} levels with {iValueCnt} values each, {iValueCnt**iLevelCnt} configs")
+
+    for sName, funcRun in [("flat cache", RunFlatCache), ("per level cache", RunPerLevelCache)]:
+        xLoop = CreateLoop(iLevelCnt, iValueCnt)
+        dStart = timer()
+        iHits = funcRun(xLoop)
+        dTime = timer() - dStart
+        print(f"{sName:>16}: {dTime:8.3f}s, {iHits} cache hits")
+    # endfor
+# endif
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+# Stand-in for the LSF tools 'bsub' and 'bjobs', for testing without an LSF cluster.
+# Call it as 'fake_lsf.py bsub' or 'fake_lsf.py bjobs [args]'. To replace the LSF tools
+# in Catharsys, set e.g. 'CATHARSYS_LSF_BJOBS' to a script that calls 'fake_lsf.py bjobs "$@"'.
+#
+# The jobs are stored in the JSON file given by the environment variable 'CATHARSYS_FAKE_LSF_STATE',
+# with the elements 'iNextId' and 'mJobs'. The latter maps the job id text, e.g. '1000' or '1000[2]'
+# for array jobs, to a dictionary of bjobs fields. Tests change the job states by editing this file.
+
+import os
+import re
+import sys
+import json
+from pathlib import Path
+
+c_sEnvState: str = "CATHARSYS_FAKE_LSF_STATE"
+
+
+####################################################################
+def LoadState(_pathState: Path) -> dict:
+    if not _pathState.exists():
+        return {"iNextId": 1000, "mJobs": {}}
+    # endif
+    return json.loads(_pathState.read_text())
+
+
+# enddef
+
+
+####################################################################
+def SaveState(_pathState: Path, _dicState: dict):
+    _pathState.write_text(json.dumps(_dicState, indent=4))
+
+
+# enddef
+
+
+####################################################################
+# Submit the job script read from stdin. Job arrays are given by '#BSUB -J name[1-n]'.
+def BSub(_pathState: Path, _sScript: str) -> int:
+    dicState = LoadState(_pathState)
+    iLsfId: int = dicState["iNextId"]
+    dicState["iNextId"] = iLsfId + 1
+
+    xMatch = re.search(r"^#BSUB\s+-J\s+(?P<name>[^\[\n]+)(\[1-(?P<cnt>\d+)\])?", _sScript, re.MULTILINE)
+    sName: str = "job" if xMatch is None else xMatch.group("name").strip().strip('"')
+    iArrayCnt: int = 0 if xMatch is None or xMatch.group("cnt") is None else int(xMatch.group("cnt"))
+
+    lArrayIdx: list[int] = [0] if iArrayCnt == 0 else list(range(1, iArrayCnt + 1))
+    for iArrayIdx in lArrayIdx:
+        sKey: str = str(iLsfId) if iArrayIdx == 0 else f"{iLsfId}[{iArrayIdx}]"
+        dicState["mJobs"][sKey] = {
+            "jobid": str(iLsfId),
+            "jobindex": str(iArrayIdx),
+            "stat": "PEND",
+            "user": os.environ.get("USER", "user"),
+            "queue": "normal",
+            "from_host": "localhost",
+            "exec_host": "-",
+            "submit_time": "Oct 17 10:22",
+            "job_name": sName,
+        }
+    # endfor
+    SaveState(_pathState, dicState)
+
+    print(f"Job <{iLsfId}> is submitted to default queue <normal>.")
+    return 0
+
+
+# enddef
+
+
+####################################################################
+# Supports the arguments '-a', '-noheader', '-o "fields delimiter=..."' and a list of job ids
+def BJobs(_pathState: Path, _lArgs: list[str]) -> int:
+    lFields: list[str] = ["jobid", "stat", "job_name"]
+    sDelimiter: str = " "
+    lIds: list[str] = []
+
+    iArgIdx: int = 0
+    while iArgIdx < len(_lArgs):
+        sArg: str = _lArgs[iArgIdx]
+        if sArg == "-o":
+            iArgIdx += 1
+            sFormat: str = _lArgs[iArgIdx]
+            xMatch = re.search(r"\s*delimiter='(?P<delim>[^']*)'\s*$", sFormat)
+            if xMatch is not None:
+                sDelimiter = xMatch.group("delim")
+                sFormat = sFormat[: xMatch.start()]
+            # endif
+            lFields = sFormat.split()
+        elif not sArg.startswith("-"):
+            lIds.append(sArg)
+        # endif
+        iArgIdx += 1
+    # endwhile
+
+    dicJobs: dict = LoadState(_pathState)["mJobs"]
+    iReturnCode: int = 0
+    for sId in lIds:
+        lJobs: list[dict] = [dicJob for dicJob in dicJobs.values() if dicJob["jobid"] == sId]
+        if len(lJobs) == 0:
+            print(f"Job <{sId}> is not found", file=sys.stderr)
+            iReturnCode = 255
+            continue
+        # endif
+        for dicJob in lJobs:
+            print(sDelimiter.join(str(dicJob.get(sField, "-")) for sField in lFields))
+        # endfor
+    # endfor
+    return iReturnCode
+
+
+# enddef
+
+
+####################################################################
+def Main(_lArgs: list[str]) -> int:
+    sState: str = os.environ.get(c_sEnvState)
+    if sState is None:
+        print(f"Environment variable '{c_sEnvState}' not set", file=sys.stderr)
+        return 1
+    # endif
+    pathState = Path(sState)
+
+    if len(_lArgs) == 0:
+        print("Usage: fake_lsf.py [bsub|bjobs] [args]", file=sys.stderr)
+        return 1
+    # endif
+
+    if _lArgs[0] == "bsub":
+        return BSub(pathState, sys.stdin.read())
+    elif _lArgs[0] == "bjobs":
+        return BJobs(pathState, _lArgs[1:])
+    # endif
+
+    print(f"Unsupported LSF tool '{_lArgs[0]}'", file=sys.stderr)
+    return 1
+
+
+# enddef
+
+
+if __name__ == "__main__":
+    sys.exit(Main(sys.argv[1:]))
+# endif
@@ -0,0 +1,128 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import os
+import json
+from pathlib import Path
+
+from catharsys.decs.cls_call_tracer import CCallTracer, GetTraceFilePath
+
+
+def _Outer():
+    pass
+
+
+# enddef
+
+
+def _Inner():
+    pass
+
+
+# enddef
+
+
+class TestClass:
+    def _CreateTracer(self) -> CCallTracer:
+        xTracer = CCallTracer(_iMaxEvents=10)
+        iStart: int = xTracer._iTimeStartNs
+        # An outer call, which contains an inner call, and a message
+        xTracer.AddCall(_Outer, iStart + 1000, iStart + 5000)
+        xTracer.AddCall(_Inner, iStart + 2000, iStart + 3000)
+        xTracer.AddMessage("hello")
+        return xTracer
+
+    # enddef
+
+    ################################################################################
+    def test_chrome_trace(self):
+        dicTrace = self._CreateTracer().GetChromeTrace()
+
+        lCalls = [x for x in dicTrace["traceEvents"] if x["ph"] == "X"]
+        assert [x["name"] for x in lCalls] == ["_Outer", "_Inner"]
+        assert lCalls[0]["ts"] == 1.0
+        assert lCalls[0]["dur"] == 4.0
+        assert lCalls[0]["args"]["file"] == __file__
+
+        assert [x["name"] for x in dicTrace["traceEvents"] if x["ph"] == "i"] == ["hello"]
+        assert len([x for x in dicTrace["traceEvents"] if x["ph"] == "M"]) == 1
+        assert dicTrace["otherData"]["iDroppedEvents"] == 0
+
+    # enddef
+
+    ################################################################################
+    def test_speedscope(self):
+        dicData = self._CreateTracer().GetSpeedscope("test")
+
+        assert dicData["name"] == "test"
+        assert [x["name"] for x in dicData["shared"]["frames"]] == ["_Outer", "_Inner"]
+
+        lProfiles = dicData["profiles"]
+        assert len(lProfiles) == 1
+        # Messages are not exported, and inner calls are nested in outer calls
+        assert [(x["type"], x["frame"], x["at"]) for x in lProfiles[0]["events"]] == [
+            ("O", 0, 1000),
+            ("O", 1, 2000),
+            ("C", 1, 3000),
+            ("C", 0, 5000),
+        ]
+
+    # enddef
+
+    ################################################################################
+    def test_dropped_events(self):
+        xTracer = CCallTracer(_iMaxEvents=2)
+        for _ in range(5):
+            xTracer.AddMessage("message")
+        # endfor
+        assert xTracer.iDroppedEvents == 3
+        assert len(xTracer.GetChromeTrace()["traceEvents"]) == 3
+
+    # enddef
+
+    ################################################################################
+    def test_save(self, tmp_path: Path):
+        xTracer = self._CreateTracer()
+
+        xTracer.Save(tmp_path / "trace.json")
+        assert "traceEvents" in json.loads((tmp_path / "trace.json").read_text())
+
+        xTracer.Save(tmp_path / "trace.speedscope.json")
+        dicData = json.loads((tmp_path / "trace.speedscope.json").read_text())
+        assert dicData["$schema"] == CCallTracer.c_sSpeedscopeSchema
+        assert dicData["name"] == "trace"
+
+    # enddef
+
+    ################################################################################
+    def test_trace_file_path(self):
+        sPid: str = str(os.getpid())
+
+        assert GetTraceFilePath("") is None
+        assert GetTraceFilePath("/tmp/trace_{pid}.json") == Path(f"/tmp/trace_{sPid}.json")
+        # Without placeholder, the process id is appended to the file name
+        assert GetTraceFilePath("/tmp/trace.speedscope.json") == Path(f"/tmp/trace_{sPid}.speedscope.json")
+
+    # enddef
+
+
+# endclass
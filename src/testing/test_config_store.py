@@ -0,0 +1,81 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+from pathlib import Path
+
+import pytest
+
+from catharsys.util.cls_config_store import CConfigStore
+
+
+class TestClass:
+    ################################################################################
+    def test_put_resolve(self, tmp_path: Path):
+        xStore = CConfigStore(tmp_path / "store")
+        dicConfig = {"sId": "cfg", "lValues": [1, 2.5, "text", None, True]}
+
+        dicRef = xStore.Put(dicConfig)
+        assert CConfigStore.IsRef(dicRef)
+        # Equal data is stored only once
+        assert xStore.Put(dict(dicConfig)) == dicRef
+        # The reference does not depend on the order of the dictionary elements
+        assert xStore.Put(dict(reversed(dicConfig.items()))) == dicRef
+        assert len(list(xStore.pathStore.glob(f"*/*{CConfigStore.c_sSuffix}"))) == 1
+
+        dicJob = {"mConfig": dicRef, "lConfigs": [{"mConfig": dicRef, "iIdx": 0}], "sName": "job"}
+        dicResolved = CConfigStore(tmp_path / "store").ResolveRefs(dicJob)
+        assert dicResolved == {"mConfig": dicConfig, "lConfigs": [{"mConfig": dicConfig, "iIdx": 0}], "sName": "job"}
+
+    # enddef
+
+    ################################################################################
+    def test_missing_entry(self, tmp_path: Path):
+        xStore = CConfigStore(tmp_path / "store")
+        with pytest.raises(RuntimeError):
+            xStore.ResolveRefs({"sDTI": CConfigStore.c_sRefDti, "sHash": "00" * 32})
+        # endwith
+
+    # enddef
+
+    ################################################################################
+    def test_evict(self, tmp_path: Path):
+        xStore = CConfigStore(tmp_path / "store", _iMaxSizeBytes=1, _fMinAge_s=3600.0)
+        dicRef = xStore.Put({"a": 1})
+
+        # Recently used entries are kept
+        xStore.Evict()
+        assert xStore.ResolveRefs(dicRef) == {"a": 1}
+
+        xStore = CConfigStore(tmp_path / "store", _iMaxSizeBytes=1, _fMinAge_s=0.0)
+        xStore.Evict()
+        with pytest.raises(RuntimeError):
+            xStore.ResolveRefs(dicRef)
+        # endwith
+
+        # Evicted entries are stored again
+        assert xStore.Put({"a": 1}) == dicRef
+        assert xStore.ResolveRefs(dicRef) == {"a": 1}
+
+    # enddef
+
+
+# endclass
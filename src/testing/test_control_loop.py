@@ -0,0 +1,114 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import itertools
+
+import pytest
+
+from catharsys.plugins.std.action_class.manifest.cls_control_loop import (
+    CLoopRange,
+    CNestedRangeIndices,
+    CControlLoopValues,
+    CControlLoopValueChain,
+)
+
+
+class CTestIter:
+    def __init__(self):
+        self.iCreateCount: int = 0
+
+    # enddef
+
+    def Create(self, _xIdx) -> dict:
+        self.iCreateCount += 1
+        return {"xIdx": _xIdx, "lData": [1]}
+
+    # enddef
+
+
+# endclass
+
+
+class TestClass:
+    def _CreateLoops(self) -> list[CLoopRange]:
+        lLoops: list[CLoopRange] = []
+        for iMin, iMax, iStep in [(1, 2, 1), (0, 10, 5), (3, 7, 2)]:
+            lLoops.append(CLoopRange(iMin, iMax, iStep, (iMax - iMin) // iStep + 1))
+        # endfor
+        CNestedRangeIndices.SetLoopStrides(lLoops)
+        return lLoops
+
+    # enddef
+
+    ################################################################################
+    def test_nested_range_indices(self):
+        lLoops = self._CreateLoops()
+        xIndices = CNestedRangeIndices(lLoops)
+
+        # The last loop varies fastest
+        lExpected = [list(x) for x in itertools.product(range(1, 3), range(0, 11, 5), range(3, 8, 2))]
+        assert len(xIndices) == len(lExpected)
+        assert list(xIndices) == lExpected
+        assert xIndices[-1] == lExpected[-1]
+        assert xIndices[2:4] == lExpected[2:4]
+
+    # enddef
+
+    ################################################################################
+    def test_active_indices(self):
+        lLoops = self._CreateLoops()
+        xGrid = CNestedRangeIndices(lLoops)
+
+        # Indices outside of the grid are ignored, duplicates are removed and the grid order is kept
+        aPositions = xGrid.EncodeIndices([[2, 10, 7], [1, 5, 3], [1, 4, 3], [2, 10, 7], [3, 0, 3]])
+        assert list(CNestedRangeIndices(lLoops, aPositions)) == [[1, 5, 3], [2, 10, 7]]
+
+        with pytest.raises(RuntimeError):
+            xGrid.EncodeIndices([[1, 5]])
+        # endwith
+
+    # enddef
+
+    ################################################################################
+    def test_loop_values(self):
+        xIter = CTestIter()
+        xValues = CControlLoopValues(_xIter=xIter, _lIndices=range(2, 5), _dicLoopInfo={"iMin": 2})
+
+        assert len(xValues) == 3
+        dicValue = xValues[0]
+        assert dicValue == {"xIdx": 2, "lData": [1], "iMin": 2}
+
+        # Changing a returned value does not change the cached value
+        dicValue["lData"].append(2)
+        assert xValues[0]["lData"] == [1]
+        assert xIter.iCreateCount == 1
+
+        xChain = CControlLoopValueChain([xValues, CControlLoopValues(_xIter=xIter, _lIndices=[]), xValues])
+        assert len(xChain) == 6
+        assert [x["xIdx"] for x in xChain] == [2, 3, 4, 2, 3, 4]
+        assert xChain.ToList() == list(xValues) * 2
+        assert repr(xChain) == repr(xChain.ToList())
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,131 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import os
+import time
+import pickle
+from pathlib import Path
+from typing import Optional
+
+import anytree
+
+from catharsys.api.products.cls_node import CNode, ENodeType
+from catharsys.api.products.cls_dir_cache import CDirCache
+from catharsys.api.products.cls_path_structure import CPathStructure
+
+
+class TestClass:
+    c_sPathStruct: str = "?scene/?camera/?image"
+
+    def _CreateTree(self, _pathRoot: Path):
+        for iScene in range(3):
+            for iCam in range(2):
+                pathCam = _pathRoot / f"scene{iScene}" / f"cam{iCam}"
+                pathCam.mkdir(parents=True)
+                for iFrame in range(4):
+                    (pathCam / f"Frame_{iFrame:04d}.png").write_text("x")
+                # endfor
+            # endfor
+        # endfor
+
+    # enddef
+
+    # Set the modification times of all directories to a time well before the racy time window
+    def _SetOldTimes(self, _pathRoot: Path):
+        iTimeNs: int = time.time_ns() - 10 * CDirCache.c_iRacyTimeNs
+        for pathDir in [_pathRoot] + [x for x in _pathRoot.rglob("*") if x.is_dir()]:
+            os.utime(pathDir, ns=(iTimeNs, iTimeNs))
+        # endfor
+
+    # enddef
+
+    # Scan the tree and return the node tree as list together with the serialized directory cache
+    def _Scan(self, _pathRoot: Path, _dicPrevious: Optional[dict] = None) -> tuple[list[tuple], dict, CDirCache]:
+        xPathStruct = CPathStructure(self.c_sPathStruct, ENodeType.ARTEFACT)
+        nodeRoot = CNode("root", _iLevel=-1, _eType=ENodeType.ROOT)
+        xDirCache = CDirCache(_dicPrevious=_dicPrevious)
+        xPathStruct.ScanFileSystem(_pathScan=_pathRoot, _nodeParent=nodeRoot, _iLevel=0, _xDirCache=xDirCache)
+
+        lNodes: list[tuple] = [
+            (tuple(x.name for x in nodeX.path), nodeX.eType, nodeX.iLevel) for nodeX in anytree.PreOrderIter(nodeRoot)
+        ]
+        # The listings are stored in the scan file with pickle
+        return lNodes, pickle.loads(pickle.dumps(xDirCache.Serialize())), xDirCache
+
+    # enddef
+
+    ################################################################################
+    def test_incremental_scan(self, tmp_path: Path):
+        self._CreateTree(tmp_path)
+        self._SetOldTimes(tmp_path)
+        lNodes, dicPrevious, _ = self._Scan(tmp_path)
+        # root, 3 scenes and 6 cameras
+        assert len(dicPrevious) == 10
+
+        # Without changes, all listings are reused
+        lNodesInc, _, xDirCache = self._Scan(tmp_path, dicPrevious)
+        assert lNodesInc == lNodes
+        assert (xDirCache.iListed, xDirCache.iReused) == (0, 10)
+
+        pathCam = tmp_path / "scene1" / "cam0"
+        (pathCam / "Frame_0001.png").unlink()
+        (pathCam / "Frame_0009.png").write_text("x")
+
+        lNodesInc, _, xDirCache = self._Scan(tmp_path, dicPrevious)
+        lNodesFull, _, _ = self._Scan(tmp_path)
+        assert lNodesInc == lNodesFull
+        assert lNodesInc != lNodes
+        assert ("root", "scene1", "cam0", "Frame_0009.png") in [x[0] for x in lNodesInc]
+        # Only the changed directory is listed again
+        assert (xDirCache.iListed, xDirCache.iReused) == (1, 9)
+
+    # enddef
+
+    ################################################################################
+    def test_racy_directory(self, tmp_path: Path):
+        self._CreateTree(tmp_path)
+        self._SetOldTimes(tmp_path)
+
+        # A directory modified just before it is listed, is not stored in the listings,
+        # as later changes within the time resolution of the file system may not change its
+        # modification time.
+        pathCam = tmp_path / "scene2" / "cam1"
+        (pathCam / "Frame_0004.png").write_text("x")
+        xStat = pathCam.stat()
+        _, dicPrevious, _ = self._Scan(tmp_path)
+        assert pathCam.as_posix() not in dicPrevious
+        assert len(dicPrevious) == 9
+
+        # Add a file without changing the modification time of the directory
+        (pathCam / "Frame_0005.png").write_text("x")
+        os.utime(pathCam, ns=(xStat.st_atime_ns, xStat.st_mtime_ns))
+
+        lNodesInc, _, xDirCache = self._Scan(tmp_path, dicPrevious)
+        lNodesFull, _, _ = self._Scan(tmp_path)
+        assert lNodesInc == lNodesFull
+        assert ("root", "scene2", "cam1", "Frame_0005.png") in [x[0] for x in lNodesInc]
+        assert (xDirCache.iListed, xDirCache.iReused) == (1, 9)
+
+    # enddef
+
+
+# endclass
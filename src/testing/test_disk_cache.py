@@ -0,0 +1,78 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import os
+from pathlib import Path
+
+from catharsys.util.cls_disk_cache import CDiskCache
+
+
+class TestClass:
+    ################################################################################
+    def test_create_key(self):
+        # The parts are separated by their lengths, so that concatenations differ
+        assert CDiskCache.CreateKey("ab", "c") != CDiskCache.CreateKey("a", "bc")
+        assert CDiskCache.CreateKey("abc") == CDiskCache.CreateKey(b"abc")
+        assert len(CDiskCache.CreateKey("abc")) == 64
+
+    # enddef
+
+    ################################################################################
+    def test_set_get(self, tmp_path: Path):
+        xCache = CDiskCache(tmp_path / "cache")
+        sKey: str = CDiskCache.CreateKey("entry")
+
+        assert xCache.Get(sKey) is None
+        assert xCache.iMisses == 1
+
+        assert xCache.Set(sKey, {"a": [1, 2, 3]}) is True
+        assert xCache.Get(sKey) == {"a": [1, 2, 3]}
+        assert xCache.iHits == 1
+
+        # Data that cannot be pickled is not stored
+        assert xCache.Set(CDiskCache.CreateKey("lambda"), lambda: 0) is False
+
+        xCache.Clear()
+        assert xCache.Get(sKey) is None
+
+    # enddef
+
+    ################################################################################
+    def test_evict(self, tmp_path: Path):
+        xCache = CDiskCache(tmp_path / "cache", _iMaxSizeBytes=3000)
+        lKeys: list[str] = [CDiskCache.CreateKey(str(i)) for i in range(3)]
+        for iIdx, sKey in enumerate(lKeys):
+            xCache.Set(sKey, b"x" * 1000)
+            # The first entry is the least recently used one
+            pathEntry: Path = xCache.pathCache / sKey[0:2] / f"{sKey}.pickle"
+            os.utime(pathEntry, (1000 + iIdx, 1000 + iIdx))
+        # endfor
+
+        xCache.Evict()
+        assert xCache.Get(lKeys[0]) is None
+        assert xCache.Get(lKeys[1]) is not None
+        assert xCache.Get(lKeys[2]) is not None
+
+    # enddef
+
+
+# endclass
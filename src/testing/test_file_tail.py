@@ -0,0 +1,81 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+from pathlib import Path
+
+from catharsys.util.cls_file_tail import CFileTail
+
+
+class TestClass:
+    ################################################################################
+    def test_read_appended_lines(self, tmp_path: Path):
+        pathFile: Path = tmp_path / "stdout.txt"
+        xTail = CFileTail(pathFile)
+
+        assert xTail.ReadLines() == []
+        assert xTail.bExists is False
+
+        pathFile.write_text("first\nsec")
+        assert xTail.ReadLines() == ["first\n"]
+        assert xTail.bExists is True
+
+        with pathFile.open("a") as xFile:
+            xFile.write("ond\nthird")
+        # endwith
+        assert xTail.ReadLines() == ["second\n"]
+        assert xTail.IsAtEnd() is True
+        assert xTail.ReadLines(_bFlush=True) == ["third"]
+
+    # enddef
+
+    ################################################################################
+    def test_replaced_file(self, tmp_path: Path):
+        pathFile: Path = tmp_path / "stdout.txt"
+        xTail = CFileTail(pathFile)
+
+        pathFile.write_text("a long first line\n")
+        assert xTail.ReadLines() == ["a long first line\n"]
+
+        # A smaller file is read from the start
+        pathFile.write_text("new\n")
+        assert xTail.ReadLines() == ["new\n"]
+
+    # enddef
+
+    ################################################################################
+    def test_max_read_bytes(self, tmp_path: Path):
+        pathFile: Path = tmp_path / "stdout.txt"
+        pathFile.write_text("0123456789\nab\n")
+        xTail = CFileTail(pathFile, _iMaxReadBytes=4)
+
+        # Long lines are returned in parts of the maximal read size
+        lLines: list[str] = []
+        while not xTail.IsAtEnd():
+            lLines.extend(xTail.ReadLines())
+        # endwhile
+        assert "".join(lLines) == "0123456789\nab\n"
+        assert lLines[-1] == "ab\n"
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,96 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import copy
+import pickle
+
+import pytest
+
+from catharsys.util.cls_frozen_data import CFrozenDict, CFrozenList, FreezeData, ThawData
+
+
+class TestClass:
+    ################################################################################
+    def test_freeze(self):
+        dicData = {"a": [1, {"b": 2}], "c": {3, 4}, "d": (5, [6])}
+        dicFrozen = FreezeData(dicData)
+
+        assert dicFrozen == {"a": [1, {"b": 2}], "c": frozenset({3, 4}), "d": (5, [6])}
+        assert isinstance(dicFrozen, CFrozenDict)
+        assert isinstance(dicFrozen["a"], CFrozenList)
+        assert isinstance(dicFrozen["a"][1], CFrozenDict)
+        assert isinstance(dicFrozen["d"][1], CFrozenList)
+
+        # Frozen data is shared and not copied
+        assert FreezeData(dicFrozen) is dicFrozen
+        assert copy.copy(dicFrozen) is dicFrozen
+
+    # enddef
+
+    ################################################################################
+    def test_read_only(self):
+        dicFrozen = FreezeData({"a": [1, 2]})
+
+        with pytest.raises(TypeError):
+            dicFrozen["b"] = 1
+        # endwith
+        with pytest.raises(TypeError):
+            dicFrozen.update({"b": 1})
+        # endwith
+        with pytest.raises(TypeError):
+            dicFrozen["a"].append(3)
+        # endwith
+        with pytest.raises(TypeError):
+            dicFrozen["a"][0] = 3
+        # endwith
+
+    # enddef
+
+    ################################################################################
+    def test_thaw(self):
+        dicFrozen = FreezeData({"a": [1, {"b": 2}], "c": {3}})
+
+        for dicData in [ThawData(dicFrozen), copy.deepcopy(dicFrozen)]:
+            assert type(dicData) is dict
+            assert type(dicData["a"]) is list
+            assert type(dicData["a"][1]) is dict
+            assert type(dicData["c"]) is set
+
+            dicData["a"].append(3)
+            assert dicFrozen["a"] == [1, {"b": 2}]
+        # endfor
+
+    # enddef
+
+    ################################################################################
+    def test_pickle(self):
+        dicFrozen = FreezeData({"a": [1, 2]})
+        dicLoaded = pickle.loads(pickle.dumps(dicFrozen))
+
+        assert dicLoaded == dicFrozen
+        assert isinstance(dicLoaded, CFrozenDict)
+        assert isinstance(dicLoaded["a"], CFrozenList)
+
+    # enddef
+
+
+# endclass
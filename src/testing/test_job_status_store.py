@@ -0,0 +1,103 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import subprocess
+from pathlib import Path
+
+from catharsys.util.cls_job_status_store import CJobStatusStore, GetActiveJobStatusContext
+
+
+class TestClass:
+    ################################################################################
+    def test_create_job_key(self, tmp_path: Path):
+        xStore = CJobStatusStore(tmp_path / "status", _iterLaunchOnlyArgs=["bResume", "iMaxLocalWorkers"])
+        dicJob = {
+            "sDTI": "/catharsys/action-class/python/manifest-based/job-config:1.0",
+            "sPathJobConfigMain": "/tmp/jobs/2026-10-17",
+            "iMaxLocalWorkers": 4,
+            "lConfigs": [{"iCfgIdx": 0, "sJobGroupId": "2026-10-17", "mConfig": {"bResume": True, "iValue": 1}}],
+        }
+        dicJobOther = {
+            "sDTI": "/catharsys/action-class/python/manifest-based/job-config:1.0",
+            "sPathJobConfigMain": "/tmp/jobs/2026-10-18",
+            "iMaxLocalWorkers": 8,
+            "lConfigs": [{"iCfgIdx": 0, "sJobGroupId": "2026-10-18", "mConfig": {"bResume": False, "iValue": 1}}],
+        }
+
+        # Volatile elements and launch-only arguments are ignored at all nesting levels
+        sKey: str = xStore.CreateJobKey(dicJob)
+        assert sKey == xStore.CreateJobKey(dicJobOther)
+
+        dicJobOther["lConfigs"][0]["mConfig"]["iValue"] = 2
+        assert sKey != xStore.CreateJobKey(dicJobOther)
+
+        # Launch-only arguments are only ignored, if they are given to the store
+        xStoreOther = CJobStatusStore(tmp_path / "status")
+        assert xStoreOther.CreateJobKey(dicJob) != xStoreOther.CreateJobKey({**dicJob, "iMaxLocalWorkers": 8})
+
+        # The given config is not changed
+        assert dicJob["lConfigs"][0]["sJobGroupId"] == "2026-10-17"
+
+    # enddef
+
+    ################################################################################
+    def test_set_done(self, tmp_path: Path):
+        xStore = CJobStatusStore(tmp_path / "status")
+        sKey: str = xStore.CreateJobKey({"iIdx": 1})
+
+        assert xStore.IsDone(sKey) is False
+        assert xStore.GetDuration(sKey) is None
+
+        xStore.SetDone(sKey, _sJobName="job", _fDuration=1.5)
+        assert xStore.IsDone(sKey) is True
+        assert xStore.GetDuration(sKey) == 1.5
+
+        xStore.Clear()
+        assert xStore.IsDone(sKey) is False
+
+    # enddef
+
+    ################################################################################
+    def test_done_command(self, tmp_path: Path):
+        xStore = CJobStatusStore(tmp_path / "status")
+
+        for sScript, iReturnCode in [("echo first\nfalse", 1), ("false\necho after", 0), ("exit 3\necho after", 3)]:
+            sKey: str = xStore.CreateJobKey({"sScript": sScript})
+            with xStore.JobContext(sKey, _sJobName="job") as xJobStatus:
+                assert GetActiveJobStatusContext() is xJobStatus
+                sJobScript: str = xJobStatus.AddDoneCommand(sScript)
+            # endwith
+            assert GetActiveJobStatusContext() is None
+            assert xJobStatus.bDeferred is True
+
+            # The script is run unchanged and the job is only recorded as done,
+            # if the script exits with return code 0.
+            xResult = subprocess.run(["bash", "-c", sJobScript], capture_output=True, text=True)
+            assert xResult.returncode == iReturnCode
+            assert ("after" in xResult.stdout) is (iReturnCode == 0)
+            assert xStore.IsDone(sKey) is (iReturnCode == 0)
+        # endfor
+
+    # enddef
+
+
+# endclass
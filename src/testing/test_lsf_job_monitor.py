@@ -0,0 +1,176 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from catharsys.util.cls_lsf_job_monitor import CLsfJobMonitor, CLsfJobEvent
+
+g_pathFakeLsf: Path = Path(__file__).parent / "fake_lsf.py"
+
+
+class TestClass:
+    @pytest.fixture(autouse=True)
+    def _SetStateFile(self, tmp_path, monkeypatch):
+        self.pathState: Path = tmp_path / "lsf-state.json"
+        monkeypatch.setenv("CATHARSYS_FAKE_LSF_STATE", self.pathState.as_posix())
+
+    # enddef
+
+    def _Submit(self, _sName: str) -> int:
+        xResult = subprocess.run(
+            [sys.executable, g_pathFakeLsf.as_posix(), "bsub"],
+            input=f"#BSUB -J {_sName}\necho hello\n",
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        return int(xResult.stdout.split("<")[1].split(">")[0])
+
+    # enddef
+
+    def _SetStat(self, _iLsfId: int, _sStat: str):
+        dicState = json.loads(self.pathState.read_text())
+        dicState["mJobs"][str(_iLsfId)]["stat"] = _sStat
+        self.pathState.write_text(json.dumps(dicState))
+
+    # enddef
+
+    def _RemoveJob(self, _iLsfId: int):
+        dicState = json.loads(self.pathState.read_text())
+        del dicState["mJobs"][str(_iLsfId)]
+        self.pathState.write_text(json.dumps(dicState))
+
+    # enddef
+
+    def _CreateMonitor(self, **kwargs) -> CLsfJobMonitor:
+        return CLsfJobMonitor(_lBjobsCmd=[sys.executable, g_pathFakeLsf.as_posix(), "bjobs"], **kwargs)
+
+    # enddef
+
+    ################################################################################
+    def test_parse_bjobs_output(self):
+        lLines = [
+            "1234|0|RUN|user|normal|host-a|host-b|Oct 17 10:22|render|frames|001",
+            "1235|3|PEND|user|normal|host-a|-|Oct 17 10:23 L|array",
+            "not a job line",
+            "1236|0|DONE|user",
+        ]
+        dicStates = CLsfJobMonitor.ParseBjobsOutput(lLines)
+
+        assert list(dicStates.keys()) == [(1234, 0), (1235, 3)]
+
+        xState = dicStates[(1234, 0)]
+        assert xState.sStat == "RUN"
+        assert xState.sExecHost == "host-b"
+        assert xState.sSubmitTime == "Oct 17 10:22"
+        assert xState.sJobName == "render|frames|001"
+
+        xState = dicStates[(1235, 3)]
+        assert xState.iArrayIdx == 3
+        assert xState.sExecHost is None
+        assert xState.sJobName == "array"
+
+    # enddef
+
+    ################################################################################
+    def test_state_transitions(self):
+        iLsfId: int = self._Submit("render|test")
+
+        lEvents: list[CLsfJobEvent] = []
+        xMonitor = self._CreateMonitor()
+        xMonitor.AddHandlerEvent(lEvents.append)
+        xMonitor.AddJob(iLsfId)
+
+        assert [(x.sPrevStat, x.xState.sStat) for x in xMonitor.Poll(_bForce=True)] == [(None, "PEND")]
+        assert xMonitor.GetJobState(iLsfId).sJobName == "render|test"
+
+        # No event without a state change
+        assert xMonitor.Poll(_bForce=True) == []
+
+        self._SetStat(iLsfId, "RUN")
+        assert [(x.sPrevStat, x.xState.sStat) for x in xMonitor.Poll(_bForce=True)] == [("PEND", "RUN")]
+
+        self._SetStat(iLsfId, "DONE")
+        lPollEvents = xMonitor.Poll(_bForce=True)
+        assert [(x.sPrevStat, x.xState.sStat, x.bFinished) for x in lPollEvents] == [("RUN", "DONE", True)]
+        assert xMonitor.bHasActiveJobs is False
+
+        assert [x.xState.sStat for x in lEvents] == ["PEND", "RUN", "DONE"]
+
+    # enddef
+
+    ################################################################################
+    def test_lost_job(self):
+        iLsfId: int = self._Submit("lost")
+
+        xMonitor = self._CreateMonitor(_iLostPolls=3)
+        xMonitor.AddJob(iLsfId)
+        self._SetStat(iLsfId, "RUN")
+        assert [x.xState.sStat for x in xMonitor.Poll(_bForce=True)] == ["RUN"]
+
+        # A job that has been seen, is only regarded as lost after consecutive missing polls
+        self._RemoveJob(iLsfId)
+        assert xMonitor.Poll(_bForce=True) == []
+        assert xMonitor.Poll(_bForce=True) == []
+        lEvents = xMonitor.Poll(_bForce=True)
+        assert [(x.xState.sStat, x.bFinished) for x in lEvents] == [(CLsfJobMonitor.c_sStatNotFound, True)]
+        assert xMonitor.bHasActiveJobs is False
+
+    # enddef
+
+    ################################################################################
+    def test_missing_poll_resets(self):
+        iLsfId: int = self._Submit("flaky")
+
+        xMonitor = self._CreateMonitor(_iLostPolls=2)
+        xMonitor.AddJob(iLsfId)
+        assert [x.xState.sStat for x in xMonitor.Poll(_bForce=True)] == ["PEND"]
+
+        dicState = json.loads(self.pathState.read_text())
+        for _ in range(3):
+            # The job is missing in every second poll only
+            self._RemoveJob(iLsfId)
+            assert xMonitor.Poll(_bForce=True) == []
+            self.pathState.write_text(json.dumps(dicState))
+            assert xMonitor.Poll(_bForce=True) == []
+        # endfor
+        assert xMonitor.bHasActiveJobs is True
+
+    # enddef
+
+    ################################################################################
+    def test_job_not_seen(self):
+        xMonitor = self._CreateMonitor(_iNotFoundPolls=2)
+        xMonitor.AddJob(4711)
+
+        assert xMonitor.Poll(_bForce=True) == []
+        lEvents = xMonitor.Poll(_bForce=True)
+        assert [(x.sPrevStat, x.xState.sStat) for x in lEvents] == [(None, CLsfJobMonitor.c_sStatNotFound)]
+
+    # enddef
+
+
+# endclass
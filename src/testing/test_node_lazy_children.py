@@ -0,0 +1,119 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import pytest
+import anytree
+
+from catharsys.api.products.cls_node import CNode, ENodeType
+
+
+class TestClass:
+    def _CreateNode(self, _sName: str, _xParent: CNode = None) -> CNode:
+        return CNode(_sName, parent=_xParent, _iLevel=0, _eType=ENodeType.PATH)
+
+    # enddef
+
+    def _LoadChildren(self, _xNode: CNode):
+        self.iLoadCount += 1
+        for sName in ["a", "b", "a"]:
+            self._CreateNode(sName, _xNode)
+        # endfor
+
+    # enddef
+
+    ################################################################################
+    def test_get_child(self):
+        self.iLoadCount = 0
+        xRoot = self._CreateNode("root")
+        xRoot.SetChildLoader(self._LoadChildren)
+        assert xRoot.bChildrenLoaded is False
+        assert self.iLoadCount == 0
+
+        # The first child with a name is returned
+        xChild = xRoot.GetChild("a")
+        assert xChild is xRoot.children[0]
+        assert xRoot.GetChild("b") is xRoot.children[1]
+        assert xRoot.GetChild("c") is None
+        assert xRoot.bChildrenLoaded is True
+        assert self.iLoadCount == 1
+
+        xChild.parent = None
+        assert xRoot.GetChild("a") is xRoot.children[1]
+
+    # enddef
+
+    ################################################################################
+    def test_tree_functions_load(self):
+        self.iLoadCount = 0
+        for funcAccess in [
+            lambda xNode: xNode.is_leaf,
+            lambda xNode: xNode.height,
+            lambda xNode: xNode.descendants,
+            lambda xNode: self._CreateNode("c", xNode),
+        ]:
+            xRoot = self._CreateNode("root")
+            xRoot.SetChildLoader(self._LoadChildren)
+            funcAccess(xRoot)
+            assert xRoot.bChildrenLoaded is True
+        # endfor
+        assert self.iLoadCount == 4
+
+        # Attaching a child to an unloaded node keeps the loaded children
+        assert [xNode.name for xNode in xRoot.children] == ["a", "b", "a", "c"]
+
+    # enddef
+
+    ################################################################################
+    def test_failing_loader(self):
+        def _LoadFailing(_xNode: CNode):
+            self._CreateNode("a", _xNode)
+            raise RuntimeError("loading failed")
+
+        # enddef
+
+        xRoot = self._CreateNode("root")
+        xRoot.SetChildLoader(_LoadFailing)
+        with pytest.raises(RuntimeError):
+            xRoot.GetChild("a")
+        # endwith
+
+        # Partially loaded children are removed and the loader is kept
+        assert xRoot.bChildrenLoaded is False
+        assert len(anytree.NodeMixin.children.fget(xRoot)) == 0
+        with pytest.raises(RuntimeError):
+            xRoot.GetChild("a")
+        # endwith
+
+    # enddef
+
+    ################################################################################
+    def test_set_loader_with_children(self):
+        xRoot = self._CreateNode("root")
+        self._CreateNode("a", xRoot)
+        with pytest.raises(RuntimeError):
+            xRoot.SetChildLoader(self._LoadChildren)
+        # endwith
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,92 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+from pathlib import Path
+
+import anytree
+
+from catharsys.api.products.cls_node import CNode, ENodeType
+from catharsys.api.products.cls_dir_cache import CDirCache
+from catharsys.api.products.cls_path_structure import CPathStructure
+
+
+class TestClass:
+    c_sPathStruct: str = "?scene/render/?camera/=frame"
+    c_dicUserVars: dict = {"frame": {"sRegExParseValue": r"Frame_(\d+)\.png"}}
+
+    def _CreateTree(self, _pathRoot: Path):
+        for iScene in range(6):
+            pathScene = _pathRoot / f"scene{iScene}"
+            pathRender = pathScene / "render"
+            if iScene == 3:
+                # Scene without render folder
+                pathScene.mkdir(parents=True)
+                continue
+            # endif
+            for iCam in range(iScene % 3 + 1):
+                pathCam = pathRender / f"cam{iCam}"
+                pathCam.mkdir(parents=True)
+                for iFrame in range(iScene + 2):
+                    (pathCam / f"Frame_{iFrame:04d}.png").write_text("x")
+                # endfor
+                (pathCam / "info.txt").write_text("x")
+                (pathCam / "Frame_sub.png").mkdir()
+            # endfor
+            (pathRender / "log.txt").write_text("x")
+        # endfor
+        (_pathRoot / "readme.txt").write_text("x")
+
+    # enddef
+
+    def _Scan(self, _pathRoot: Path, _iWorkers: int) -> list[tuple]:
+        xPathStruct = CPathStructure(self.c_sPathStruct, ENodeType.ARTEFACT, _dicUserVars=self.c_dicUserVars)
+        nodeRoot = CNode("root", _iLevel=-1, _eType=ENodeType.ROOT)
+        xDirCache = CDirCache(_iWorkers=_iWorkers)
+        try:
+            xPathStruct.ScanFileSystem(_pathScan=_pathRoot, _nodeParent=nodeRoot, _iLevel=0, _xDirCache=xDirCache)
+        finally:
+            xDirCache.Close()
+        # endtry
+
+        return [
+            (tuple(x.name for x in nodeX.path), nodeX.eType, nodeX.iLevel, tuple(nodeX.lPathNames))
+            for nodeX in anytree.PreOrderIter(nodeRoot)
+        ]
+
+    # enddef
+
+    ################################################################################
+    def test_parallel_scan(self, tmp_path):
+        self._CreateTree(tmp_path)
+
+        lSerial = self._Scan(tmp_path, 1)
+        lParallel = self._Scan(tmp_path, 8)
+
+        # Scene i has (i % 3 + 1) cameras, scene 3 has no render folder.
+        # A regular expression variable only uses the first matching entry.
+        assert len([x for x in lSerial if x[1] == ENodeType.ARTEFACT]) == 1 + 2 + 3 + 2 + 3
+        assert lParallel == lSerial
+
+    # enddef
+
+
+# endclass
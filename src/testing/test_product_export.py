@@ -0,0 +1,123 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+import json
+import itertools
+from pathlib import Path
+
+import pytest
+
+from catharsys.api.products.cls_product_export import CProductExport, CExportShardIndex, CGroupConfig
+
+
+class TestClass:
+    # Stub of the filter evaluation. Excludes camera 'c1' in scenes 's0' and 's2', and
+    # includes only the given scenes, if 'lInclude' is given.
+    def _EvalFilters(self, _dicFilters: dict, _dicVars: dict[str, str]) -> bool:
+        if _dicVars["cam"] == "c1" and _dicVars["scene"] in ["s0", "s2"]:
+            return False
+        # endif
+        lInclude: list = _dicFilters.get("lInclude")
+        return lInclude is None or _dicVars["scene"] in lInclude
+
+    # enddef
+
+    ################################################################################
+    @pytest.mark.parametrize(
+        "dicFilters",
+        [
+            {},
+            {"lExclude": ["${cam}", "${scene}"]},
+            {"lExclude": ["${cam}", "${scene}"], "lInclude": ["s3"]},
+            {"lExclude": ["${cam}", "${scene}"], "lInclude": []},
+        ],
+    )
+    def test_filtered_enumeration(self, dicFilters: dict):
+        lGroupDimConfigs: list[CGroupConfig] = [
+            CGroupConfig("scene", "Scene", [f"s{i}" for i in range(5)]),
+            CGroupConfig("frame", "Frame", [f"f{i}" for i in range(7)]),
+            CGroupConfig("cam", "Camera", ["c0", "c1", "c2"]),
+        ]
+        xExport = CProductExport.__new__(CProductExport)
+        xExport._EvalFilters = self._EvalFilters
+        # Use small chunks, so that the enumeration spans several chunks
+        xExport.c_iCfgChunkSize = 8
+
+        lFilterDims, aIsIncluded = xExport._GetFilterMask(dicFilters, lGroupDimConfigs)
+        lCfgValueCounts: list[int] = [len(xCfg.lValues) for xCfg in lGroupDimConfigs]
+        lSelected = list(xExport._IterSelectedCfgIndices(lCfgValueCounts, lFilterDims, aIsIncluded))
+
+        # Evaluate the filters for every combination of the full grid
+        lExpected: list[list[int]] = []
+        for tCfgIndices in itertools.product(*[range(iCount) for iCount in lCfgValueCounts]):
+            dicVars = {xCfg.sId: xCfg.lValues[iIdx] for xCfg, iIdx in zip(lGroupDimConfigs, tCfgIndices)}
+            if len(dicFilters) == 0 or self._EvalFilters(dicFilters, dicVars):
+                lExpected.append(list(tCfgIndices))
+            # endif
+        # endfor
+
+        assert lSelected == lExpected
+
+    # enddef
+
+    ################################################################################
+    ################################################################################
+    def test_shard_index(self, tmp_path: Path):
+        xExport = CProductExport.__new__(CProductExport)
+        iSampleCount: int = 2500
+        iShardCount: int = 4
+        lShards: list[dict] = []
+        for iShardIdx in range(iShardCount):
+            iStart, iEnd = xExport._GetShardRange(iSampleCount, 1000, iShardCount, iShardIdx)
+            lShards.append(
+                {
+                    "sFolder": xExport._GetShardFolderName(iShardIdx),
+                    "iSampleStart": iStart,
+                    "iSampleCount": iEnd - iStart,
+                }
+            )
+        # endfor
+        # With three sample groups, one of the four shards is empty
+        assert [x["iSampleCount"] for x in lShards] == [0, 1000, 1000, 500]
+
+        dicIndex = {"iSampleCount": iSampleCount, "lShards": lShards, "mMeta": {"image": {"var_ids": ["frame"]}}}
+        (tmp_path / CProductExport.c_sShardIndexFilename).write_text(json.dumps(dicIndex))
+
+        xIndex = CExportShardIndex.Load(tmp_path)
+        assert xIndex.iSampleCount == iSampleCount
+        assert xIndex.dicMeta == dicIndex["mMeta"]
+        assert [x.pathXtar for x in xIndex.lShards] == [tmp_path / x["sFolder"] for x in lShards]
+
+        for iSampleIdx, iShardIdx, iLocalIdx in [(0, 1, 0), (999, 1, 999), (1000, 2, 0), (2499, 3, 499)]:
+            xShard, iIdx = xIndex.GetShard(iSampleIdx)
+            assert xShard is xIndex.lShards[iShardIdx]
+            assert iIdx == iLocalIdx
+        # endfor
+
+        with pytest.raises(IndexError):
+            xIndex.GetShard(iSampleCount)
+        # endwith
+
+    # enddef
+
+
+# endclass
@@ -0,0 +1,98 @@
+###
+# <LICENSE id="Apache-2.0">
+#
+#   Image-Render Automation Functions module
+#   Copyright 2026 Robert Bosch GmbH and its subsidiaries
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+#
+# </LICENSE>
+###
+
+
+from pathlib import Path
+
+from catharsys.api.products.cls_node import CNode, ENodeType
+from catharsys.api.products.cls_scan_columns import CScanColumns
+
+
+class TestClass:
+    def _CreateTree(self) -> CNode:
+        xRoot = CNode("root", _iLevel=0, _eType=ENodeType.ROOT)
+        xGroup = CNode("grp", parent=xRoot, _iLevel=1, _eType=ENodeType.GROUP, _xData={"sId": "grp"})
+        for iIdx, sName in enumerate(["b", "a", "ä", "b"]):
+            xPath = CNode(
+                sName,
+                parent=xGroup,
+                _iLevel=2,
+                _eType=ENodeType.PATH,
+                _xData=[iIdx],
+                _sPathName=f"path-{sName}" if iIdx == 1 else None,
+            )
+            CNode("Frame_0001.png", parent=xPath, _iLevel=3, _eType=ENodeType.ARTEFACT, _xData="image")
+        # endfor
+        CNode("empty", parent=xRoot, _iLevel=1, _eType=ENodeType.GROUP)
+        return xRoot
+
+    # enddef
+
+    def _AssertTree(self, _xColumns: CScanColumns):
+        assert _xColumns.iNodeCount == 11
+        assert _xColumns.GetName(0) == "root"
+        assert _xColumns.GetSubtreeSize(0) == 11
+
+        iGroup: int = _xColumns.GetChild(0, "grp")
+        assert iGroup == 1
+        assert _xColumns.GetType(iGroup) == int(ENodeType.GROUP)
+        assert _xColumns.GetData(iGroup) == {"sId": "grp"}
+        assert _xColumns.GetSubtreeSize(iGroup) == 9
+        assert _xColumns.GetChild(0, "empty") == 10
+        assert _xColumns.GetChild(0, "missing") == -1
+
+        # Children are kept in tree order and the first child with a name is found
+        lChildren = _xColumns.GetChildren(iGroup).tolist()
+        assert [_xColumns.GetName(iNode) for iNode in lChildren] == ["b", "a", "ä", "b"]
+        assert [_xColumns.GetData(iNode) for iNode in lChildren] == [[0], [1], [2], [3]]
+        assert _xColumns.GetChild(iGroup, "b") == lChildren[0]
+        assert _xColumns.GetPathName(lChildren[1]) == "path-a"
+        assert _xColumns.GetPathName(lChildren[0]) == "b"
+        assert _xColumns.GetChildrenByName(iGroup, {"a", "b"}).tolist() == [lChildren[0], lChildren[1], lChildren[3]]
+
+        iArtefact: int = _xColumns.GetChild(lChildren[2], "Frame_0001.png")
+        assert _xColumns.GetLevel(iArtefact) == 3
+        assert _xColumns.GetData(iArtefact) == "image"
+
+        assert _xColumns.GetLevelNameSets(0, 4) == [
+            {"root"},
+            {"grp", "empty"},
+            {"a", "b", "ä"},
+            {"Frame_0001.png"},
+        ]
+
+    # enddef
+
+    ################################################################################
+    def test_round_trip(self, tmp_path: Path):
+        xColumns = CScanColumns.FromTree(self._CreateTree(), lambda xData: xData)
+        self._AssertTree(xColumns)
+
+        pathFolder: Path = tmp_path / "columns"
+        xColumns.Save(pathFolder)
+        for bMemoryMap in [True, False]:
+            self._AssertTree(CScanColumns.Load(pathFolder, _bMemoryMap=bMemoryMap))
+        # endfor
+
+    # enddef
+
+
+# endclass